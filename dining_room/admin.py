@@ -17,9 +17,10 @@ from django.utils.html import escape
 from django.utils.translation import gettext, gettext_lazy as _
 from django.views.decorators.csrf import csrf_protect
 from django.views.decorators.debug import sensitive_post_parameters
+from django.views.decorators.http import require_POST
 
 from . import constants
-from .models import User, StudyManagement, StudyAction
+from .models import User, StudyManagement, ConditionQuota, PooledAccount, StudyAction, ActionLogEntry
 
 
 # Helper classes such as list filters, etc
@@ -144,6 +145,64 @@ class StudyManagementAdmin(admin.ModelAdmin):
         ).count()
 
 
+@admin.register(ConditionQuota)
+class ConditionQuotaAdmin(admin.ModelAdmin):
+    """
+    The admin class for the ConditionQuota model
+    """
+    list_display = ('__str__', 'study_condition', 'start_condition', 'number_assigned')
+    list_filter = ('study_management', 'study_condition', 'start_condition')
+    readonly_fields = ('study_management', 'study_condition', 'start_condition')
+    actions = ['sync_quotas']
+
+    def sync_quotas(self, request, queryset):
+        """Recount the participants in the quotas"""
+        sms = StudyManagement.objects.filter(pk__in=queryset.values('study_management'))
+        for sm in sms:
+            ConditionQuota.sync(sm)
+        self.message_user(request, f"Synced the quotas of {len(sms)} study managements", messages.SUCCESS)
+    sync_quotas.short_description = _("Recount the participants in the quotas")
+
+
+@admin.register(PooledAccount)
+class PooledAccountAdmin(admin.ModelAdmin):
+    """
+    The admin class for the PooledAccount model. The changelist shows the size
+    of the pool and has a button to top it up
+    """
+    list_display = ('username', 'unique_key', 'date_created')
+    readonly_fields = ('username', 'unique_key', 'date_created')
+    exclude = ('password',)
+
+    def has_add_permission(self, request):
+        return False
+
+    def get_urls(self):
+        return [
+            path(
+                'top-up/',
+                self.admin_site.admin_view(self.top_up),
+                name='dining_room_pooledaccount_top_up',
+            ),
+        ] + super().get_urls()
+
+    def changelist_view(self, request, extra_context=None):
+        extra_context = extra_context or {}
+        extra_context['pool_size'] = settings.ACCOUNT_POOL_SIZE
+        extra_context['pool_count'] = PooledAccount.objects.count()
+        return super().changelist_view(request, extra_context=extra_context)
+
+    @method_decorator(require_POST)
+    def top_up(self, request):
+        """Refill the pool up to the configured size"""
+        if not self.has_change_permission(request):
+            raise PermissionDenied
+
+        number_added = PooledAccount.refill(settings.ACCOUNT_POOL_SIZE)
+        self.message_user(request, f"Added {number_added} accounts to the pool", messages.SUCCESS)
+        return HttpResponseRedirect(reverse('admin:dining_room_pooledaccount_changelist'))
+
+
 @admin.register(StudyAction)
 class StudyActionAdmin(admin.ModelAdmin):
     """
@@ -169,6 +228,10 @@ class StudyActionAdmin(admin.ModelAdmin):
         'user__study_condition',
         'user__start_condition',
         'user__study_management',
+        'chose_dx_suggestion',
+        'chose_ax_suggestion',
+        'chose_dx_optimal',
+        'chose_ax_optimal',
     )
     readonly_fields = (
         'duration',
@@ -181,6 +244,7 @@ class StudyActionAdmin(admin.ModelAdmin):
         'optimal_ax',
     )
     ordering = ('user', 'start_timestamp')
+    list_select_related = ('user',)
 
     def certainty(self, obj):
         return obj.diagnosis_certainty
@@ -197,18 +261,33 @@ class StudyActionAdmin(admin.ModelAdmin):
     def chose_dx(self, obj):
         return obj.chose_dx_suggestion
     chose_dx.boolean = True
+    chose_dx.admin_order_field = 'chose_dx_suggestion'
 
     def chose_ax(self, obj):
         return obj.chose_ax_suggestion
     chose_ax.boolean = True
+    chose_ax.admin_order_field = 'chose_ax_suggestion'
 
     def optimal_dx(self, obj):
         return obj.chose_dx_optimal
     optimal_dx.boolean = True
+    optimal_dx.admin_order_field = 'chose_dx_optimal'
 
     def optimal_ax(self, obj):
         return obj.chose_ax_optimal
     optimal_ax.boolean = True
+    optimal_ax.admin_order_field = 'chose_ax_optimal'
+
+
+@admin.register(ActionLogEntry)
+class ActionLogEntryAdmin(admin.ModelAdmin):
+    """
+    The admin class for the ActionLogEntry model
+    """
+    list_display = ('__str__', 'csv_filename', 'mirrored')
+    list_filter = ('mirrored', 'user__study_management')
+    readonly_fields = ('user', 'csv_filename', 'row')
+    ordering = ('pk',)
 
 
 # Special requirements for the redefined auth models
@@ -555,6 +634,9 @@ class StudyActionInline(admin.TabularInline):
     show_change_link = True
     extra = 0
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_action_idx()
+
     def certainty(self, obj):
         return obj.diagnosis_certainty
     certainty.admin_order_field = 'diagnosis_certainty'
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# Authentication backend for the participants
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import BaseBackend
+from django.contrib.auth.hashers import check_password
+
+from .hashers import is_participant_password
+
+
+class ParticipantBackend(BaseBackend):
+    """
+    Authenticate non-staff users whose passwords were hashed by the
+    participant hasher. The hash is verified without being upgraded to the
+    default hasher. Participants do not get any permissions from this backend.
+    Sessions of other users that were logged in with this backend, such as by
+    ``login`` without a backend, are restored as by the ModelBackend
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None or password is None:
+            return None
+
+        UserModel = get_user_model()
+        try:
+            user = UserModel._default_manager.get_by_natural_key(username)
+        except UserModel.DoesNotExist:
+            return None
+
+        if user.is_staff or not user.is_active or not is_participant_password(user.password):
+            return None
+
+        if check_password(password, user.password):
+            return user
+
+    def get_user(self, user_id):
+        # The saved response of the last state request is only needed to
+        # answer its retries, so it is not loaded with the user
+        UserModel = get_user_model()
+        try:
+            user = UserModel._default_manager.defer('next_state_response').get(pk=user_id)
+        except UserModel.DoesNotExist:
+            return None
+        return user if user.is_active else None
+
@@ -136,6 +136,14 @@ LOCATION_MAPPINGS = {
 }
 
 
+# The inverse of the mappings above; i.e., given the label of a location under
+# a mapping, get the true location
+INVERSE_LOCATION_MAPPINGS = {
+    mapping_name: objdict({ v: k for k, v in mapping.items() })
+    for mapping_name, mapping in LOCATION_MAPPINGS.items()
+}
+
+
 # Empty gripper
 EMPTY_GRIPPER = 'empty'
 EMPTY_GRIPPER_DISPLAY = 'nothing'
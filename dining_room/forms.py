@@ -1,13 +1,12 @@
-import datetime
 import logging
-import itertools
 
 from django import forms
-from django.db.models import Q, Count
-from django.contrib.auth import authenticate, login
+from django.contrib.auth import login
+from django.db import transaction, IntegrityError
 from django.utils import timezone
 
-from .models import User, StudyManagement
+from .models import User, StudyManagement, ConditionQuota, PooledAccount
+from .utils import AccountPoolRefiller
 
 
 # Create the forms here
@@ -22,101 +21,54 @@ class CreateUserForm(forms.Form):
     nothing as input
     """
 
-    ALLOWED_TIME_SINCE_LOGIN = datetime.timedelta(minutes=46)
-
     def __init__(self, request=None, *args, **kwargs):
         """Initialize the same way as an AuthenticationForm"""
         self.request = request
         self.user_cache = None
         super().__init__(*args, **kwargs)
 
-        # Cache a pointer to the study manager
-        self._sm = None
-        self._conditions_idx = None
-        self._conditions_aggregate = None
-
     def _create_user(self, study_condition, start_condition):
-        # Loop through to make sure that we never have duplicates
-        username = unique_key = None
-        while ((username is None or unique_key is None)):
-            username_candidate = User.objects.make_random_password(allowed_chars='abcdefghjkmnpqrstuvwxyz23456789')
-            unique_key_candidate = User.objects.make_random_password(allowed_chars='abcdefghjkmnpqrstuvwxyz23456789')
-            num_existing_users = User.objects.filter(Q(username=username_candidate) | Q(unique_key=unique_key_candidate)).count()
-            if num_existing_users == 0:
-                username, unique_key = username_candidate, unique_key_candidate
-
-        # Create the user
-        user = User.objects.create_user(username, unique_key, study_condition=study_condition, start_condition=start_condition)
-        return user
-
-    def _clear_abandoned_users(self):
-        """
-        Clear out users that might've abandoned the study
-        """
-        User.objects.filter(
-            Q(is_staff=False) &
-            Q(date_survey_completed__isnull=True) &
-            (Q(ignore_data_reason__isnull=True) | Q(ignore_data_reason='')) &
-            Q(last_login__lte=(timezone.now() - CreateUserForm.ALLOWED_TIME_SINCE_LOGIN))
-        ).update(
-            ignore_data_reason = f'marked as abandoned at {timezone.now()}'
-        )
-
-    def _get_study_management(self):
-        """Get a study manager. We cache the expensive aggregate generator"""
-        sm = StudyManagement.get_default()
-        if sm != self._sm:
-            self._sm = sm
-            self._conditions_idx = {}
-            self._conditions_aggregate = {}
-            for idx, (study_condition, start_condition) in enumerate(itertools.product(sm.enabled_study_conditions_list, sm.enabled_start_conditions_list)):
-                self._conditions_aggregate[str(idx)] = Count('pk', filter=Q(study_condition=study_condition, start_condition=start_condition))
-                self._conditions_idx[str(idx)] = (study_condition, start_condition)
-        return sm
+        # Use an account from the pool, if there is one, and let the refiller
+        # know that the pool needs to be topped up
+        user = PooledAccount.claim(study_condition=study_condition, start_condition=start_condition)
+        AccountPoolRefiller.notify()
+        if user is not None:
+            return user
+
+        # Otherwise create the user. Another process could create the same
+        # username or key after it was generated, so generate another one
+        while True:
+            account = PooledAccount.generate()
+            user = User(username=account.username, unique_key=account.unique_key, password=account.password, study_condition=study_condition, start_condition=start_condition)
+            try:
+                with transaction.atomic():
+                    user.save()
+                return user
+            except IntegrityError as e:
+                continue
 
     def clean(self):
         cleaned_data = super().clean()
-        self._clear_abandoned_users()
-
-        # Get the management object
-        sm = self._get_study_management()
-
-        # Create the different filter conditions and make a queryset from that
-        users_not_staff = Q(is_staff=False)
-        users_valid_condition = Q(ignore_data_reason__isnull=True) | Q(ignore_data_reason='')
-        users_enabled_conditions = (Q(study_condition__in=sm.enabled_study_conditions_list) & Q(start_condition__in=sm.enabled_start_conditions_list))
-        qs = User.objects.filter(users_not_staff & users_valid_condition & users_enabled_conditions)
-
-        # First check that we haven't exceeded the max number of users
-        number_of_users = qs.count()
-        if sm.max_number_of_people <= number_of_users:
-            raise forms.ValidationError("Exceeded max number; cannot create user")
-
-        # Get the number of users per condition
-        counts_per_condition = qs.aggregate(**self._conditions_aggregate)
-        min_count = float('inf')
-        assigned_condition = None
-        for cidx, count in counts_per_condition.items():
-            if count > min_count or count >= sm.number_per_condition:
-                continue
-
-            min_count = count
-            assigned_condition = self._conditions_idx[cidx]
+        sm = StudyManagement.get_default()
 
-        # If a condition exists, then pick the user, otherwise return a fail
+        # Allocate a slot in a condition. If a condition exists, then pick the
+        # user, otherwise return a fail
+        assigned_condition = ConditionQuota.allocate(sm)
         if assigned_condition is None:
-            raise forms.ValidationError("Exceeded number per condition; cannot create user")
+            raise forms.ValidationError("Exceeded number of participants; cannot create user")
 
-        user = self._create_user(*assigned_condition)
-        logger.info(f"{user} created for {assigned_condition[0]}, {assigned_condition[1]}")
+        try:
+            user = self._create_user(*assigned_condition)
+        except Exception as e:
+            ConditionQuota.release(sm, *assigned_condition)
+            raise
 
-        # Authenticate the user in
-        self.user_cache = authenticate(self.request, username=user.username, password=user.username)
-        if self.user_cache is None:
-            raise forms.ValidationError("Cannot authenticate user")
+        logger.info(f"{user} created for {assigned_condition[0]}, {assigned_condition[1]}")
 
-        # Log the user in
-        self.user_cache = login(self.request, self.user_cache)
+        # Log the user in. We've just created the user with a known password,
+        # so there is no need to authenticate them
+        login(self.request, user, backend='dining_room.backends.ParticipantBackend')
+        self.user_cache = user
 
         # Return the cleaned data
         return cleaned_data
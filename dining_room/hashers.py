@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# Password hashers for the participants' accounts
+
+from django.contrib.auth.hashers import BasePasswordHasher, mask_hash
+from django.utils.crypto import constant_time_compare, get_random_string, salted_hmac
+from django.utils.translation import gettext_noop as _
+
+
+class ParticipantPasswordHasher(BasePasswordHasher):
+    """
+    A cheap hasher for the participants' passwords, which are the same as
+    their usernames. The hash is an HMAC keyed by the SECRET_KEY, so changing
+    the SECRET_KEY invalidates the passwords.
+
+    This hasher must only be used for non-staff accounts; staff cannot log in
+    with these passwords (see ``User.check_password``)
+    """
+
+    algorithm = 'participant_hmac'
+
+    def salt(self):
+        return get_random_string(12)
+
+    def encode(self, password, salt):
+        assert password is not None
+        assert salt and '$' not in salt
+        hash = salted_hmac(f'{self.algorithm}${salt}', password).hexdigest()
+        return f'{self.algorithm}${salt}${hash}'
+
+    def verify(self, password, encoded):
+        algorithm, salt, hash = encoded.split('$', 2)
+        assert algorithm == self.algorithm
+        return constant_time_compare(encoded, self.encode(password, salt))
+
+    def safe_summary(self, encoded):
+        algorithm, salt, hash = encoded.split('$', 2)
+        assert algorithm == self.algorithm
+        return {
+            _('algorithm'): algorithm,
+            _('salt'): mask_hash(salt, show=2),
+            _('hash'): mask_hash(hash),
+        }
+
+    def harden_runtime(self, password, encoded):
+        pass
+
+
+def is_participant_password(encoded):
+    """Check if the encoded password was hashed by the participant hasher"""
+    return encoded is not None and encoded.startswith(f'{ParticipantPasswordHasher.algorithm}$')
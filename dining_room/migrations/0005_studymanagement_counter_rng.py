@@ -0,0 +1,18 @@
+# Generated by Django 3.0.2 on 2020-02-24 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dining_room', '0004_auto_20200219_1527'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studymanagement',
+            name='counter_rng',
+            field=models.BooleanField(default=False, help_text="Draw the noise in the suggestions from a counter-based RNG keyed by the user and the request number, instead of from the user's saved RNG state"),
+        ),
+    ]
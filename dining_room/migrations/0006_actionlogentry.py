@@ -0,0 +1,30 @@
+# Generated by Django 3.0.2 on 2020-02-25 14:03
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dining_room', '0005_studymanagement_counter_rng'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ActionLogEntry',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('csv_filename', models.CharField(help_text='The path of the CSV file within the Dropbox root', max_length=255)),
+                ('row', models.TextField(help_text='JSON list of the values in the CSV row')),
+                ('mirrored', models.BooleanField(db_index=True, default=False, help_text='Whether the row has been written to the CSV file')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'action log entry',
+                'verbose_name_plural': 'action log entries',
+                'ordering': ('pk',),
+            },
+        ),
+    ]
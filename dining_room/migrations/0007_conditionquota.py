@@ -0,0 +1,29 @@
+# Generated by Django 3.0.2 on 2020-02-26 16:21
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dining_room', '0006_actionlogentry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ConditionQuota',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('study_condition', models.IntegerField(blank=True, choices=[(None, '(Unknown)'), (1, 'Baseline'), (2, 'DX, 100'), (3, 'AX, 100'), (4, 'DX & AX, 100'), (5, 'DX, 90'), (6, 'AX, 90'), (7, 'DX & AX, 90'), (8, 'DX, 80'), (9, 'AX, 80'), (10, 'DX & AX, 80'), (11, 'DX, 70'), (12, 'AX, 70'), (13, 'DX & AX, 70')], null=True, verbose_name='study condition')),
+                ('start_condition', models.CharField(blank=True, choices=[(None, '(Unknown)'), ('kc.kc.default.above_mug.default.empty.dt', 'At Counter Above Mug'), ('kc.kc.occluding.default.default.empty.dt', 'At Counter Occluding'), ('kc.kc.occluding.above_mug.default.empty.dt', 'At Counter Occluding Above Mug'), ('dt.kc.default.default.default.empty.kc', 'At Counter Mislocalized'), ('kc.dt.default.default.default.empty.dt', 'At Table'), ('kc.dt.default.above_mug.default.empty.dt', 'At Table Above Mug'), ('kc.dt.occluding.default.default.empty.dt', 'At Table Occluding'), ('kc.dt.occluding.above_mug.default.empty.dt', 'At Table Occluding Above Mug')], max_length=80, null=True, verbose_name='start condition')),
+                ('number_assigned', models.PositiveIntegerField(default=0, help_text='Number of valid participants assigned to the conditions')),
+                ('study_management', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='dining_room.StudyManagement')),
+            ],
+            options={
+                'verbose_name': 'condition quota',
+                'verbose_name_plural': 'condition quotas',
+                'unique_together': {('study_management', 'study_condition', 'start_condition')},
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 3.0.2 on 2020-02-27 11:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dining_room', '0007_conditionquota'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PooledAccount',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('username', models.CharField(max_length=30, unique=True, verbose_name='username')),
+                ('unique_key', models.CharField(max_length=30, unique=True, verbose_name='unique_key')),
+                ('password', models.CharField(max_length=128, verbose_name='password')),
+                ('date_created', models.DateTimeField(auto_now_add=True, verbose_name='date created')),
+            ],
+            options={
+                'verbose_name': 'pooled account',
+                'verbose_name_plural': 'pooled accounts',
+            },
+        ),
+    ]
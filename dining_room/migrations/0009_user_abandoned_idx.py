@@ -0,0 +1,17 @@
+# Generated by Django 3.0.2 on 2020-02-28 10:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dining_room', '0008_pooledaccount'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('date_survey_completed__isnull', True), ('is_staff', False)), fields=['last_login'], name='user_abandoned_idx'),
+        ),
+    ]
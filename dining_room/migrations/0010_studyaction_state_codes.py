@@ -0,0 +1,64 @@
+# Generated by Django 3.0.2 on 2020-03-02 14:21
+
+import ast
+
+from django.db import migrations, models
+
+
+# A frozen copy of ``State.code`` at the time of this migration: the index of
+# each value of the state tuple in its list, packed at the shift of its list
+CODE_FIELD_VALUES = [
+    ['kc', 'dt', 'c'],
+    ['kc', 'dt'],
+    ['default', 'occluding', 'gripper'],
+    ['default', 'above_mug', 'gripper'],
+    ['default', 'gripper'],
+    ['empty', 'jug', 'bowl', 'mug'],
+    ['kc', 'dt', 'c'],
+]
+CODE_FIELD_SHIFTS = [0, 2, 3, 5, 7, 8, 10]
+
+
+def get_state_code(state_repr):
+    """Get the code of the state from its repr in the CSV files"""
+    if not state_repr:
+        return None
+
+    code = 0
+    for value, values, shift in zip(ast.literal_eval(state_repr), CODE_FIELD_VALUES, CODE_FIELD_SHIFTS):
+        code |= values.index(value) << shift
+    return code
+
+
+def set_state_codes(apps, schema_editor):
+    """Set the codes of the states of the existing actions"""
+    StudyAction = apps.get_model('dining_room', 'StudyAction')
+
+    actions = []
+    for action in StudyAction.objects.only('pk', 'start_state', 'next_state').iterator():
+        action.start_state_code = get_state_code(action.start_state)
+        action.next_state_code = get_state_code(action.next_state)
+        actions.append(action)
+
+    StudyAction.objects.bulk_update(actions, ['start_state_code', 'next_state_code'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dining_room', '0009_user_abandoned_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studyaction',
+            name='next_state_code',
+            field=models.IntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='studyaction',
+            name='start_state_code',
+            field=models.IntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.RunPython(set_state_codes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,158 @@
+# Generated by Django 3.0.2 on 2020-03-03 10:37
+
+import ast
+
+from django.db import migrations, models
+
+
+CHOICE_FIELDS = ['chose_dx_suggestion', 'chose_ax_suggestion', 'chose_dx_optimal', 'chose_ax_optimal']
+
+
+# A frozen copy of the rules in the domain, and of
+# ``StudyAction.compute_choices``, at the time of this migration. A state is the
+# 7 tuple of (base_location, object_location, jug_state, bowl_state, mug_state,
+# gripper_state, current_dt_label)
+
+def get_visible_objects(state):
+    """The same as ``State.visible_objects``"""
+    base_location, object_location, jug_state, bowl_state, mug_state, gripper_state, current_dt_label = state
+    visible_objects = []
+    if base_location == object_location:
+        if jug_state != 'gripper' and not (mug_state == 'gripper' and object_location == 'dt'):
+            visible_objects.append('jug')
+
+        if bowl_state != 'gripper' and not (mug_state == 'gripper' and object_location == 'kc' and jug_state == 'gripper'):
+            visible_objects.append('bowl')
+
+        if mug_state == 'default' and jug_state != 'occluding':
+            visible_objects.append('mug')
+
+    return visible_objects
+
+
+def get_graspable_objects(state):
+    """The same as ``State.graspable_objects``"""
+    base_location, object_location, jug_state, bowl_state, mug_state, gripper_state, current_dt_label = state
+    graspable_objects = []
+    if gripper_state == 'empty' and base_location == object_location:
+        visible_objects = get_visible_objects(state)
+
+        if 'jug' in visible_objects:
+            graspable_objects.append('jug')
+
+        if 'bowl' in visible_objects and (jug_state != 'occluding' or bowl_state != 'above_mug'):
+            graspable_objects.append('bowl')
+
+        if 'mug' in visible_objects and bowl_state != 'above_mug':
+            graspable_objects.append('mug')
+
+    return graspable_objects
+
+
+def get_optimal_action(state):
+    """The same as ``Suggestions._get_optimal_action``"""
+    base_location, object_location, jug_state, bowl_state, mug_state, gripper_state, current_dt_label = state
+    graspable_objects = get_graspable_objects(state)
+
+    if base_location == 'c' and mug_state == 'gripper' and gripper_state == 'mug' and current_dt_label == 'dt':
+        return []
+    elif current_dt_label != 'dt':
+        return [f'at_{base_location}']
+    elif gripper_state == 'mug' and base_location != 'c':
+        return ['go_to_c']
+    elif gripper_state != 'empty':
+        return ['place']
+    elif 'mug' in graspable_objects:
+        return ['pick_mug']
+    elif 'bowl' in graspable_objects and 'mug' in get_visible_objects(state):
+        return ['pick_bowl']
+    elif 'jug' in graspable_objects:
+        return ['pick_jug']
+    elif base_location != object_location:
+        return [f'go_to_{object_location}']
+    return []
+
+
+def get_accumulated_diagnoses(state):
+    """The same as ``Suggestions._get_ordered_diagnoses`` with accumulate=True"""
+    base_location, object_location, jug_state, bowl_state, mug_state, gripper_state, current_dt_label = state
+    visible_objects = get_visible_objects(state)
+    suggestions = []
+
+    if current_dt_label != 'dt':
+        suggestions.append('lost')
+
+    if object_location == 'dt' and base_location == 'kc':
+        suggestions.append('different_location')
+
+    if 'mug' not in visible_objects and gripper_state != 'mug':
+        suggestions.append('cannot_see')
+
+    if ('mug' not in visible_objects or bowl_state == 'above_mug') and gripper_state != 'mug':
+        suggestions.append('cannot_pick')
+
+    return suggestions or ['none']
+
+
+def compute_choices(action):
+    """The same as ``StudyAction.compute_choices``"""
+    choices = dict.fromkeys(CHOICE_FIELDS)
+
+    if action.diagnoses is not None and action.dx_suggestions is not None:
+        choices['chose_dx_suggestion'] = len(set(action.diagnoses) & set(action.dx_suggestions)) > 0
+
+    if action.action is not None and action.ax_suggestions is not None:
+        choices['chose_ax_suggestion'] = action.action in action.ax_suggestions
+
+    if action.start_state:
+        state = tuple(ast.literal_eval(action.start_state))
+        if action.diagnoses is not None:
+            choices['chose_dx_optimal'] = len(set(action.diagnoses) & set(get_accumulated_diagnoses(state))) > 0
+        if action.action is not None:
+            choices['chose_ax_optimal'] = action.action in get_optimal_action(state)
+
+    return choices
+
+
+def set_choices(apps, schema_editor):
+    """Compute the choices of the existing actions"""
+    StudyAction = apps.get_model('dining_room', 'StudyAction')
+
+    actions = []
+    for action in StudyAction.objects.iterator():
+        for name, value in compute_choices(action).items():
+            setattr(action, name, value)
+        actions.append(action)
+
+    StudyAction.objects.bulk_update(actions, CHOICE_FIELDS, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dining_room', '0010_studyaction_state_codes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studyaction',
+            name='chose_ax_optimal',
+            field=models.BooleanField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='studyaction',
+            name='chose_ax_suggestion',
+            field=models.BooleanField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='studyaction',
+            name='chose_dx_optimal',
+            field=models.BooleanField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='studyaction',
+            name='chose_dx_suggestion',
+            field=models.BooleanField(blank=True, db_index=True, null=True),
+        ),
+        migrations.RunPython(set_choices, migrations.RunPython.noop),
+    ]
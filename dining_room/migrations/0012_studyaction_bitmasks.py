@@ -0,0 +1,91 @@
+# Generated by Django 3.0.2 on 2020-03-04 16:12
+
+import dining_room.models.analysis
+from django.db import migrations
+
+
+SET_FIELDS = ['diagnoses', 'dx_suggestions', 'ax_suggestions']
+
+
+def set_bits(apps, schema_editor):
+    """Copy the comma separated sets into the bitmasks"""
+    StudyAction = apps.get_model('dining_room', 'StudyAction')
+
+    actions = []
+    for action in StudyAction.objects.iterator():
+        for name in SET_FIELDS:
+            setattr(action, f'{name}_bits', getattr(action, name))
+        actions.append(action)
+
+    StudyAction.objects.bulk_update(actions, [f'{name}_bits' for name in SET_FIELDS], batch_size=1000)
+
+
+def unset_bits(apps, schema_editor):
+    """Copy the bitmasks back into the comma separated sets"""
+    StudyAction = apps.get_model('dining_room', 'StudyAction')
+
+    actions = []
+    for action in StudyAction.objects.iterator():
+        for name in SET_FIELDS:
+            setattr(action, name, getattr(action, f'{name}_bits'))
+        actions.append(action)
+
+    StudyAction.objects.bulk_update(actions, SET_FIELDS, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dining_room', '0011_studyaction_choices'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studyaction',
+            name='ax_suggestions_bits',
+            field=dining_room.models.analysis.BitmaskSetField(blank=True, choices=[('at_c', "Update robot's location belief to: Couch"), ('at_dt', "Update robot's location belief to:  Dining Table"), ('at_kc', "Update robot's location belief to:  Kitchen Counter"), ('go_to_c', 'Navigate to Couch'), ('go_to_dt', 'Navigate to Dining Table'), ('go_to_kc', 'Navigate to Kitchen Counter'), ('remove_obstacle', 'Remove the obstacle blocking navigation'), ('out_of_collision', 'Move away from a collision'), ('look_at_c', 'Look at Couch'), ('look_at_dt', 'Look at Dining Table'), ('look_at_kc', 'Look at Kitchen Counter'), ('pick_bowl', 'Pick up the Bowl'), ('pick_jug', 'Pick up the Jug'), ('pick_mug', 'Pick up the Cup'), ('place', 'Put away held object'), ('restart_video', 'Restart the camera'), ('find_charger', 'Find the charger and navigate to it')], null=True),
+        ),
+        migrations.AddField(
+            model_name='studyaction',
+            name='diagnoses_bits',
+            field=dining_room.models.analysis.BitmaskSetField(choices=[('lost', 'The robot is lost'), ('cannot_move', 'The robot is stuck and cannot move to a location'), ('base_collision', 'The robot has collided with an object'), ('path_blocked', "The robot's path is blocked"), ('cannot_pick', 'The cup cannot be picked up'), ('cannot_see', 'The cup is not visible'), ('different_location', 'The cup is not where it should be'), ('object_fell', "The object fell out of the robot's hand"), ('battery_low', 'The battery is low'), ('video_problem', 'There is a problem with the camera'), ('none', 'There is no problem')], null=True),
+        ),
+        migrations.AddField(
+            model_name='studyaction',
+            name='dx_suggestions_bits',
+            field=dining_room.models.analysis.BitmaskSetField(blank=True, choices=[('lost', 'The robot is lost'), ('cannot_move', 'The robot is stuck and cannot move to a location'), ('base_collision', 'The robot has collided with an object'), ('path_blocked', "The robot's path is blocked"), ('cannot_pick', 'The cup cannot be picked up'), ('cannot_see', 'The cup is not visible'), ('different_location', 'The cup is not where it should be'), ('object_fell', "The object fell out of the robot's hand"), ('battery_low', 'The battery is low'), ('video_problem', 'There is a problem with the camera'), ('none', 'There is no problem')], null=True),
+        ),
+        migrations.RunPython(set_bits, unset_bits),
+        migrations.RemoveField(
+            model_name='studyaction',
+            name='ax_suggestions',
+        ),
+        migrations.RenameField(
+            model_name='studyaction',
+            old_name='ax_suggestions_bits',
+            new_name='ax_suggestions',
+        ),
+        migrations.RemoveField(
+            model_name='studyaction',
+            name='diagnoses',
+        ),
+        migrations.RenameField(
+            model_name='studyaction',
+            old_name='diagnoses_bits',
+            new_name='diagnoses',
+        ),
+        migrations.RemoveField(
+            model_name='studyaction',
+            name='dx_suggestions',
+        ),
+        migrations.RenameField(
+            model_name='studyaction',
+            old_name='dx_suggestions_bits',
+            new_name='dx_suggestions',
+        ),
+        migrations.AlterField(
+            model_name='studyaction',
+            name='diagnoses',
+            field=dining_room.models.analysis.BitmaskSetField(choices=[('lost', 'The robot is lost'), ('cannot_move', 'The robot is stuck and cannot move to a location'), ('base_collision', 'The robot has collided with an object'), ('path_blocked', "The robot's path is blocked"), ('cannot_pick', 'The cup cannot be picked up'), ('cannot_see', 'The cup is not visible'), ('different_location', 'The cup is not where it should be'), ('object_fell', "The object fell out of the robot's hand"), ('battery_low', 'The battery is low'), ('video_problem', 'There is a problem with the camera'), ('none', 'There is no problem')]),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 3.0.2 on 2020-03-05 11:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dining_room', '0012_studyaction_bitmasks'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='next_state_key',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='next_state_response',
+            field=models.TextField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 3.0.2 on 2020-03-06 10:12
+
+import json
+
+from django.db import migrations, models
+
+
+# A frozen copy of the index of the start state in the rows of the action log
+# at the time of this migration. Restart markers have no start state
+START_STATE_IDX = 1
+
+
+def set_is_restart(apps, schema_editor):
+    ActionLogEntry = apps.get_model('dining_room', 'ActionLogEntry')
+
+    entries = []
+    for entry in ActionLogEntry.objects.only('pk', 'row').iterator():
+        entry.is_restart = not json.loads(entry.row)[START_STATE_IDX]
+        entries.append(entry)
+
+    ActionLogEntry.objects.bulk_update(entries, ['is_restart'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dining_room', '0013_user_next_state_response'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='actionlogentry',
+            name='is_restart',
+            field=models.BooleanField(default=False, help_text='Whether the row is a restart marker, instead of an action'),
+        ),
+        migrations.RunPython(set_is_restart, migrations.RunPython.noop),
+    ]
@@ -1,2 +1,2 @@
-from .website import User, UserManager, StudyManagement
+from .website import User, UserManager, StudyManagement, ConditionQuota, PooledAccount, ActionLogEntry
 from .analysis import StudyAction
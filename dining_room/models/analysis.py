@@ -2,19 +2,179 @@
 # heroku
 
 from django.conf import settings
+from django.core import exceptions
 from django.db import models
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
 from django.utils import timezone
+from django.utils.text import capfirst
 from django.utils.translation import gettext_lazy as _
 
-import multiselectfield
+from multiselectfield.db.fields import MSFList
+from multiselectfield.forms.fields import MultiSelectFormField
 
 from .. import constants
 from .domain import State, Transition, Suggestions
 from .website import User, StudyManagement
 
 
+# Custom fields
+
+class BitmaskSetField(models.Field):
+    """
+    A set of choices stored as an integer bitmask. Bit ``i`` of the mask is
+    set if the ``i``th key of the choices is in the set. In python, the value
+    is a list of the keys in the order of the choices, which is the same API
+    as a ``MultiSelectField``. The column is a big integer, but the field is
+    not an integer field, so the admin displays the list of keys
+
+    Use the ``has_any`` lookup to test membership in the DB, e.g.
+    ``filter(diagnoses__has_any=['lost', 'none'])``
+    """
+
+    description = _("Set of choices stored as a bitmask")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.keys = [key for key, _ in self.choices]
+        self.bits = { key: idx for idx, key in enumerate(self.keys) }
+
+    def get_internal_type(self):
+        return 'BigIntegerField'
+
+    @property
+    def flatchoices(self):
+        # Empty, so that the admin does not try to look up the list of values
+        # as a key in the choices
+        return []
+
+    def encode(self, values):
+        """Convert an iterable of keys, or a comma separated string of keys,
+        into a mask"""
+        if isinstance(values, str):
+            values = [x for x in values.split(',') if x]
+
+        mask = 0
+        for value in values:
+            if value not in self.bits:
+                raise ValueError(f"Unknown choice {value} for {self.name}")
+            mask |= (1 << self.bits[value])
+        return mask
+
+    def decode(self, mask):
+        """Convert a mask into the list of keys"""
+        return MSFList(dict(self.choices), [key for idx, key in enumerate(self.keys) if mask & (1 << idx)])
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return self.decode(value)
+
+    def to_python(self, value):
+        if value is None or isinstance(value, MSFList):
+            return value
+        if isinstance(value, int):
+            return self.decode(value)
+        try:
+            return self.decode(self.encode(value))
+        except ValueError as e:
+            raise exceptions.ValidationError(str(e), code='invalid_choice')
+
+    def get_prep_value(self, value):
+        if value is None or isinstance(value, int):
+            return value
+        return self.encode(value)
+
+    def value_to_string(self, obj):
+        value = self.value_from_object(obj)
+        return ','.join(value) if value is not None else ''
+
+    def validate(self, value, model_instance):
+        for key in (value or []):
+            if key not in self.bits:
+                raise exceptions.ValidationError(
+                    self.error_messages['invalid_choice'],
+                    code='invalid_choice',
+                    params={ 'value': key },
+                )
+        if not self.blank and not value:
+            raise exceptions.ValidationError(self.error_messages['blank'], code='blank')
+
+    def formfield(self, **kwargs):
+        defaults = {
+            'required': not self.blank,
+            'label': capfirst(self.verbose_name),
+            'help_text': self.help_text,
+            'choices': self.choices,
+        }
+        defaults.update(kwargs)
+        return MultiSelectFormField(**defaults)
+
+    def contribute_to_class(self, cls, name, **kwargs):
+        super().contribute_to_class(cls, name, **kwargs)
+
+        # Replace the display method for single choices
+        def get_display(obj):
+            value = self.to_python(getattr(obj, name))
+            return str(value) if value is not None else ''
+        setattr(cls, f'get_{name}_display', get_display)
+
+
+@BitmaskSetField.register_lookup
+class HasAny(models.Lookup):
+    """Whether any of the values are in the set"""
+    lookup_name = 'has_any'
+
+    def get_prep_lookup(self):
+        if hasattr(self.rhs, 'resolve_expression'):
+            return self.rhs
+        return self.lhs.output_field.get_prep_value(self.rhs)
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f'({lhs} & {rhs}) != 0', lhs_params + rhs_params
+
+
 # Model for the action streams
 
+class StudyActionQuerySet(models.QuerySet):
+    """
+    Custom queries on the actions
+    """
+
+    def with_action_idx(self):
+        """Annotate the index of each action among the actions of its user in
+        the queryset, so that ``action_idx`` does not need a query"""
+        return self.annotate(_action_idx=Window(
+            expression=RowNumber(),
+            partition_by=[F('user')],
+            order_by=F('start_timestamp').asc()
+        ) - 1)
+
+    def filter_state(self, predicate, field='start_state'):
+        """
+        Filter the actions to those whose state in field ('start_state' or
+        'next_state') satisfies the predicate, a function of a State. For
+        example, ``filter_state(lambda x: x.mislocalized)``. The filter runs
+        in the DB on the codes of the states
+        """
+        codes = [x.code for x in State.all_states() if predicate(x)]
+        return self.filter(**{ f'{field}_code__in': codes })
+
+    def recompute_choices(self, batch_size=1000):
+        """Recompute the choices of the actions (see
+        ``StudyAction.compute_choices``). Returns the number of actions"""
+        actions = []
+        for action in self.iterator():
+            for name, value in StudyAction.compute_choices(action).items():
+                setattr(action, name, value)
+            actions.append(action)
+
+        self.model.objects.bulk_update(actions, StudyAction.CHOICE_FIELDS, batch_size=batch_size)
+        return len(actions)
+
+
 class StudyAction(models.Model):
     """
     A model for the data that we're saving in CSV form in production. We
@@ -31,11 +191,15 @@ class StudyAction(models.Model):
     end_timestamp = models.DateTimeField()       # This is the timestamp on the same row
 
     start_state = models.CharField(max_length=80)
-    diagnoses = multiselectfield.MultiSelectField(choices=tuple(constants.DIAGNOSES.items()))
+    diagnoses = BitmaskSetField(choices=tuple(constants.DIAGNOSES.items()))
     diagnosis_certainty = models.IntegerField()
     action = models.CharField(max_length=20, choices=tuple(constants.ACTIONS.items()))
     next_state = models.CharField(max_length=80, null=True, blank=True)
 
+    # The states as ``State.code``. These are set from the strings on save
+    start_state_code = models.IntegerField(null=True, blank=True, db_index=True)
+    next_state_code = models.IntegerField(null=True, blank=True, db_index=True)
+
     video_loaded_time = models.DateTimeField()
     video_stop_time = models.DateTimeField()
     dx_selected_time = models.DateTimeField()
@@ -46,12 +210,21 @@ class StudyAction(models.Model):
     browser_refreshed = models.BooleanField(default=False)
     corrupted_dx_suggestions = models.BooleanField(default=False)
     corrupted_ax_suggestions = models.BooleanField(default=False)
-    dx_suggestions = multiselectfield.MultiSelectField(choices=tuple(constants.DIAGNOSES.items()), blank=True, null=True)
-    ax_suggestions = multiselectfield.MultiSelectField(choices=tuple(constants.ACTIONS.items()), blank=True, null=True)
+    dx_suggestions = BitmaskSetField(choices=tuple(constants.DIAGNOSES.items()), blank=True, null=True)
+    ax_suggestions = BitmaskSetField(choices=tuple(constants.ACTIONS.items()), blank=True, null=True)
+
+    # Whether the choices followed the suggestions and were optimal. These are
+    # computed on save, and with the recompute_action_choices command
+    chose_dx_suggestion = models.BooleanField(null=True, blank=True, db_index=True)
+    chose_ax_suggestion = models.BooleanField(null=True, blank=True, db_index=True)
+    chose_dx_optimal = models.BooleanField(null=True, blank=True, db_index=True)
+    chose_ax_optimal = models.BooleanField(null=True, blank=True, db_index=True)
 
-    # Cached property
+    # Cached property. Can be annotated with ``with_action_idx``
     _action_idx = None
 
+    objects = StudyActionQuerySet.as_manager()
+
     # Fields that should not be part of the JSON action information
     NOT_CSV_HEADER_FIELDS = [
         'id',
@@ -61,10 +234,19 @@ class StudyAction(models.Model):
         'browser_refreshed',
         'dx_suggestions',
         'ax_suggestions',
+        'start_state_code',
+        'next_state_code',
+        'chose_dx_suggestion',
+        'chose_ax_suggestion',
+        'chose_dx_optimal',
+        'chose_ax_optimal',
         # The corrupted flags should be populated post-processing, but they
         # are now forever part of the CSV header
     ]
 
+    # The fields that are set by compute_choices
+    CHOICE_FIELDS = ['chose_dx_suggestion', 'chose_ax_suggestion', 'chose_dx_optimal', 'chose_ax_optimal']
+
     class Meta:
         verbose_name = _('study action')
         verbose_name_plural = _('study actions')
@@ -81,6 +263,25 @@ class StudyAction(models.Model):
         """
         return [x.name for x in StudyAction._meta.get_fields() if x.name not in StudyAction.NOT_CSV_HEADER_FIELDS]
 
+    def save(self, *args, **kwargs):
+        """Set the codes of the states from their strings, and the choices,
+        before saving"""
+        self.start_state_code = State.from_repr(self.start_state).code if self.start_state else None
+        self.next_state_code = State.from_repr(self.next_state).code if self.next_state else None
+        for name, value in StudyAction.compute_choices(self).items():
+            setattr(self, name, value)
+        super().save(*args, **kwargs)
+
+    def get_start_state(self):
+        """Get the start State of the action"""
+        return State(self.start_state_code) if self.start_state_code is not None else State.from_repr(self.start_state)
+
+    def get_next_state(self):
+        """Get the next State of the action, or None"""
+        if self.next_state_code is not None:
+            return State(self.next_state_code)
+        return State.from_repr(self.next_state) if self.next_state else None
+
     @property
     def action_idx(self):
         """Get the action index for the given user"""
@@ -105,32 +306,28 @@ class StudyAction(models.Model):
     def decision_duration(self):
         return (self.ax_selected_time - self.video_stop_time) if self.video_stop_time is not None else None
 
-    @property
-    def chose_dx_suggestion(self):
-        if self.diagnoses is None or self.dx_suggestions is None:
-            return None
-        return len(set(self.diagnoses) & set(self.dx_suggestions)) > 0
+    @staticmethod
+    def compute_choices(action):
+        """
+        Compute whether the choices in the action followed the suggestions and
+        were optimal. Returns a dictionary of the values of the ``CHOICE_FIELDS``
+        """
+        choices = dict.fromkeys(StudyAction.CHOICE_FIELDS)
+        diagnoses = StudyAction._meta.get_field('diagnoses')
+
+        if action.diagnoses is not None and action.dx_suggestions is not None:
+            choices['chose_dx_suggestion'] = (diagnoses.encode(action.diagnoses) & diagnoses.encode(action.dx_suggestions)) != 0
 
-    @property
-    def chose_ax_suggestion(self):
         # None of the data will hit this. So instead we return 0 (not NA) when
         # there are no AX suggestions
-        if self.action is None or self.ax_suggestions is None:
-            return None
-        return self.action in self.ax_suggestions
+        if action.action is not None and action.ax_suggestions is not None:
+            choices['chose_ax_suggestion'] = action.action in action.ax_suggestions
 
-    @property
-    def chose_dx_optimal(self):
-        if self.start_state is None or self.diagnoses is None:
-            return None
-        state = State(eval(self.start_state))
-        optimal_dx = Suggestions().ordered_diagnoses(state, None, accumulate=True)
-        return len(set(self.diagnoses) & set(optimal_dx)) > 0
+        if action.start_state_code is not None:
+            entry = Suggestions.get_table_entry(State(action.start_state_code))
+            if action.diagnoses is not None:
+                choices['chose_dx_optimal'] = (diagnoses.encode(action.diagnoses) & diagnoses.encode(entry.accumulated_diagnoses)) != 0
+            if action.action is not None:
+                choices['chose_ax_optimal'] = action.action in entry.optimal_action
 
-    @property
-    def chose_ax_optimal(self):
-        if self.start_state is None or self.action is None:
-            return None
-        state = State(eval(self.start_state))
-        optimal_ax = Suggestions().optimal_action(state, None)
-        return self.action in optimal_ax
+        return choices
@@ -4,8 +4,10 @@
 
 import os
 import sys
+import ast
 import copy
 import logging
+import itertools
 import collections
 
 import numpy as np
@@ -80,31 +82,116 @@ class State:
         - if the user is done with the session
 
     Once a state is initialized, subsequent states are dynamically created.
-    """
 
-    # Attributes (private). Use getters and setters instead
-    _base_location = None
-    _object_location = None
-    _jug_state = None
-    _bowl_state = None
-    _mug_state = None
-    _gripper_state = None
-    _current_dt_label = None
+    A state can also be packed into a small integer code (``State.code``),
+    where each attribute occupies a fixed number of bits. The code of a state
+    is always less than ``1 << State.CODE_BITS``
+    """
 
-    def __init__(self, state):
+    # The values of the attributes, in the order of the tuple. The index of a
+    # value in its list is what gets packed into the code
+    CODE_FIELD_VALUES = [
+        constants.LOCATIONS,
+        constants.LOCATIONS[:-1],
+        constants.OBJECT_STATES['jug'],
+        constants.OBJECT_STATES['bowl'],
+        constants.OBJECT_STATES['mug'],
+        [constants.EMPTY_GRIPPER] + constants.OBJECTS,
+        constants.LOCATIONS,
+    ]
+    CODE_FIELD_BITS = [int(np.ceil(np.log2(len(x)))) for x in CODE_FIELD_VALUES]
+    CODE_FIELD_SHIFTS = [int(x) for x in np.cumsum([0] + CODE_FIELD_BITS[:-1])]
+    CODE_BITS = sum(CODE_FIELD_BITS)
+
+    # The names of the attributes, in the order of the tuple
+    FIELDS = (
+        'base_location',
+        'object_location',
+        'jug_state',
+        'bowl_state',
+        'mug_state',
+        'gripper_state',
+        'current_dt_label',
+    )
+
+    # States are immutable and interned; each distinct state exists only once,
+    # so the inferred attributes are computed at most once per state
+    __slots__ = (
+        '_tuple',
+        '_relocalized_base_location',
+        '_visible_objects',
+        '_graspable_objects',
+    )
+    _interned = {}
+
+    def __new__(cls, state):
         """
-        Given a 7 tuple of the state, create a State object
+        Given a 7 tuple of the state, get the State object. The state can
+        also be specified as a '.' separated string or as an integer code
         """
-        if isinstance(state, (list, tuple,)):
-            assert len(state) == 7
-            self.tuple = state
-        elif isinstance(state, State):
-            self.tuple = state.tuple
+        if isinstance(state, State):
+            return state
+        elif isinstance(state, (list, tuple,)):
+            state = tuple(state)
+        elif isinstance(state, str):
+            state = tuple(state.split('.'))
+        elif isinstance(state, (int, np.integer,)):
+            state = State.decode(state)
         else:
             raise NotImplementedError("Unknown type: {}".format(state))
 
+        # Return the interned state if it exists
+        interned_state = State._interned.get(state)
+        if interned_state is not None:
+            return interned_state
+
+        # Otherwise, validate the state and intern it
+        assert len(state) == len(State.FIELDS), state
+        base_location, object_location, jug_state, bowl_state, mug_state, gripper_state, current_dt_label = state
+        assert base_location in constants.LOCATIONS, base_location
+        assert object_location in constants.LOCATIONS[:-1], object_location
+        assert jug_state in constants.OBJECT_STATES['jug'], jug_state
+        assert bowl_state in constants.OBJECT_STATES['bowl'], bowl_state
+        assert mug_state in constants.OBJECT_STATES['mug'], mug_state
+        assert gripper_state is None or gripper_state in (constants.OBJECTS + [constants.EMPTY_GRIPPER]), gripper_state
+        assert current_dt_label in constants.LOCATIONS, current_dt_label
+
+        interned_state = super().__new__(cls)
+        object.__setattr__(interned_state, '_tuple', (
+            base_location,
+            object_location,
+            jug_state,
+            bowl_state,
+            mug_state,
+            gripper_state or constants.EMPTY_GRIPPER,
+            current_dt_label,
+        ))
+        object.__setattr__(interned_state, '_relocalized_base_location', None)
+        object.__setattr__(interned_state, '_visible_objects', None)
+        object.__setattr__(interned_state, '_graspable_objects', None)
+
+        # The normalized tuple and the given tuple both map to the state
+        interned_state = State._interned.setdefault(interned_state._tuple, interned_state)
+        State._interned.setdefault(state, interned_state)
+        return interned_state
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"State is immutable; cannot set {name}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"State is immutable; cannot delete {name}")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (State, (self._tuple,))
+
     def __eq__(self, other):
-        return isinstance(other, State) and (self.tuple == other.tuple)
+        return self is other or (isinstance(other, State) and (self._tuple == other._tuple))
 
     def __ne__(self, other):
         if not isinstance(other, State):
@@ -113,7 +200,7 @@ class State:
             return not self.__eq__(other)
 
     def __hash__(self):
-        return hash(self.tuple)
+        return hash(self._tuple)
 
     def __str__(self):
         return str((
@@ -127,107 +214,109 @@ class State:
         ))
 
     def __repr__(self):
-        return str(self.tuple)
+        return str(self._tuple)
 
     # Attributes
     @property
     def base_location(self):
         """The true location of the robot base"""
-        return self._base_location
-
-    @base_location.setter
-    def base_location(self, value):
-        assert value in constants.LOCATIONS, value
-        self._base_location = value
+        return self._tuple[0]
 
     @property
     def object_location(self):
         """The true location of the objects"""
-        return self._object_location
-
-    @object_location.setter
-    def object_location(self, value):
-        assert value in constants.LOCATIONS[:-1], value
-        self._object_location = value
+        return self._tuple[1]
 
     @property
     def jug_state(self):
         """The state of the jug"""
-        return self._jug_state
-
-    @jug_state.setter
-    def jug_state(self, value):
-        assert value in constants.OBJECT_STATES['jug'], value
-        self._jug_state = value
+        return self._tuple[2]
 
     @property
     def bowl_state(self):
         """The state of the bowl"""
-        return self._bowl_state
-
-    @bowl_state.setter
-    def bowl_state(self, value):
-        assert value in constants.OBJECT_STATES['bowl'], value
-        self._bowl_state = value
+        return self._tuple[3]
 
     @property
     def mug_state(self):
         """The state of the mug"""
-        return self._mug_state
-
-    @mug_state.setter
-    def mug_state(self, value):
-        assert value in constants.OBJECT_STATES['mug'], value
-        self._mug_state = value
+        return self._tuple[4]
 
     @property
     def gripper_state(self):
         """The state of the gripper"""
-        return self._gripper_state
-
-    @gripper_state.setter
-    def gripper_state(self, value):
-        assert value is None or value in (constants.OBJECTS + [constants.EMPTY_GRIPPER]), value
-        self._gripper_state = value or constants.EMPTY_GRIPPER
+        return self._tuple[5]
 
     @property
     def current_dt_label(self):
         """
         The current mapping of the dining table; used to look up localization
         """
-        return self._current_dt_label
-
-    @current_dt_label.setter
-    def current_dt_label(self, value):
-        assert value in constants.LOCATIONS, value
-        self._current_dt_label = value
+        return self._tuple[6]
 
     # Inferred attributes
     @property
     def tuple(self):
         """A tuple representation of the state"""
-        return (
-            self.base_location,
-            self.object_location,
-            self.jug_state,
-            self.bowl_state,
-            self.mug_state,
-            self.gripper_state,
-            self.current_dt_label,
-        )
+        return self._tuple
+
+    @property
+    def string(self):
+        """A '.' separated string representation of the state"""
+        return '.'.join(self._tuple)
+
+    @property
+    def code(self):
+        """An integer representation of the state"""
+        return State.encode(self._tuple)
+
+    @staticmethod
+    def encode(state_tuple):
+        """Pack a state tuple into an integer code"""
+        code = 0
+        for value, values, shift in zip(state_tuple, State.CODE_FIELD_VALUES, State.CODE_FIELD_SHIFTS):
+            code |= values.index(value) << shift
+        return code
 
-    @tuple.setter
-    def tuple(self, value):
-        assert len(value) == len(self.tuple), value
-        self.base_location, self.object_location, self.jug_state, self.bowl_state, self.mug_state, self.gripper_state, self.current_dt_label = value
+    @staticmethod
+    def decode(code):
+        """Unpack an integer code into a state tuple. Raise a ValueError if the
+        code does not correspond to a state"""
+        code = int(code)
+        if code < 0 or (code >> State.CODE_BITS) > 0:
+            raise ValueError(f"Invalid state code: {code}")
+
+        state_tuple = []
+        for values, bits, shift in zip(State.CODE_FIELD_VALUES, State.CODE_FIELD_BITS, State.CODE_FIELD_SHIFTS):
+            value_idx = (code >> shift) & ((1 << bits) - 1)
+            if value_idx >= len(values):
+                raise ValueError(f"Invalid state code: {code}")
+            state_tuple.append(values[value_idx])
+
+        return tuple(state_tuple)
+
+    @staticmethod
+    def from_repr(state_repr):
+        """Get the State from its ``repr`` (the string of its tuple), as it is
+        saved in the CSV files. Raise a ValueError if the string is malformed"""
+        return State(ast.literal_eval(state_repr))
+
+    @staticmethod
+    def all_states():
+        """Get a list of all the states that can be represented by a code,
+        including those that are not reachable"""
+        return [State(x) for x in itertools.product(*State.CODE_FIELD_VALUES)]
 
     @property
     def relocalized_base_location(self):
         """The label of the robot's current location"""
-        current_location = constants.LOCATION_NAMES[self.base_location]
-        dt_mapping = constants.LOCATION_NAMES[self.current_dt_label]
-        relocalized_base_location = constants.LOCATION_MAPPINGS['dining_table_to_' + dt_mapping][current_location]
-        return relocalized_base_location
+        if self._relocalized_base_location is None:
+            current_location = constants.LOCATION_NAMES[self.base_location]
+            dt_mapping = constants.LOCATION_NAMES[self.current_dt_label]
+            relocalized_base_location = constants.LOCATION_MAPPINGS['dining_table_to_' + dt_mapping][current_location]
+            object.__setattr__(self, '_relocalized_base_location', relocalized_base_location)
+
+        return self._relocalized_base_location
 
     @property
     def mislocalized(self):
@@ -242,37 +331,42 @@ class State:
     @property
     def visible_objects(self):
         """The objects that are 'visible' to the robot"""
-        visible_objects = []
-        if self.base_location == self.object_location:
-            if self.jug_state != 'gripper' and not (self.mug_state == 'gripper' and self.object_location == 'dt'):
-                visible_objects.append('jug')
+        if self._visible_objects is None:
+            visible_objects = []
+            if self.base_location == self.object_location:
+                if self.jug_state != 'gripper' and not (self.mug_state == 'gripper' and self.object_location == 'dt'):
+                    visible_objects.append('jug')
 
-            if self.bowl_state != 'gripper' and not (self.mug_state == 'gripper' and self.object_location == 'kc' and self.jug_state == 'gripper'):
-                visible_objects.append('bowl')
+                if self.bowl_state != 'gripper' and not (self.mug_state == 'gripper' and self.object_location == 'kc' and self.jug_state == 'gripper'):
+                    visible_objects.append('bowl')
 
-            if self.mug_state == 'default' and self.jug_state != 'occluding':
-                visible_objects.append('mug')
+                if self.mug_state == 'default' and self.jug_state != 'occluding':
+                    visible_objects.append('mug')
 
-        return visible_objects
+            object.__setattr__(self, '_visible_objects', tuple(visible_objects))
+
+        return self._visible_objects
 
     @property
     def graspable_objects(self):
         """The objects that the robot can pick up given the state"""
-        graspable_objects = []
-        if self.gripper_empty and self.base_location == self.object_location:
-            # Cache the visible objects
-            visible_objects = self.visible_objects
+        if self._graspable_objects is None:
+            graspable_objects = []
+            if self.gripper_empty and self.base_location == self.object_location:
+                visible_objects = self.visible_objects
+
+                if 'jug' in visible_objects:
+                    graspable_objects.append('jug')
 
-            if 'jug' in visible_objects:
-                graspable_objects.append('jug')
+                if 'bowl' in visible_objects and (self.jug_state != 'occluding' or self.bowl_state != 'above_mug'):
+                    graspable_objects.append('bowl')
 
-            if 'bowl' in visible_objects and (self.jug_state != 'occluding' or self.bowl_state != 'above_mug'):
-                graspable_objects.append('bowl')
+                if 'mug' in visible_objects and self.bowl_state != 'above_mug':
+                    graspable_objects.append('mug')
 
-            if 'mug' in visible_objects and self.bowl_state != 'above_mug':
-                graspable_objects.append('mug')
+            object.__setattr__(self, '_graspable_objects', tuple(graspable_objects))
 
-        return graspable_objects
+        return self._graspable_objects
 
     @property
     def is_end_state(self):
@@ -284,6 +378,11 @@ class State:
             and self.current_dt_label == 'dt'
         )
 
+    def replace(self, **fields):
+        """Get the state that results from replacing the given attributes"""
+        assert set(fields.keys()) <= set(State.FIELDS), fields
+        return State(tuple(fields.get(name, value) for name, value in zip(State.FIELDS, self._tuple)))
+
     # Methods on states
     def get_valid_actions(self):
         """
@@ -348,6 +447,9 @@ class Transition:
     _action = None
     _end_state = None
 
+    # A manifest of the video names of transitions: transition tuple -> name
+    VIDEO_MANIFEST = {}
+
     def __init__(self, start_state, action, end_state):
         self.start_state = start_state
         self.action = action
@@ -419,7 +521,16 @@ class Transition:
 
     @property
     def video_name(self):
-        """The name of the video file to use"""
+        """The name of the video file to use. The names are compiled into the
+        video manifest the first time that they are requested"""
+        key = self.tuple
+        video_name = Transition.VIDEO_MANIFEST.get(key)
+        if video_name is None:
+            video_name = Transition.VIDEO_MANIFEST.setdefault(key, self._get_video_name())
+        return video_name
+
+    def _get_video_name(self):
+        """Run the rules to get the name of the video file to use"""
         # If this is the start, then we should be using the end state to
         # determine the video name. Else use the start state
         action = self.action
@@ -449,9 +560,8 @@ class Transition:
                 location_name = action[len('go_to_'):]
 
             location_name = constants.LOCATION_NAMES[location_name]
-            dt_mapping = constants.LOCATION_MAPPINGS['dining_table_to_' + constants.LOCATION_NAMES[state.current_dt_label]]
-            desired_location = { v: k for k, v in dt_mapping.items() }[location_name]
-            desired_location = constants.LOCATION_NAMES[desired_location]
+            dt_mapping = constants.INVERSE_LOCATION_MAPPINGS['dining_table_to_' + constants.LOCATION_NAMES[state.current_dt_label]]
+            desired_location = constants.LOCATION_NAMES[dt_mapping[location_name]]
 
             # If we are going to be repeating the location, then the action is a
             # noop. Else, we should have a video for the case
@@ -563,8 +673,9 @@ class Transition:
         if state.base_location == 'c' and state.current_dt_label != 'dt' and state.mug_state == 'gripper' and not action.startswith('at_'):
             return end_state
 
-        # Then we use custom rules to update the state according to the action
-        end_state = State(state)
+        # Then we use custom rules to update the state according to the action.
+        # States are immutable, so the end state is the state unless replaced
+        end_state = state
 
         # Idempotent mappings of AT(X), GOTO(X), LOOK_AT(X) if we are at X
         # (according to the localization) are allowed
@@ -579,16 +690,15 @@ class Transition:
             # Find the appropriate mapping and set the end state to that
             for mapping_name, mapping in constants.LOCATION_MAPPINGS.items():
                 if mapping[base_location] == location_name:
-                    end_state.current_dt_label = constants.LOCATION_NAMES[mapping['dining_table']]
+                    end_state = state.replace(current_dt_label=constants.LOCATION_NAMES[mapping['dining_table']])
                     break
 
         # Update the robot's position
         elif action.startswith('go_to_'):
-            dt_mapping = constants.LOCATION_MAPPINGS['dining_table_to_' + constants.LOCATION_NAMES[state.current_dt_label]]
+            dt_mapping = constants.INVERSE_LOCATION_MAPPINGS['dining_table_to_' + constants.LOCATION_NAMES[state.current_dt_label]]
             location_name = constants.LOCATION_NAMES[location_name]
-            desired_location = { v: k for k,v in dt_mapping.items() }[location_name]
-            desired_location = constants.LOCATION_NAMES[desired_location]
-            end_state.base_location = desired_location
+            desired_location = constants.LOCATION_NAMES[dt_mapping[location_name]]
+            end_state = state.replace(base_location=desired_location)
 
         # Look at does nothing to the state itself
         elif action.startswith('look_at_'):
@@ -596,12 +706,11 @@ class Transition:
 
         # Update the object states based on the objects that are picked
         elif action.startswith('pick_'):
-            end_state.gripper_state = object_name
-            setattr(end_state, object_name + '_state', 'gripper')
+            end_state = state.replace(gripper_state=object_name, **{ object_name + '_state': 'gripper' })
 
         # Update the object states based on the object that was picked
         elif action == 'place':
-            end_state.gripper_state = constants.EMPTY_GRIPPER
+            end_state = state.replace(gripper_state=constants.EMPTY_GRIPPER)
 
         # If this is a restart of the camera, pretend as if that has happened
         elif action == 'restart_video':
@@ -616,11 +725,31 @@ class Transition:
         return end_state
 
 
+# The suggestions that are applicable in a state. The entries are tuples:
+#   - optimal_action: output of ``Suggestions.optimal_action``
+#   - ordered_diagnoses: output of ``Suggestions.ordered_diagnoses``
+#   - accumulated_diagnoses: the same, but with accumulate=True
+#   - dx_alternatives: diagnoses that are not in accumulated_diagnoses
+#   - ax_alternatives: valid actions that are not in optimal_action
+#   - valid_actions: all the valid actions in the state
+SuggestionsTableEntry = collections.namedtuple('SuggestionsTableEntry', [
+    'optimal_action',
+    'ordered_diagnoses',
+    'accumulated_diagnoses',
+    'dx_alternatives',
+    'ax_alternatives',
+    'valid_actions',
+])
+
+
 class Suggestions:
     """
     A class to provide suggestions. It can be initialized with a maximum number
     of suggestions, and whether to pad the suggestions on output. On the website
     these configs can be obtained from the user / study management object
+
+    The suggestions are pure functions of the state, so they are computed once
+    per state and stored in ``Suggestions.TABLE``
     """
 
     DEFAULT_MAX_DX_SUGGESTIONS = 1
@@ -631,10 +760,14 @@ class Suggestions:
     # Parameters that we cannot change
     DEFAULT_RNG_SEED = 0x1337
     RNG_STATE_SAVE_MODULO = int(1e5)
+    RNG_KEY_MASK = (1 << 64) - 1
 
     DX_CORRUPT_IDX_OFFSETS = [1, 4, 8]
     AX_CORRUPT_IDX_OFFSETS = [1, 4, 8]
 
+    # The precomputed suggestions: state -> SuggestionsTableEntry
+    TABLE = {}
+
     def __init__(self,
         user=None,
         max_dx_suggestions=DEFAULT_MAX_DX_SUGGESTIONS,
@@ -654,16 +787,23 @@ class Suggestions:
         self.user = user if user is not None and user.is_authenticated else None
         use_defaults = (user is None or not user.is_authenticated)
 
-        self.max_dx_suggestions = max_dx_suggestions if use_defaults else user.study_management.max_dx_suggestions
-        self.max_ax_suggestions = max_ax_suggestions if use_defaults else user.study_management.max_ax_suggestions
-        self.pad_suggestions = pad_suggestions if use_defaults else user.study_management.pad_suggestions
+        study_management = None if use_defaults else user.cached_study_management
+        self.max_dx_suggestions = max_dx_suggestions if use_defaults else study_management.max_dx_suggestions
+        self.max_ax_suggestions = max_ax_suggestions if use_defaults else study_management.max_ax_suggestions
+        self.pad_suggestions = pad_suggestions if use_defaults else study_management.pad_suggestions
         self.noise_level = noise_level if use_defaults else user.noise_level
 
         self.show_dx_suggestions = True if use_defaults else user.show_dx_suggestions
         self.show_ax_suggestions = True if use_defaults else user.show_ax_suggestions
 
-        # Create an rng
-        self.rng = np.random.default_rng(Suggestions.DEFAULT_RNG_SEED if use_defaults else user.rng_state)
+        # Create an rng. The counter-based rng needs no saved state; the legacy
+        # rng is seeded from the state that was saved on the previous request
+        self.counter_rng = False if use_defaults else study_management.counter_rng
+        if self.counter_rng:
+            rng_user = user.replay_of or user
+            self.rng = Suggestions.get_counter_rng(rng_user.pk, user.number_state_requests)
+        else:
+            self.rng = np.random.default_rng(Suggestions.DEFAULT_RNG_SEED if use_defaults else user.rng_state)
 
     @staticmethod
     def get_next_rng_seed(rng):
@@ -671,6 +811,34 @@ class Suggestions:
         is reinitialized from scratch"""
         return rng.bit_generator.state['state']['state'] % Suggestions.RNG_STATE_SAVE_MODULO
 
+    @staticmethod
+    def get_counter_rng(user_id, request_number):
+        """Get the counter-based rng for a user's request. The draws for any
+        request can be recreated from just the user id and the request number
+        (``User.number_state_requests``)"""
+        key = [user_id & Suggestions.RNG_KEY_MASK, request_number & Suggestions.RNG_KEY_MASK]
+        return np.random.Generator(np.random.Philox(key=key))
+
+    @staticmethod
+    def get_table_entry(state):
+        """Get the SuggestionsTableEntry for the state, computing it if it is
+        not already in the table"""
+        entry = Suggestions.TABLE.get(state)
+        if entry is None:
+            optimal_action = Suggestions._get_optimal_action(state)
+            accumulated_diagnoses = Suggestions._get_ordered_diagnoses(state, accumulate=True)
+            valid_actions = tuple(k for k, v in state.get_valid_actions().items() if v)
+            entry = Suggestions.TABLE.setdefault(state, SuggestionsTableEntry(
+                optimal_action,
+                Suggestions._get_ordered_diagnoses(state, accumulate=False),
+                accumulated_diagnoses,
+                tuple(x for x in constants.DIAGNOSES.keys() if x not in accumulated_diagnoses),
+                tuple(x for x in valid_actions if x not in optimal_action),
+                valid_actions,
+            ))
+
+        return entry
+
     def optimal_action(self, state, action):
         """
         Suggest the optimal action to take given the state of the system. This
@@ -684,6 +852,11 @@ class Suggestions:
           suggestions (list of str) : the suggestions appropriate to the condition
               represented by the function
         """
+        return list(Suggestions.get_table_entry(state).optimal_action)
+
+    @staticmethod
+    def _get_optimal_action(state):
+        """Run the heuristics for ``optimal_action``. Returns a tuple"""
         suggestions = []
 
         # If we've completed the scenario, then don't suggest anything
@@ -719,7 +892,7 @@ class Suggestions:
             suggestions.append(f'go_to_{state.object_location}')
 
         # Return the suggestions
-        return suggestions
+        return tuple(suggestions)
 
     def ordered_diagnoses(self, state, action, accumulate=False):
         """
@@ -741,6 +914,12 @@ class Suggestions:
           suggestions (list of str) : the suggestions appropriate to the condition
               represented by the function
         """
+        entry = Suggestions.get_table_entry(state)
+        return list(entry.accumulated_diagnoses if accumulate else entry.ordered_diagnoses)
+
+    @staticmethod
+    def _get_ordered_diagnoses(state, accumulate):
+        """Run the rules for ``ordered_diagnoses``. Returns a tuple"""
         suggestions = []
 
         # An expression to check if we should return multiple diagnoses
@@ -775,7 +954,7 @@ class Suggestions:
             suggestions.append('none')
 
         # Return the suggestions
-        return suggestions
+        return tuple(suggestions)
 
     def _should_corrupt(self, offsets):
         """
@@ -836,16 +1015,16 @@ class Suggestions:
         Returns:
           suggestions (list of str) : the suggestions
         """
+        entry = Suggestions.get_table_entry(state)
         if self.show_dx_suggestions:
-            suggestions = self.ordered_diagnoses(state, action, accumulate=True)
+            suggestions = entry.accumulated_diagnoses
+            alternatives = entry.dx_alternatives
         else:
-            suggestions = []
+            suggestions = ()
+            alternatives = tuple(constants.DIAGNOSES.keys())
 
         # Limit the number to the maximum number of diagnoses
-        limited_suggestions = suggestions[:self.max_dx_suggestions]
-
-        # Alternative suggestions
-        alternatives = [x for x in constants.DIAGNOSES.keys() if x not in suggestions]
+        limited_suggestions = list(suggestions[:self.max_dx_suggestions])
 
         # Add noise and pad. We pad if there is no problem as well
         suggestions = self._add_noise_and_pad(
@@ -856,9 +1035,8 @@ class Suggestions:
         )
 
         # Update the user's rng state
-        if self.user is not None:
-            self.user.rng_state = Suggestions.get_next_rng_seed(self.rng)
-            self.user.save()
+        if self.user is not None and not self.counter_rng:
+            self.user.update(rng_state=Suggestions.get_next_rng_seed(self.rng))
 
         # Return the diagnoses
         return suggestions
@@ -876,17 +1054,17 @@ class Suggestions:
         Returns:
           suggestions (list of str) : the suggestions
         """
+        entry = Suggestions.get_table_entry(state)
         if self.show_ax_suggestions:
-            suggestions = self.optimal_action(state, action)
+            suggestions = entry.optimal_action
+            alternatives = entry.ax_alternatives
         else:
-            suggestions = []
+            suggestions = ()
+            alternatives = entry.valid_actions
 
-        # Limit the number to the maximum number of diagnoses
-        limited_suggestions = suggestions[:self.max_ax_suggestions]
-
-        # Alternative suggestions. We don't treat SA actions separately
-        valid_actions_check = state.get_valid_actions()
-        alternatives = [k for k, v in valid_actions_check.items() if (k not in suggestions and v)]
+        # Limit the number to the maximum number of diagnoses. The alternative
+        # suggestions are the valid actions; we don't treat SA actions separately
+        limited_suggestions = list(suggestions[:self.max_ax_suggestions])
 
         # Add noise and pad
         suggestions = self._add_noise_and_pad(
@@ -897,9 +1075,8 @@ class Suggestions:
         )
 
         # Update the user's rng state
-        if self.user is not None:
-            self.user.rng_state = Suggestions.get_next_rng_seed(self.rng)
-            self.user.save()
+        if self.user is not None and not self.counter_rng:
+            self.user.update(rng_state=Suggestions.get_next_rng_seed(self.rng))
 
         # Return the actions
         return suggestions
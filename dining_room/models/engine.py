@@ -0,0 +1,259 @@
+#!/usr/bin/env python
+# A compiled version of the Dining Room domain. The rules in `domain` are
+# evaluated once for every state that is reachable from the start conditions,
+# and the results are stored in dense integer-indexed tables
+
+import logging
+import threading
+import collections
+
+import numpy as np
+
+from .. import constants
+from .domain import State, Transition, Suggestions
+
+
+logger = logging.getLogger(__name__)
+
+
+# The result of taking a single step in the compiled domain
+
+Step = collections.namedtuple('Step', ['end_state', 'action_result', 'arm_status', 'video_name'])
+
+
+class TransitionTable:
+    """
+    Enumerates all the states that are reachable from a set of start states,
+    and precomputes the following for every (state, action) pair:
+
+        - the index of the end state (``INVALID`` if the action is not
+            applicable in the state)
+        - whether the action should be shown as valid in the UI (the output of
+            ``State.get_valid_actions``)
+        - the index of the arm status in ``constants.ARM_STATUS``
+        - the index of the name of the video to show in ``videos``
+
+    The suggestions for every state are also precomputed into
+    ``Suggestions.TABLE`` when the state is compiled.
+
+    The tables are indexed by the index of the state in ``states`` and the
+    index of the action in ``constants.ACTIONS``. The results are exactly the
+    same as those from ``Transition.get_end_state``, ``State.get_valid_actions``
+    and ``Transition.video_name``. States that are not in the table are
+    compiled into it the first time that they are encountered.
+
+    For batch processing, states and actions can also be referred to by their
+    integer codes; the code of a state is ``State.code``, and the code of an
+    action is its index in ``constants.ACTIONS``.
+    """
+
+    # The actions in the order of the columns of the tables
+    ACTIONS = list(constants.ACTIONS.keys())
+    ACTION_IDX = { action: idx for idx, action in enumerate(ACTIONS) }
+
+    # The value of an invalid transition in the end state table
+    INVALID = -1
+
+    def __init__(self, start_states):
+        """
+        Create the tables given an iterable of start states. Each start state
+        can be a State, a 7 tuple, or a '.' separated string
+        """
+        self.states = []
+        self.state_idx = {}
+        self.videos = []
+        self.video_idx = {}
+
+        # The tables. Initialized in _compile
+        self.codes = self.code_idx = None
+        self.end_states = self.valid_actions = self.arm_statuses = None
+        self.video_names = self.noop_video_names = None
+
+        # Lock to add states to the tables
+        self._lock = threading.Lock()
+        self._compile([State(x) for x in start_states])
+
+    def __len__(self):
+        return len(self.states)
+
+    def __contains__(self, state):
+        return State(state).tuple in self.state_idx
+
+    def _get_video_idx(self, video_name):
+        """Get the index of a video, adding it to the list if necessary"""
+        if video_name not in self.video_idx:
+            self.video_idx[video_name] = len(self.videos)
+            self.videos.append(video_name)
+        return self.video_idx[video_name]
+
+    def _compile(self, start_states):
+        """Run a breadth first search from the start states and add the results
+        of the rules in the domain to the tables"""
+        states, state_idx = list(self.states), dict(self.state_idx)
+        end_states, valid_actions, arm_statuses, video_names, noop_video_names = [], [], [], [], []
+
+        def add_state(state):
+            if state.tuple not in state_idx:
+                state_idx[state.tuple] = len(states)
+                states.append(state)
+                queue.append(state)
+            return state_idx[state.tuple]
+
+        queue = collections.deque()
+        for state in start_states:
+            add_state(state)
+
+        while len(queue) > 0:
+            state = queue.popleft()
+            noop_transition = Transition(None, None, state)
+            noop_video_names.append(self._get_video_idx(noop_transition.video_name))
+            Suggestions.get_table_entry(state)
+
+            # Get the information on the transitions out of this state
+            valid_actions_check = state.get_valid_actions()
+            end_states_row, arm_statuses_row, video_names_row = [], [], []
+            for action in TransitionTable.ACTIONS:
+                end_state = Transition.get_end_state(state, action)
+                if end_state is None:
+                    end_states_row.append(TransitionTable.INVALID)
+                    transition = noop_transition
+                else:
+                    end_states_row.append(add_state(end_state))
+                    transition = Transition(state, action, end_state)
+
+                arm_statuses_row.append(constants.ARM_STATUS.index(transition.arm_status))
+                video_names_row.append(self._get_video_idx(transition.video_name))
+
+            end_states.append(end_states_row)
+            valid_actions.append([valid_actions_check[x] for x in TransitionTable.ACTIONS])
+            arm_statuses.append(arm_statuses_row)
+            video_names.append(video_names_row)
+
+        # Append to the tables. Rows of existing states never refer to the new
+        # states, so we only need to make the new states visible to lookups
+        # after the tables have been updated
+        def extend(table, rows, dtype):
+            rows = np.asarray(rows, dtype=dtype)
+            return rows if table is None else np.concatenate([table, rows])
+
+        num_actions = len(TransitionTable.ACTIONS)
+        codes = np.array([x.code for x in states], dtype=np.int32)
+        code_idx = np.full(1 << State.CODE_BITS, TransitionTable.INVALID, dtype=np.int32)
+        code_idx[codes] = np.arange(len(states), dtype=np.int32)
+
+        self.states = states
+        self.codes = codes
+        self.end_states = extend(self.end_states, np.reshape(end_states, (-1, num_actions)), np.int16)
+        self.valid_actions = extend(self.valid_actions, np.reshape(valid_actions, (-1, num_actions)), bool)
+        self.arm_statuses = extend(self.arm_statuses, np.reshape(arm_statuses, (-1, num_actions)), np.uint8)
+        self.video_names = extend(self.video_names, np.reshape(video_names, (-1, num_actions)), np.int32)
+        self.noop_video_names = extend(self.noop_video_names, noop_video_names, np.int32)
+        self.code_idx = code_idx
+        self.state_idx = state_idx
+
+        logger.debug(f"Compiled {len(self.states)} states and {len(self.videos)} videos")
+
+    def add_states(self, states):
+        """Add the states, and the states reachable from them, to the tables"""
+        with self._lock:
+            states = [State(x) for x in states]
+            states = [x for x in states if x.tuple not in self.state_idx]
+            if len(states) > 0:
+                self._compile(states)
+
+    def index(self, state):
+        """Get the index of the state in the tables, adding it if necessary"""
+        state = State(state)
+        if state.tuple not in self.state_idx:
+            self.add_states([state])
+        return self.state_idx[state.tuple]
+
+    def get_end_state(self, state, action):
+        """The same as ``Transition.get_end_state``"""
+        state_idx = self.index(state)
+        end_state_idx = self.end_states[state_idx, TransitionTable.ACTION_IDX[action]]
+        return self.states[end_state_idx] if end_state_idx != TransitionTable.INVALID else None
+
+    def get_valid_actions(self, state):
+        """The same as ``State.get_valid_actions``"""
+        state_idx = self.index(state)
+        return dict(zip(TransitionTable.ACTIONS, self.valid_actions[state_idx].tolist()))
+
+    def step(self, state, action):
+        """
+        Take the action in the state. If the action is None, unknown, or not
+        applicable in the state, then the end state is the same as the state,
+        and the step is a noop. Returns a ``Step``
+        """
+        state_idx = self.index(state)
+        if action is None or action not in TransitionTable.ACTION_IDX:
+            return Step(self.states[state_idx], action is None, constants.ARM_STATUS[0], self.videos[self.noop_video_names[state_idx]])
+
+        action_idx = TransitionTable.ACTION_IDX[action]
+        end_state_idx = self.end_states[state_idx, action_idx]
+        return Step(
+            self.states[end_state_idx if end_state_idx != TransitionTable.INVALID else state_idx],
+            bool(end_state_idx != TransitionTable.INVALID),
+            constants.ARM_STATUS[self.arm_statuses[state_idx, action_idx]],
+            self.videos[self.video_names[state_idx, action_idx]]
+        )
+
+    def check_video_links(self, video_links):
+        """
+        Cross-check the videos of the transitions in the table against the
+        names of the videos in ``video_links``. Returns a tuple of sorted lists:
+
+            - the videos in the table that are missing from the links
+            - the videos in the links that are not used by the table
+        """
+        videos = set(self.videos)
+        missing = sorted(videos - set(video_links))
+        unused = sorted(set(video_links) - videos)
+        return missing, unused
+
+    # Batch methods on codes
+    @staticmethod
+    def encode_actions(actions):
+        """Convert an iterable of action names into an array of action codes"""
+        return np.array([TransitionTable.ACTION_IDX[x] for x in actions], dtype=np.int16)
+
+    @staticmethod
+    def encode_states(states):
+        """Convert an iterable of states (in any form accepted by ``State``)
+        into an array of state codes"""
+        return np.array([State(x).code for x in states], dtype=np.int32)
+
+    @staticmethod
+    def decode_states(codes):
+        """Convert an array of state codes into a list of State objects"""
+        return [State(int(x)) for x in np.asarray(codes).ravel()]
+
+    def step_codes(self, state_codes, action_codes):
+        """
+        Take a batch of steps. ``state_codes`` and ``action_codes`` are arrays
+        (of broadcastable shapes) of state and action codes. Returns a tuple of
+        arrays:
+
+            - the codes of the end states. If an action is not applicable in a
+                state, then the end state is the same as the state
+            - a boolean mask of whether the actions were applicable
+
+        State codes that are not in the tables are compiled into them. A
+        ValueError is raised if a code does not correspond to a state
+        """
+        state_codes, action_codes = np.broadcast_arrays(np.asarray(state_codes), np.asarray(action_codes))
+
+        # Make sure that all the states are in the tables
+        if np.any((state_codes < 0) | (state_codes >= len(self.code_idx))):
+            raise ValueError(f"Invalid state codes: {state_codes[(state_codes < 0) | (state_codes >= len(self.code_idx))]}")
+
+        state_idx = self.code_idx[state_codes]
+        if np.any(state_idx == TransitionTable.INVALID):
+            self.add_states([State.decode(x) for x in np.unique(state_codes[state_idx == TransitionTable.INVALID])])
+            state_idx = self.code_idx[state_codes]
+
+        # Then lookup the transitions
+        end_state_idx = self.end_states[state_idx, action_codes]
+        valid = (end_state_idx != TransitionTable.INVALID)
+        end_state_codes = np.where(valid, self.codes[end_state_idx], state_codes)
+        return end_state_codes, valid
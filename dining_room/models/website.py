@@ -1,17 +1,26 @@
 import os
+import time
+import datetime
+import itertools
+import contextlib
 
 from django.conf import settings
 from django.core.validators import MinValueValidator
-from django.db import models
+from django.db import models, transaction, IntegrityError
+from django.db.models import Q, F, Count
 from django.contrib import auth
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import (AbstractBaseUser,
                                         PermissionsMixin, BaseUserManager)
 from django.contrib.auth.validators import ASCIIUsernameValidator
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
 from django.utils import timezone
 from django.utils.crypto import get_random_string, salted_hmac
 from django.utils.translation import gettext_lazy as _
 
 from .. import constants
+from ..hashers import ParticipantPasswordHasher, is_participant_password
 from .domain import State, Transition, Suggestions
 
 
@@ -32,9 +41,18 @@ class StudyManagement(models.Model):
     max_dx_suggestions = models.IntegerField(default=Suggestions.DEFAULT_MAX_DX_SUGGESTIONS, help_text="Max number of diagnosis suggestions to display", validators=[MinValueValidator(1)])
     max_ax_suggestions = models.IntegerField(default=Suggestions.DEFAULT_MAX_AX_SUGGESTIONS, help_text="Max number of action suggestions to display", validators=[MinValueValidator(1)])
     pad_suggestions = models.BooleanField(default=Suggestions.DEFAULT_PAD_SUGGESTIONS, help_text="Pad the suggestions if we don't have enough")
+    counter_rng = models.BooleanField(default=False, help_text="Draw the noise in the suggestions from a counter-based RNG keyed by the user and the request number, instead of from the user's saved RNG state")
 
     _enabled_study_conditions = _enabled_start_conditions = None
 
+    # The process-wide cache of the objects, and the key of its version in the
+    # cache that is shared between the processes. If the cache is not shared,
+    # then the other processes cannot see the changes to the version, so the
+    # objects are reloaded after the timeout (in seconds) instead
+    _cache = None
+    CACHE_VERSION_KEY = 'study_management_version'
+    LOCAL_CACHE_TIMEOUT = 10
+
     class Meta:
         verbose_name = _('study management')
         verbose_name_plural = _('study management')
@@ -63,11 +81,60 @@ class StudyManagement(models.Model):
     def resolved_data_directory(self):
         return os.path.join(settings.DROPBOX_DATA_FOLDER, self.data_directory)
 
+    @staticmethod
+    def _get_cache():
+        """Get the process-wide cache of the study management objects. The
+        cache is reset when the version in the shared cache changes, or after
+        ``LOCAL_CACHE_TIMEOUT`` if the cache is not shared"""
+        version = cache.get(StudyManagement.CACHE_VERSION_KEY)
+        if version is None:
+            cache.add(StudyManagement.CACHE_VERSION_KEY, get_random_string(12), timeout=None)
+            version = cache.get(StudyManagement.CACHE_VERSION_KEY)
+
+        now = time.monotonic()
+        if (
+            StudyManagement._cache is None or
+            StudyManagement._cache['version'] != version or
+            (not settings.CACHE_IS_SHARED and now >= StudyManagement._cache['expires'])
+        ):
+            StudyManagement._cache = {
+                'version': version,
+                'expires': now + StudyManagement.LOCAL_CACHE_TIMEOUT,
+                'default': None,
+                'objects': {},
+            }
+        return StudyManagement._cache
+
+    @staticmethod
+    def invalidate_cache(*args, **kwargs):
+        """Invalidate the cached study management objects in all processes
+        that share the cache; the other processes reload the objects after
+        ``LOCAL_CACHE_TIMEOUT``. Accepts the arguments of a signal receiver"""
+        cache.set(StudyManagement.CACHE_VERSION_KEY, get_random_string(12), timeout=None)
+        StudyManagement._cache = None
+
+    @staticmethod
+    def get_cached(pk):
+        """Get the study management object with the pk from the process-wide
+        cache. The object is shared, so save any changes made to it"""
+        if pk is None:
+            return None
+
+        sm_cache = StudyManagement._get_cache()
+        if pk not in sm_cache['objects']:
+            sm_cache['objects'][pk] = StudyManagement.objects.get(pk=pk)
+        return sm_cache['objects'][pk]
+
     @staticmethod
     def get_default():
         """Get the default study management object that we shall be using. I
-        think this should be a 'manager', but it doesn't really matter now"""
-        return StudyManagement.objects.order_by('-pk')[0]
+        think this should be a 'manager', but it doesn't really matter now.
+        The object is cached as in ``get_cached``"""
+        sm_cache = StudyManagement._get_cache()
+        if sm_cache['default'] is None:
+            sm_cache['default'] = StudyManagement.objects.order_by('-pk')[0]
+            sm_cache['objects'].setdefault(sm_cache['default'].pk, sm_cache['default'])
+        return sm_cache['default']
 
     @staticmethod
     def get_default_pk():
@@ -94,6 +161,10 @@ class StudyManagement(models.Model):
         return condition in self.enabled_start_conditions_list
 
 
+post_save.connect(StudyManagement.invalidate_cache, sender=StudyManagement)
+post_delete.connect(StudyManagement.invalidate_cache, sender=StudyManagement)
+
+
 # Create the model for the user and the associated manager
 
 class UserManager(models.Manager):
@@ -118,7 +189,7 @@ class UserManager(models.Manager):
     def get_by_natural_key(self, username):
         return self.get(**{self.model.USERNAME_FIELD: username})
 
-    def _create_user(self, username, unique_key, password, **extra_fields):
+    def _create_user(self, username, unique_key, password, hasher='default', **extra_fields):
         """
         Create and save a user with the given username, unique_key, and password
         """
@@ -126,16 +197,19 @@ class UserManager(models.Manager):
             raise ValueError("Username must be set")
         username = self.model.normalize_username(username)
         user = self.model(username=username, unique_key=unique_key, **extra_fields)
-        user.set_password(password)
+        user.password = make_password(password, hasher=hasher)
         user.save(using=self._db)
         return user
 
     def create_user(self, username, unique_key, **extra_fields):
+        """Participants' passwords are their usernames, and are hashed with the
+        participant hasher. Staff get the default hasher"""
         extra_fields.setdefault('is_staff', False)
         extra_fields.setdefault('is_superuser', False)
         password = username
         extra_fields.pop('password', None)
-        return self._create_user(username, unique_key, password, **extra_fields)
+        hasher = 'default' if extra_fields['is_staff'] else ParticipantPasswordHasher.algorithm
+        return self._create_user(username, unique_key, password, hasher=hasher, **extra_fields)
 
     def create_superuser(self, username, password, **extra_fields):
         """"""
@@ -156,7 +230,8 @@ class UserManager(models.Manager):
     def with_perm(self, perm, is_active=True, include_superusers=True, backend=None, obj=None):
         """Return a list of users with permissions"""
         if backend is None:
-            backends = auth._get_backends(return_tuples=True)
+            # Only the backends that grant permissions are relevant
+            backends = [x for x in auth._get_backends(return_tuples=True) if hasattr(x[0], 'with_perm')]
             assert len(backends) == 1, f"Expected 1 backend, got: {backends}"
             backend, _ = backends[0]
         elif not isinstance(backend, str):
@@ -337,6 +412,12 @@ class User(AbstractBaseUser, PermissionsMixin):
     # is invoked. This can then be used as the basis for injecting noise
     number_state_requests = models.IntegerField(default=-1)
 
+    # The idempotency key and the JSON response of the last request to
+    # `get_next_state`, so that retries of the request are not processed again
+    # by any of the processes
+    next_state_key = models.CharField(max_length=64, blank=True, null=True)
+    next_state_response = models.TextField(blank=True, null=True)
+
     # Likert Responses
     class LikertResponses(models.IntegerChoices):
         STRONGLY_DISAGREE = 0
@@ -421,16 +502,46 @@ class User(AbstractBaseUser, PermissionsMixin):
     EMAIL_FIELD = 'unique_key'  # Just in case some code actually uses it
     REQUIRED_FIELDS = ['unique_key']
 
+    # Changes that are waiting to be written to the DB. See deferred_updates
+    _pending_updates = _pending_increments = None
+
+    # Whether the user's data was invalid when it was last loaded or saved, or
+    # None if unknown. See _check_invalid_data
+    _saved_invalid_data = None
+
+    # The participant whose requests are being replayed by this user, when the
+    # user is simulating them. The counter-based rng of the suggestions is then
+    # keyed by the participant, so that the replay sees the same suggestions
+    replay_of = None
+
+    # The time since their last login after which a participant that has not
+    # completed the study is considered to have abandoned it
+    ABANDONED_AFTER = datetime.timedelta(minutes=46)
+
     # Associate the manager and the meta information
     objects = UserManager()
 
     class Meta:
         verbose_name = _('user')
         verbose_name_plural = _('users')
+        indexes = [
+            # Used to sweep the participants that have abandoned the study
+            models.Index(
+                fields=['last_login'],
+                name='user_abandoned_idx',
+                condition=Q(is_staff=False, date_survey_completed__isnull=True)
+            ),
+        ]
 
     # Inferred properties that are used by the code to figure out how to render
     # the UI for the user
 
+    @property
+    def cached_study_management(self):
+        """The study management object of the user from the process-wide
+        cache. Use this instead of study_management on the hot paths"""
+        return StudyManagement.get_cached(self.study_management_id)
+
     @property
     def csv_file(self):
         """The CSV file associated with the user's actions"""
@@ -492,6 +603,92 @@ class User(AbstractBaseUser, PermissionsMixin):
         return self.studyaction_set.count()
 
     # Custom methods
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        user = super().from_db(db, field_names, values)
+        if 'ignore_data_reason' in field_names:
+            user._saved_invalid_data = user.invalid_data
+        return user
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._check_invalid_data()
+
+    def _check_invalid_data(self):
+        """Resync the condition quotas if the participant's data has been
+        invalidated or revalidated since it was loaded"""
+        if (
+            not self.is_staff and
+            self._saved_invalid_data is not None and
+            self._saved_invalid_data != self.invalid_data
+        ):
+            ConditionQuota.sync(StudyManagement.get_default())
+        self._saved_invalid_data = self.invalid_data
+
+    def check_password(self, raw_password):
+        """Staff cannot log in with passwords from the participant hasher"""
+        if self.is_staff and is_participant_password(self.password):
+            return False
+        return super().check_password(raw_password)
+
+    @contextlib.contextmanager
+    def deferred_updates(self):
+        """
+        Context manager within which the changes made through ``update`` and
+        ``increment`` are collected, and then written to the DB as a single
+        UPDATE of only the changed fields when the block exits
+        """
+        if self._pending_updates is not None:
+            yield self
+            return
+
+        self._pending_updates, self._pending_increments = {}, {}
+        try:
+            yield self
+        finally:
+            updates = self._pending_updates
+            updates.update({k: F(k) + v for k, v in self._pending_increments.items()})
+            self._pending_updates = self._pending_increments = None
+            self._write_updates(updates)
+
+    def _write_updates(self, updates):
+        """Write the dictionary of updates to the user's row in the DB"""
+        if len(updates) == 0:
+            return
+
+        self.date_modified = updates['date_modified'] = timezone.now()
+        User.objects.filter(pk=self.pk).update(**updates)
+        if 'ignore_data_reason' in updates:
+            self._check_invalid_data()
+
+    def update(self, **fields):
+        """
+        Set the fields on the user and save only those fields to the DB. The
+        save is delayed if we are within ``deferred_updates``
+        """
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+        if self._pending_updates is None:
+            self._write_updates(fields)
+        else:
+            self._pending_updates.update(fields)
+        return self
+
+    def increment(self, name, amount=1):
+        """
+        Increment the value of an integer field. The increment is performed
+        in the DB, so concurrent increments are not lost. The save is delayed
+        if we are within ``deferred_updates``
+        """
+        setattr(self, name, getattr(self, name) + amount)
+
+        if self._pending_increments is None:
+            self._write_updates({ name: F(name) + amount })
+        else:
+            self._pending_increments[name] = self._pending_increments.get(name, 0) + amount
+        return self
+
     def reset_progress(self, *args, **kwargs):
         """
         Reset the state of the user. Accepts the same arguments as save
@@ -508,3 +705,254 @@ class User(AbstractBaseUser, PermissionsMixin):
         self.ignore_data_reason = None
         self.save(*args, **kwargs)
         return self
+
+
+# Model for assigning participants to conditions
+
+class ConditionQuota(models.Model):
+    """
+    The number of participants assigned to each combination of study and start
+    conditions of a study management object; the row with null conditions has
+    the total number of participants. Slots are allocated with row-level locks,
+    so participants can be assigned in parallel.
+
+    The counts are of the valid participants, as in the baseline assignment.
+    ``sync`` recounts them from the users, and runs when a study management
+    object is saved, so that newly enabled conditions get quotas, and when a
+    participant's data is invalidated or revalidated
+    """
+
+    study_management = models.ForeignKey(StudyManagement, on_delete=models.CASCADE)
+    study_condition = models.IntegerField(_('study condition'), blank=True, null=True, choices=User.StudyConditions.choices)
+    start_condition = models.CharField(_('start condition'), max_length=80, blank=True, null=True, choices=User.StartConditions.choices)
+    number_assigned = models.PositiveIntegerField(default=0, help_text="Number of valid participants assigned to the conditions")
+
+    class Meta:
+        verbose_name = _('condition quota')
+        verbose_name_plural = _('condition quotas')
+        unique_together = ('study_management', 'study_condition', 'start_condition')
+
+    def __str__(self):
+        if self.study_condition is None and self.start_condition is None:
+            return f"{self.study_management}: total"
+        return f"{self.study_management}: {self.get_study_condition_display()}, {self.start_condition}"
+
+    @staticmethod
+    def sync(sm):
+        """Recount the valid participants in each of the enabled conditions of
+        the study management object, creating the quotas if necessary"""
+        with transaction.atomic():
+            quotas = {
+                (x.study_condition, x.start_condition): x
+                for x in ConditionQuota.objects.select_for_update().filter(study_management=sm)
+            }
+
+            counts = User.objects.filter(
+                Q(is_staff=False) &
+                (Q(ignore_data_reason__isnull=True) | Q(ignore_data_reason='')) &
+                Q(study_condition__in=sm.enabled_study_conditions_list) &
+                Q(start_condition__in=sm.enabled_start_conditions_list)
+            ).values_list('study_condition', 'start_condition').annotate(Count('pk'))
+            counts = { (study_condition, start_condition): count for study_condition, start_condition, count in counts }
+            counts[(None, None)] = sum(counts.values())
+
+            conditions = [(None, None)] + list(itertools.product(sm.enabled_study_conditions_list, sm.enabled_start_conditions_list))
+            for study_condition, start_condition in conditions:
+                quota = quotas.get((study_condition, start_condition))
+                count = counts.get((study_condition, start_condition), 0)
+                if quota is None:
+                    ConditionQuota.objects.create(study_management=sm, study_condition=study_condition, start_condition=start_condition, number_assigned=count)
+                elif quota.number_assigned != count:
+                    ConditionQuota.objects.filter(pk=quota.pk).update(number_assigned=count)
+
+    @staticmethod
+    def sync_on_save(sender, instance, raw=False, **kwargs):
+        """Sync the quotas of a study management object when it is saved.
+        Accepts the arguments of a signal receiver"""
+        if raw:
+            return
+
+        # The enabled conditions might have changed since they were parsed
+        instance._enabled_study_conditions = instance._enabled_start_conditions = None
+        ConditionQuota.sync(instance)
+
+    @staticmethod
+    def _allocate(sm, skip_locked):
+        """Allocate a slot in the condition with the fewest participants.
+        Returns the (study_condition, start_condition) or None"""
+        with transaction.atomic():
+            quota = ConditionQuota.objects.select_for_update(skip_locked=skip_locked).filter(
+                study_management=sm,
+                study_condition__in=sm.enabled_study_conditions_list,
+                start_condition__in=sm.enabled_start_conditions_list,
+                number_assigned__lt=sm.number_per_condition
+            ).order_by('number_assigned', 'pk').first()
+            if quota is None:
+                return None
+
+            # Check the total number of participants
+            allocated = ConditionQuota.objects.filter(
+                study_management=sm,
+                study_condition__isnull=True,
+                start_condition__isnull=True,
+                number_assigned__lt=sm.max_number_of_people
+            ).update(number_assigned=F('number_assigned') + 1)
+            if not allocated:
+                return None
+
+            ConditionQuota.objects.filter(pk=quota.pk).update(number_assigned=F('number_assigned') + 1)
+            return quota.study_condition, quota.start_condition
+
+    @staticmethod
+    def allocate(sm):
+        """
+        Allocate a slot for a participant in the study management object. If
+        no slots are available, the quotas are synced with the users in case
+        participants have been invalidated, and the allocation is retried.
+
+        Returns the (study_condition, start_condition), or None if the study is
+        full
+        """
+        for attempt in range(2):
+            # Skip the quotas that are being allocated, unless they're the only
+            # ones with slots
+            condition = ConditionQuota._allocate(sm, skip_locked=True) or ConditionQuota._allocate(sm, skip_locked=False)
+            if condition is not None or attempt > 0:
+                return condition
+
+            ConditionQuota.sync(sm)
+
+    @staticmethod
+    def sweep_abandoned(sm):
+        """
+        Mark the participants that have abandoned the study as invalid, and
+        resync the quotas of the study management object if any were marked.
+        Returns the number of slots that were freed in the quotas
+        """
+        now = timezone.now()
+        reason = f'marked as abandoned at {now}'
+        number_marked = User.objects.filter(
+            Q(is_staff=False) &
+            Q(date_survey_completed__isnull=True) &
+            (Q(ignore_data_reason__isnull=True) | Q(ignore_data_reason='')) &
+            Q(last_login__lte=(now - User.ABANDONED_AFTER))
+        ).update(ignore_data_reason=reason)
+        if number_marked == 0:
+            return 0
+
+        ConditionQuota.sync(sm)
+        return User.objects.filter(
+            ignore_data_reason=reason,
+            study_condition__in=sm.enabled_study_conditions_list,
+            start_condition__in=sm.enabled_start_conditions_list
+        ).count()
+
+    @staticmethod
+    def release(sm, study_condition, start_condition):
+        """Release a slot that was allocated, but not used"""
+        ConditionQuota.objects.filter(
+            Q(study_management=sm) &
+            Q(number_assigned__gt=0) &
+            (Q(study_condition=study_condition, start_condition=start_condition) | Q(study_condition__isnull=True, start_condition__isnull=True))
+        ).update(number_assigned=F('number_assigned') - 1)
+
+
+post_save.connect(ConditionQuota.sync_on_save, sender=StudyManagement)
+
+
+# Model for the accounts that are ready to be assigned to participants
+
+class PooledAccount(models.Model):
+    """
+    An account whose username and unique key have been generated, and whose
+    password has been hashed, ahead of time. Participants are assigned one of
+    these accounts when they sign up
+    """
+
+    username = models.CharField(_('username'), max_length=30, unique=True)
+    unique_key = models.CharField(_('unique_key'), max_length=30, unique=True)
+    password = models.CharField(_('password'), max_length=128)
+    date_created = models.DateTimeField(_('date created'), auto_now_add=True)
+
+    ALLOWED_CHARS = 'abcdefghjkmnpqrstuvwxyz23456789'
+
+    class Meta:
+        verbose_name = _('pooled account')
+        verbose_name_plural = _('pooled accounts')
+
+    def __str__(self):
+        return self.username
+
+    @staticmethod
+    def generate():
+        """Generate an account with a username and unique key that are not in
+        use. The account is not saved"""
+        username = unique_key = None
+        while ((username is None or unique_key is None)):
+            username_candidate = User.objects.make_random_password(allowed_chars=PooledAccount.ALLOWED_CHARS)
+            unique_key_candidate = User.objects.make_random_password(allowed_chars=PooledAccount.ALLOWED_CHARS)
+            num_existing_accounts = (
+                User.objects.filter(Q(username=username_candidate) | Q(unique_key=unique_key_candidate)).count() +
+                PooledAccount.objects.filter(Q(username=username_candidate) | Q(unique_key=unique_key_candidate)).count()
+            )
+            if num_existing_accounts == 0:
+                username, unique_key = username_candidate, unique_key_candidate
+
+        # The password is the same as the username
+        password = make_password(username, hasher=ParticipantPasswordHasher.algorithm)
+        return PooledAccount(username=username, unique_key=unique_key, password=password)
+
+    @staticmethod
+    def refill(size):
+        """Add accounts to the pool until it has size accounts. Returns the
+        number of accounts that were added"""
+        number_added = 0
+        while PooledAccount.objects.count() < size:
+            try:
+                PooledAccount.generate().save()
+                number_added += 1
+            except IntegrityError as e:
+                # Another process added the same username or key
+                continue
+        return number_added
+
+    @staticmethod
+    def claim(**extra_fields):
+        """
+        Create a user from an account in the pool. The extra fields are set on
+        the user. Returns None if the pool is empty
+        """
+        with transaction.atomic():
+            account = PooledAccount.objects.select_for_update(skip_locked=True).order_by('pk').first()
+            if account is None:
+                return None
+
+            account.delete()
+            user = User(username=account.username, unique_key=account.unique_key, password=account.password, **extra_fields)
+            user.save()
+
+        return user
+
+
+# Model for the log of the participants' actions
+
+class ActionLogEntry(models.Model):
+    """
+    An append-only log of the rows that should be in the participants' CSV
+    files on Dropbox. Rows are added to the log during the study, and they are
+    mirrored to the CSV files outside of the requests
+    """
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    csv_filename = models.CharField(max_length=255, help_text="The path of the CSV file within the Dropbox root")
+    row = models.TextField(help_text="JSON list of the values in the CSV row")
+    is_restart = models.BooleanField(default=False, help_text="Whether the row is a restart marker, instead of an action")
+    mirrored = models.BooleanField(default=False, db_index=True, help_text="Whether the row has been written to the CSV file")
+
+    class Meta:
+        verbose_name = _('action log entry')
+        verbose_name_plural = _('action log entries')
+        ordering = ('pk',)
+
+    def __str__(self):
+        return f"{self.user}: {self.pk}"
@@ -92,4 +92,4 @@ object-assign
  *
  * Date: 2019-04-08
  */
-function(e){var t,n,r,o,i,a,s,l,c,u,f,d,p,h,m,v,y,b,g,_="sizzle"+1*new Date,w=e.document,x=0,E=0,k=le(),j=le(),T=le(),O=le(),C=function(e,t){return e===t&&(f=!0),0},S={}.hasOwnProperty,L=[],P=L.pop,N=L.push,A=L.push,M=L.slice,D=function(e,t){for(var n=0,r=e.length;n<r;n++)if(e[n]===t)return n;return-1},H="checked|selected|async|autofocus|autoplay|controls|defer|disabled|hidden|ismap|loop|multiple|open|readonly|required|scoped",R="[\\x20\\t\\r\\n\\f]",I="(?:\\\\.|[\\w-]|[^\0-\\xa0])+",F="\\["+R+"*("+I+")(?:"+R+"*([*^$|!~]?=)"+R+"*(?:'((?:\\\\.|[^\\\\'])*)'|\"((?:\\\\.|[^\\\\\"])*)\"|("+I+"))|)"+R+"*\\]",z=":("+I+")(?:\\((('((?:\\\\.|[^\\\\'])*)'|\"((?:\\\\.|[^\\\\\"])*)\")|((?:\\\\.|[^\\\\()[\\]]|"+F+")*)|.*)\\)|)",G=new RegExp(R+"+","g"),U=new RegExp("^"+R+"+|((?:^|[^\\\\])(?:\\\\.)*)"+R+"+$","g"),B=new RegExp("^"+R+"*,"+R+"*"),W=new RegExp("^"+R+"*([>+~]|"+R+")"+R+"*"),q=new RegExp(R+"|>"),V=new RegExp(z),$=new RegExp("^"+I+"$"),X={ID:new RegExp("^#("+I+")"),CLASS:new RegExp("^\\.("+I+")"),TAG:new RegExp("^("+I+"|[*])"),ATTR:new RegExp("^"+F),PSEUDO:new RegExp("^"+z),CHILD:new RegExp("^:(only|first|last|nth|nth-last)-(child|of-type)(?:\\("+R+"*(even|odd|(([+-]|)(\\d*)n|)"+R+"*(?:([+-]|)"+R+"*(\\d+)|))"+R+"*\\)|)","i"),bool:new RegExp("^(?:"+H+")$","i"),needsContext:new RegExp("^"+R+"*[>+~]|:(even|odd|eq|gt|lt|nth|first|last)(?:\\("+R+"*((?:-\\d)?\\d*)"+R+"*\\)|)(?=[^-]|$)","i")},Y=/HTML$/i,K=/^(?:input|select|textarea|button)$/i,Q=/^h\d$/i,J=/^[^{]+\{\s*\[native \w/,Z=/^(?:#([\w-]+)|(\w+)|\.([\w-]+))$/,ee=/[+~]/,te=new RegExp("\\\\([\\da-f]{1,6}"+R+"?|("+R+")|.)","ig"),ne=function(e,t,n){var r="0x"+t-65536;return r!=r||n?t:r<0?String.fromCharCode(r+65536):String.fromCharCode(r>>10|55296,1023&r|56320)},re=/([\0-\x1f\x7f]|^-?\d)|^-$|[^\0-\x1f\x7f-\uFFFF\w-]/g,oe=function(e,t){return t?"\0"===e?"�":e.slice(0,-1)+"\\"+e.charCodeAt(e.length-1).toString(16)+" ":"\\"+e},ie=function(){d()},ae=_e((function(e){return!0===e.disabled&&"fieldset"===e.nodeName.toLowerCase()}),{dir:"parentNode",next:"legend"});try{A.apply(L=M.call(w.childNodes),w.childNodes),L[w.childNodes.length].nodeType}catch(e){A={apply:L.length?function(e,t){N.apply(e,M.call(t))}:function(e,t){for(var n=e.length,r=0;e[n++]=t[r++];);e.length=n-1}}}function se(e,t,r,o){var i,s,c,u,f,h,y,b=t&&t.ownerDocument,x=t?t.nodeType:9;if(r=r||[],"string"!=typeof e||!e||1!==x&&9!==x&&11!==x)return r;if(!o&&((t?t.ownerDocument||t:w)!==p&&d(t),t=t||p,m)){if(11!==x&&(f=Z.exec(e)))if(i=f[1]){if(9===x){if(!(c=t.getElementById(i)))return r;if(c.id===i)return r.push(c),r}else if(b&&(c=b.getElementById(i))&&g(t,c)&&c.id===i)return r.push(c),r}else{if(f[2])return A.apply(r,t.getElementsByTagName(e)),r;if((i=f[3])&&n.getElementsByClassName&&t.getElementsByClassName)return A.apply(r,t.getElementsByClassName(i)),r}if(n.qsa&&!O[e+" "]&&(!v||!v.test(e))&&(1!==x||"object"!==t.nodeName.toLowerCase())){if(y=e,b=t,1===x&&q.test(e)){for((u=t.getAttribute("id"))?u=u.replace(re,oe):t.setAttribute("id",u=_),s=(h=a(e)).length;s--;)h[s]="#"+u+" "+ge(h[s]);y=h.join(","),b=ee.test(e)&&ye(t.parentNode)||t}try{return A.apply(r,b.querySelectorAll(y)),r}catch(t){O(e,!0)}finally{u===_&&t.removeAttribute("id")}}}return l(e.replace(U,"$1"),t,r,o)}function le(){var e=[];return function t(n,o){return e.push(n+" ")>r.cacheLength&&delete t[e.shift()],t[n+" "]=o}}function ce(e){return e[_]=!0,e}function ue(e){var t=p.createElement("fieldset");try{return!!e(t)}catch(e){return!1}finally{t.parentNode&&t.parentNode.removeChild(t),t=null}}function fe(e,t){for(var n=e.split("|"),o=n.length;o--;)r.attrHandle[n[o]]=t}function de(e,t){var n=t&&e,r=n&&1===e.nodeType&&1===t.nodeType&&e.sourceIndex-t.sourceIndex;if(r)return r;if(n)for(;n=n.nextSibling;)if(n===t)return-1;return e?1:-1}function pe(e){return function(t){return"input"===t.nodeName.toLowerCase()&&t.type===e}}function he(e){return function(t){var n=t.nodeName.toLowerCase();return("input"===n||"button"===n)&&t.type===e}}function me(e){return function(t){return"form"in t?t.parentNode&&!1===t.disabled?"label"in t?"label"in t.parentNode?t.parentNode.disabled===e:t.disabled===e:t.isDisabled===e||t.isDisabled!==!e&&ae(t)===e:t.disabled===e:"label"in t&&t.disabled===e}}function ve(e){return ce((function(t){return t=+t,ce((function(n,r){for(var o,i=e([],n.length,t),a=i.length;a--;)n[o=i[a]]&&(n[o]=!(r[o]=n[o]))}))}))}function ye(e){return e&&void 0!==e.getElementsByTagName&&e}for(t in n=se.support={},i=se.isXML=function(e){var t=e.namespaceURI,n=(e.ownerDocument||e).documentElement;return!Y.test(t||n&&n.nodeName||"HTML")},d=se.setDocument=function(e){var t,o,a=e?e.ownerDocument||e:w;return a!==p&&9===a.nodeType&&a.documentElement?(h=(p=a).documentElement,m=!i(p),w!==p&&(o=p.defaultView)&&o.top!==o&&(o.addEventListener?o.addEventListener("unload",ie,!1):o.attachEvent&&o.attachEvent("onunload",ie)),n.attributes=ue((function(e){return e.className="i",!e.getAttribute("className")})),n.getElementsByTagName=ue((function(e){return e.appendChild(p.createComment("")),!e.getElementsByTagName("*").length})),n.getElementsByClassName=J.test(p.getElementsByClassName),n.getById=ue((function(e){return h.appendChild(e).id=_,!p.getElementsByName||!p.getElementsByName(_).length})),n.getById?(r.filter.ID=function(e){var t=e.replace(te,ne);return function(e){return e.getAttribute("id")===t}},r.find.ID=function(e,t){if(void 0!==t.getElementById&&m){var n=t.getElementById(e);return n?[n]:[]}}):(r.filter.ID=function(e){var t=e.replace(te,ne);return function(e){var n=void 0!==e.getAttributeNode&&e.getAttributeNode("id");return n&&n.value===t}},r.find.ID=function(e,t){if(void 0!==t.getElementById&&m){var n,r,o,i=t.getElementById(e);if(i){if((n=i.getAttributeNode("id"))&&n.value===e)return[i];for(o=t.getElementsByName(e),r=0;i=o[r++];)if((n=i.getAttributeNode("id"))&&n.value===e)return[i]}return[]}}),r.find.TAG=n.getElementsByTagName?function(e,t){return void 0!==t.getElementsByTagName?t.getElementsByTagName(e):n.qsa?t.querySelectorAll(e):void 0}:function(e,t){var n,r=[],o=0,i=t.getElementsByTagName(e);if("*"===e){for(;n=i[o++];)1===n.nodeType&&r.push(n);return r}return i},r.find.CLASS=n.getElementsByClassName&&function(e,t){if(void 0!==t.getElementsByClassName&&m)return t.getElementsByClassName(e)},y=[],v=[],(n.qsa=J.test(p.querySelectorAll))&&(ue((function(e){h.appendChild(e).innerHTML="<a id='"+_+"'></a><select id='"+_+"-\r\\' msallowcapture=''><option selected=''></option></select>",e.querySelectorAll("[msallowcapture^='']").length&&v.push("[*^$]="+R+"*(?:''|\"\")"),e.querySelectorAll("[selected]").length||v.push("\\["+R+"*(?:value|"+H+")"),e.querySelectorAll("[id~="+_+"-]").length||v.push("~="),e.querySelectorAll(":checked").length||v.push(":checked"),e.querySelectorAll("a#"+_+"+*").length||v.push(".#.+[+~]")})),ue((function(e){e.innerHTML="<a href='' disabled='disabled'></a><select disabled='disabled'><option/></select>";var t=p.createElement("input");t.setAttribute("type","hidden"),e.appendChild(t).setAttribute("name","D"),e.querySelectorAll("[name=d]").length&&v.push("name"+R+"*[*^$|!~]?="),2!==e.querySelectorAll(":enabled").length&&v.push(":enabled",":disabled"),h.appendChild(e).disabled=!0,2!==e.querySelectorAll(":disabled").length&&v.push(":enabled",":disabled"),e.querySelectorAll("*,:x"),v.push(",.*:")}))),(n.matchesSelector=J.test(b=h.matches||h.webkitMatchesSelector||h.mozMatchesSelector||h.oMatchesSelector||h.msMatchesSelector))&&ue((function(e){n.disconnectedMatch=b.call(e,"*"),b.call(e,"[s!='']:x"),y.push("!=",z)})),v=v.length&&new RegExp(v.join("|")),y=y.length&&new RegExp(y.join("|")),t=J.test(h.compareDocumentPosition),g=t||J.test(h.contains)?function(e,t){var n=9===e.nodeType?e.documentElement:e,r=t&&t.parentNode;return e===r||!(!r||1!==r.nodeType||!(n.contains?n.contains(r):e.compareDocumentPosition&&16&e.compareDocumentPosition(r)))}:function(e,t){if(t)for(;t=t.parentNode;)if(t===e)return!0;return!1},C=t?function(e,t){if(e===t)return f=!0,0;var r=!e.compareDocumentPosition-!t.compareDocumentPosition;return r||(1&(r=(e.ownerDocument||e)===(t.ownerDocument||t)?e.compareDocumentPosition(t):1)||!n.sortDetached&&t.compareDocumentPosition(e)===r?e===p||e.ownerDocument===w&&g(w,e)?-1:t===p||t.ownerDocument===w&&g(w,t)?1:u?D(u,e)-D(u,t):0:4&r?-1:1)}:function(e,t){if(e===t)return f=!0,0;var n,r=0,o=e.parentNode,i=t.parentNode,a=[e],s=[t];if(!o||!i)return e===p?-1:t===p?1:o?-1:i?1:u?D(u,e)-D(u,t):0;if(o===i)return de(e,t);for(n=e;n=n.parentNode;)a.unshift(n);for(n=t;n=n.parentNode;)s.unshift(n);for(;a[r]===s[r];)r++;return r?de(a[r],s[r]):a[r]===w?-1:s[r]===w?1:0},p):p},se.matches=function(e,t){return se(e,null,null,t)},se.matchesSelector=function(e,t){if((e.ownerDocument||e)!==p&&d(e),n.matchesSelector&&m&&!O[t+" "]&&(!y||!y.test(t))&&(!v||!v.test(t)))try{var r=b.call(e,t);if(r||n.disconnectedMatch||e.document&&11!==e.document.nodeType)return r}catch(e){O(t,!0)}return se(t,p,null,[e]).length>0},se.contains=function(e,t){return(e.ownerDocument||e)!==p&&d(e),g(e,t)},se.attr=function(e,t){(e.ownerDocument||e)!==p&&d(e);var o=r.attrHandle[t.toLowerCase()],i=o&&S.call(r.attrHandle,t.toLowerCase())?o(e,t,!m):void 0;return void 0!==i?i:n.attributes||!m?e.getAttribute(t):(i=e.getAttributeNode(t))&&i.specified?i.value:null},se.escape=function(e){return(e+"").replace(re,oe)},se.error=function(e){throw new Error("Syntax error, unrecognized expression: "+e)},se.uniqueSort=function(e){var t,r=[],o=0,i=0;if(f=!n.detectDuplicates,u=!n.sortStable&&e.slice(0),e.sort(C),f){for(;t=e[i++];)t===e[i]&&(o=r.push(i));for(;o--;)e.splice(r[o],1)}return u=null,e},o=se.getText=function(e){var t,n="",r=0,i=e.nodeType;if(i){if(1===i||9===i||11===i){if("string"==typeof e.textContent)return e.textContent;for(e=e.firstChild;e;e=e.nextSibling)n+=o(e)}else if(3===i||4===i)return e.nodeValue}else for(;t=e[r++];)n+=o(t);return n},(r=se.selectors={cacheLength:50,createPseudo:ce,match:X,attrHandle:{},find:{},relative:{">":{dir:"parentNode",first:!0}," ":{dir:"parentNode"},"+":{dir:"previousSibling",first:!0},"~":{dir:"previousSibling"}},preFilter:{ATTR:function(e){return e[1]=e[1].replace(te,ne),e[3]=(e[3]||e[4]||e[5]||"").replace(te,ne),"~="===e[2]&&(e[3]=" "+e[3]+" "),e.slice(0,4)},CHILD:function(e){return e[1]=e[1].toLowerCase(),"nth"===e[1].slice(0,3)?(e[3]||se.error(e[0]),e[4]=+(e[4]?e[5]+(e[6]||1):2*("even"===e[3]||"odd"===e[3])),e[5]=+(e[7]+e[8]||"odd"===e[3])):e[3]&&se.error(e[0]),e},PSEUDO:function(e){var t,n=!e[6]&&e[2];return X.CHILD.test(e[0])?null:(e[3]?e[2]=e[4]||e[5]||"":n&&V.test(n)&&(t=a(n,!0))&&(t=n.indexOf(")",n.length-t)-n.length)&&(e[0]=e[0].slice(0,t),e[2]=n.slice(0,t)),e.slice(0,3))}},filter:{TAG:function(e){var t=e.replace(te,ne).toLowerCase();return"*"===e?function(){return!0}:function(e){return e.nodeName&&e.nodeName.toLowerCase()===t}},CLASS:function(e){var t=k[e+" "];return t||(t=new RegExp("(^|"+R+")"+e+"("+R+"|$)"))&&k(e,(function(e){return t.test("string"==typeof e.className&&e.className||void 0!==e.getAttribute&&e.getAttribute("class")||"")}))},ATTR:function(e,t,n){return function(r){var o=se.attr(r,e);return null==o?"!="===t:!t||(o+="","="===t?o===n:"!="===t?o!==n:"^="===t?n&&0===o.indexOf(n):"*="===t?n&&o.indexOf(n)>-1:"$="===t?n&&o.slice(-n.length)===n:"~="===t?(" "+o.replace(G," ")+" ").indexOf(n)>-1:"|="===t&&(o===n||o.slice(0,n.length+1)===n+"-"))}},CHILD:function(e,t,n,r,o){var i="nth"!==e.slice(0,3),a="last"!==e.slice(-4),s="of-type"===t;return 1===r&&0===o?function(e){return!!e.parentNode}:function(t,n,l){var c,u,f,d,p,h,m=i!==a?"nextSibling":"previousSibling",v=t.parentNode,y=s&&t.nodeName.toLowerCase(),b=!l&&!s,g=!1;if(v){if(i){for(;m;){for(d=t;d=d[m];)if(s?d.nodeName.toLowerCase()===y:1===d.nodeType)return!1;h=m="only"===e&&!h&&"nextSibling"}return!0}if(h=[a?v.firstChild:v.lastChild],a&&b){for(g=(p=(c=(u=(f=(d=v)[_]||(d[_]={}))[d.uniqueID]||(f[d.uniqueID]={}))[e]||[])[0]===x&&c[1])&&c[2],d=p&&v.childNodes[p];d=++p&&d&&d[m]||(g=p=0)||h.pop();)if(1===d.nodeType&&++g&&d===t){u[e]=[x,p,g];break}}else if(b&&(g=p=(c=(u=(f=(d=t)[_]||(d[_]={}))[d.uniqueID]||(f[d.uniqueID]={}))[e]||[])[0]===x&&c[1]),!1===g)for(;(d=++p&&d&&d[m]||(g=p=0)||h.pop())&&((s?d.nodeName.toLowerCase()!==y:1!==d.nodeType)||!++g||(b&&((u=(f=d[_]||(d[_]={}))[d.uniqueID]||(f[d.uniqueID]={}))[e]=[x,g]),d!==t)););return(g-=o)===r||g%r==0&&g/r>=0}}},PSEUDO:function(e,t){var n,o=r.pseudos[e]||r.setFilters[e.toLowerCase()]||se.error("unsupported pseudo: "+e);return o[_]?o(t):o.length>1?(n=[e,e,"",t],r.setFilters.hasOwnProperty(e.toLowerCase())?ce((function(e,n){for(var r,i=o(e,t),a=i.length;a--;)e[r=D(e,i[a])]=!(n[r]=i[a])})):function(e){return o(e,0,n)}):o}},pseudos:{not:ce((function(e){var t=[],n=[],r=s(e.replace(U,"$1"));return r[_]?ce((function(e,t,n,o){for(var i,a=r(e,null,o,[]),s=e.length;s--;)(i=a[s])&&(e[s]=!(t[s]=i))})):function(e,o,i){return t[0]=e,r(t,null,i,n),t[0]=null,!n.pop()}})),has:ce((function(e){return function(t){return se(e,t).length>0}})),contains:ce((function(e){return e=e.replace(te,ne),function(t){return(t.textContent||o(t)).indexOf(e)>-1}})),lang:ce((function(e){return $.test(e||"")||se.error("unsupported lang: "+e),e=e.replace(te,ne).toLowerCase(),function(t){var n;do{if(n=m?t.lang:t.getAttribute("xml:lang")||t.getAttribute("lang"))return(n=n.toLowerCase())===e||0===n.indexOf(e+"-")}while((t=t.parentNode)&&1===t.nodeType);return!1}})),target:function(t){var n=e.location&&e.location.hash;return n&&n.slice(1)===t.id},root:function(e){return e===h},focus:function(e){return e===p.activeElement&&(!p.hasFocus||p.hasFocus())&&!!(e.type||e.href||~e.tabIndex)},enabled:me(!1),disabled:me(!0),checked:function(e){var t=e.nodeName.toLowerCase();return"input"===t&&!!e.checked||"option"===t&&!!e.selected},selected:function(e){return e.parentNode&&e.parentNode.selectedIndex,!0===e.selected},empty:function(e){for(e=e.firstChild;e;e=e.nextSibling)if(e.nodeType<6)return!1;return!0},parent:function(e){return!r.pseudos.empty(e)},header:function(e){return Q.test(e.nodeName)},input:function(e){return K.test(e.nodeName)},button:function(e){var t=e.nodeName.toLowerCase();return"input"===t&&"button"===e.type||"button"===t},text:function(e){var t;return"input"===e.nodeName.toLowerCase()&&"text"===e.type&&(null==(t=e.getAttribute("type"))||"text"===t.toLowerCase())},first:ve((function(){return[0]})),last:ve((function(e,t){return[t-1]})),eq:ve((function(e,t,n){return[n<0?n+t:n]})),even:ve((function(e,t){for(var n=0;n<t;n+=2)e.push(n);return e})),odd:ve((function(e,t){for(var n=1;n<t;n+=2)e.push(n);return e})),lt:ve((function(e,t,n){for(var r=n<0?n+t:n>t?t:n;--r>=0;)e.push(r);return e})),gt:ve((function(e,t,n){for(var r=n<0?n+t:n;++r<t;)e.push(r);return e}))}}).pseudos.nth=r.pseudos.eq,{radio:!0,checkbox:!0,file:!0,password:!0,image:!0})r.pseudos[t]=pe(t);for(t in{submit:!0,reset:!0})r.pseudos[t]=he(t);function be(){}function ge(e){for(var t=0,n=e.length,r="";t<n;t++)r+=e[t].value;return r}function _e(e,t,n){var r=t.dir,o=t.next,i=o||r,a=n&&"parentNode"===i,s=E++;return t.first?function(t,n,o){for(;t=t[r];)if(1===t.nodeType||a)return e(t,n,o);return!1}:function(t,n,l){var c,u,f,d=[x,s];if(l){for(;t=t[r];)if((1===t.nodeType||a)&&e(t,n,l))return!0}else for(;t=t[r];)if(1===t.nodeType||a)if(u=(f=t[_]||(t[_]={}))[t.uniqueID]||(f[t.uniqueID]={}),o&&o===t.nodeName.toLowerCase())t=t[r]||t;else{if((c=u[i])&&c[0]===x&&c[1]===s)return d[2]=c[2];if(u[i]=d,d[2]=e(t,n,l))return!0}return!1}}function we(e){return e.length>1?function(t,n,r){for(var o=e.length;o--;)if(!e[o](t,n,r))return!1;return!0}:e[0]}function xe(e,t,n,r,o){for(var i,a=[],s=0,l=e.length,c=null!=t;s<l;s++)(i=e[s])&&(n&&!n(i,r,o)||(a.push(i),c&&t.push(s)));return a}function Ee(e,t,n,r,o,i){return r&&!r[_]&&(r=Ee(r)),o&&!o[_]&&(o=Ee(o,i)),ce((function(i,a,s,l){var c,u,f,d=[],p=[],h=a.length,m=i||function(e,t,n){for(var r=0,o=t.length;r<o;r++)se(e,t[r],n);return n}(t||"*",s.nodeType?[s]:s,[]),v=!e||!i&&t?m:xe(m,d,e,s,l),y=n?o||(i?e:h||r)?[]:a:v;if(n&&n(v,y,s,l),r)for(c=xe(y,p),r(c,[],s,l),u=c.length;u--;)(f=c[u])&&(y[p[u]]=!(v[p[u]]=f));if(i){if(o||e){if(o){for(c=[],u=y.length;u--;)(f=y[u])&&c.push(v[u]=f);o(null,y=[],c,l)}for(u=y.length;u--;)(f=y[u])&&(c=o?D(i,f):d[u])>-1&&(i[c]=!(a[c]=f))}}else y=xe(y===a?y.splice(h,y.length):y),o?o(null,a,y,l):A.apply(a,y)}))}function ke(e){for(var t,n,o,i=e.length,a=r.relative[e[0].type],s=a||r.relative[" "],l=a?1:0,u=_e((function(e){return e===t}),s,!0),f=_e((function(e){return D(t,e)>-1}),s,!0),d=[function(e,n,r){var o=!a&&(r||n!==c)||((t=n).nodeType?u(e,n,r):f(e,n,r));return t=null,o}];l<i;l++)if(n=r.relative[e[l].type])d=[_e(we(d),n)];else{if((n=r.filter[e[l].type].apply(null,e[l].matches))[_]){for(o=++l;o<i&&!r.relative[e[o].type];o++);return Ee(l>1&&we(d),l>1&&ge(e.slice(0,l-1).concat({value:" "===e[l-2].type?"*":""})).replace(U,"$1"),n,l<o&&ke(e.slice(l,o)),o<i&&ke(e=e.slice(o)),o<i&&ge(e))}d.push(n)}return we(d)}return be.prototype=r.filters=r.pseudos,r.setFilters=new be,a=se.tokenize=function(e,t){var n,o,i,a,s,l,c,u=j[e+" "];if(u)return t?0:u.slice(0);for(s=e,l=[],c=r.preFilter;s;){for(a in n&&!(o=B.exec(s))||(o&&(s=s.slice(o[0].length)||s),l.push(i=[])),n=!1,(o=W.exec(s))&&(n=o.shift(),i.push({value:n,type:o[0].replace(U," ")}),s=s.slice(n.length)),r.filter)!(o=X[a].exec(s))||c[a]&&!(o=c[a](o))||(n=o.shift(),i.push({value:n,type:a,matches:o}),s=s.slice(n.length));if(!n)break}return t?s.length:s?se.error(e):j(e,l).slice(0)},s=se.compile=function(e,t){var n,o=[],i=[],s=T[e+" "];if(!s){for(t||(t=a(e)),n=t.length;n--;)(s=ke(t[n]))[_]?o.push(s):i.push(s);(s=T(e,function(e,t){var n=t.length>0,o=e.length>0,i=function(i,a,s,l,u){var f,h,v,y=0,b="0",g=i&&[],_=[],w=c,E=i||o&&r.find.TAG("*",u),k=x+=null==w?1:Math.random()||.1,j=E.length;for(u&&(c=a===p||a||u);b!==j&&null!=(f=E[b]);b++){if(o&&f){for(h=0,a||f.ownerDocument===p||(d(f),s=!m);v=e[h++];)if(v(f,a||p,s)){l.push(f);break}u&&(x=k)}n&&((f=!v&&f)&&y--,i&&g.push(f))}if(y+=b,n&&b!==y){for(h=0;v=t[h++];)v(g,_,a,s);if(i){if(y>0)for(;b--;)g[b]||_[b]||(_[b]=P.call(l));_=xe(_)}A.apply(l,_),u&&!i&&_.length>0&&y+t.length>1&&se.uniqueSort(l)}return u&&(x=k,c=w),g};return n?ce(i):i}(i,o))).selector=e}return s},l=se.select=function(e,t,n,o){var i,l,c,u,f,d="function"==typeof e&&e,p=!o&&a(e=d.selector||e);if(n=n||[],1===p.length){if((l=p[0]=p[0].slice(0)).length>2&&"ID"===(c=l[0]).type&&9===t.nodeType&&m&&r.relative[l[1].type]){if(!(t=(r.find.ID(c.matches[0].replace(te,ne),t)||[])[0]))return n;d&&(t=t.parentNode),e=e.slice(l.shift().value.length)}for(i=X.needsContext.test(e)?0:l.length;i--&&(c=l[i],!r.relative[u=c.type]);)if((f=r.find[u])&&(o=f(c.matches[0].replace(te,ne),ee.test(l[0].type)&&ye(t.parentNode)||t))){if(l.splice(i,1),!(e=o.length&&ge(l)))return A.apply(n,o),n;break}}return(d||s(e,p))(o,t,!m,n,!t||ee.test(e)&&ye(t.parentNode)||t),n},n.sortStable=_.split("").sort(C).join("")===_,n.detectDuplicates=!!f,d(),n.sortDetached=ue((function(e){return 1&e.compareDocumentPosition(p.createElement("fieldset"))})),ue((function(e){return e.innerHTML="<a href='#'></a>","#"===e.firstChild.getAttribute("href")}))||fe("type|href|height|width",(function(e,t,n){if(!n)return e.getAttribute(t,"type"===t.toLowerCase()?1:2)})),n.attributes&&ue((function(e){return e.innerHTML="<input/>",e.firstChild.setAttribute("value",""),""===e.firstChild.getAttribute("value")}))||fe("value",(function(e,t,n){if(!n&&"input"===e.nodeName.toLowerCase())return e.defaultValue})),ue((function(e){return null==e.getAttribute("disabled")}))||fe(H,(function(e,t,n){var r;if(!n)return!0===e[t]?t.toLowerCase():(r=e.getAttributeNode(t))&&r.specified?r.value:null})),se}(n);E.find=T,E.expr=T.selectors,E.expr[":"]=E.expr.pseudos,E.uniqueSort=E.unique=T.uniqueSort,E.text=T.getText,E.isXMLDoc=T.isXML,E.contains=T.contains,E.escapeSelector=T.escape;var O=function(e,t,n){for(var r=[],o=void 0!==n;(e=e[t])&&9!==e.nodeType;)if(1===e.nodeType){if(o&&E(e).is(n))break;r.push(e)}return r},C=function(e,t){for(var n=[];e;e=e.nextSibling)1===e.nodeType&&e!==t&&n.push(e);return n},S=E.expr.match.needsContext;function L(e,t){return e.nodeName&&e.nodeName.toLowerCase()===t.toLowerCase()}var P=/^<([a-z][^\/\0>:\x20\t\r\n\f]*)[\x20\t\r\n\f]*\/?>(?:<\/\1>|)$/i;function N(e,t,n){return b(t)?E.grep(e,(function(e,r){return!!t.call(e,r,e)!==n})):t.nodeType?E.grep(e,(function(e){return e===t!==n})):"string"!=typeof t?E.grep(e,(function(e){return f.call(t,e)>-1!==n})):E.filter(t,e,n)}E.filter=function(e,t,n){var r=t[0];return n&&(e=":not("+e+")"),1===t.length&&1===r.nodeType?E.find.matchesSelector(r,e)?[r]:[]:E.find.matches(e,E.grep(t,(function(e){return 1===e.nodeType})))},E.fn.extend({find:function(e){var t,n,r=this.length,o=this;if("string"!=typeof e)return this.pushStack(E(e).filter((function(){for(t=0;t<r;t++)if(E.contains(o[t],this))return!0})));for(n=this.pushStack([]),t=0;t<r;t++)E.find(e,o[t],n);return r>1?E.uniqueSort(n):n},filter:function(e){return this.pushStack(N(this,e||[],!1))},not:function(e){return this.pushStack(N(this,e||[],!0))},is:function(e){return!!N(this,"string"==typeof e&&S.test(e)?E(e):e||[],!1).length}});var A,M=/^(?:\s*(<[\w\W]+>)[^>]*|#([\w-]+))$/;(E.fn.init=function(e,t,n){var r,o;if(!e)return this;if(n=n||A,"string"==typeof e){if(!(r="<"===e[0]&&">"===e[e.length-1]&&e.length>=3?[null,e,null]:M.exec(e))||!r[1]&&t)return!t||t.jquery?(t||n).find(e):this.constructor(t).find(e);if(r[1]){if(t=t instanceof E?t[0]:t,E.merge(this,E.parseHTML(r[1],t&&t.nodeType?t.ownerDocument||t:a,!0)),P.test(r[1])&&E.isPlainObject(t))for(r in t)b(this[r])?this[r](t[r]):this.attr(r,t[r]);return this}return(o=a.getElementById(r[2]))&&(this[0]=o,this.length=1),this}return e.nodeType?(this[0]=e,this.length=1,this):b(e)?void 0!==n.ready?n.ready(e):e(E):E.makeArray(e,this)}).prototype=E.fn,A=E(a);var D=/^(?:parents|prev(?:Until|All))/,H={children:!0,contents:!0,next:!0,prev:!0};function R(e,t){for(;(e=e[t])&&1!==e.nodeType;);return e}E.fn.extend({has:function(e){var t=E(e,this),n=t.length;return this.filter((function(){for(var e=0;e<n;e++)if(E.contains(this,t[e]))return!0}))},closest:function(e,t){var n,r=0,o=this.length,i=[],a="string"!=typeof e&&E(e);if(!S.test(e))for(;r<o;r++)for(n=this[r];n&&n!==t;n=n.parentNode)if(n.nodeType<11&&(a?a.index(n)>-1:1===n.nodeType&&E.find.matchesSelector(n,e))){i.push(n);break}return this.pushStack(i.length>1?E.uniqueSort(i):i)},index:function(e){return e?"string"==typeof e?f.call(E(e),this[0]):f.call(this,e.jquery?e[0]:e):this[0]&&this[0].parentNode?this.first().prevAll().length:-1},add:function(e,t){return this.pushStack(E.uniqueSort(E.merge(this.get(),E(e,t))))},addBack:function(e){return this.add(null==e?this.prevObject:this.prevObject.filter(e))}}),E.each({parent:function(e){var t=e.parentNode;return t&&11!==t.nodeType?t:null},parents:function(e){return O(e,"parentNode")},parentsUntil:function(e,t,n){return O(e,"parentNode",n)},next:function(e){return R(e,"nextSibling")},prev:function(e){return R(e,"previousSibling")},nextAll:function(e){return O(e,"nextSibling")},prevAll:function(e){return O(e,"previousSibling")},nextUntil:function(e,t,n){return O(e,"nextSibling",n)},prevUntil:function(e,t,n){return O(e,"previousSibling",n)},siblings:function(e){return C((e.parentNode||{}).firstChild,e)},children:function(e){return C(e.firstChild)},contents:function(e){return void 0!==e.contentDocument?e.contentDocument:(L(e,"template")&&(e=e.content||e),E.merge([],e.childNodes))}},(function(e,t){E.fn[e]=function(n,r){var o=E.map(this,t,n);return"Until"!==e.slice(-5)&&(r=n),r&&"string"==typeof r&&(o=E.filter(r,o)),this.length>1&&(H[e]||E.uniqueSort(o),D.test(e)&&o.reverse()),this.pushStack(o)}}));var I=/[^\x20\t\r\n\f]+/g;function F(e){return e}function z(e){throw e}function G(e,t,n,r){var o;try{e&&b(o=e.promise)?o.call(e).done(t).fail(n):e&&b(o=e.then)?o.call(e,t,n):t.apply(void 0,[e].slice(r))}catch(e){n.apply(void 0,[e])}}E.Callbacks=function(e){e="string"==typeof e?function(e){var t={};return E.each(e.match(I)||[],(function(e,n){t[n]=!0})),t}(e):E.extend({},e);var t,n,r,o,i=[],a=[],s=-1,l=function(){for(o=o||e.once,r=t=!0;a.length;s=-1)for(n=a.shift();++s<i.length;)!1===i[s].apply(n[0],n[1])&&e.stopOnFalse&&(s=i.length,n=!1);e.memory||(n=!1),t=!1,o&&(i=n?[]:"")},c={add:function(){return i&&(n&&!t&&(s=i.length-1,a.push(n)),function t(n){E.each(n,(function(n,r){b(r)?e.unique&&c.has(r)||i.push(r):r&&r.length&&"string"!==x(r)&&t(r)}))}(arguments),n&&!t&&l()),this},remove:function(){return E.each(arguments,(function(e,t){for(var n;(n=E.inArray(t,i,n))>-1;)i.splice(n,1),n<=s&&s--})),this},has:function(e){return e?E.inArray(e,i)>-1:i.length>0},empty:function(){return i&&(i=[]),this},disable:function(){return o=a=[],i=n="",this},disabled:function(){return!i},lock:function(){return o=a=[],n||t||(i=n=""),this},locked:function(){return!!o},fireWith:function(e,n){return o||(n=[e,(n=n||[]).slice?n.slice():n],a.push(n),t||l()),this},fire:function(){return c.fireWith(this,arguments),this},fired:function(){return!!r}};return c},E.extend({Deferred:function(e){var t=[["notify","progress",E.Callbacks("memory"),E.Callbacks("memory"),2],["resolve","done",E.Callbacks("once memory"),E.Callbacks("once memory"),0,"resolved"],["reject","fail",E.Callbacks("once memory"),E.Callbacks("once memory"),1,"rejected"]],r="pending",o={state:function(){return r},always:function(){return i.done(arguments).fail(arguments),this},catch:function(e){return o.then(null,e)},pipe:function(){var e=arguments;return E.Deferred((function(n){E.each(t,(function(t,r){var o=b(e[r[4]])&&e[r[4]];i[r[1]]((function(){var e=o&&o.apply(this,arguments);e&&b(e.promise)?e.promise().progress(n.notify).done(n.resolve).fail(n.reject):n[r[0]+"With"](this,o?[e]:arguments)}))})),e=null})).promise()},then:function(e,r,o){var i=0;function a(e,t,r,o){return function(){var s=this,l=arguments,c=function(){var n,c;if(!(e<i)){if((n=r.apply(s,l))===t.promise())throw new TypeError("Thenable self-resolution");c=n&&("object"==typeof n||"function"==typeof n)&&n.then,b(c)?o?c.call(n,a(i,t,F,o),a(i,t,z,o)):(i++,c.call(n,a(i,t,F,o),a(i,t,z,o),a(i,t,F,t.notifyWith))):(r!==F&&(s=void 0,l=[n]),(o||t.resolveWith)(s,l))}},u=o?c:function(){try{c()}catch(n){E.Deferred.exceptionHook&&E.Deferred.exceptionHook(n,u.stackTrace),e+1>=i&&(r!==z&&(s=void 0,l=[n]),t.rejectWith(s,l))}};e?u():(E.Deferred.getStackHook&&(u.stackTrace=E.Deferred.getStackHook()),n.setTimeout(u))}}return E.Deferred((function(n){t[0][3].add(a(0,n,b(o)?o:F,n.notifyWith)),t[1][3].add(a(0,n,b(e)?e:F)),t[2][3].add(a(0,n,b(r)?r:z))})).promise()},promise:function(e){return null!=e?E.extend(e,o):o}},i={};return E.each(t,(function(e,n){var a=n[2],s=n[5];o[n[1]]=a.add,s&&a.add((function(){r=s}),t[3-e][2].disable,t[3-e][3].disable,t[0][2].lock,t[0][3].lock),a.add(n[3].fire),i[n[0]]=function(){return i[n[0]+"With"](this===i?void 0:this,arguments),this},i[n[0]+"With"]=a.fireWith})),o.promise(i),e&&e.call(i,i),i},when:function(e){var t=arguments.length,n=t,r=Array(n),o=l.call(arguments),i=E.Deferred(),a=function(e){return function(n){r[e]=this,o[e]=arguments.length>1?l.call(arguments):n,--t||i.resolveWith(r,o)}};if(t<=1&&(G(e,i.done(a(n)).resolve,i.reject,!t),"pending"===i.state()||b(o[n]&&o[n].then)))return i.then();for(;n--;)G(o[n],a(n),i.reject);return i.promise()}});var U=/^(Eval|Internal|Range|Reference|Syntax|Type|URI)Error$/;E.Deferred.exceptionHook=function(e,t){n.console&&n.console.warn&&e&&U.test(e.name)&&n.console.warn("jQuery.Deferred exception: "+e.message,e.stack,t)},E.readyException=function(e){n.setTimeout((function(){throw e}))};var B=E.Deferred();function W(){a.removeEventListener("DOMContentLoaded",W),n.removeEventListener("load",W),E.ready()}E.fn.ready=function(e){return B.then(e).catch((function(e){E.readyException(e)})),this},E.extend({isReady:!1,readyWait:1,ready:function(e){(!0===e?--E.readyWait:E.isReady)||(E.isReady=!0,!0!==e&&--E.readyWait>0||B.resolveWith(a,[E]))}}),E.ready.then=B.then,"complete"===a.readyState||"loading"!==a.readyState&&!a.documentElement.doScroll?n.setTimeout(E.ready):(a.addEventListener("DOMContentLoaded",W),n.addEventListener("load",W));var q=function(e,t,n,r,o,i,a){var s=0,l=e.length,c=null==n;if("object"===x(n))for(s in o=!0,n)q(e,t,s,n[s],!0,i,a);else if(void 0!==r&&(o=!0,b(r)||(a=!0),c&&(a?(t.call(e,r),t=null):(c=t,t=function(e,t,n){return c.call(E(e),n)})),t))for(;s<l;s++)t(e[s],n,a?r:r.call(e[s],s,t(e[s],n)));return o?e:c?t.call(e):l?t(e[0],n):i},V=/^-ms-/,$=/-([a-z])/g;function X(e,t){return t.toUpperCase()}function Y(e){return e.replace(V,"ms-").replace($,X)}var K=function(e){return 1===e.nodeType||9===e.nodeType||!+e.nodeType};function Q(){this.expando=E.expando+Q.uid++}Q.uid=1,Q.prototype={cache:function(e){var t=e[this.expando];return t||(t={},K(e)&&(e.nodeType?e[this.expando]=t:Object.defineProperty(e,this.expando,{value:t,configurable:!0}))),t},set:function(e,t,n){var r,o=this.cache(e);if("string"==typeof t)o[Y(t)]=n;else for(r in t)o[Y(r)]=t[r];return o},get:function(e,t){return void 0===t?this.cache(e):e[this.expando]&&e[this.expando][Y(t)]},access:function(e,t,n){return void 0===t||t&&"string"==typeof t&&void 0===n?this.get(e,t):(this.set(e,t,n),void 0!==n?n:t)},remove:function(e,t){var n,r=e[this.expando];if(void 0!==r){if(void 0!==t){n=(t=Array.isArray(t)?t.map(Y):(t=Y(t))in r?[t]:t.match(I)||[]).length;for(;n--;)delete r[t[n]]}(void 0===t||E.isEmptyObject(r))&&(e.nodeType?e[this.expando]=void 0:delete e[this.expando])}},hasData:function(e){var t=e[this.expando];return void 0!==t&&!E.isEmptyObject(t)}};var J=new Q,Z=new Q,ee=/^(?:\{[\w\W]*\}|\[[\w\W]*\])$/,te=/[A-Z]/g;function ne(e,t,n){var r;if(void 0===n&&1===e.nodeType)if(r="data-"+t.replace(te,"-$&").toLowerCase(),"string"==typeof(n=e.getAttribute(r))){try{n=function(e){return"true"===e||"false"!==e&&("null"===e?null:e===+e+""?+e:ee.test(e)?JSON.parse(e):e)}(n)}catch(e){}Z.set(e,t,n)}else n=void 0;return n}E.extend({hasData:function(e){return Z.hasData(e)||J.hasData(e)},data:function(e,t,n){return Z.access(e,t,n)},removeData:function(e,t){Z.remove(e,t)},_data:function(e,t,n){return J.access(e,t,n)},_removeData:function(e,t){J.remove(e,t)}}),E.fn.extend({data:function(e,t){var n,r,o,i=this[0],a=i&&i.attributes;if(void 0===e){if(this.length&&(o=Z.get(i),1===i.nodeType&&!J.get(i,"hasDataAttrs"))){for(n=a.length;n--;)a[n]&&0===(r=a[n].name).indexOf("data-")&&(r=Y(r.slice(5)),ne(i,r,o[r]));J.set(i,"hasDataAttrs",!0)}return o}return"object"==typeof e?this.each((function(){Z.set(this,e)})):q(this,(function(t){var n;if(i&&void 0===t)return void 0!==(n=Z.get(i,e))?n:void 0!==(n=ne(i,e))?n:void 0;this.each((function(){Z.set(this,e,t)}))}),null,t,arguments.length>1,null,!0)},removeData:function(e){return this.each((function(){Z.remove(this,e)}))}}),E.extend({queue:function(e,t,n){var r;if(e)return t=(t||"fx")+"queue",r=J.get(e,t),n&&(!r||Array.isArray(n)?r=J.access(e,t,E.makeArray(n)):r.push(n)),r||[]},dequeue:function(e,t){t=t||"fx";var n=E.queue(e,t),r=n.length,o=n.shift(),i=E._queueHooks(e,t);"inprogress"===o&&(o=n.shift(),r--),o&&("fx"===t&&n.unshift("inprogress"),delete i.stop,o.call(e,(function(){E.dequeue(e,t)}),i)),!r&&i&&i.empty.fire()},_queueHooks:function(e,t){var n=t+"queueHooks";return J.get(e,n)||J.access(e,n,{empty:E.Callbacks("once memory").add((function(){J.remove(e,[t+"queue",n])}))})}}),E.fn.extend({queue:function(e,t){var n=2;return"string"!=typeof e&&(t=e,e="fx",n--),arguments.length<n?E.queue(this[0],e):void 0===t?this:this.each((function(){var n=E.queue(this,e,t);E._queueHooks(this,e),"fx"===e&&"inprogress"!==n[0]&&E.dequeue(this,e)}))},dequeue:function(e){return this.each((function(){E.dequeue(this,e)}))},clearQueue:function(e){return this.queue(e||"fx",[])},promise:function(e,t){var n,r=1,o=E.Deferred(),i=this,a=this.length,s=function(){--r||o.resolveWith(i,[i])};for("string"!=typeof e&&(t=e,e=void 0),e=e||"fx";a--;)(n=J.get(i[a],e+"queueHooks"))&&n.empty&&(r++,n.empty.add(s));return s(),o.promise(t)}});var re=/[+-]?(?:\d*\.|)\d+(?:[eE][+-]?\d+|)/.source,oe=new RegExp("^(?:([+-])=|)("+re+")([a-z%]*)$","i"),ie=["Top","Right","Bottom","Left"],ae=a.documentElement,se=function(e){return E.contains(e.ownerDocument,e)},le={composed:!0};ae.getRootNode&&(se=function(e){return E.contains(e.ownerDocument,e)||e.getRootNode(le)===e.ownerDocument});var ce=function(e,t){return"none"===(e=t||e).style.display||""===e.style.display&&se(e)&&"none"===E.css(e,"display")},ue=function(e,t,n,r){var o,i,a={};for(i in t)a[i]=e.style[i],e.style[i]=t[i];for(i in o=n.apply(e,r||[]),t)e.style[i]=a[i];return o};function fe(e,t,n,r){var o,i,a=20,s=r?function(){return r.cur()}:function(){return E.css(e,t,"")},l=s(),c=n&&n[3]||(E.cssNumber[t]?"":"px"),u=e.nodeType&&(E.cssNumber[t]||"px"!==c&&+l)&&oe.exec(E.css(e,t));if(u&&u[3]!==c){for(l/=2,c=c||u[3],u=+l||1;a--;)E.style(e,t,u+c),(1-i)*(1-(i=s()/l||.5))<=0&&(a=0),u/=i;u*=2,E.style(e,t,u+c),n=n||[]}return n&&(u=+u||+l||0,o=n[1]?u+(n[1]+1)*n[2]:+n[2],r&&(r.unit=c,r.start=u,r.end=o)),o}var de={};function pe(e){var t,n=e.ownerDocument,r=e.nodeName,o=de[r];return o||(t=n.body.appendChild(n.createElement(r)),o=E.css(t,"display"),t.parentNode.removeChild(t),"none"===o&&(o="block"),de[r]=o,o)}function he(e,t){for(var n,r,o=[],i=0,a=e.length;i<a;i++)(r=e[i]).style&&(n=r.style.display,t?("none"===n&&(o[i]=J.get(r,"display")||null,o[i]||(r.style.display="")),""===r.style.display&&ce(r)&&(o[i]=pe(r))):"none"!==n&&(o[i]="none",J.set(r,"display",n)));for(i=0;i<a;i++)null!=o[i]&&(e[i].style.display=o[i]);return e}E.fn.extend({show:function(){return he(this,!0)},hide:function(){return he(this)},toggle:function(e){return"boolean"==typeof e?e?this.show():this.hide():this.each((function(){ce(this)?E(this).show():E(this).hide()}))}});var me=/^(?:checkbox|radio)$/i,ve=/<([a-z][^\/\0>\x20\t\r\n\f]*)/i,ye=/^$|^module$|\/(?:java|ecma)script/i,be={option:[1,"<select multiple='multiple'>","</select>"],thead:[1,"<table>","</table>"],col:[2,"<table><colgroup>","</colgroup></table>"],tr:[2,"<table><tbody>","</tbody></table>"],td:[3,"<table><tbody><tr>","</tr></tbody></table>"],_default:[0,"",""]};function ge(e,t){var n;return n=void 0!==e.getElementsByTagName?e.getElementsByTagName(t||"*"):void 0!==e.querySelectorAll?e.querySelectorAll(t||"*"):[],void 0===t||t&&L(e,t)?E.merge([e],n):n}function _e(e,t){for(var n=0,r=e.length;n<r;n++)J.set(e[n],"globalEval",!t||J.get(t[n],"globalEval"))}be.optgroup=be.option,be.tbody=be.tfoot=be.colgroup=be.caption=be.thead,be.th=be.td;var we,xe,Ee=/<|&#?\w+;/;function ke(e,t,n,r,o){for(var i,a,s,l,c,u,f=t.createDocumentFragment(),d=[],p=0,h=e.length;p<h;p++)if((i=e[p])||0===i)if("object"===x(i))E.merge(d,i.nodeType?[i]:i);else if(Ee.test(i)){for(a=a||f.appendChild(t.createElement("div")),s=(ve.exec(i)||["",""])[1].toLowerCase(),l=be[s]||be._default,a.innerHTML=l[1]+E.htmlPrefilter(i)+l[2],u=l[0];u--;)a=a.lastChild;E.merge(d,a.childNodes),(a=f.firstChild).textContent=""}else d.push(t.createTextNode(i));for(f.textContent="",p=0;i=d[p++];)if(r&&E.inArray(i,r)>-1)o&&o.push(i);else if(c=se(i),a=ge(f.appendChild(i),"script"),c&&_e(a),n)for(u=0;i=a[u++];)ye.test(i.type||"")&&n.push(i);return f}we=a.createDocumentFragment().appendChild(a.createElement("div")),(xe=a.createElement("input")).setAttribute("type","radio"),xe.setAttribute("checked","checked"),xe.setAttribute("name","t"),we.appendChild(xe),y.checkClone=we.cloneNode(!0).cloneNode(!0).lastChild.checked,we.innerHTML="<textarea>x</textarea>",y.noCloneChecked=!!we.cloneNode(!0).lastChild.defaultValue;var je=/^key/,Te=/^(?:mouse|pointer|contextmenu|drag|drop)|click/,Oe=/^([^.]*)(?:\.(.+)|)/;function Ce(){return!0}function Se(){return!1}function Le(e,t){return e===function(){try{return a.activeElement}catch(e){}}()==("focus"===t)}function Pe(e,t,n,r,o,i){var a,s;if("object"==typeof t){for(s in"string"!=typeof n&&(r=r||n,n=void 0),t)Pe(e,s,n,r,t[s],i);return e}if(null==r&&null==o?(o=n,r=n=void 0):null==o&&("string"==typeof n?(o=r,r=void 0):(o=r,r=n,n=void 0)),!1===o)o=Se;else if(!o)return e;return 1===i&&(a=o,(o=function(e){return E().off(e),a.apply(this,arguments)}).guid=a.guid||(a.guid=E.guid++)),e.each((function(){E.event.add(this,t,o,r,n)}))}function Ne(e,t,n){n?(J.set(e,t,!1),E.event.add(e,t,{namespace:!1,handler:function(e){var r,o,i=J.get(this,t);if(1&e.isTrigger&&this[t]){if(i.length)(E.event.special[t]||{}).delegateType&&e.stopPropagation();else if(i=l.call(arguments),J.set(this,t,i),r=n(this,t),this[t](),i!==(o=J.get(this,t))||r?J.set(this,t,!1):o={},i!==o)return e.stopImmediatePropagation(),e.preventDefault(),o.value}else i.length&&(J.set(this,t,{value:E.event.trigger(E.extend(i[0],E.Event.prototype),i.slice(1),this)}),e.stopImmediatePropagation())}})):void 0===J.get(e,t)&&E.event.add(e,t,Ce)}E.event={global:{},add:function(e,t,n,r,o){var i,a,s,l,c,u,f,d,p,h,m,v=J.get(e);if(v)for(n.handler&&(n=(i=n).handler,o=i.selector),o&&E.find.matchesSelector(ae,o),n.guid||(n.guid=E.guid++),(l=v.events)||(l=v.events={}),(a=v.handle)||(a=v.handle=function(t){return void 0!==E&&E.event.triggered!==t.type?E.event.dispatch.apply(e,arguments):void 0}),c=(t=(t||"").match(I)||[""]).length;c--;)p=m=(s=Oe.exec(t[c])||[])[1],h=(s[2]||"").split(".").sort(),p&&(f=E.event.special[p]||{},p=(o?f.delegateType:f.bindType)||p,f=E.event.special[p]||{},u=E.extend({type:p,origType:m,data:r,handler:n,guid:n.guid,selector:o,needsContext:o&&E.expr.match.needsContext.test(o),namespace:h.join(".")},i),(d=l[p])||((d=l[p]=[]).delegateCount=0,f.setup&&!1!==f.setup.call(e,r,h,a)||e.addEventListener&&e.addEventListener(p,a)),f.add&&(f.add.call(e,u),u.handler.guid||(u.handler.guid=n.guid)),o?d.splice(d.delegateCount++,0,u):d.push(u),E.event.global[p]=!0)},remove:function(e,t,n,r,o){var i,a,s,l,c,u,f,d,p,h,m,v=J.hasData(e)&&J.get(e);if(v&&(l=v.events)){for(c=(t=(t||"").match(I)||[""]).length;c--;)if(p=m=(s=Oe.exec(t[c])||[])[1],h=(s[2]||"").split(".").sort(),p){for(f=E.event.special[p]||{},d=l[p=(r?f.delegateType:f.bindType)||p]||[],s=s[2]&&new RegExp("(^|\\.)"+h.join("\\.(?:.*\\.|)")+"(\\.|$)"),a=i=d.length;i--;)u=d[i],!o&&m!==u.origType||n&&n.guid!==u.guid||s&&!s.test(u.namespace)||r&&r!==u.selector&&("**"!==r||!u.selector)||(d.splice(i,1),u.selector&&d.delegateCount--,f.remove&&f.remove.call(e,u));a&&!d.length&&(f.teardown&&!1!==f.teardown.call(e,h,v.handle)||E.removeEvent(e,p,v.handle),delete l[p])}else for(p in l)E.event.remove(e,p+t[c],n,r,!0);E.isEmptyObject(l)&&J.remove(e,"handle events")}},dispatch:function(e){var t,n,r,o,i,a,s=E.event.fix(e),l=new Array(arguments.length),c=(J.get(this,"events")||{})[s.type]||[],u=E.event.special[s.type]||{};for(l[0]=s,t=1;t<arguments.length;t++)l[t]=arguments[t];if(s.delegateTarget=this,!u.preDispatch||!1!==u.preDispatch.call(this,s)){for(a=E.event.handlers.call(this,s,c),t=0;(o=a[t++])&&!s.isPropagationStopped();)for(s.currentTarget=o.elem,n=0;(i=o.handlers[n++])&&!s.isImmediatePropagationStopped();)s.rnamespace&&!1!==i.namespace&&!s.rnamespace.test(i.namespace)||(s.handleObj=i,s.data=i.data,void 0!==(r=((E.event.special[i.origType]||{}).handle||i.handler).apply(o.elem,l))&&!1===(s.result=r)&&(s.preventDefault(),s.stopPropagation()));return u.postDispatch&&u.postDispatch.call(this,s),s.result}},handlers:function(e,t){var n,r,o,i,a,s=[],l=t.delegateCount,c=e.target;if(l&&c.nodeType&&!("click"===e.type&&e.button>=1))for(;c!==this;c=c.parentNode||this)if(1===c.nodeType&&("click"!==e.type||!0!==c.disabled)){for(i=[],a={},n=0;n<l;n++)void 0===a[o=(r=t[n]).selector+" "]&&(a[o]=r.needsContext?E(o,this).index(c)>-1:E.find(o,this,null,[c]).length),a[o]&&i.push(r);i.length&&s.push({elem:c,handlers:i})}return c=this,l<t.length&&s.push({elem:c,handlers:t.slice(l)}),s},addProp:function(e,t){Object.defineProperty(E.Event.prototype,e,{enumerable:!0,configurable:!0,get:b(t)?function(){if(this.originalEvent)return t(this.originalEvent)}:function(){if(this.originalEvent)return this.originalEvent[e]},set:function(t){Object.defineProperty(this,e,{enumerable:!0,configurable:!0,writable:!0,value:t})}})},fix:function(e){return e[E.expando]?e:new E.Event(e)},special:{load:{noBubble:!0},click:{setup:function(e){var t=this||e;return me.test(t.type)&&t.click&&L(t,"input")&&Ne(t,"click",Ce),!1},trigger:function(e){var t=this||e;return me.test(t.type)&&t.click&&L(t,"input")&&Ne(t,"click"),!0},_default:function(e){var t=e.target;return me.test(t.type)&&t.click&&L(t,"input")&&J.get(t,"click")||L(t,"a")}},beforeunload:{postDispatch:function(e){void 0!==e.result&&e.originalEvent&&(e.originalEvent.returnValue=e.result)}}}},E.removeEvent=function(e,t,n){e.removeEventListener&&e.removeEventListener(t,n)},E.Event=function(e,t){if(!(this instanceof E.Event))return new E.Event(e,t);e&&e.type?(this.originalEvent=e,this.type=e.type,this.isDefaultPrevented=e.defaultPrevented||void 0===e.defaultPrevented&&!1===e.returnValue?Ce:Se,this.target=e.target&&3===e.target.nodeType?e.target.parentNode:e.target,this.currentTarget=e.currentTarget,this.relatedTarget=e.relatedTarget):this.type=e,t&&E.extend(this,t),this.timeStamp=e&&e.timeStamp||Date.now(),this[E.expando]=!0},E.Event.prototype={constructor:E.Event,isDefaultPrevented:Se,isPropagationStopped:Se,isImmediatePropagationStopped:Se,isSimulated:!1,preventDefault:function(){var e=this.originalEvent;this.isDefaultPrevented=Ce,e&&!this.isSimulated&&e.preventDefault()},stopPropagation:function(){var e=this.originalEvent;this.isPropagationStopped=Ce,e&&!this.isSimulated&&e.stopPropagation()},stopImmediatePropagation:function(){var e=this.originalEvent;this.isImmediatePropagationStopped=Ce,e&&!this.isSimulated&&e.stopImmediatePropagation(),this.stopPropagation()}},E.each({altKey:!0,bubbles:!0,cancelable:!0,changedTouches:!0,ctrlKey:!0,detail:!0,eventPhase:!0,metaKey:!0,pageX:!0,pageY:!0,shiftKey:!0,view:!0,char:!0,code:!0,charCode:!0,key:!0,keyCode:!0,button:!0,buttons:!0,clientX:!0,clientY:!0,offsetX:!0,offsetY:!0,pointerId:!0,pointerType:!0,screenX:!0,screenY:!0,targetTouches:!0,toElement:!0,touches:!0,which:function(e){var t=e.button;return null==e.which&&je.test(e.type)?null!=e.charCode?e.charCode:e.keyCode:!e.which&&void 0!==t&&Te.test(e.type)?1&t?1:2&t?3:4&t?2:0:e.which}},E.event.addProp),E.each({focus:"focusin",blur:"focusout"},(function(e,t){E.event.special[e]={setup:function(){return Ne(this,e,Le),!1},trigger:function(){return Ne(this,e),!0},delegateType:t}})),E.each({mouseenter:"mouseover",mouseleave:"mouseout",pointerenter:"pointerover",pointerleave:"pointerout"},(function(e,t){E.event.special[e]={delegateType:t,bindType:t,handle:function(e){var n,r=this,o=e.relatedTarget,i=e.handleObj;return o&&(o===r||E.contains(r,o))||(e.type=i.origType,n=i.handler.apply(this,arguments),e.type=t),n}}})),E.fn.extend({on:function(e,t,n,r){return Pe(this,e,t,n,r)},one:function(e,t,n,r){return Pe(this,e,t,n,r,1)},off:function(e,t,n){var r,o;if(e&&e.preventDefault&&e.handleObj)return r=e.handleObj,E(e.delegateTarget).off(r.namespace?r.origType+"."+r.namespace:r.origType,r.selector,r.handler),this;if("object"==typeof e){for(o in e)this.off(o,t,e[o]);return this}return!1!==t&&"function"!=typeof t||(n=t,t=void 0),!1===n&&(n=Se),this.each((function(){E.event.remove(this,e,n,t)}))}});var Ae=/<(?!area|br|col|embed|hr|img|input|link|meta|param)(([a-z][^\/\0>\x20\t\r\n\f]*)[^>]*)\/>/gi,Me=/<script|<style|<link/i,De=/checked\s*(?:[^=]|=\s*.checked.)/i,He=/^\s*<!(?:\[CDATA\[|--)|(?:\]\]|--)>\s*$/g;function Re(e,t){return L(e,"table")&&L(11!==t.nodeType?t:t.firstChild,"tr")&&E(e).children("tbody")[0]||e}function Ie(e){return e.type=(null!==e.getAttribute("type"))+"/"+e.type,e}function Fe(e){return"true/"===(e.type||"").slice(0,5)?e.type=e.type.slice(5):e.removeAttribute("type"),e}function ze(e,t){var n,r,o,i,a,s,l,c;if(1===t.nodeType){if(J.hasData(e)&&(i=J.access(e),a=J.set(t,i),c=i.events))for(o in delete a.handle,a.events={},c)for(n=0,r=c[o].length;n<r;n++)E.event.add(t,o,c[o][n]);Z.hasData(e)&&(s=Z.access(e),l=E.extend({},s),Z.set(t,l))}}function Ge(e,t){var n=t.nodeName.toLowerCase();"input"===n&&me.test(e.type)?t.checked=e.checked:"input"!==n&&"textarea"!==n||(t.defaultValue=e.defaultValue)}function Ue(e,t,n,r){t=c.apply([],t);var o,i,a,s,l,u,f=0,d=e.length,p=d-1,h=t[0],m=b(h);if(m||d>1&&"string"==typeof h&&!y.checkClone&&De.test(h))return e.each((function(o){var i=e.eq(o);m&&(t[0]=h.call(this,o,i.html())),Ue(i,t,n,r)}));if(d&&(i=(o=ke(t,e[0].ownerDocument,!1,e,r)).firstChild,1===o.childNodes.length&&(o=i),i||r)){for(s=(a=E.map(ge(o,"script"),Ie)).length;f<d;f++)l=o,f!==p&&(l=E.clone(l,!0,!0),s&&E.merge(a,ge(l,"script"))),n.call(e[f],l,f);if(s)for(u=a[a.length-1].ownerDocument,E.map(a,Fe),f=0;f<s;f++)l=a[f],ye.test(l.type||"")&&!J.access(l,"globalEval")&&E.contains(u,l)&&(l.src&&"module"!==(l.type||"").toLowerCase()?E._evalUrl&&!l.noModule&&E._evalUrl(l.src,{nonce:l.nonce||l.getAttribute("nonce")}):w(l.textContent.replace(He,""),l,u))}return e}function Be(e,t,n){for(var r,o=t?E.filter(t,e):e,i=0;null!=(r=o[i]);i++)n||1!==r.nodeType||E.cleanData(ge(r)),r.parentNode&&(n&&se(r)&&_e(ge(r,"script")),r.parentNode.removeChild(r));return e}E.extend({htmlPrefilter:function(e){return e.replace(Ae,"<$1></$2>")},clone:function(e,t,n){var r,o,i,a,s=e.cloneNode(!0),l=se(e);if(!(y.noCloneChecked||1!==e.nodeType&&11!==e.nodeType||E.isXMLDoc(e)))for(a=ge(s),r=0,o=(i=ge(e)).length;r<o;r++)Ge(i[r],a[r]);if(t)if(n)for(i=i||ge(e),a=a||ge(s),r=0,o=i.length;r<o;r++)ze(i[r],a[r]);else ze(e,s);return(a=ge(s,"script")).length>0&&_e(a,!l&&ge(e,"script")),s},cleanData:function(e){for(var t,n,r,o=E.event.special,i=0;void 0!==(n=e[i]);i++)if(K(n)){if(t=n[J.expando]){if(t.events)for(r in t.events)o[r]?E.event.remove(n,r):E.removeEvent(n,r,t.handle);n[J.expando]=void 0}n[Z.expando]&&(n[Z.expando]=void 0)}}}),E.fn.extend({detach:function(e){return Be(this,e,!0)},remove:function(e){return Be(this,e)},text:function(e){return q(this,(function(e){return void 0===e?E.text(this):this.empty().each((function(){1!==this.nodeType&&11!==this.nodeType&&9!==this.nodeType||(this.textContent=e)}))}),null,e,arguments.length)},append:function(){return Ue(this,arguments,(function(e){1!==this.nodeType&&11!==this.nodeType&&9!==this.nodeType||Re(this,e).appendChild(e)}))},prepend:function(){return Ue(this,arguments,(function(e){if(1===this.nodeType||11===this.nodeType||9===this.nodeType){var t=Re(this,e);t.insertBefore(e,t.firstChild)}}))},before:function(){return Ue(this,arguments,(function(e){this.parentNode&&this.parentNode.insertBefore(e,this)}))},after:function(){return Ue(this,arguments,(function(e){this.parentNode&&this.parentNode.insertBefore(e,this.nextSibling)}))},empty:function(){for(var e,t=0;null!=(e=this[t]);t++)1===e.nodeType&&(E.cleanData(ge(e,!1)),e.textContent="");return this},clone:function(e,t){return e=null!=e&&e,t=null==t?e:t,this.map((function(){return E.clone(this,e,t)}))},html:function(e){return q(this,(function(e){var t=this[0]||{},n=0,r=this.length;if(void 0===e&&1===t.nodeType)return t.innerHTML;if("string"==typeof e&&!Me.test(e)&&!be[(ve.exec(e)||["",""])[1].toLowerCase()]){e=E.htmlPrefilter(e);try{for(;n<r;n++)1===(t=this[n]||{}).nodeType&&(E.cleanData(ge(t,!1)),t.innerHTML=e);t=0}catch(e){}}t&&this.empty().append(e)}),null,e,arguments.length)},replaceWith:function(){var e=[];return Ue(this,arguments,(function(t){var n=this.parentNode;E.inArray(this,e)<0&&(E.cleanData(ge(this)),n&&n.replaceChild(t,this))}),e)}}),E.each({appendTo:"append",prependTo:"prepend",insertBefore:"before",insertAfter:"after",replaceAll:"replaceWith"},(function(e,t){E.fn[e]=function(e){for(var n,r=[],o=E(e),i=o.length-1,a=0;a<=i;a++)n=a===i?this:this.clone(!0),E(o[a])[t](n),u.apply(r,n.get());return this.pushStack(r)}}));var We=new RegExp("^("+re+")(?!px)[a-z%]+$","i"),qe=function(e){var t=e.ownerDocument.defaultView;return t&&t.opener||(t=n),t.getComputedStyle(e)},Ve=new RegExp(ie.join("|"),"i");function $e(e,t,n){var r,o,i,a,s=e.style;return(n=n||qe(e))&&(""!==(a=n.getPropertyValue(t)||n[t])||se(e)||(a=E.style(e,t)),!y.pixelBoxStyles()&&We.test(a)&&Ve.test(t)&&(r=s.width,o=s.minWidth,i=s.maxWidth,s.minWidth=s.maxWidth=s.width=a,a=n.width,s.width=r,s.minWidth=o,s.maxWidth=i)),void 0!==a?a+"":a}function Xe(e,t){return{get:function(){if(!e())return(this.get=t).apply(this,arguments);delete this.get}}}!function(){function e(){if(u){c.style.cssText="position:absolute;left:-11111px;width:60px;margin-top:1px;padding:0;border:0",u.style.cssText="position:relative;display:block;box-sizing:border-box;overflow:scroll;margin:auto;border:1px;padding:1px;width:60%;top:1%",ae.appendChild(c).appendChild(u);var e=n.getComputedStyle(u);r="1%"!==e.top,l=12===t(e.marginLeft),u.style.right="60%",s=36===t(e.right),o=36===t(e.width),u.style.position="absolute",i=12===t(u.offsetWidth/3),ae.removeChild(c),u=null}}function t(e){return Math.round(parseFloat(e))}var r,o,i,s,l,c=a.createElement("div"),u=a.createElement("div");u.style&&(u.style.backgroundClip="content-box",u.cloneNode(!0).style.backgroundClip="",y.clearCloneStyle="content-box"===u.style.backgroundClip,E.extend(y,{boxSizingReliable:function(){return e(),o},pixelBoxStyles:function(){return e(),s},pixelPosition:function(){return e(),r},reliableMarginLeft:function(){return e(),l},scrollboxSize:function(){return e(),i}}))}();var Ye=["Webkit","Moz","ms"],Ke=a.createElement("div").style,Qe={};function Je(e){var t=E.cssProps[e]||Qe[e];return t||(e in Ke?e:Qe[e]=function(e){for(var t=e[0].toUpperCase()+e.slice(1),n=Ye.length;n--;)if((e=Ye[n]+t)in Ke)return e}(e)||e)}var Ze=/^(none|table(?!-c[ea]).+)/,et=/^--/,tt={position:"absolute",visibility:"hidden",display:"block"},nt={letterSpacing:"0",fontWeight:"400"};function rt(e,t,n){var r=oe.exec(t);return r?Math.max(0,r[2]-(n||0))+(r[3]||"px"):t}function ot(e,t,n,r,o,i){var a="width"===t?1:0,s=0,l=0;if(n===(r?"border":"content"))return 0;for(;a<4;a+=2)"margin"===n&&(l+=E.css(e,n+ie[a],!0,o)),r?("content"===n&&(l-=E.css(e,"padding"+ie[a],!0,o)),"margin"!==n&&(l-=E.css(e,"border"+ie[a]+"Width",!0,o))):(l+=E.css(e,"padding"+ie[a],!0,o),"padding"!==n?l+=E.css(e,"border"+ie[a]+"Width",!0,o):s+=E.css(e,"border"+ie[a]+"Width",!0,o));return!r&&i>=0&&(l+=Math.max(0,Math.ceil(e["offset"+t[0].toUpperCase()+t.slice(1)]-i-l-s-.5))||0),l}function it(e,t,n){var r=qe(e),o=(!y.boxSizingReliable()||n)&&"border-box"===E.css(e,"boxSizing",!1,r),i=o,a=$e(e,t,r),s="offset"+t[0].toUpperCase()+t.slice(1);if(We.test(a)){if(!n)return a;a="auto"}return(!y.boxSizingReliable()&&o||"auto"===a||!parseFloat(a)&&"inline"===E.css(e,"display",!1,r))&&e.getClientRects().length&&(o="border-box"===E.css(e,"boxSizing",!1,r),(i=s in e)&&(a=e[s])),(a=parseFloat(a)||0)+ot(e,t,n||(o?"border":"content"),i,r,a)+"px"}function at(e,t,n,r,o){return new at.prototype.init(e,t,n,r,o)}E.extend({cssHooks:{opacity:{get:function(e,t){if(t){var n=$e(e,"opacity");return""===n?"1":n}}}},cssNumber:{animationIterationCount:!0,columnCount:!0,fillOpacity:!0,flexGrow:!0,flexShrink:!0,fontWeight:!0,gridArea:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnStart:!0,gridRow:!0,gridRowEnd:!0,gridRowStart:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,widows:!0,zIndex:!0,zoom:!0},cssProps:{},style:function(e,t,n,r){if(e&&3!==e.nodeType&&8!==e.nodeType&&e.style){var o,i,a,s=Y(t),l=et.test(t),c=e.style;if(l||(t=Je(s)),a=E.cssHooks[t]||E.cssHooks[s],void 0===n)return a&&"get"in a&&void 0!==(o=a.get(e,!1,r))?o:c[t];"string"===(i=typeof n)&&(o=oe.exec(n))&&o[1]&&(n=fe(e,t,o),i="number"),null!=n&&n==n&&("number"!==i||l||(n+=o&&o[3]||(E.cssNumber[s]?"":"px")),y.clearCloneStyle||""!==n||0!==t.indexOf("background")||(c[t]="inherit"),a&&"set"in a&&void 0===(n=a.set(e,n,r))||(l?c.setProperty(t,n):c[t]=n))}},css:function(e,t,n,r){var o,i,a,s=Y(t);return et.test(t)||(t=Je(s)),(a=E.cssHooks[t]||E.cssHooks[s])&&"get"in a&&(o=a.get(e,!0,n)),void 0===o&&(o=$e(e,t,r)),"normal"===o&&t in nt&&(o=nt[t]),""===n||n?(i=parseFloat(o),!0===n||isFinite(i)?i||0:o):o}}),E.each(["height","width"],(function(e,t){E.cssHooks[t]={get:function(e,n,r){if(n)return!Ze.test(E.css(e,"display"))||e.getClientRects().length&&e.getBoundingClientRect().width?it(e,t,r):ue(e,tt,(function(){return it(e,t,r)}))},set:function(e,n,r){var o,i=qe(e),a=!y.scrollboxSize()&&"absolute"===i.position,s=(a||r)&&"border-box"===E.css(e,"boxSizing",!1,i),l=r?ot(e,t,r,s,i):0;return s&&a&&(l-=Math.ceil(e["offset"+t[0].toUpperCase()+t.slice(1)]-parseFloat(i[t])-ot(e,t,"border",!1,i)-.5)),l&&(o=oe.exec(n))&&"px"!==(o[3]||"px")&&(e.style[t]=n,n=E.css(e,t)),rt(0,n,l)}}})),E.cssHooks.marginLeft=Xe(y.reliableMarginLeft,(function(e,t){if(t)return(parseFloat($e(e,"marginLeft"))||e.getBoundingClientRect().left-ue(e,{marginLeft:0},(function(){return e.getBoundingClientRect().left})))+"px"})),E.each({margin:"",padding:"",border:"Width"},(function(e,t){E.cssHooks[e+t]={expand:function(n){for(var r=0,o={},i="string"==typeof n?n.split(" "):[n];r<4;r++)o[e+ie[r]+t]=i[r]||i[r-2]||i[0];return o}},"margin"!==e&&(E.cssHooks[e+t].set=rt)})),E.fn.extend({css:function(e,t){return q(this,(function(e,t,n){var r,o,i={},a=0;if(Array.isArray(t)){for(r=qe(e),o=t.length;a<o;a++)i[t[a]]=E.css(e,t[a],!1,r);return i}return void 0!==n?E.style(e,t,n):E.css(e,t)}),e,t,arguments.length>1)}}),E.Tween=at,at.prototype={constructor:at,init:function(e,t,n,r,o,i){this.elem=e,this.prop=n,this.easing=o||E.easing._default,this.options=t,this.start=this.now=this.cur(),this.end=r,this.unit=i||(E.cssNumber[n]?"":"px")},cur:function(){var e=at.propHooks[this.prop];return e&&e.get?e.get(this):at.propHooks._default.get(this)},run:function(e){var t,n=at.propHooks[this.prop];return this.options.duration?this.pos=t=E.easing[this.easing](e,this.options.duration*e,0,1,this.options.duration):this.pos=t=e,this.now=(this.end-this.start)*t+this.start,this.options.step&&this.options.step.call(this.elem,this.now,this),n&&n.set?n.set(this):at.propHooks._default.set(this),this}},at.prototype.init.prototype=at.prototype,at.propHooks={_default:{get:function(e){var t;return 1!==e.elem.nodeType||null!=e.elem[e.prop]&&null==e.elem.style[e.prop]?e.elem[e.prop]:(t=E.css(e.elem,e.prop,""))&&"auto"!==t?t:0},set:function(e){E.fx.step[e.prop]?E.fx.step[e.prop](e):1!==e.elem.nodeType||!E.cssHooks[e.prop]&&null==e.elem.style[Je(e.prop)]?e.elem[e.prop]=e.now:E.style(e.elem,e.prop,e.now+e.unit)}}},at.propHooks.scrollTop=at.propHooks.scrollLeft={set:function(e){e.elem.nodeType&&e.elem.parentNode&&(e.elem[e.prop]=e.now)}},E.easing={linear:function(e){return e},swing:function(e){return.5-Math.cos(e*Math.PI)/2},_default:"swing"},E.fx=at.prototype.init,E.fx.step={};var st,lt,ct=/^(?:toggle|show|hide)$/,ut=/queueHooks$/;function ft(){lt&&(!1===a.hidden&&n.requestAnimationFrame?n.requestAnimationFrame(ft):n.setTimeout(ft,E.fx.interval),E.fx.tick())}function dt(){return n.setTimeout((function(){st=void 0})),st=Date.now()}function pt(e,t){var n,r=0,o={height:e};for(t=t?1:0;r<4;r+=2-t)o["margin"+(n=ie[r])]=o["padding"+n]=e;return t&&(o.opacity=o.width=e),o}function ht(e,t,n){for(var r,o=(mt.tweeners[t]||[]).concat(mt.tweeners["*"]),i=0,a=o.length;i<a;i++)if(r=o[i].call(n,t,e))return r}function mt(e,t,n){var r,o,i=0,a=mt.prefilters.length,s=E.Deferred().always((function(){delete l.elem})),l=function(){if(o)return!1;for(var t=st||dt(),n=Math.max(0,c.startTime+c.duration-t),r=1-(n/c.duration||0),i=0,a=c.tweens.length;i<a;i++)c.tweens[i].run(r);return s.notifyWith(e,[c,r,n]),r<1&&a?n:(a||s.notifyWith(e,[c,1,0]),s.resolveWith(e,[c]),!1)},c=s.promise({elem:e,props:E.extend({},t),opts:E.extend(!0,{specialEasing:{},easing:E.easing._default},n),originalProperties:t,originalOptions:n,startTime:st||dt(),duration:n.duration,tweens:[],createTween:function(t,n){var r=E.Tween(e,c.opts,t,n,c.opts.specialEasing[t]||c.opts.easing);return c.tweens.push(r),r},stop:function(t){var n=0,r=t?c.tweens.length:0;if(o)return this;for(o=!0;n<r;n++)c.tweens[n].run(1);return t?(s.notifyWith(e,[c,1,0]),s.resolveWith(e,[c,t])):s.rejectWith(e,[c,t]),this}}),u=c.props;for(!function(e,t){var n,r,o,i,a;for(n in e)if(o=t[r=Y(n)],i=e[n],Array.isArray(i)&&(o=i[1],i=e[n]=i[0]),n!==r&&(e[r]=i,delete e[n]),(a=E.cssHooks[r])&&"expand"in a)for(n in i=a.expand(i),delete e[r],i)n in e||(e[n]=i[n],t[n]=o);else t[r]=o}(u,c.opts.specialEasing);i<a;i++)if(r=mt.prefilters[i].call(c,e,u,c.opts))return b(r.stop)&&(E._queueHooks(c.elem,c.opts.queue).stop=r.stop.bind(r)),r;return E.map(u,ht,c),b(c.opts.start)&&c.opts.start.call(e,c),c.progress(c.opts.progress).done(c.opts.done,c.opts.complete).fail(c.opts.fail).always(c.opts.always),E.fx.timer(E.extend(l,{elem:e,anim:c,queue:c.opts.queue})),c}E.Animation=E.extend(mt,{tweeners:{"*":[function(e,t){var n=this.createTween(e,t);return fe(n.elem,e,oe.exec(t),n),n}]},tweener:function(e,t){b(e)?(t=e,e=["*"]):e=e.match(I);for(var n,r=0,o=e.length;r<o;r++)n=e[r],mt.tweeners[n]=mt.tweeners[n]||[],mt.tweeners[n].unshift(t)},prefilters:[function(e,t,n){var r,o,i,a,s,l,c,u,f="width"in t||"height"in t,d=this,p={},h=e.style,m=e.nodeType&&ce(e),v=J.get(e,"fxshow");for(r in n.queue||(null==(a=E._queueHooks(e,"fx")).unqueued&&(a.unqueued=0,s=a.empty.fire,a.empty.fire=function(){a.unqueued||s()}),a.unqueued++,d.always((function(){d.always((function(){a.unqueued--,E.queue(e,"fx").length||a.empty.fire()}))}))),t)if(o=t[r],ct.test(o)){if(delete t[r],i=i||"toggle"===o,o===(m?"hide":"show")){if("show"!==o||!v||void 0===v[r])continue;m=!0}p[r]=v&&v[r]||E.style(e,r)}if((l=!E.isEmptyObject(t))||!E.isEmptyObject(p))for(r in f&&1===e.nodeType&&(n.overflow=[h.overflow,h.overflowX,h.overflowY],null==(c=v&&v.display)&&(c=J.get(e,"display")),"none"===(u=E.css(e,"display"))&&(c?u=c:(he([e],!0),c=e.style.display||c,u=E.css(e,"display"),he([e]))),("inline"===u||"inline-block"===u&&null!=c)&&"none"===E.css(e,"float")&&(l||(d.done((function(){h.display=c})),null==c&&(u=h.display,c="none"===u?"":u)),h.display="inline-block")),n.overflow&&(h.overflow="hidden",d.always((function(){h.overflow=n.overflow[0],h.overflowX=n.overflow[1],h.overflowY=n.overflow[2]}))),l=!1,p)l||(v?"hidden"in v&&(m=v.hidden):v=J.access(e,"fxshow",{display:c}),i&&(v.hidden=!m),m&&he([e],!0),d.done((function(){for(r in m||he([e]),J.remove(e,"fxshow"),p)E.style(e,r,p[r])}))),l=ht(m?v[r]:0,r,d),r in v||(v[r]=l.start,m&&(l.end=l.start,l.start=0))}],prefilter:function(e,t){t?mt.prefilters.unshift(e):mt.prefilters.push(e)}}),E.speed=function(e,t,n){var r=e&&"object"==typeof e?E.extend({},e):{complete:n||!n&&t||b(e)&&e,duration:e,easing:n&&t||t&&!b(t)&&t};return E.fx.off?r.duration=0:"number"!=typeof r.duration&&(r.duration in E.fx.speeds?r.duration=E.fx.speeds[r.duration]:r.duration=E.fx.speeds._default),null!=r.queue&&!0!==r.queue||(r.queue="fx"),r.old=r.complete,r.complete=function(){b(r.old)&&r.old.call(this),r.queue&&E.dequeue(this,r.queue)},r},E.fn.extend({fadeTo:function(e,t,n,r){return this.filter(ce).css("opacity",0).show().end().animate({opacity:t},e,n,r)},animate:function(e,t,n,r){var o=E.isEmptyObject(e),i=E.speed(t,n,r),a=function(){var t=mt(this,E.extend({},e),i);(o||J.get(this,"finish"))&&t.stop(!0)};return a.finish=a,o||!1===i.queue?this.each(a):this.queue(i.queue,a)},stop:function(e,t,n){var r=function(e){var t=e.stop;delete e.stop,t(n)};return"string"!=typeof e&&(n=t,t=e,e=void 0),t&&!1!==e&&this.queue(e||"fx",[]),this.each((function(){var t=!0,o=null!=e&&e+"queueHooks",i=E.timers,a=J.get(this);if(o)a[o]&&a[o].stop&&r(a[o]);else for(o in a)a[o]&&a[o].stop&&ut.test(o)&&r(a[o]);for(o=i.length;o--;)i[o].elem!==this||null!=e&&i[o].queue!==e||(i[o].anim.stop(n),t=!1,i.splice(o,1));!t&&n||E.dequeue(this,e)}))},finish:function(e){return!1!==e&&(e=e||"fx"),this.each((function(){var t,n=J.get(this),r=n[e+"queue"],o=n[e+"queueHooks"],i=E.timers,a=r?r.length:0;for(n.finish=!0,E.queue(this,e,[]),o&&o.stop&&o.stop.call(this,!0),t=i.length;t--;)i[t].elem===this&&i[t].queue===e&&(i[t].anim.stop(!0),i.splice(t,1));for(t=0;t<a;t++)r[t]&&r[t].finish&&r[t].finish.call(this);delete n.finish}))}}),E.each(["toggle","show","hide"],(function(e,t){var n=E.fn[t];E.fn[t]=function(e,r,o){return null==e||"boolean"==typeof e?n.apply(this,arguments):this.animate(pt(t,!0),e,r,o)}})),E.each({slideDown:pt("show"),slideUp:pt("hide"),slideToggle:pt("toggle"),fadeIn:{opacity:"show"},fadeOut:{opacity:"hide"},fadeToggle:{opacity:"toggle"}},(function(e,t){E.fn[e]=function(e,n,r){return this.animate(t,e,n,r)}})),E.timers=[],E.fx.tick=function(){var e,t=0,n=E.timers;for(st=Date.now();t<n.length;t++)(e=n[t])()||n[t]!==e||n.splice(t--,1);n.length||E.fx.stop(),st=void 0},E.fx.timer=function(e){E.timers.push(e),E.fx.start()},E.fx.interval=13,E.fx.start=function(){lt||(lt=!0,ft())},E.fx.stop=function(){lt=null},E.fx.speeds={slow:600,fast:200,_default:400},E.fn.delay=function(e,t){return e=E.fx&&E.fx.speeds[e]||e,t=t||"fx",this.queue(t,(function(t,r){var o=n.setTimeout(t,e);r.stop=function(){n.clearTimeout(o)}}))},function(){var e=a.createElement("input"),t=a.createElement("select").appendChild(a.createElement("option"));e.type="checkbox",y.checkOn=""!==e.value,y.optSelected=t.selected,(e=a.createElement("input")).value="t",e.type="radio",y.radioValue="t"===e.value}();var vt,yt=E.expr.attrHandle;E.fn.extend({attr:function(e,t){return q(this,E.attr,e,t,arguments.length>1)},removeAttr:function(e){return this.each((function(){E.removeAttr(this,e)}))}}),E.extend({attr:function(e,t,n){var r,o,i=e.nodeType;if(3!==i&&8!==i&&2!==i)return void 0===e.getAttribute?E.prop(e,t,n):(1===i&&E.isXMLDoc(e)||(o=E.attrHooks[t.toLowerCase()]||(E.expr.match.bool.test(t)?vt:void 0)),void 0!==n?null===n?void E.removeAttr(e,t):o&&"set"in o&&void 0!==(r=o.set(e,n,t))?r:(e.setAttribute(t,n+""),n):o&&"get"in o&&null!==(r=o.get(e,t))?r:null==(r=E.find.attr(e,t))?void 0:r)},attrHooks:{type:{set:function(e,t){if(!y.radioValue&&"radio"===t&&L(e,"input")){var n=e.value;return e.setAttribute("type",t),n&&(e.value=n),t}}}},removeAttr:function(e,t){var n,r=0,o=t&&t.match(I);if(o&&1===e.nodeType)for(;n=o[r++];)e.removeAttribute(n)}}),vt={set:function(e,t,n){return!1===t?E.removeAttr(e,n):e.setAttribute(n,n),n}},E.each(E.expr.match.bool.source.match(/\w+/g),(function(e,t){var n=yt[t]||E.find.attr;yt[t]=function(e,t,r){var o,i,a=t.toLowerCase();return r||(i=yt[a],yt[a]=o,o=null!=n(e,t,r)?a:null,yt[a]=i),o}}));var bt=/^(?:input|select|textarea|button)$/i,gt=/^(?:a|area)$/i;function _t(e){return(e.match(I)||[]).join(" ")}function wt(e){return e.getAttribute&&e.getAttribute("class")||""}function xt(e){return Array.isArray(e)?e:"string"==typeof e&&e.match(I)||[]}E.fn.extend({prop:function(e,t){return q(this,E.prop,e,t,arguments.length>1)},removeProp:function(e){return this.each((function(){delete this[E.propFix[e]||e]}))}}),E.extend({prop:function(e,t,n){var r,o,i=e.nodeType;if(3!==i&&8!==i&&2!==i)return 1===i&&E.isXMLDoc(e)||(t=E.propFix[t]||t,o=E.propHooks[t]),void 0!==n?o&&"set"in o&&void 0!==(r=o.set(e,n,t))?r:e[t]=n:o&&"get"in o&&null!==(r=o.get(e,t))?r:e[t]},propHooks:{tabIndex:{get:function(e){var t=E.find.attr(e,"tabindex");return t?parseInt(t,10):bt.test(e.nodeName)||gt.test(e.nodeName)&&e.href?0:-1}}},propFix:{for:"htmlFor",class:"className"}}),y.optSelected||(E.propHooks.selected={get:function(e){var t=e.parentNode;return t&&t.parentNode&&t.parentNode.selectedIndex,null},set:function(e){var t=e.parentNode;t&&(t.selectedIndex,t.parentNode&&t.parentNode.selectedIndex)}}),E.each(["tabIndex","readOnly","maxLength","cellSpacing","cellPadding","rowSpan","colSpan","useMap","frameBorder","contentEditable"],(function(){E.propFix[this.toLowerCase()]=this})),E.fn.extend({addClass:function(e){var t,n,r,o,i,a,s,l=0;if(b(e))return this.each((function(t){E(this).addClass(e.call(this,t,wt(this)))}));if((t=xt(e)).length)for(;n=this[l++];)if(o=wt(n),r=1===n.nodeType&&" "+_t(o)+" "){for(a=0;i=t[a++];)r.indexOf(" "+i+" ")<0&&(r+=i+" ");o!==(s=_t(r))&&n.setAttribute("class",s)}return this},removeClass:function(e){var t,n,r,o,i,a,s,l=0;if(b(e))return this.each((function(t){E(this).removeClass(e.call(this,t,wt(this)))}));if(!arguments.length)return this.attr("class","");if((t=xt(e)).length)for(;n=this[l++];)if(o=wt(n),r=1===n.nodeType&&" "+_t(o)+" "){for(a=0;i=t[a++];)for(;r.indexOf(" "+i+" ")>-1;)r=r.replace(" "+i+" "," ");o!==(s=_t(r))&&n.setAttribute("class",s)}return this},toggleClass:function(e,t){var n=typeof e,r="string"===n||Array.isArray(e);return"boolean"==typeof t&&r?t?this.addClass(e):this.removeClass(e):b(e)?this.each((function(n){E(this).toggleClass(e.call(this,n,wt(this),t),t)})):this.each((function(){var t,o,i,a;if(r)for(o=0,i=E(this),a=xt(e);t=a[o++];)i.hasClass(t)?i.removeClass(t):i.addClass(t);else void 0!==e&&"boolean"!==n||((t=wt(this))&&J.set(this,"__className__",t),this.setAttribute&&this.setAttribute("class",t||!1===e?"":J.get(this,"__className__")||""))}))},hasClass:function(e){var t,n,r=0;for(t=" "+e+" ";n=this[r++];)if(1===n.nodeType&&(" "+_t(wt(n))+" ").indexOf(t)>-1)return!0;return!1}});var Et=/\r/g;E.fn.extend({val:function(e){var t,n,r,o=this[0];return arguments.length?(r=b(e),this.each((function(n){var o;1===this.nodeType&&(null==(o=r?e.call(this,n,E(this).val()):e)?o="":"number"==typeof o?o+="":Array.isArray(o)&&(o=E.map(o,(function(e){return null==e?"":e+""}))),(t=E.valHooks[this.type]||E.valHooks[this.nodeName.toLowerCase()])&&"set"in t&&void 0!==t.set(this,o,"value")||(this.value=o))}))):o?(t=E.valHooks[o.type]||E.valHooks[o.nodeName.toLowerCase()])&&"get"in t&&void 0!==(n=t.get(o,"value"))?n:"string"==typeof(n=o.value)?n.replace(Et,""):null==n?"":n:void 0}}),E.extend({valHooks:{option:{get:function(e){var t=E.find.attr(e,"value");return null!=t?t:_t(E.text(e))}},select:{get:function(e){var t,n,r,o=e.options,i=e.selectedIndex,a="select-one"===e.type,s=a?null:[],l=a?i+1:o.length;for(r=i<0?l:a?i:0;r<l;r++)if(((n=o[r]).selected||r===i)&&!n.disabled&&(!n.parentNode.disabled||!L(n.parentNode,"optgroup"))){if(t=E(n).val(),a)return t;s.push(t)}return s},set:function(e,t){for(var n,r,o=e.options,i=E.makeArray(t),a=o.length;a--;)((r=o[a]).selected=E.inArray(E.valHooks.option.get(r),i)>-1)&&(n=!0);return n||(e.selectedIndex=-1),i}}}}),E.each(["radio","checkbox"],(function(){E.valHooks[this]={set:function(e,t){if(Array.isArray(t))return e.checked=E.inArray(E(e).val(),t)>-1}},y.checkOn||(E.valHooks[this].get=function(e){return null===e.getAttribute("value")?"on":e.value})})),y.focusin="onfocusin"in n;var kt=/^(?:focusinfocus|focusoutblur)$/,jt=function(e){e.stopPropagation()};E.extend(E.event,{trigger:function(e,t,r,o){var i,s,l,c,u,f,d,p,m=[r||a],v=h.call(e,"type")?e.type:e,y=h.call(e,"namespace")?e.namespace.split("."):[];if(s=p=l=r=r||a,3!==r.nodeType&&8!==r.nodeType&&!kt.test(v+E.event.triggered)&&(v.indexOf(".")>-1&&(y=v.split("."),v=y.shift(),y.sort()),u=v.indexOf(":")<0&&"on"+v,(e=e[E.expando]?e:new E.Event(v,"object"==typeof e&&e)).isTrigger=o?2:3,e.namespace=y.join("."),e.rnamespace=e.namespace?new RegExp("(^|\\.)"+y.join("\\.(?:.*\\.|)")+"(\\.|$)"):null,e.result=void 0,e.target||(e.target=r),t=null==t?[e]:E.makeArray(t,[e]),d=E.event.special[v]||{},o||!d.trigger||!1!==d.trigger.apply(r,t))){if(!o&&!d.noBubble&&!g(r)){for(c=d.delegateType||v,kt.test(c+v)||(s=s.parentNode);s;s=s.parentNode)m.push(s),l=s;l===(r.ownerDocument||a)&&m.push(l.defaultView||l.parentWindow||n)}for(i=0;(s=m[i++])&&!e.isPropagationStopped();)p=s,e.type=i>1?c:d.bindType||v,(f=(J.get(s,"events")||{})[e.type]&&J.get(s,"handle"))&&f.apply(s,t),(f=u&&s[u])&&f.apply&&K(s)&&(e.result=f.apply(s,t),!1===e.result&&e.preventDefault());return e.type=v,o||e.isDefaultPrevented()||d._default&&!1!==d._default.apply(m.pop(),t)||!K(r)||u&&b(r[v])&&!g(r)&&((l=r[u])&&(r[u]=null),E.event.triggered=v,e.isPropagationStopped()&&p.addEventListener(v,jt),r[v](),e.isPropagationStopped()&&p.removeEventListener(v,jt),E.event.triggered=void 0,l&&(r[u]=l)),e.result}},simulate:function(e,t,n){var r=E.extend(new E.Event,n,{type:e,isSimulated:!0});E.event.trigger(r,null,t)}}),E.fn.extend({trigger:function(e,t){return this.each((function(){E.event.trigger(e,t,this)}))},triggerHandler:function(e,t){var n=this[0];if(n)return E.event.trigger(e,t,n,!0)}}),y.focusin||E.each({focus:"focusin",blur:"focusout"},(function(e,t){var n=function(e){E.event.simulate(t,e.target,E.event.fix(e))};E.event.special[t]={setup:function(){var r=this.ownerDocument||this,o=J.access(r,t);o||r.addEventListener(e,n,!0),J.access(r,t,(o||0)+1)},teardown:function(){var r=this.ownerDocument||this,o=J.access(r,t)-1;o?J.access(r,t,o):(r.removeEventListener(e,n,!0),J.remove(r,t))}}}));var Tt=n.location,Ot=Date.now(),Ct=/\?/;E.parseXML=function(e){var t;if(!e||"string"!=typeof e)return null;try{t=(new n.DOMParser).parseFromString(e,"text/xml")}catch(e){t=void 0}return t&&!t.getElementsByTagName("parsererror").length||E.error("Invalid XML: "+e),t};var St=/\[\]$/,Lt=/\r?\n/g,Pt=/^(?:submit|button|image|reset|file)$/i,Nt=/^(?:input|select|textarea|keygen)/i;function At(e,t,n,r){var o;if(Array.isArray(t))E.each(t,(function(t,o){n||St.test(e)?r(e,o):At(e+"["+("object"==typeof o&&null!=o?t:"")+"]",o,n,r)}));else if(n||"object"!==x(t))r(e,t);else for(o in t)At(e+"["+o+"]",t[o],n,r)}E.param=function(e,t){var n,r=[],o=function(e,t){var n=b(t)?t():t;r[r.length]=encodeURIComponent(e)+"="+encodeURIComponent(null==n?"":n)};if(null==e)return"";if(Array.isArray(e)||e.jquery&&!E.isPlainObject(e))E.each(e,(function(){o(this.name,this.value)}));else for(n in e)At(n,e[n],t,o);return r.join("&")},E.fn.extend({serialize:function(){return E.param(this.serializeArray())},serializeArray:function(){return this.map((function(){var e=E.prop(this,"elements");return e?E.makeArray(e):this})).filter((function(){var e=this.type;return this.name&&!E(this).is(":disabled")&&Nt.test(this.nodeName)&&!Pt.test(e)&&(this.checked||!me.test(e))})).map((function(e,t){var n=E(this).val();return null==n?null:Array.isArray(n)?E.map(n,(function(e){return{name:t.name,value:e.replace(Lt,"\r\n")}})):{name:t.name,value:n.replace(Lt,"\r\n")}})).get()}});var Mt=/%20/g,Dt=/#.*$/,Ht=/([?&])_=[^&]*/,Rt=/^(.*?):[ \t]*([^\r\n]*)$/gm,It=/^(?:GET|HEAD)$/,Ft=/^\/\//,zt={},Gt={},Ut="*/".concat("*"),Bt=a.createElement("a");function Wt(e){return function(t,n){"string"!=typeof t&&(n=t,t="*");var r,o=0,i=t.toLowerCase().match(I)||[];if(b(n))for(;r=i[o++];)"+"===r[0]?(r=r.slice(1)||"*",(e[r]=e[r]||[]).unshift(n)):(e[r]=e[r]||[]).push(n)}}function qt(e,t,n,r){var o={},i=e===Gt;function a(s){var l;return o[s]=!0,E.each(e[s]||[],(function(e,s){var c=s(t,n,r);return"string"!=typeof c||i||o[c]?i?!(l=c):void 0:(t.dataTypes.unshift(c),a(c),!1)})),l}return a(t.dataTypes[0])||!o["*"]&&a("*")}function Vt(e,t){var n,r,o=E.ajaxSettings.flatOptions||{};for(n in t)void 0!==t[n]&&((o[n]?e:r||(r={}))[n]=t[n]);return r&&E.extend(!0,e,r),e}Bt.href=Tt.href,E.extend({active:0,lastModified:{},etag:{},ajaxSettings:{url:Tt.href,type:"GET",isLocal:/^(?:about|app|app-storage|.+-extension|file|res|widget):$/.test(Tt.protocol),global:!0,processData:!0,async:!0,contentType:"application/x-www-form-urlencoded; charset=UTF-8",accepts:{"*":Ut,text:"text/plain",html:"text/html",xml:"application/xml, text/xml",json:"application/json, text/javascript"},contents:{xml:/\bxml\b/,html:/\bhtml/,json:/\bjson\b/},responseFields:{xml:"responseXML",text:"responseText",json:"responseJSON"},converters:{"* text":String,"text html":!0,"text json":JSON.parse,"text xml":E.parseXML},flatOptions:{url:!0,context:!0}},ajaxSetup:function(e,t){return t?Vt(Vt(e,E.ajaxSettings),t):Vt(E.ajaxSettings,e)},ajaxPrefilter:Wt(zt),ajaxTransport:Wt(Gt),ajax:function(e,t){"object"==typeof e&&(t=e,e=void 0),t=t||{};var r,o,i,s,l,c,u,f,d,p,h=E.ajaxSetup({},t),m=h.context||h,v=h.context&&(m.nodeType||m.jquery)?E(m):E.event,y=E.Deferred(),b=E.Callbacks("once memory"),g=h.statusCode||{},_={},w={},x="canceled",k={readyState:0,getResponseHeader:function(e){var t;if(u){if(!s)for(s={};t=Rt.exec(i);)s[t[1].toLowerCase()+" "]=(s[t[1].toLowerCase()+" "]||[]).concat(t[2]);t=s[e.toLowerCase()+" "]}return null==t?null:t.join(", ")},getAllResponseHeaders:function(){return u?i:null},setRequestHeader:function(e,t){return null==u&&(e=w[e.toLowerCase()]=w[e.toLowerCase()]||e,_[e]=t),this},overrideMimeType:function(e){return null==u&&(h.mimeType=e),this},statusCode:function(e){var t;if(e)if(u)k.always(e[k.status]);else for(t in e)g[t]=[g[t],e[t]];return this},abort:function(e){var t=e||x;return r&&r.abort(t),j(0,t),this}};if(y.promise(k),h.url=((e||h.url||Tt.href)+"").replace(Ft,Tt.protocol+"//"),h.type=t.method||t.type||h.method||h.type,h.dataTypes=(h.dataType||"*").toLowerCase().match(I)||[""],null==h.crossDomain){c=a.createElement("a");try{c.href=h.url,c.href=c.href,h.crossDomain=Bt.protocol+"//"+Bt.host!=c.protocol+"//"+c.host}catch(e){h.crossDomain=!0}}if(h.data&&h.processData&&"string"!=typeof h.data&&(h.data=E.param(h.data,h.traditional)),qt(zt,h,t,k),u)return k;for(d in(f=E.event&&h.global)&&0==E.active++&&E.event.trigger("ajaxStart"),h.type=h.type.toUpperCase(),h.hasContent=!It.test(h.type),o=h.url.replace(Dt,""),h.hasContent?h.data&&h.processData&&0===(h.contentType||"").indexOf("application/x-www-form-urlencoded")&&(h.data=h.data.replace(Mt,"+")):(p=h.url.slice(o.length),h.data&&(h.processData||"string"==typeof h.data)&&(o+=(Ct.test(o)?"&":"?")+h.data,delete h.data),!1===h.cache&&(o=o.replace(Ht,"$1"),p=(Ct.test(o)?"&":"?")+"_="+Ot+++p),h.url=o+p),h.ifModified&&(E.lastModified[o]&&k.setRequestHeader("If-Modified-Since",E.lastModified[o]),E.etag[o]&&k.setRequestHeader("If-None-Match",E.etag[o])),(h.data&&h.hasContent&&!1!==h.contentType||t.contentType)&&k.setRequestHeader("Content-Type",h.contentType),k.setRequestHeader("Accept",h.dataTypes[0]&&h.accepts[h.dataTypes[0]]?h.accepts[h.dataTypes[0]]+("*"!==h.dataTypes[0]?", "+Ut+"; q=0.01":""):h.accepts["*"]),h.headers)k.setRequestHeader(d,h.headers[d]);if(h.beforeSend&&(!1===h.beforeSend.call(m,k,h)||u))return k.abort();if(x="abort",b.add(h.complete),k.done(h.success),k.fail(h.error),r=qt(Gt,h,t,k)){if(k.readyState=1,f&&v.trigger("ajaxSend",[k,h]),u)return k;h.async&&h.timeout>0&&(l=n.setTimeout((function(){k.abort("timeout")}),h.timeout));try{u=!1,r.send(_,j)}catch(e){if(u)throw e;j(-1,e)}}else j(-1,"No Transport");function j(e,t,a,s){var c,d,p,_,w,x=t;u||(u=!0,l&&n.clearTimeout(l),r=void 0,i=s||"",k.readyState=e>0?4:0,c=e>=200&&e<300||304===e,a&&(_=function(e,t,n){for(var r,o,i,a,s=e.contents,l=e.dataTypes;"*"===l[0];)l.shift(),void 0===r&&(r=e.mimeType||t.getResponseHeader("Content-Type"));if(r)for(o in s)if(s[o]&&s[o].test(r)){l.unshift(o);break}if(l[0]in n)i=l[0];else{for(o in n){if(!l[0]||e.converters[o+" "+l[0]]){i=o;break}a||(a=o)}i=i||a}if(i)return i!==l[0]&&l.unshift(i),n[i]}(h,k,a)),_=function(e,t,n,r){var o,i,a,s,l,c={},u=e.dataTypes.slice();if(u[1])for(a in e.converters)c[a.toLowerCase()]=e.converters[a];for(i=u.shift();i;)if(e.responseFields[i]&&(n[e.responseFields[i]]=t),!l&&r&&e.dataFilter&&(t=e.dataFilter(t,e.dataType)),l=i,i=u.shift())if("*"===i)i=l;else if("*"!==l&&l!==i){if(!(a=c[l+" "+i]||c["* "+i]))for(o in c)if((s=o.split(" "))[1]===i&&(a=c[l+" "+s[0]]||c["* "+s[0]])){!0===a?a=c[o]:!0!==c[o]&&(i=s[0],u.unshift(s[1]));break}if(!0!==a)if(a&&e.throws)t=a(t);else try{t=a(t)}catch(e){return{state:"parsererror",error:a?e:"No conversion from "+l+" to "+i}}}return{state:"success",data:t}}(h,_,k,c),c?(h.ifModified&&((w=k.getResponseHeader("Last-Modified"))&&(E.lastModified[o]=w),(w=k.getResponseHeader("etag"))&&(E.etag[o]=w)),204===e||"HEAD"===h.type?x="nocontent":304===e?x="notmodified":(x=_.state,d=_.data,c=!(p=_.error))):(p=x,!e&&x||(x="error",e<0&&(e=0))),k.status=e,k.statusText=(t||x)+"",c?y.resolveWith(m,[d,x,k]):y.rejectWith(m,[k,x,p]),k.statusCode(g),g=void 0,f&&v.trigger(c?"ajaxSuccess":"ajaxError",[k,h,c?d:p]),b.fireWith(m,[k,x]),f&&(v.trigger("ajaxComplete",[k,h]),--E.active||E.event.trigger("ajaxStop")))}return k},getJSON:function(e,t,n){return E.get(e,t,n,"json")},getScript:function(e,t){return E.get(e,void 0,t,"script")}}),E.each(["get","post"],(function(e,t){E[t]=function(e,n,r,o){return b(n)&&(o=o||r,r=n,n=void 0),E.ajax(E.extend({url:e,type:t,dataType:o,data:n,success:r},E.isPlainObject(e)&&e))}})),E._evalUrl=function(e,t){return E.ajax({url:e,type:"GET",dataType:"script",cache:!0,async:!1,global:!1,converters:{"text script":function(){}},dataFilter:function(e){E.globalEval(e,t)}})},E.fn.extend({wrapAll:function(e){var t;return this[0]&&(b(e)&&(e=e.call(this[0])),t=E(e,this[0].ownerDocument).eq(0).clone(!0),this[0].parentNode&&t.insertBefore(this[0]),t.map((function(){for(var e=this;e.firstElementChild;)e=e.firstElementChild;return e})).append(this)),this},wrapInner:function(e){return b(e)?this.each((function(t){E(this).wrapInner(e.call(this,t))})):this.each((function(){var t=E(this),n=t.contents();n.length?n.wrapAll(e):t.append(e)}))},wrap:function(e){var t=b(e);return this.each((function(n){E(this).wrapAll(t?e.call(this,n):e)}))},unwrap:function(e){return this.parent(e).not("body").each((function(){E(this).replaceWith(this.childNodes)})),this}}),E.expr.pseudos.hidden=function(e){return!E.expr.pseudos.visible(e)},E.expr.pseudos.visible=function(e){return!!(e.offsetWidth||e.offsetHeight||e.getClientRects().length)},E.ajaxSettings.xhr=function(){try{return new n.XMLHttpRequest}catch(e){}};var $t={0:200,1223:204},Xt=E.ajaxSettings.xhr();y.cors=!!Xt&&"withCredentials"in Xt,y.ajax=Xt=!!Xt,E.ajaxTransport((function(e){var t,r;if(y.cors||Xt&&!e.crossDomain)return{send:function(o,i){var a,s=e.xhr();if(s.open(e.type,e.url,e.async,e.username,e.password),e.xhrFields)for(a in e.xhrFields)s[a]=e.xhrFields[a];for(a in e.mimeType&&s.overrideMimeType&&s.overrideMimeType(e.mimeType),e.crossDomain||o["X-Requested-With"]||(o["X-Requested-With"]="XMLHttpRequest"),o)s.setRequestHeader(a,o[a]);t=function(e){return function(){t&&(t=r=s.onload=s.onerror=s.onabort=s.ontimeout=s.onreadystatechange=null,"abort"===e?s.abort():"error"===e?"number"!=typeof s.status?i(0,"error"):i(s.status,s.statusText):i($t[s.status]||s.status,s.statusText,"text"!==(s.responseType||"text")||"string"!=typeof s.responseText?{binary:s.response}:{text:s.responseText},s.getAllResponseHeaders()))}},s.onload=t(),r=s.onerror=s.ontimeout=t("error"),void 0!==s.onabort?s.onabort=r:s.onreadystatechange=function(){4===s.readyState&&n.setTimeout((function(){t&&r()}))},t=t("abort");try{s.send(e.hasContent&&e.data||null)}catch(e){if(t)throw e}},abort:function(){t&&t()}}})),E.ajaxPrefilter((function(e){e.crossDomain&&(e.contents.script=!1)})),E.ajaxSetup({accepts:{script:"text/javascript, application/javascript, application/ecmascript, application/x-ecmascript"},contents:{script:/\b(?:java|ecma)script\b/},converters:{"text script":function(e){return E.globalEval(e),e}}}),E.ajaxPrefilter("script",(function(e){void 0===e.cache&&(e.cache=!1),e.crossDomain&&(e.type="GET")})),E.ajaxTransport("script",(function(e){var t,n;if(e.crossDomain||e.scriptAttrs)return{send:function(r,o){t=E("<script>").attr(e.scriptAttrs||{}).prop({charset:e.scriptCharset,src:e.url}).on("load error",n=function(e){t.remove(),n=null,e&&o("error"===e.type?404:200,e.type)}),a.head.appendChild(t[0])},abort:function(){n&&n()}}}));var Yt,Kt=[],Qt=/(=)\?(?=&|$)|\?\?/;E.ajaxSetup({jsonp:"callback",jsonpCallback:function(){var e=Kt.pop()||E.expando+"_"+Ot++;return this[e]=!0,e}}),E.ajaxPrefilter("json jsonp",(function(e,t,r){var o,i,a,s=!1!==e.jsonp&&(Qt.test(e.url)?"url":"string"==typeof e.data&&0===(e.contentType||"").indexOf("application/x-www-form-urlencoded")&&Qt.test(e.data)&&"data");if(s||"jsonp"===e.dataTypes[0])return o=e.jsonpCallback=b(e.jsonpCallback)?e.jsonpCallback():e.jsonpCallback,s?e[s]=e[s].replace(Qt,"$1"+o):!1!==e.jsonp&&(e.url+=(Ct.test(e.url)?"&":"?")+e.jsonp+"="+o),e.converters["script json"]=function(){return a||E.error(o+" was not called"),a[0]},e.dataTypes[0]="json",i=n[o],n[o]=function(){a=arguments},r.always((function(){void 0===i?E(n).removeProp(o):n[o]=i,e[o]&&(e.jsonpCallback=t.jsonpCallback,Kt.push(o)),a&&b(i)&&i(a[0]),a=i=void 0})),"script"})),y.createHTMLDocument=((Yt=a.implementation.createHTMLDocument("").body).innerHTML="<form></form><form></form>",2===Yt.childNodes.length),E.parseHTML=function(e,t,n){return"string"!=typeof e?[]:("boolean"==typeof t&&(n=t,t=!1),t||(y.createHTMLDocument?((r=(t=a.implementation.createHTMLDocument("")).createElement("base")).href=a.location.href,t.head.appendChild(r)):t=a),i=!n&&[],(o=P.exec(e))?[t.createElement(o[1])]:(o=ke([e],t,i),i&&i.length&&E(i).remove(),E.merge([],o.childNodes)));var r,o,i},E.fn.load=function(e,t,n){var r,o,i,a=this,s=e.indexOf(" ");return s>-1&&(r=_t(e.slice(s)),e=e.slice(0,s)),b(t)?(n=t,t=void 0):t&&"object"==typeof t&&(o="POST"),a.length>0&&E.ajax({url:e,type:o||"GET",dataType:"html",data:t}).done((function(e){i=arguments,a.html(r?E("<div>").append(E.parseHTML(e)).find(r):e)})).always(n&&function(e,t){a.each((function(){n.apply(this,i||[e.responseText,t,e])}))}),this},E.each(["ajaxStart","ajaxStop","ajaxComplete","ajaxError","ajaxSuccess","ajaxSend"],(function(e,t){E.fn[t]=function(e){return this.on(t,e)}})),E.expr.pseudos.animated=function(e){return E.grep(E.timers,(function(t){return e===t.elem})).length},E.offset={setOffset:function(e,t,n){var r,o,i,a,s,l,c=E.css(e,"position"),u=E(e),f={};"static"===c&&(e.style.position="relative"),s=u.offset(),i=E.css(e,"top"),l=E.css(e,"left"),("absolute"===c||"fixed"===c)&&(i+l).indexOf("auto")>-1?(a=(r=u.position()).top,o=r.left):(a=parseFloat(i)||0,o=parseFloat(l)||0),b(t)&&(t=t.call(e,n,E.extend({},s))),null!=t.top&&(f.top=t.top-s.top+a),null!=t.left&&(f.left=t.left-s.left+o),"using"in t?t.using.call(e,f):u.css(f)}},E.fn.extend({offset:function(e){if(arguments.length)return void 0===e?this:this.each((function(t){E.offset.setOffset(this,e,t)}));var t,n,r=this[0];return r?r.getClientRects().length?(t=r.getBoundingClientRect(),n=r.ownerDocument.defaultView,{top:t.top+n.pageYOffset,left:t.left+n.pageXOffset}):{top:0,left:0}:void 0},position:function(){if(this[0]){var e,t,n,r=this[0],o={top:0,left:0};if("fixed"===E.css(r,"position"))t=r.getBoundingClientRect();else{for(t=this.offset(),n=r.ownerDocument,e=r.offsetParent||n.documentElement;e&&(e===n.body||e===n.documentElement)&&"static"===E.css(e,"position");)e=e.parentNode;e&&e!==r&&1===e.nodeType&&((o=E(e).offset()).top+=E.css(e,"borderTopWidth",!0),o.left+=E.css(e,"borderLeftWidth",!0))}return{top:t.top-o.top-E.css(r,"marginTop",!0),left:t.left-o.left-E.css(r,"marginLeft",!0)}}},offsetParent:function(){return this.map((function(){for(var e=this.offsetParent;e&&"static"===E.css(e,"position");)e=e.offsetParent;return e||ae}))}}),E.each({scrollLeft:"pageXOffset",scrollTop:"pageYOffset"},(function(e,t){var n="pageYOffset"===t;E.fn[e]=function(r){return q(this,(function(e,r,o){var i;if(g(e)?i=e:9===e.nodeType&&(i=e.defaultView),void 0===o)return i?i[t]:e[r];i?i.scrollTo(n?i.pageXOffset:o,n?o:i.pageYOffset):e[r]=o}),e,r,arguments.length)}})),E.each(["top","left"],(function(e,t){E.cssHooks[t]=Xe(y.pixelPosition,(function(e,n){if(n)return n=$e(e,t),We.test(n)?E(e).position()[t]+"px":n}))})),E.each({Height:"height",Width:"width"},(function(e,t){E.each({padding:"inner"+e,content:t,"":"outer"+e},(function(n,r){E.fn[r]=function(o,i){var a=arguments.length&&(n||"boolean"!=typeof o),s=n||(!0===o||!0===i?"margin":"border");return q(this,(function(t,n,o){var i;return g(t)?0===r.indexOf("outer")?t["inner"+e]:t.document.documentElement["client"+e]:9===t.nodeType?(i=t.documentElement,Math.max(t.body["scroll"+e],i["scroll"+e],t.body["offset"+e],i["offset"+e],i["client"+e])):void 0===o?E.css(t,n,s):E.style(t,n,o,s)}),t,a?o:void 0,a)}}))})),E.each("blur focus focusin focusout resize scroll click dblclick mousedown mouseup mousemove mouseover mouseout mouseenter mouseleave change select submit keydown keypress keyup contextmenu".split(" "),(function(e,t){E.fn[t]=function(e,n){return arguments.length>0?this.on(t,null,e,n):this.trigger(t)}})),E.fn.extend({hover:function(e,t){return this.mouseenter(e).mouseleave(t||e)}}),E.fn.extend({bind:function(e,t,n){return this.on(e,null,t,n)},unbind:function(e,t){return this.off(e,null,t)},delegate:function(e,t,n,r){return this.on(t,e,n,r)},undelegate:function(e,t,n){return 1===arguments.length?this.off(e,"**"):this.off(t,e||"**",n)}}),E.proxy=function(e,t){var n,r,o;if("string"==typeof t&&(n=e[t],t=e,e=n),b(e))return r=l.call(arguments,2),(o=function(){return e.apply(t||this,r.concat(l.call(arguments)))}).guid=e.guid=e.guid||E.guid++,o},E.holdReady=function(e){e?E.readyWait++:E.ready(!0)},E.isArray=Array.isArray,E.parseJSON=JSON.parse,E.nodeName=L,E.isFunction=b,E.isWindow=g,E.camelCase=Y,E.type=x,E.now=Date.now,E.isNumeric=function(e){var t=E.type(e);return("number"===t||"string"===t)&&!isNaN(e-parseFloat(e))},void 0===(r=function(){return E}.apply(t,[]))||(e.exports=r);var Jt=n.jQuery,Zt=n.$;return E.noConflict=function(e){return n.$===E&&(n.$=Zt),e&&n.jQuery===E&&(n.jQuery=Jt),E},o||(n.jQuery=n.$=E),E})),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n="undefined"!=typeof __webpack_exports__?__webpack_exports__:t;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/jquery/dist/jquery.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/jquery/dist/jquery.js")}}()},function(e,t,n){"use strict";n.r(t);n(23);var r=n(0),o=n.n(r),i=n(3),a=n.n(i),s=n(1),l=n.n(s),c=o.a.createContext(null);!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/components/Context.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/components/Context.js")}}();var u=function(e){e()};!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/batch.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/batch.js")}}();var f={notify:function(){}};function d(){var e=u,t=[],n=[];return{clear:function(){n=null,t=null},notify:function(){var r=t=n;e((function(){for(var e=0;e<r.length;e++)r[e]()}))},get:function(){return n},subscribe:function(e){var r=!0;return n===t&&(n=t.slice()),n.push(e),function(){r&&null!==t&&(r=!1,n===t&&(n=t.slice()),n.splice(n.indexOf(e),1))}}}}var p=function(){function e(e,t){this.store=e,this.parentSub=t,this.unsubscribe=null,this.listeners=f,this.handleChangeWrapper=this.handleChangeWrapper.bind(this)}var t=e.prototype;return t.addNestedSub=function(e){return this.trySubscribe(),this.listeners.subscribe(e)},t.notifyNestedSubs=function(){this.listeners.notify()},t.handleChangeWrapper=function(){this.onStateChange&&this.onStateChange()},t.isSubscribed=function(){return Boolean(this.unsubscribe)},t.trySubscribe=function(){this.unsubscribe||(this.unsubscribe=this.parentSub?this.parentSub.addNestedSub(this.handleChangeWrapper):this.store.subscribe(this.handleChangeWrapper),this.listeners=d())},t.tryUnsubscribe=function(){this.unsubscribe&&(this.unsubscribe(),this.unsubscribe=null,this.listeners.clear(),this.listeners=f)},e}();function h(e){var t=e.store,n=e.context,i=e.children,a=Object(r.useMemo)((function(){var e=new p(t);return e.onStateChange=e.notifyNestedSubs,{store:t,subscription:e}}),[t]),s=Object(r.useMemo)((function(){return t.getState()}),[t]);Object(r.useEffect)((function(){var e=a.subscription;return e.trySubscribe(),s!==t.getState()&&e.notifyNestedSubs(),function(){e.tryUnsubscribe(),e.onStateChange=null}}),[a,s]);var l=n||c;return o.a.createElement(l.Provider,{value:a},i)}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/Subscription.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/Subscription.js")}}(),h.propTypes={store:l.a.shape({subscribe:l.a.func.isRequired,dispatch:l.a.func.isRequired,getState:l.a.func.isRequired}),context:l.a.object,children:l.a.any};var m=h;function v(){return(v=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e}).apply(this,arguments)}function y(e,t){if(null==e)return{};var n,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||(o[n]=e[n]);return o}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/components/Provider.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/components/Provider.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@babel/runtime/helpers/esm/extends.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@babel/runtime/helpers/esm/extends.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@babel/runtime/helpers/esm/objectWithoutPropertiesLoose.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@babel/runtime/helpers/esm/objectWithoutPropertiesLoose.js")}}();var b=n(11),g=n.n(b),_=n(5),w=n.n(_),x=n(9),E="undefined"!=typeof window&&void 0!==window.document&&void 0!==window.document.createElement?r.useLayoutEffect:r.useEffect;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/useIsomorphicLayoutEffect.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/useIsomorphicLayoutEffect.js")}}();var k=[],j=[null,null];function T(e,t){var n=e[1];return[t.payload,n+1]}var O=function(){return[null,0]};function C(e,t){void 0===t&&(t={});var n=t,i=n.getDisplayName,a=void 0===i?function(e){return"ConnectAdvanced("+e+")"}:i,s=n.methodName,l=void 0===s?"connectAdvanced":s,u=n.renderCountProp,f=void 0===u?void 0:u,d=n.shouldHandleStateChanges,h=void 0===d||d,m=n.storeKey,b=void 0===m?"store":m,_=n.withRef,C=void 0!==_&&_,S=n.forwardRef,L=void 0!==S&&S,P=n.context,N=void 0===P?c:P,A=y(n,["getDisplayName","methodName","renderCountProp","shouldHandleStateChanges","storeKey","withRef","forwardRef","context"]);w()(void 0===f,"renderCountProp is removed. render counting is built into the latest React Dev Tools profiling extension"),w()(!C,"withRef is removed. To access the wrapped instance, use a ref on the connected component");w()("store"===b,"storeKey has been removed and does not do anything. To use a custom Redux store for specific components, create a custom React context with React.createContext(), and pass the context object to React Redux's Provider and specific components like: <Provider context={MyContext}><ConnectedComponent context={MyContext} /></Provider>. You may also pass a {context : MyContext} option to connect");var M=N;return function(t){var n=t.displayName||t.name||"Component",i=a(n),s=v({},A,{getDisplayName:a,methodName:l,renderCountProp:f,shouldHandleStateChanges:h,storeKey:b,displayName:i,wrappedComponentName:n,WrappedComponent:t}),c=A.pure;var u=c?r.useMemo:function(e){return e()};function d(n){var a=Object(r.useMemo)((function(){var e=n.forwardedRef,t=y(n,["forwardedRef"]);return[n.context,e,t]}),[n]),l=a[0],c=a[1],f=a[2],d=Object(r.useMemo)((function(){return l&&l.Consumer&&Object(x.isContextConsumer)(o.a.createElement(l.Consumer,null))?l:M}),[l,M]),m=Object(r.useContext)(d),b=Boolean(n.store)&&Boolean(n.store.getState)&&Boolean(n.store.dispatch),g=Boolean(m)&&Boolean(m.store);w()(b||g,'Could not find "store" in the context of "'+i+'". Either wrap the root component in a <Provider>, or pass a custom React context provider to <Provider> and the corresponding React context consumer to '+i+" in connect options.");var _=b?n.store:m.store,C=Object(r.useMemo)((function(){return function(t){return e(t.dispatch,s)}(_)}),[_]),S=Object(r.useMemo)((function(){if(!h)return j;var e=new p(_,b?null:m.subscription),t=e.notifyNestedSubs.bind(e);return[e,t]}),[_,b,m]),L=S[0],P=S[1],N=Object(r.useMemo)((function(){return b?m:v({},m,{subscription:L})}),[b,m,L]),A=Object(r.useReducer)(T,k,O),D=A[0][0],H=A[1];if(D&&D.error)throw D.error;var R=Object(r.useRef)(),I=Object(r.useRef)(f),F=Object(r.useRef)(),z=Object(r.useRef)(!1),G=u((function(){return F.current&&f===I.current?F.current:C(_.getState(),f)}),[_,D,f]);E((function(){I.current=f,R.current=G,z.current=!1,F.current&&(F.current=null,P())})),E((function(){if(h){var e=!1,t=null,n=function(){if(!e){var n,r,o=_.getState();try{n=C(o,I.current)}catch(e){r=e,t=e}r||(t=null),n===R.current?z.current||P():(R.current=n,F.current=n,z.current=!0,H({type:"STORE_UPDATED",payload:{error:r}}))}};L.onStateChange=n,L.trySubscribe(),n();return function(){if(e=!0,L.tryUnsubscribe(),L.onStateChange=null,t)throw t}}}),[_,L,C]);var U=Object(r.useMemo)((function(){return o.a.createElement(t,v({},G,{ref:c}))}),[c,t,G]);return Object(r.useMemo)((function(){return h?o.a.createElement(d.Provider,{value:N},U):U}),[d,U,N])}var m=c?o.a.memo(d):d;if(m.WrappedComponent=t,m.displayName=i,L){var _=o.a.forwardRef((function(e,t){return o.a.createElement(m,v({},e,{forwardedRef:t}))}));return _.displayName=i,_.WrappedComponent=t,g()(_,t)}return g()(m,t)}}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/components/connectAdvanced.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/components/connectAdvanced.js")}}();var S=Object.prototype.hasOwnProperty;function L(e,t){return e===t?0!==e||0!==t||1/e==1/t:e!=e&&t!=t}function P(e,t){if(L(e,t))return!0;if("object"!=typeof e||null===e||"object"!=typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(var o=0;o<n.length;o++)if(!S.call(t,n[o])||!L(e[n[o]],t[n[o]]))return!1;return!0}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/shallowEqual.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/shallowEqual.js")}}();var N=n(12),A=function(){return Math.random().toString(36).substring(7).split("").join(".")},M={INIT:"@@redux/INIT"+A(),REPLACE:"@@redux/REPLACE"+A(),PROBE_UNKNOWN_ACTION:function(){return"@@redux/PROBE_UNKNOWN_ACTION"+A()}};function D(e){if("object"!=typeof e||null===e)return!1;for(var t=e;null!==Object.getPrototypeOf(t);)t=Object.getPrototypeOf(t);return Object.getPrototypeOf(e)===t}function H(e,t){var n=t&&t.type;return"Given "+(n&&'action "'+String(n)+'"'||"an action")+', reducer "'+e+'" returned undefined. To ignore an action, you must explicitly return the previous state. If you want this reducer to hold no value, you can return null instead of undefined.'}function R(e,t){return function(){return t(e.apply(this,arguments))}}function I(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function F(e,t){var n=Object.keys(e);return Object.getOwnPropertySymbols&&n.push.apply(n,Object.getOwnPropertySymbols(e)),t&&(n=n.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n}function z(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?F(n,!0).forEach((function(t){I(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):F(n).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function G(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return 0===t.length?function(e){return e}:1===t.length?t[0]:t.reduce((function(e,t){return function(){return e(t.apply(void 0,arguments))}}))}function U(e){return function(t,n){var r=e(t,n);function o(){return r}return o.dependsOnOwnProps=!1,o}}function B(e){return null!==e.dependsOnOwnProps&&void 0!==e.dependsOnOwnProps?Boolean(e.dependsOnOwnProps):1!==e.length}function W(e,t){return function(t,n){n.displayName;var r=function(e,t){return r.dependsOnOwnProps?r.mapToProps(e,t):r.mapToProps(e)};return r.dependsOnOwnProps=!0,r.mapToProps=function(t,n){r.mapToProps=e,r.dependsOnOwnProps=B(e);var o=r(t,n);return"function"==typeof o&&(r.mapToProps=o,r.dependsOnOwnProps=B(o),o=r(t,n)),o},r}}(function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/redux/es/redux.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/redux/es/redux.js")}})(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/isPlainObject.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/isPlainObject.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/warning.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/warning.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/verifyPlainObject.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/verifyPlainObject.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/wrapMapToProps.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/wrapMapToProps.js")}}();var q=[function(e){return"function"==typeof e?W(e):void 0},function(e){return e?void 0:U((function(e){return{dispatch:e}}))},function(e){return e&&"object"==typeof e?U((function(t){return function(e,t){if("function"==typeof e)return R(e,t);if("object"!=typeof e||null===e)throw new Error("bindActionCreators expected an object or a function, instead received "+(null===e?"null":typeof e)+'. Did you write "import ActionCreators from" instead of "import * as ActionCreators from"?');var n={};for(var r in e){var o=e[r];"function"==typeof o&&(n[r]=R(o,t))}return n}(e,t)})):void 0}];!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/mapDispatchToProps.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/mapDispatchToProps.js")}}();var V=[function(e){return"function"==typeof e?W(e):void 0},function(e){return e?void 0:U((function(){return{}}))}];function $(e,t,n){return v({},n,{},e,{},t)}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/mapStateToProps.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/mapStateToProps.js")}}();var X=[function(e){return"function"==typeof e?function(e){return function(t,n){n.displayName;var r,o=n.pure,i=n.areMergedPropsEqual,a=!1;return function(t,n,s){var l=e(t,n,s);return a?o&&i(l,r)||(r=l):(a=!0,r=l),r}}}(e):void 0},function(e){return e?void 0:function(){return $}}];function Y(e,t,n,r){return function(o,i){return n(e(o,i),t(r,i),i)}}function K(e,t,n,r,o){var i,a,s,l,c,u=o.areStatesEqual,f=o.areOwnPropsEqual,d=o.areStatePropsEqual,p=!1;function h(o,p){var h,m,v=!f(p,a),y=!u(o,i);return i=o,a=p,v&&y?(s=e(i,a),t.dependsOnOwnProps&&(l=t(r,a)),c=n(s,l,a)):v?(e.dependsOnOwnProps&&(s=e(i,a)),t.dependsOnOwnProps&&(l=t(r,a)),c=n(s,l,a)):y?(h=e(i,a),m=!d(h,s),s=h,m&&(c=n(s,l,a)),c):c}return function(o,u){return p?h(o,u):(s=e(i=o,a=u),l=t(r,a),c=n(s,l,a),p=!0,c)}}function Q(e,t){var n=t.initMapStateToProps,r=t.initMapDispatchToProps,o=t.initMergeProps,i=y(t,["initMapStateToProps","initMapDispatchToProps","initMergeProps"]),a=n(e,i),s=r(e,i),l=o(e,i);return(i.pure?K:Y)(a,s,l,e,i)}function J(e,t,n){for(var r=t.length-1;r>=0;r--){var o=t[r](e);if(o)return o}return function(t,r){throw new Error("Invalid value of type "+typeof e+" for "+n+" argument when connecting component "+r.wrappedComponentName+".")}}function Z(e,t){return e===t}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/mergeProps.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/mergeProps.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/verifySubselectors.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/verifySubselectors.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/selectorFactory.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/selectorFactory.js")}}();var ee,te,ne,re,oe,ie,ae,se,le,ce,ue,fe,de=(ne=(te=void 0===ee?{}:ee).connectHOC,re=void 0===ne?C:ne,oe=te.mapStateToPropsFactories,ie=void 0===oe?V:oe,ae=te.mapDispatchToPropsFactories,se=void 0===ae?q:ae,le=te.mergePropsFactories,ce=void 0===le?X:le,ue=te.selectorFactory,fe=void 0===ue?Q:ue,function(e,t,n,r){void 0===r&&(r={});var o=r,i=o.pure,a=void 0===i||i,s=o.areStatesEqual,l=void 0===s?Z:s,c=o.areOwnPropsEqual,u=void 0===c?P:c,f=o.areStatePropsEqual,d=void 0===f?P:f,p=o.areMergedPropsEqual,h=void 0===p?P:p,m=y(o,["pure","areStatesEqual","areOwnPropsEqual","areStatePropsEqual","areMergedPropsEqual"]),b=J(e,ie,"mapStateToProps"),g=J(t,se,"mapDispatchToProps"),_=J(n,ce,"mergeProps");return re(fe,v({methodName:"connect",getDisplayName:function(e){return"Connect("+e+")"},shouldHandleStateChanges:Boolean(e),initMapStateToProps:b,initMapDispatchToProps:g,initMergeProps:_,pure:a,areStatesEqual:l,areOwnPropsEqual:u,areStatePropsEqual:d,areMergedPropsEqual:h},m))});function pe(){var e=Object(r.useContext)(c);return w()(e,"could not find react-redux context value; please ensure the component is wrapped in a <Provider>"),e}function he(e){void 0===e&&(e=c);var t=e===c?pe:function(){return Object(r.useContext)(e)};return function(){return t().store}}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/connect.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/connect.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/hooks/useReduxContext.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/hooks/useReduxContext.js")}}();var me=he();!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/hooks/useStore.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/hooks/useStore.js")}}();!function(e){void 0===e&&(e=c);var t=e===c?me:he(e)}();!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/hooks/useDispatch.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/hooks/useDispatch.js")}}();var ve=function(e,t){return e===t};var ye;!function(e){void 0===e&&(e=c);var t=e===c?pe:function(){return Object(r.useContext)(e)}}();function be(e){return function(t){var n=t.dispatch,r=t.getState;return function(t){return function(o){return"function"==typeof o?o(n,r,e):t(o)}}}}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/hooks/useSelector.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/hooks/useSelector.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/reactBatchedUpdates.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/reactBatchedUpdates.js")}}(),ye=i.unstable_batchedUpdates,u=ye,function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/index.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/index.js")}}();var ge=be();ge.withExtraArgument=be;var _e=ge;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/redux-thunk/es/index.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/redux-thunk/es/index.js")}}();var we=n(16),xe=n(22),Ee=n(13);function ke(e){return(ke="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function je(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Te(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{},r=Object.keys(n);"function"==typeof Object.getOwnPropertySymbols&&(r=r.concat(Object.getOwnPropertySymbols(n).filter((function(e){return Object.getOwnPropertyDescriptor(n,e).enumerable})))),r.forEach((function(t){je(e,t,n[t])}))}return e}function Oe(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||(o[n]=e[n]);return o}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function Ce(e){return function(e){if(Array.isArray(e)){for(var t=0,n=new Array(e.length);t<e.length;t++)n[t]=e[t];return n}}(e)||function(e){if(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e))return Array.from(e)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance")}()}function Se(e){return t=e,(t-=0)==t?e:(e=e.replace(/[\-_\s]+(.)?/g,(function(e,t){return t?t.toUpperCase():""}))).substr(0,1).toLowerCase()+e.substr(1);var t}function Le(e){return e.split(";").map((function(e){return e.trim()})).filter((function(e){return e})).reduce((function(e,t){var n,r=t.indexOf(":"),o=Se(t.slice(0,r)),i=t.slice(r+1).trim();return o.startsWith("webkit")?e[(n=o,n.charAt(0).toUpperCase()+n.slice(1))]=i:e[o]=i,e}),{})}var Pe=!1;try{Pe=!0}catch(e){}function Ne(e){return null===e?null:"object"===ke(e)&&e.prefix&&e.iconName?e:Array.isArray(e)&&2===e.length?{prefix:e[0],iconName:e[1]}:"string"==typeof e?{prefix:"fas",iconName:e}:void 0}function Ae(e,t){return Array.isArray(t)&&t.length>0||!Array.isArray(t)&&t?je({},e,t):{}}function Me(e){var t=e.icon,n=e.mask,r=e.symbol,o=e.className,i=e.title,a=Ne(t),s=Ae("classes",[].concat(Ce(function(e){var t,n=e.spin,r=e.pulse,o=e.fixedWidth,i=e.inverse,a=e.border,s=e.listItem,l=e.flip,c=e.size,u=e.rotation,f=e.pull,d=(je(t={"fa-spin":n,"fa-pulse":r,"fa-fw":o,"fa-inverse":i,"fa-border":a,"fa-li":s,"fa-flip-horizontal":"horizontal"===l||"both"===l,"fa-flip-vertical":"vertical"===l||"both"===l},"fa-".concat(c),null!=c),je(t,"fa-rotate-".concat(u),null!=u),je(t,"fa-pull-".concat(f),null!=f),je(t,"fa-swap-opacity",e.swapOpacity),t);return Object.keys(d).map((function(e){return d[e]?e:null})).filter((function(e){return e}))}(e)),Ce(o.split(" ")))),l=Ae("transform","string"==typeof e.transform?Ee.b.transform(e.transform):e.transform),c=Ae("mask",Ne(n)),u=Object(Ee.a)(a,Te({},s,l,c,{symbol:r,title:i}));if(!u)return function(){var e;!Pe&&console&&"function"==typeof console.error&&(e=console).error.apply(e,arguments)}("Could not find icon",a),null;var f=u.abstract,d={};return Object.keys(e).forEach((function(t){Me.defaultProps.hasOwnProperty(t)||(d[t]=e[t])})),De(f[0],d)}Me.displayName="FontAwesomeIcon",Me.propTypes={border:l.a.bool,className:l.a.string,mask:l.a.oneOfType([l.a.object,l.a.array,l.a.string]),fixedWidth:l.a.bool,inverse:l.a.bool,flip:l.a.oneOf(["horizontal","vertical","both"]),icon:l.a.oneOfType([l.a.object,l.a.array,l.a.string]),listItem:l.a.bool,pull:l.a.oneOf(["right","left"]),pulse:l.a.bool,rotation:l.a.oneOf([90,180,270]),size:l.a.oneOf(["lg","xs","sm","1x","2x","3x","4x","5x","6x","7x","8x","9x","10x"]),spin:l.a.bool,symbol:l.a.oneOfType([l.a.bool,l.a.string]),title:l.a.string,transform:l.a.oneOfType([l.a.string,l.a.object]),swapOpacity:l.a.bool},Me.defaultProps={border:!1,className:"",mask:null,fixedWidth:!1,inverse:!1,flip:null,icon:null,listItem:!1,pull:null,pulse:!1,rotation:null,size:null,spin:!1,symbol:!1,title:"",transform:null,swapOpacity:!1};var De=function e(t,n){var r=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};if("string"==typeof n)return n;var o=(n.children||[]).map((function(n){return e(t,n)})),i=Object.keys(n.attributes||{}).reduce((function(e,t){var r=n.attributes[t];switch(t){case"class":e.attrs.className=r,delete n.attributes.class;break;case"style":e.attrs.style=Le(r);break;default:0===t.indexOf("aria-")||0===t.indexOf("data-")?e.attrs[t.toLowerCase()]=r:e.attrs[Se(t)]=r}return e}),{attrs:{}}),a=r.style,s=void 0===a?{}:a,l=Oe(r,["style"]);return i.attrs.style=Te({},i.attrs.style,s),t.apply(void 0,[n.tag,Te({},i.attrs,l)].concat(Ce(o)))}.bind(null,o.a.createElement);!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@fortawesome/react-fontawesome/index.es.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@fortawesome/react-fontawesome/index.es.js")}}();var He=n(17);function Re(e){return function(t,n){t(function(e){return{type:"SELECT_ACTION",action:e}}(e));var r=n();return fetch(window.constants.NEXT_STATE_URL,{method:"POST",mode:"cors",headers:{"Content-Type":"application/json"},body:JSON.stringify({server_state_tuple:r.scenario_state.server_state_tuple,action:e,ui_state:r.ui_status})}).then((function(e){return e.json()})).then((function(e){return t({type:"UPDATE_STATE",new_state:e})})).catch(console.error)}}function Ie(e){return(Ie="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function Fe(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function ze(e){return(ze=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function Ge(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function Ue(e,t){return(Ue=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}var Be=function(e){function t(e){var n;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,t),(n=function(e,t){return!t||"object"!==Ie(t)&&"function"!=typeof t?Ge(e):t}(this,ze(t).call(this,e))).MAX_HEIGHT="600px",n.PLAY_TIMEOUT=500,n.loaded=n.loaded.bind(Ge(n)),n.ended=n.ended.bind(Ge(n)),n.videoRef=o.a.createRef(),n}var n,r,i;return function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&Ue(e,t)}(t,e),n=t,(r=[{key:"ended",value:function(){this.props.dispatch({type:"DISPLAY_STATE"})}},{key:"loaded",value:function(){var e=this;this.props.video_loaded||(this.props.dispatch({type:"PLAY_VIDEO"}),setTimeout((function(){e.videoRef.current.play()}),this.PLAY_TIMEOUT))}},{key:"render",value:function(){return o.a.createElement("div",{className:"row"},o.a.createElement("div",{className:"col"},o.a.createElement("div",{className:"view"},o.a.createElement("div",{className:"embed-responsive embed-responsive-4by3"+(!this.props.ax_selected_time&&this.props.video_loaded?" visible":" invisible"),style:{maxHeight:this.MAX_HEIGHT},key:this.props.video_loaded||!!this.props.ax_selected_time},o.a.createElement("video",{autoPlay:!1,muted:!0,className:"embed-responsive-item",key:this.props.video_link,onEnded:this.ended,onCanPlayThrough:this.loaded,ref:this.videoRef},o.a.createElement("source",{src:this.props.video_link}))),o.a.createElement("div",{className:"mask text-center"+(this.props.ax_selected_time||!this.props.video_loaded?"":" d-none")},o.a.createElement("h1",{className:"mb-5"},"Communicating with robot..."),o.a.createElement("p",{className:"text-primary"},o.a.createElement(Me,{icon:He.faSpinner,size:"9x",pulse:!0}))))))}}])&&Fe(n.prototype,r),i&&Fe(n,i),t}(o.a.Component),We=de((function(e,t){return{video_link:e.scenario_state.video_link,video_loaded:e.ui_status.video_loaded,ax_selected_time:e.ui_status.ax_selected_time}}))(Be);function qe(){return(qe=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e}).apply(this,arguments)}function Ve(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){if(!(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e)))return;var n=[],r=!0,o=!1,i=void 0;try{for(var a,s=e[Symbol.iterator]();!(r=(a=s.next()).done)&&(n.push(a.value),!t||n.length!==t);r=!0);}catch(e){o=!0,i=e}finally{try{r||null==s.return||s.return()}finally{if(o)throw i}}return n}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance")}()}function $e(e){return($e="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function Xe(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function Ye(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function Ke(e,t,n){return t&&Ye(e.prototype,t),n&&Ye(e,n),e}function Qe(e,t){return!t||"object"!==$e(t)&&"function"!=typeof t?function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e):t}function Je(e){return(Je=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function Ze(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&et(e,t)}function et(e,t){return(et=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}var tt=function(e){function t(e){var n;return Xe(this,t),(n=Qe(this,Je(t).call(this,e))).BLINKING_BELIEFS={"Arm status":["In Motion"]},n}return Ze(t,e),Ke(t,[{key:"render",value:function(){var e=this.props.value instanceof Array?"[ "+this.props.value.join(", ")+" ]":this.props.value;return this.BLINKING_BELIEFS[this.props.attr]&&this.BLINKING_BELIEFS[this.props.attr].includes(this.props.value)&&(e=o.a.createElement("span",{className:"blinking"},e)),o.a.createElement("tr",null,o.a.createElement("td",null,o.a.createElement("i",null,this.props.attr)),o.a.createElement("td",null,e))}}]),t}(o.a.Component),nt=function(e){function t(e){var n;return Xe(this,t),(n=Qe(this,Je(t).call(this,e))).SHOW_IN_VIDEO_ATTRS=["Arm status"],n}return Ze(t,e),Ke(t,[{key:"shouldShowAttr",value:function(e,t){return!(!e||!e.video_loaded)&&(!!e.video_playing&&this.SHOW_IN_VIDEO_ATTRS.includes(t))}},{key:"render",value:function(){var e=[],t=!0,n=!1,r=void 0;try{for(var i,a=this.props.beliefs.entries()[Symbol.iterator]();!(t=(i=a.next()).done);t=!0){var s=Ve(i.value,2),l=(s[0],s[1]);this.shouldShowAttr(this.props.video_status,l.attr)&&e.push(o.a.createElement(tt,qe({},l,{key:l.value})))}}catch(e){n=!0,r=e}finally{try{t||null==a.return||a.return()}finally{if(n)throw r}}return o.a.createElement("div",{className:"row"},o.a.createElement("div",{className:"col"}),o.a.createElement("div",{className:"col-9"},o.a.createElement("table",{className:"table-sm table table-borderless table-hover"},o.a.createElement("colgroup",null,o.a.createElement("col",{width:"35%"}),o.a.createElement("col",{width:"65%"})),o.a.createElement("tbody",null,e))))}}]),t}(o.a.Component),rt=de((function(e,t){return{video_status:{video_loaded:e.ui_status.video_loaded,video_playing:e.ui_status.video_playing},beliefs:e.scenario_state.robot_beliefs}}))(nt),ot=function(e){return o.a.createElement("div",{className:"row"},o.a.createElement("div",{className:"col"},o.a.createElement(We,null),o.a.createElement("div",{className:"my-3"}),o.a.createElement(rt,null)))},it=n(2),at=n.n(it),st=(n(35),n(18)),lt=n.n(st),ct=o.a.createContext({});ct.Consumer,ct.Provider;function ut(e,t){var n=Object(r.useContext)(ct);return e||n[t]||t}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ThemeProvider.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ThemeProvider.js")}}();var ft=o.a.forwardRef((function(e,t){var n=e.bsPrefix,r=e.placement,i=e.className,a=e.style,s=e.children,l=e.arrowProps,c=(e.scheduleUpdate,e.outOfBoundaries,y(e,["bsPrefix","placement","className","style","children","arrowProps","scheduleUpdate","outOfBoundaries"]));return n=ut(n,"tooltip"),o.a.createElement("div",v({ref:t,style:a,role:"tooltip","x-placement":r,className:at()(i,n,"bs-tooltip-"+r)},c),o.a.createElement("div",v({className:"arrow"},l)),o.a.createElement("div",{className:n+"-inner"},s))}));ft.defaultProps={placement:"right"},ft.displayName="Tooltip";var dt=ft;function pt(e,t){e.prototype=Object.create(t.prototype),e.prototype.constructor=e,e.__proto__=t}function ht(e,t){return e.contains?e.contains(t):e.compareDocumentPosition?e===t||!!(16&e.compareDocumentPosition(t)):void 0}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/Tooltip.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/Tooltip.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@babel/runtime/helpers/esm/inheritsLoose.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@babel/runtime/helpers/esm/inheritsLoose.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/contains.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/contains.js")}}();var mt=n(10),vt=n.n(mt),yt=n(7);function bt(){return Object(r.useState)(null)}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@restart/hooks/esm/useCallbackRef.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@restart/hooks/esm/useCallbackRef.js")}}();var gt=function(e){return e&&"function"!=typeof e?function(t){e.current=t}:e};var _t=function(e,t){return Object(r.useMemo)((function(){return function(e,t){var n=gt(e),r=gt(t);return function(e){n&&n(e),r&&r(e)}}(e,t)}),[e,t])};!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@restart/hooks/esm/useMergedRefs.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@restart/hooks/esm/useMergedRefs.js")}}();var wt={position:"absolute",top:"0",left:"0",opacity:"0",pointerEvents:"none"},xt={};!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/usePopper.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/usePopper.js")}}();var Et=!("undefined"==typeof window||!window.document||!window.document.createElement);!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/canUseDOM.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/canUseDOM.js")}}();var kt=!1,jt=!1;try{var Tt={get passive(){return kt=!0},get once(){return jt=kt=!0}};Et&&(window.addEventListener("test",Tt,Tt),window.removeEventListener("test",Tt,!0))}catch(e){}var Ot=function(e,t,n,r){if(r&&"boolean"!=typeof r&&!jt){var o=r.once,i=r.capture,a=n;!jt&&o&&(a=n.__once||function e(r){this.removeEventListener(t,e,i),n.call(this,r)},n.__once=a),e.addEventListener(t,a,kt?r:i)}e.addEventListener(t,n,r)};!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/addEventListener.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/addEventListener.js")}}();var Ct=function(e,t,n,r){var o=r&&"boolean"!=typeof r?r.capture:r;e.removeEventListener(t,n,o),n.__once&&e.removeEventListener(t,n.__once,o)};!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/removeEventListener.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/removeEventListener.js")}}();var St=function(e,t,n,r){return Ot(e,t,n,r),function(){Ct(e,t,n,r)}};!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/listen.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/listen.js")}}();var Lt=function(e){var t=Object(r.useRef)(e);return Object(r.useEffect)((function(){t.current=e}),[e]),t};function Pt(e){var t=Lt(e);return Object(r.useCallback)((function(){return t.current&&t.current.apply(t,arguments)}),[t])}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@restart/hooks/esm/useCommittedRef.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@restart/hooks/esm/useCommittedRef.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@restart/hooks/esm/useEventCallback.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@restart/hooks/esm/useEventCallback.js")}}();var Nt=function(){};var At=function(e,t,n){var o=void 0===n?{}:n,i=o.disabled,a=o.clickTrigger,s=void 0===a?"click":a,l=Object(r.useRef)(!1),c=t||Nt,u=Object(r.useCallback)((function(t){var n,r=e&&("current"in e?e.current:e);vt()(!!r,"RootClose captured a close event but does not have a ref to compare it to. useRootClose(), should be passed a ref that resolves to a DOM node"),l.current=!r||!!((n=t).metaKey||n.altKey||n.ctrlKey||n.shiftKey)||!function(e){return 0===e.button}(t)||ht(r,t.target)}),[e]),f=Pt((function(e){l.current||c(e)})),d=Pt((function(e){27===e.keyCode&&c(e)}));Object(r.useEffect)((function(){if(!i&&null!=e){var t=St(document,s,u,!0),n=St(document,s,f),r=St(document,"keyup",d),o=[];return"ontouchstart"in document.documentElement&&(o=[].slice.call(document.body.children).map((function(e){return St(e,"mousemove",Nt)}))),function(){t(),n(),r(),o.forEach((function(e){return e()}))}}}),[e,i,s,u,f,d])};function Mt(e){return e&&e.ownerDocument||document}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/useRootClose.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/useRootClose.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/ownerDocument.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/ownerDocument.js")}}();var Dt=function(e){if("undefined"!=typeof document)return null==e?Mt().body:("function"==typeof e&&(e=e()),e&&e.current&&(e=e.current),e&&e.nodeType?e:null)};function Ht(e,t){var n=Object(r.useState)((function(){return Dt(e)})),o=n[0],i=n[1];if(!o){var a=Dt(e);a&&i(a)}return Object(r.useEffect)((function(){t&&o&&t(o)}),[t,o]),Object(r.useEffect)((function(){var t=Dt(e);t!==o&&i(t)}),[e,o]),o}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/utils/useWaitForDOMRef.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/utils/useWaitForDOMRef.js")}}();var Rt=o.a.forwardRef((function(e,t){var n=e.flip,i=e.placement,s=e.containerPadding,l=e.popperConfig,c=void 0===l?{}:l,u=e.transition,f=bt(),d=f[0],p=f[1],h=bt(),m=h[0],b=h[1],g=_t(p,t),_=Ht(e.container),w=Ht(e.target),x=Object(r.useState)(!e.show),E=x[0],k=x[1],j=c.modifiers,T=void 0===j?{}:j,O=function(e,t,n){var o=void 0===n?{}:n,i=o.enabled,a=void 0===i||i,s=o.placement,l=void 0===s?"bottom":s,c=o.positionFixed,u=void 0!==c&&c,f=o.eventsEnabled,d=void 0===f||f,p=o.modifiers,h=void 0===p?{}:p,m=Object(r.useRef)(),y=!(!h.arrow||!h.arrow.element),b=Object(r.useCallback)((function(){m.current&&m.current.scheduleUpdate()}),[]),g=Object(r.useState)({placement:l,scheduleUpdate:b,outOfBoundaries:!1,styles:wt,arrowStyles:xt}),_=g[0],w=g[1];return Object(r.useEffect)((function(){b()}),[_.placement,b]),Object(r.useEffect)((function(){m.current&&(d?m.current.enableEventListeners():m.current.disableEventListeners())}),[d]),Object(r.useEffect)((function(){if(a&&null!=e&&null!=t){var n=h.arrow&&v({},h.arrow,{element:h.arrow.element});return m.current=new yt.a(e,t,{placement:l,positionFixed:u,modifiers:v({},h,{arrow:n,applyStyle:{enabled:!1},updateStateModifier:{enabled:!0,order:900,fn:function(e){w({scheduleUpdate:b,styles:v({position:e.offsets.popper.position},e.styles),arrowStyles:e.arrowStyles,outOfBoundaries:e.hide,placement:e.placement})}}})}),function(){null!==m.current&&(m.current.destroy(),m.current=null)}}}),[a,l,u,e,t,y]),_}(w,d,v({},c,{placement:i||"bottom",enableEvents:e.show,modifiers:v({},T,{preventOverflow:v({padding:s||5},T.preventOverflow),arrow:v({},T.arrow,{enabled:!!m,element:m}),flip:v({enabled:!!n},T.preventOverflow)})})),C=O.styles,S=O.arrowStyles,L=y(O,["styles","arrowStyles"]);e.show?E&&k(!1):e.transition||E||k(!0);var P=e.show||u&&!E;if(At(d,e.onHide,{disabled:!e.rootClose||e.rootCloseDisabled,clickTrigger:e.rootCloseEvent}),!P)return null;var N=e.children(v({},L,{show:e.show,props:{style:C,ref:g},arrowProps:{style:S,ref:b}}));if(u){var A=e.onExit,M=e.onExiting,D=e.onEnter,H=e.onEntering,R=e.onEntered;N=o.a.createElement(u,{in:e.show,appear:!0,onExit:A,onExiting:M,onExited:function(){k(!0),e.onExited&&e.onExited.apply(e,arguments)},onEnter:D,onEntering:H,onEntered:R},N)}return _?a.a.createPortal(N,_):null}));Rt.displayName="Overlay",Rt.propTypes={show:l.a.bool,placement:l.a.oneOf(yt.a.placements),target:l.a.any,container:l.a.any,flip:l.a.bool,children:l.a.func.isRequired,containerPadding:l.a.number,popperConfig:l.a.object,rootClose:l.a.bool,rootCloseEvent:l.a.oneOf(["click","mousedown"]),rootCloseDisabled:l.a.bool,onHide:function(e){var t=l.a.func;e.rootClose&&(t=t.isRequired);for(var n=arguments.length,r=new Array(n>1?n-1:0),o=1;o<n;o++)r[o-1]=arguments[o];return t.apply(void 0,[e].concat(r))},transition:l.a.elementType,onEnter:l.a.func,onEntering:l.a.func,onEntered:l.a.func,onExit:l.a.func,onExiting:l.a.func,onExited:l.a.func},Rt.defaultProps={containerPadding:5};var It=Rt;function Ft(e,t){return function(e){var t=Mt(e);return t&&t.defaultView||window}(e).getComputedStyle(e,t)}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/Overlay.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/Overlay.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/ownerWindow.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/ownerWindow.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/getComputedStyle.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/getComputedStyle.js")}}();var zt=/([A-Z])/g;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/hyphenate.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/hyphenate.js")}}();var Gt=/^ms-/;function Ut(e){return function(e){return e.replace(zt,"-$1").toLowerCase()}(e).replace(Gt,"-ms-")}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/hyphenateStyle.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/hyphenateStyle.js")}}();var Bt=/^((translate|rotate|scale)(X|Y|Z|3d)?|matrix(3d)?|perspective|skew(X|Y)?)$/i;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/isTransform.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/isTransform.js")}}();var Wt=function(e,t){var n="",r="";if("string"==typeof t)return e.style.getPropertyValue(Ut(t))||Ft(e).getPropertyValue(Ut(t));Object.keys(t).forEach((function(o){var i=t[o];i||0===i?!function(e){return!(!e||!Bt.test(e))}(o)?n+=Ut(o)+": "+i+";":r+=o+"("+i+") ":e.style.removeProperty(Ut(o))})),r&&(n+="transform: "+r+";"),e.style.cssText+=";"+n};!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/css.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/css.js")}}();var qt=Et&&"ontransitionend"in window;function Vt(e,t,n){void 0===n&&(n=5);var r=!1,o=setTimeout((function(){r||function(e){var t=document.createEvent("HTMLEvents");t.initEvent("transitionend",!0,!0),e.dispatchEvent(t)}(e)}),t+n),i=St(e,"transitionend",(function(){r=!0}),{once:!0});return function(){clearTimeout(o),i()}}var $t=function(e,t,n){return qt?(null==n&&(r=Wt(e,"transitionDuration")||"",o=-1===r.indexOf("ms")?1e3:1,n=parseFloat(r)*o||0),Vt(e,n),St(e,"transitionend",t)):Vt(e,0,0);var r,o};!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/transitionEnd.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/transitionEnd.js")}}();var Xt=!1;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-transition-group/esm/config.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-transition-group/esm/config.js")}}();var Yt=o.a.createContext(null);!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-transition-group/esm/TransitionGroupContext.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-transition-group/esm/TransitionGroupContext.js")}}();var Kt=function(e){function t(t,n){var r;r=e.call(this,t,n)||this;var o,i=n&&!n.isMounting?t.enter:t.appear;return r.appearStatus=null,t.in?i?(o="exited",r.appearStatus="entering"):o="entered":o=t.unmountOnExit||t.mountOnEnter?"unmounted":"exited",r.state={status:o},r.nextCallback=null,r}pt(t,e),t.getDerivedStateFromProps=function(e,t){return e.in&&"unmounted"===t.status?{status:"exited"}:null};var n=t.prototype;return n.componentDidMount=function(){this.updateStatus(!0,this.appearStatus)},n.componentDidUpdate=function(e){var t=null;if(e!==this.props){var n=this.state.status;this.props.in?"entering"!==n&&"entered"!==n&&(t="entering"):"entering"!==n&&"entered"!==n||(t="exiting")}this.updateStatus(!1,t)},n.componentWillUnmount=function(){this.cancelNextCallback()},n.getTimeouts=function(){var e,t,n,r=this.props.timeout;return e=t=n=r,null!=r&&"number"!=typeof r&&(e=r.exit,t=r.enter,n=void 0!==r.appear?r.appear:t),{exit:e,enter:t,appear:n}},n.updateStatus=function(e,t){if(void 0===e&&(e=!1),null!==t){this.cancelNextCallback();var n=a.a.findDOMNode(this);"entering"===t?this.performEnter(n,e):this.performExit(n)}else this.props.unmountOnExit&&"exited"===this.state.status&&this.setState({status:"unmounted"})},n.performEnter=function(e,t){var n=this,r=this.props.enter,o=this.context?this.context.isMounting:t,i=this.getTimeouts(),a=o?i.appear:i.enter;!t&&!r||Xt?this.safeSetState({status:"entered"},(function(){n.props.onEntered(e)})):(this.props.onEnter(e,o),this.safeSetState({status:"entering"},(function(){n.props.onEntering(e,o),n.onTransitionEnd(e,a,(function(){n.safeSetState({status:"entered"},(function(){n.props.onEntered(e,o)}))}))})))},n.performExit=function(e){var t=this,n=this.props.exit,r=this.getTimeouts();n&&!Xt?(this.props.onExit(e),this.safeSetState({status:"exiting"},(function(){t.props.onExiting(e),t.onTransitionEnd(e,r.exit,(function(){t.safeSetState({status:"exited"},(function(){t.props.onExited(e)}))}))}))):this.safeSetState({status:"exited"},(function(){t.props.onExited(e)}))},n.cancelNextCallback=function(){null!==this.nextCallback&&(this.nextCallback.cancel(),this.nextCallback=null)},n.safeSetState=function(e,t){t=this.setNextCallback(t),this.setState(e,t)},n.setNextCallback=function(e){var t=this,n=!0;return this.nextCallback=function(r){n&&(n=!1,t.nextCallback=null,e(r))},this.nextCallback.cancel=function(){n=!1},this.nextCallback},n.onTransitionEnd=function(e,t,n){this.setNextCallback(n);var r=null==t&&!this.props.addEndListener;e&&!r?(this.props.addEndListener&&this.props.addEndListener(e,this.nextCallback),null!=t&&setTimeout(this.nextCallback,t)):setTimeout(this.nextCallback,0)},n.render=function(){var e=this.state.status;if("unmounted"===e)return null;var t=this.props,n=t.children,r=y(t,["children"]);if(delete r.in,delete r.mountOnEnter,delete r.unmountOnExit,delete r.appear,delete r.enter,delete r.exit,delete r.timeout,delete r.addEndListener,delete r.onEnter,delete r.onEntering,delete r.onEntered,delete r.onExit,delete r.onExiting,delete r.onExited,"function"==typeof n)return o.a.createElement(Yt.Provider,{value:null},n(e,r));var i=o.a.Children.only(n);return(o.a.createElement(Yt.Provider,{value:null},o.a.cloneElement(i,r)))},t}(o.a.Component);function Qt(){}Kt.contextType=Yt,Kt.propTypes={},Kt.defaultProps={in:!1,mountOnEnter:!1,unmountOnExit:!1,appear:!1,enter:!0,exit:!0,onEnter:Qt,onEntering:Qt,onEntered:Qt,onExit:Qt,onExiting:Qt,onExited:Qt},Kt.UNMOUNTED=0,Kt.EXITED=1,Kt.ENTERING=2,Kt.ENTERED=3,Kt.EXITING=4;var Jt,Zt=Kt;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-transition-group/esm/Transition.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-transition-group/esm/Transition.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/triggerBrowserReflow.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/triggerBrowserReflow.js")}}();var en=((Jt={}).entering="show",Jt.entered="show",Jt),tn=o.a.forwardRef((function(e,t){var n=e.className,i=e.children,a=y(e,["className","children"]),s=Object(r.useCallback)((function(e){!function(e){e.offsetHeight}(e),a.onEnter&&a.onEnter(e)}),[a]);return o.a.createElement(Zt,v({ref:t,addEndListener:$t},a,{onEnter:s}),(function(e,t){return o.a.cloneElement(i,v({},t,{className:at()("fade",n,i.props.className,en[e])}))}))}));tn.defaultProps={in:!1,timeout:300,mountOnEnter:!1,unmountOnExit:!1,appear:!1},tn.displayName="Fade";var nn=tn;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/Fade.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/Fade.js")}}();var rn={transition:nn,rootClose:!1,show:!1,placement:"top"};function on(e){var t=e.children,n=e.transition,r=y(e,["children","transition"]);return n=!0===n?nn:n||null,o.a.createElement(It,v({},r,{transition:n}),(function(e){var r=e.props,a=e.arrowProps,s=e.show,l=y(e,["props","arrowProps","show"]);return function(e,t){var n=e.ref,r=t.ref;e.ref=n.__wrapped||(n.__wrapped=function(e){return n(Object(i.findDOMNode)(e))}),t.ref=r.__wrapped||(r.__wrapped=function(e){return r(Object(i.findDOMNode)(e))})}(r,a),"function"==typeof t?t(v({},l,{},r,{show:s,arrowProps:a})):o.a.cloneElement(t,v({},l,{},r,{arrowProps:a,className:at()(t.props.className,!n&&s&&"show"),style:v({},t.props.style,{},r.style)}))}))}on.defaultProps=rn;var an=on;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/Overlay.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/Overlay.js")}}();var sn=function(e){function t(){return e.apply(this,arguments)||this}return pt(t,e),t.prototype.render=function(){return this.props.children},t}(o.a.Component),ln=function(e){return e&&"object"==typeof e?e:{show:e,hide:e}},cn=function(e){function t(t,n){var r;return(r=e.call(this,t,n)||this).getTarget=function(){return a.a.findDOMNode(r.trigger.current)},r.handleShow=function(){clearTimeout(r._timeout),r._hoverState="show";var e=ln(r.props.delay);e.show?r._timeout=setTimeout((function(){"show"===r._hoverState&&r.show()}),e.show):r.show()},r.handleHide=function(){clearTimeout(r._timeout),r._hoverState="hide";var e=ln(r.props.delay);e.hide?r._timeout=setTimeout((function(){"hide"===r._hoverState&&r.hide()}),e.hide):r.hide()},r.handleFocus=function(e){var t=r.getChildProps().onFocus;r.handleShow(e),t&&t(e)},r.handleBlur=function(e){var t=r.getChildProps().onBlur;r.handleHide(e),t&&t(e)},r.handleClick=function(e){var t=r.getChildProps().onClick;r.state.show?r.hide():r.show(),t&&t(e)},r.handleMouseOver=function(e){r.handleMouseOverOut(r.handleShow,e,"fromElement")},r.handleMouseOut=function(e){return r.handleMouseOverOut(r.handleHide,e,"toElement")},r.trigger=o.a.createRef(),r.state={show:!!t.defaultShow},r.ariaModifier={enabled:!0,order:900,fn:function(e){var t=e.instance.popper,n=r.getTarget();if(!r.state.show||!n)return e;var o=t.getAttribute("role")||"";return t.id&&"tooltip"===o.toLowerCase()&&n.setAttribute("aria-describedby",t.id),e}},r}pt(t,e);var n=t.prototype;return n.componentWillUnmount=function(){clearTimeout(this._timeout)},n.getChildProps=function(){return o.a.Children.only(this.props.children).props},n.handleMouseOverOut=function(e,t,n){var r=t.currentTarget,o=t.relatedTarget||t.nativeEvent[n];o&&o===r||ht(r,o)||e(t)},n.hide=function(){this.setState({show:!1})},n.show=function(){this.setState({show:!0})},n.render=function(){var e=this.props,t=e.trigger,n=e.overlay,i=e.children,a=e.popperConfig,s=void 0===a?{}:a,l=y(e,["trigger","overlay","children","popperConfig"]);delete l.delay,delete l.defaultShow;var c=o.a.Children.only(i),u={},f=null==t?[]:[].concat(t);return-1!==f.indexOf("click")&&(u.onClick=this.handleClick),-1!==f.indexOf("focus")&&(u.onFocus=this.handleShow,u.onBlur=this.handleHide),-1!==f.indexOf("hover")&&(u.onMouseOver=this.handleMouseOver,u.onMouseOut=this.handleMouseOut),o.a.createElement(o.a.Fragment,null,o.a.createElement(sn,{ref:this.trigger},Object(r.cloneElement)(c,u)),o.a.createElement(an,v({},l,{popperConfig:v({},s,{modifiers:v({},s.modifiers,{ariaModifier:this.ariaModifier})}),show:this.state.show,onHide:this.handleHide,target:this.getTarget}),n))},t}(o.a.Component);cn.defaultProps={defaultOverlayShown:!1,trigger:["hover","focus"]};var un=cn;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/OverlayTrigger.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/OverlayTrigger.js")}}();var fn=n(4),dn=(de((function(e,t){return{video_loaded:e.ui_status.video_loaded,video_playing:e.ui_status.video_playing,suggestions:e.scenario_state.dx_suggestions}}))((function(e){if(!e.video_loaded||e.video_playing)return"";var t=e.suggestions.map((function(e){return o.a.createElement("li",{key:e},o.a.createElement("h5",null,window.constants.DIAGNOSES[e]))}));return o.a.createElement("div",{className:"row"},o.a.createElement("p",{className:"col"},o.a.createElement(un,{placement:"right",overlay:o.a.createElement(dt,null,"The problems that the robot thinks might be stopping it from reaching its goal")},o.a.createElement(Me,{icon:fn.faQuestionCircle}))," ",o.a.createElement("b",null,"Possible Problems")),o.a.createElement("div",{className:"col-9"},o.a.createElement("ul",{className:"list-unstyled"},t)))})),de((function(e,t){return{video_loaded:e.ui_status.video_loaded,video_playing:e.ui_status.video_playing,suggestions:e.scenario_state.ax_suggestions}}))((function(e){if(!e.video_loaded||e.video_playing)return"";var t=e.suggestions.map((function(e){return o.a.createElement("li",{key:e},o.a.createElement("h5",null,window.constants.ACTIONS[e]))}));return o.a.createElement("div",{className:"row"},o.a.createElement("p",{className:"col"},o.a.createElement(un,{placement:"right",overlay:o.a.createElement(dt,null,"Actions the robot thinks might help you gather more information about the problem, or help resolve it")},o.a.createElement(Me,{icon:fn.faQuestionCircle}))," ",o.a.createElement("b",null,"Recommended Actions")),o.a.createElement("div",{className:"col-9"},o.a.createElement("ul",{className:"list-unstyled"},t)))})),function(e){return o.a.createElement("div",{className:"row"},o.a.createElement("h5",{className:"col-2"},o.a.createElement("b",null,"Goal:")),o.a.createElement("h5",{className:"col"},"Pick up the Cup from the Kitchen Counter and take it to the Couch."))}),pn=n(20),hn=n(19);function mn(){return(mn=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e}).apply(this,arguments)}function vn(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){if(!(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e)))return;var n=[],r=!0,o=!1,i=void 0;try{for(var a,s=e[Symbol.iterator]();!(r=(a=s.next()).done)&&(n.push(a.value),!t||n.length!==t);r=!0);}catch(e){o=!0,i=e}finally{try{r||null==s.return||s.return()}finally{if(o)throw i}}return n}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance")}()}function yn(e){return(yn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function bn(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function gn(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function _n(e,t,n){return t&&gn(e.prototype,t),n&&gn(e,n),e}function wn(e,t){return!t||"object"!==yn(t)&&"function"!=typeof t?function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e):t}function xn(e){return(xn=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function En(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&kn(e,t)}function kn(e,t){return(kn=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}var jn=function(e){function t(){return bn(this,t),wn(this,xn(t).apply(this,arguments))}return En(t,e),_n(t,[{key:"render",value:function(){var e=this.props.error instanceof Array?this.props.error.map((function(e){return o.a.createElement("span",{key:e},window.constants.DIAGNOSES[e],o.a.createElement("br",null))})):window.constants.DIAGNOSES[this.props.error],t=this.props.result?o.a.createElement("h3",{className:"text-success"},o.a.createElement(Me,{icon:hn.faCheckCircle})):o.a.createElement("h3",{className:"text-danger"},o.a.createElement(Me,{icon:pn.faTimesCircle}));return o.a.createElement("tr",null,o.a.createElement("th",{scope:"row"},this.props.idx),o.a.createElement("td",null,e),o.a.createElement("td",null,window.constants.ACTIONS[this.props.action]),o.a.createElement("td",null,t))}}]),t}(o.a.Component),Tn=function(e){function t(e){var n;return bn(this,t),(n=wn(this,xn(t).call(this,e))).MAX_HEIGHT="250px",n}return En(t,e),_n(t,[{key:"render",value:function(){var e=[],t=!0,n=!1,r=void 0;try{for(var i,a=this.props.history.slice().reverse().entries()[Symbol.iterator]();!(t=(i=a.next()).done);t=!0){var s=vn(i.value,2),l=s[0],c=s[1];e.push(o.a.createElement(jn,mn({key:this.props.history.length-l,idx:this.props.history.length-l},c)))}}catch(e){n=!0,r=e}finally{try{t||null==a.return||a.return()}finally{if(n)throw r}}return o.a.createElement("div",{className:"row overflow-auto",style:{maxHeight:this.MAX_HEIGHT}},o.a.createElement("div",{className:"col"},o.a.createElement("div",{className:"row"},o.a.createElement("p",{className:"col"},o.a.createElement(un,{placement:"right",overlay:o.a.createElement(dt,null,"The history of actions you have taken with the most-recent first. A red 'X' indicates that the action failed")},o.a.createElement(Me,{icon:fn.faQuestionCircle}))," ",o.a.createElement("b",null,"History"))),o.a.createElement("div",{className:"row"},o.a.createElement("div",{className:"col"},o.a.createElement("table",{className:"table-sm table text-center"+(e.length>0?"":" invisible")},o.a.createElement("colgroup",null,o.a.createElement("col",{width:"10%"}),o.a.createElement("col",{width:"40%"}),o.a.createElement("col",{width:"40%"}),o.a.createElement("col",{width:"10%"})),o.a.createElement("thead",{className:"thead-light"},o.a.createElement("tr",null,o.a.createElement("th",{scope:"col"},"#"),o.a.createElement("th",{scope:"col"},"Problems Identified"),o.a.createElement("th",{scope:"col"},"Action Taken"),o.a.createElement("th",{scope:"col"},"Result"))),o.a.createElement("tbody",null,e))))))}}]),t}(o.a.Component),On=de((function(e,t){return{history:e.history.history}}))(Tn),Cn=n(8);function Sn(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){if(!(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e)))return;var n=[],r=!0,o=!1,i=void 0;try{for(var a,s=e[Symbol.iterator]();!(r=(a=s.next()).done)&&(n.push(a.value),!t||n.length!==t);r=!0);}catch(e){o=!0,i=e}finally{try{r||null==s.return||s.return()}finally{if(o)throw i}}return n}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance")}()}function Ln(e){return(Ln="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function Pn(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function Nn(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function An(e,t,n){return t&&Nn(e.prototype,t),n&&Nn(e,n),e}function Mn(e,t){return!t||"object"!==Ln(t)&&"function"!=typeof t?Hn(e):t}function Dn(e){return(Dn=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function Hn(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function Rn(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&In(e,t)}function In(e,t){return(In=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}var Fn=function(e){function t(e){var n;return Pn(this,t),(n=Mn(this,Dn(t).call(this,e))).DEFAULT_BUTTON_COLOUR=" btn-outline-info",n.DISABLED_BUTTON_COLOUR=" btn-outline-secondary",n.select_action=n.select_action.bind(Hn(n)),n}return Rn(t,e),An(t,[{key:"select_action",value:function(e){this.props.dispatch(Re(this.props.value))}},{key:"render",value:function(){var e=!!this.props.show_suggestions&&!!this.props.suggested&&!this.props.disabled,t=this.DEFAULT_BUTTON_COLOUR,n=[];if(e){for(var r=0;r<this.props.suggested_imp;r++)n.push(o.a.createElement(Me,{icon:Cn.faStar,key:r}));n.push(o.a.createElement("br",{key:-1}))}return o.a.createElement("button",{className:"col btn"+t,style:{height:"100%",minHeight:"4rem"},onClick:this.select_action,disabled:this.props.disabled},o.a.createElement("span",{className:"lead",style:{pointerEvents:"none"}},n,window.constants.ACTIONS[this.props.value]))}}]),t}(o.a.Component),zn=function(e){function t(e){var n;Pn(this,t),(n=Mn(this,Dn(t).call(this,e))).BUTTONS_LAYOUT=[{name:"Update location belief",actions:window.constants.ACTIONS_ORDER.slice(0,3)},{name:"Navigate",actions:window.constants.ACTIONS_ORDER.slice(3,6)},{name:"",actions:window.constants.ACTIONS_ORDER.slice(6,8)},{name:"Look at",actions:window.constants.ACTIONS_ORDER.slice(8,11)},{name:"Pick",actions:window.constants.ACTIONS_ORDER.slice(11,14)},{name:"Place",actions:window.constants.ACTIONS_ORDER.slice(14,15)},{name:"Hardware & Drivers",actions:window.constants.ACTIONS_ORDER.slice(15,17)}],n.MAX_BUTTONS_PER_ROW=0;var r=!0,o=!1,i=void 0;try{for(var a,s=n.BUTTONS_LAYOUT.entries()[Symbol.iterator]();!(r=(a=s.next()).done);r=!0){var l=Sn(a.value,2),c=(l[0],l[1]);c.actions.length>n.MAX_BUTTONS_PER_ROW&&(n.MAX_BUTTONS_PER_ROW=c.actions.length)}}catch(e){o=!0,i=e}finally{try{r||null==s.return||s.return()}finally{if(o)throw i}}return n}return Rn(t,e),An(t,[{key:"render",value:function(){if(!this.props.video_loaded||this.props.video_playing||!this.props.dx_confirmed||!this.props.dx_certainty)return"";var e=[],t=!0,n=!1,r=void 0;try{for(var i,a=this.BUTTONS_LAYOUT.entries()[Symbol.iterator]();!(t=(i=a.next()).done);t=!0){var s=Sn(i.value,2),l=(s[0],s[1]),c=[],u=!0,f=!1,d=void 0;try{for(var p,h=l.actions.entries()[Symbol.iterator]();!(u=(p=h.next()).done);u=!0){var m=Sn(p.value,2),v=(m[0],m[1]),y=this.props.suggestions.includes(v),b=this.props.suggestions.indexOf(v),g=y?this.props.suggestions.length-b:0;c.push(o.a.createElement(Fn,{key:v,dispatch:this.props.dispatch,value:v,disabled:!!this.props.selected_action,show_suggestions:this.props.show_suggestions,suggested:y,suggested_idx:b,suggested_imp:g}))}}catch(e){f=!0,d=e}finally{try{u||null==h.return||h.return()}finally{if(f)throw d}}for(var _=c.length;_<this.MAX_BUTTONS_PER_ROW;_++)c.push(o.a.createElement("div",{className:"btn col invisible",key:_}));e.push(o.a.createElement("div",{className:"row my-1",key:l.name},o.a.createElement("div",{className:"col"},o.a.createElement("div",{className:"row"},o.a.createElement("p",{className:"col my-0"},o.a.createElement("small",null,l.name))),o.a.createElement("div",{className:"row"},o.a.createElement("div",{className:"col btn-group"},c)))))}}catch(e){n=!0,r=e}finally{try{t||null==a.return||a.return()}finally{if(n)throw r}}var w=this.props.show_suggestions?o.a.createElement("small",null,o.a.createElement("br",null),"The robot puts a star on the actions it thinks might help you gather more information about the problem, or help resolve it. ",o.a.createElement("b",null,"The more stars, the more certain the robot might be"),"."):"";return o.a.createElement("div",{className:"row"},o.a.createElement("div",{className:"col"},o.a.createElement("div",{className:"row"},o.a.createElement("p",{className:"col"},o.a.createElement(un,{placement:"right",overlay:o.a.createElement(dt,null,"Select the next action that the robot should take to eventually achieve its goal")},o.a.createElement(Me,{icon:fn.faQuestionCircle}))," ",o.a.createElement("b",null,"What action should the robot take to move towards its goal?"),w)),e))}}]),t}(o.a.Component),Gn=de((function(e,t){return{video_loaded:e.ui_status.video_loaded,video_playing:e.ui_status.video_playing,valid_actions:e.scenario_state.valid_actions,dx_confirmed:e.ui_status.confirmed_dx.length>0,dx_certainty:e.ui_status.dx_certainty,selected_action:e.ui_status.selected_action,suggestions:e.scenario_state.ax_suggestions,show_suggestions:!!window.constants.EXPERIMENT_CONDITION.show_ax_suggestions}}))(zn),Un=n(21),Bn=n.n(Un);function Wn(e){return(Wn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function qn(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function Vn(e){return(Vn=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function $n(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function Xn(e,t){return(Xn=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}var Yn=function(e){function t(e){var n;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,t),(n=function(e,t){return!t||"object"!==Wn(t)&&"function"!=typeof t?$n(e):t}(this,Vn(t).call(this,e))).MAX_VALUE=5,n.MIN_VALUE=1,n.DEFAULT_VALUE=3,n.state={},n.confirm_diagnoses=n.confirm_diagnoses.bind($n(n)),n.sliderRef=o.a.createRef(),n.slider=null,n}var n,r,i;return function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&Xn(e,t)}(t,e),n=t,(r=[{key:"create_slider",value:function(){this.slider=new Bn.a("input.slider",{min:this.MIN_VALUE,max:this.MAX_VALUE,step:1,value:this.props.dx_certainty||this.DEFAULT_VALUE,tooltip:"hide",ticks:[1,2,3,4,5]}),this.slider.enable()}},{key:"destroy_slider",value:function(){this.slider.destroy(),this.slider=null}},{key:"componentDidMount",value:function(){this.sliderRef.current&&!this.slider&&this.create_slider()}},{key:"componentDidUpdate",value:function(){this.sliderRef.current&&!this.slider?this.create_slider():!this.sliderRef.current&&this.slider&&this.destroy_slider()}},{key:"componentWillUnmount",value:function(){this.slider&&this.destroy_slider()}},{key:"confirm_diagnoses",value:function(e){this.props.dispatch({type:"CONFIRM_DIAGNOSES",certainty:this.slider.getValue()}),this.slider.disable()}},{key:"render",value:function(){return this.props.video_loaded&&!this.props.video_playing&&this.props.dx_confirmed?o.a.createElement("div",{className:"row"},o.a.createElement("div",{className:"col"},o.a.createElement("div",{className:"row"},o.a.createElement("p",{className:"col"},o.a.createElement(un,{placement:"right",overlay:o.a.createElement(dt,null,"Indicate on the scale how confident you are of the problem(s) that you have identified. For multiple problems, provide your confidence in your ",o.a.createElement("b",null,"most confident")," guess")},o.a.createElement(Me,{icon:fn.faQuestionCircle}))," ",o.a.createElement("b",null,"How sure are you of the above problem(s)?"))),o.a.createElement("div",{className:"row"},o.a.createElement("div",{className:"col"},o.a.createElement("div",{className:"row"},o.a.createElement("span",{className:"col-2 align-self-center"},"Very Unsure"),o.a.createElement("span",{className:"col bg-secondary align-self-center"},o.a.createElement("input",{type:"text",className:"col-8 slider",style:{width:"100%"},ref:this.sliderRef})),o.a.createElement("span",{className:"col-2 align-self-center"},"Very Sure")))),o.a.createElement("div",{className:"row mt-2"},o.a.createElement("div",{className:"offset-8 col"},o.a.createElement("button",{className:"btn btn-block btn-success",disabled:!!this.props.dx_certainty,onClick:this.confirm_diagnoses},"Confirm"))))):""}}])&&qn(n.prototype,r),i&&qn(n,i),t}(o.a.Component),Kn=de((function(e,t){return{video_loaded:e.ui_status.video_loaded,video_playing:e.ui_status.video_playing,dx_confirmed:e.ui_status.confirmed_dx.length>0,dx_certainty:e.ui_status.dx_certainty}}))(Yn);function Qn(e){return function(e){if(Array.isArray(e)){for(var t=0,n=new Array(e.length);t<e.length;t++)n[t]=e[t];return n}}(e)||function(e){if(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e))return Array.from(e)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance")}()}function Jn(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){if(!(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e)))return;var n=[],r=!0,o=!1,i=void 0;try{for(var a,s=e[Symbol.iterator]();!(r=(a=s.next()).done)&&(n.push(a.value),!t||n.length!==t);r=!0);}catch(e){o=!0,i=e}finally{try{r||null==s.return||s.return()}finally{if(o)throw i}}return n}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance")}()}function Zn(e){return(Zn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function er(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function tr(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function nr(e,t,n){return t&&tr(e.prototype,t),n&&tr(e,n),e}function rr(e,t){return!t||"object"!==Zn(t)&&"function"!=typeof t?or(e):t}function or(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function ir(e){return(ir=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function ar(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&sr(e,t)}function sr(e,t){return(sr=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}var lr,cr=function(e){function t(e){var n;return er(this,t),(n=rr(this,ir(t).call(this,e))).DEFAULT_BUTTON_COLOUR=" btn-outline-info",n.DISABLED_BUTTON_COLOUR=" btn-outline-secondary",n}return ar(t,e),nr(t,[{key:"render",value:function(){var e=!!this.props.show_suggestions&&!!this.props.suggested&&!this.props.disabled,t=this.DEFAULT_BUTTON_COLOUR,n=[];if(e){for(var r=0;r<this.props.suggested_imp;r++)n.push(o.a.createElement(Me,{icon:Cn.faStar,key:r}));n.push(o.a.createElement("br",{key:-1}))}return o.a.createElement("button",{className:"mx-1 col btn"+t+(this.props.selected?" active font-weight-bold":""),type:"button",style:{minHeight:"4rem",pointerEvents:this.props.disabled?"none":"auto"},value:this.props.value,onClick:this.props.select_diagnosis},o.a.createElement("span",{className:"lead",style:{pointerEvents:"none"}},n,window.constants.DIAGNOSES[this.props.value]))}}]),t}(o.a.Component),ur=function(e){function t(e){var n;er(this,t),(n=rr(this,ir(t).call(this,e))).state={selected_diagnoses:[]},n.BUTTONS_LAYOUT=[{name:"Location faults",diagnoses:window.constants.DIAGNOSES_ORDER.slice(0,4)},{name:"Object faults",diagnoses:window.constants.DIAGNOSES_ORDER.slice(4,8)},{name:"Miscellaneous & None",diagnoses:window.constants.DIAGNOSES_ORDER.slice(8,11)}],n.MAX_BUTTONS_PER_ROW=0;var r=!0,o=!1,i=void 0;try{for(var a,s=n.BUTTONS_LAYOUT.entries()[Symbol.iterator]();!(r=(a=s.next()).done);r=!0){var l=Jn(a.value,2),c=(l[0],l[1]);c.diagnoses.length>n.MAX_BUTTONS_PER_ROW&&(n.MAX_BUTTONS_PER_ROW=c.diagnoses.length)}}catch(e){o=!0,i=e}finally{try{r||null==s.return||s.return()}finally{if(o)throw i}}return n.select_diagnosis=n.select_diagnosis.bind(or(n)),n.select_diagnoses=n.select_diagnoses.bind(or(n)),n}return ar(t,e),nr(t,[{key:"select_diagnosis",value:function(e){var t=e.target.value,n=Qn(this.state.selected_diagnoses);n.includes(t)?n.splice(n.indexOf(t),1):n.push(t),this.setState({selected_diagnoses:n})}},{key:"select_diagnoses",value:function(e){this.props.dispatch({type:"SELECT_DIAGNOSES",diagnoses:this.state.selected_diagnoses})}},{key:"render",value:function(){if(!this.props.video_loaded||this.props.video_playing)return"";var e=[],t=!0,n=!1,r=void 0;try{for(var i,a=this.BUTTONS_LAYOUT.entries()[Symbol.iterator]();!(t=(i=a.next()).done);t=!0){var s=Jn(i.value,2),l=(s[0],s[1]),c=[],u=!0,f=!1,d=void 0;try{for(var p,h=l.diagnoses.entries()[Symbol.iterator]();!(u=(p=h.next()).done);u=!0){var m=Jn(p.value,2),v=(m[0],m[1]),y=this.props.suggestions.includes(v),b=this.props.suggestions.indexOf(v),g=y?this.props.suggestions.length-b:0;c.push(o.a.createElement(cr,{key:v,value:v,disabled:this.props.confirmed_dx.length>0,selected:this.state.selected_diagnoses.includes(v),select_diagnosis:this.select_diagnosis,show_suggestions:this.props.show_suggestions,suggested:y,suggested_idx:b,suggested_imp:g}))}}catch(e){f=!0,d=e}finally{try{u||null==h.return||h.return()}finally{if(f)throw d}}for(var _=c.length;_<this.MAX_BUTTONS_PER_ROW;_++)c.push(o.a.createElement("div",{className:"mx-1 btn col invisible",key:_}));e.push(o.a.createElement("div",{className:"row my-1",key:l.name},c))}}catch(e){n=!0,r=e}finally{try{t||null==a.return||a.return()}finally{if(n)throw r}}var w=this.props.show_suggestions?o.a.createElement("small",null,o.a.createElement("br",null),"The robot might put a star on the problem(s) it thinks might be stopping it from reaching its goal. ",o.a.createElement("b",null,"The more stars, the more certain the robot might be"),"."):"";return o.a.createElement("div",{className:"row"},o.a.createElement("div",{className:"col"},o.a.createElement("div",{className:"row"},o.a.createElement("p",{className:"col"},o.a.createElement(un,{placement:"right",overlay:o.a.createElement(dt,null,"Select the problem(s) in the current situation you observe or are trying to resolve")},o.a.createElement(Me,{icon:fn.faQuestionCircle}))," ",o.a.createElement("b",null,"What do you think is interfering with the robot's ability to achieve its goal?"),w)),e,o.a.createElement("div",{className:"row mt-2"},o.a.createElement("div",{className:"offset-8 col"},o.a.createElement("button",{className:"btn btn-block btn-success",disabled:0===this.state.selected_diagnoses.length||this.props.confirmed_dx.length>0,onClick:this.select_diagnoses},"Select")))))}}],[{key:"getDerivedStateFromProps",value:function(e,t){return e.video_loaded&&!e.video_playing?t:{selected_diagnoses:e.confirmed_dx}}}]),t}(o.a.Component),fr=de((function(e,t){return{video_loaded:e.ui_status.video_loaded,video_playing:e.ui_status.video_playing,confirmed_dx:e.ui_status.confirmed_dx,suggestions:e.scenario_state.dx_suggestions,show_suggestions:!!window.constants.EXPERIMENT_CONDITION.show_dx_suggestions}}))(ur),dr=function(e){return o.a.createElement("div",{className:"row bg-light"},o.a.createElement("div",{className:"col"},o.a.createElement(fr,null),o.a.createElement("div",{className:"my-3"}),o.a.createElement(Kn,null),o.a.createElement("div",{className:"my-3"}),o.a.createElement(Gn,null)))};function pr(e){if((!lr&&0!==lr||e)&&Et){var t=document.createElement("div");t.style.position="absolute",t.style.top="-9999px",t.style.width="50px",t.style.height="50px",t.style.overflow="scroll",document.body.appendChild(t),lr=t.offsetWidth-t.clientWidth,document.body.removeChild(t)}return lr}function hr(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function mr(e){void 0===e&&(e=Mt());try{var t=e.activeElement;return t&&t.nodeName?t:null}catch(t){return e.body}}function vr(e,t){e.classList?e.classList.add(t):function(e,t){return e.classList?!!t&&e.classList.contains(t):-1!==(" "+(e.className.baseVal||e.className)+" ").indexOf(" "+t+" ")}(e,t)||("string"==typeof e.className?e.className=e.className+" "+t:e.setAttribute("class",(e.className&&e.className.baseVal||"")+" "+t))}function yr(e,t){return e.replace(new RegExp("(^|\\s)"+t+"(?:\\s|$)","g"),"$1").replace(/\s+/g," ").replace(/^\s*|\s*$/g,"")}function br(e,t){e.classList?e.classList.remove(t):"string"==typeof e.className?e.className=yr(e.className,t):e.setAttribute("class",yr(e.className&&e.className.baseVal||"",t))}function gr(e){return"window"in e&&e.window===e?e:"nodeType"in(t=e)&&t.nodeType===document.DOCUMENT_NODE&&e.defaultView||!1;var t}function _r(e){var t;return gr(e)||(t=e)&&"body"===t.tagName.toLowerCase()?function(e){var t=Mt(e),n=gr(t);return t.body.clientWidth<n.innerWidth}(e):e.scrollHeight>e.clientHeight}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/scrollbarSize.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/scrollbarSize.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@babel/runtime/helpers/esm/assertThisInitialized.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@babel/runtime/helpers/esm/assertThisInitialized.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/activeElement.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/activeElement.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/hasClass.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/hasClass.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/addClass.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/addClass.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/removeClass.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/removeClass.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/isDocument.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/isDocument.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/isWindow.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/isWindow.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/utils/isOverflowing.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/utils/isOverflowing.js")}}();var wr=["template","script","style"],xr=function(e,t,n){t=[].concat(t),[].forEach.call(e.children,(function(e){-1===t.indexOf(e)&&function(e){var t=e.nodeType,n=e.tagName;return 1===t&&-1===wr.indexOf(n.toLowerCase())}(e)&&n(e)}))};function Er(e,t){t&&(e?t.setAttribute("aria-hidden","true"):t.removeAttribute("aria-hidden"))}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/utils/manageAriaHidden.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/utils/manageAriaHidden.js")}}();var kr=function(){function e(e){var t=void 0===e?{}:e,n=t.hideSiblingNodes,r=void 0===n||n,o=t.handleContainerOverflow,i=void 0===o||o;this.hideSiblingNodes=r,this.handleContainerOverflow=i,this.modals=[],this.containers=[],this.data=[],this.scrollbarSize=pr()}var t=e.prototype;return t.isContainerOverflowing=function(e){var t=this.data[this.containerIndexFromModal(e)];return t&&t.overflowing},t.containerIndexFromModal=function(e){return t=this.data,n=function(t){return-1!==t.modals.indexOf(e)},r=-1,t.some((function(e,t){return!!n(e,t)&&(r=t,!0)})),r;var t,n,r},t.setContainerStyle=function(e,t){var n={overflow:"hidden"};e.style={overflow:t.style.overflow,paddingRight:t.style.paddingRight},e.overflowing&&(n.paddingRight=parseInt(Wt(t,"paddingRight")||0,10)+this.scrollbarSize+"px"),Wt(t,n)},t.removeContainerStyle=function(e,t){var n=e.style;Object.keys(n).forEach((function(e){t.style[e]=n[e]}))},t.add=function(e,t,n){var r=this.modals.indexOf(e),o=this.containers.indexOf(t);if(-1!==r)return r;if(r=this.modals.length,this.modals.push(e),this.hideSiblingNodes&&function(e,t){var n=t.dialog,r=t.backdrop;xr(e,[n,r],(function(e){return Er(!0,e)}))}(t,e),-1!==o)return this.data[o].modals.push(e),r;var i={modals:[e],classes:n?n.split(/\s+/):[],overflowing:_r(t)};return this.handleContainerOverflow&&this.setContainerStyle(i,t),i.classes.forEach(vr.bind(null,t)),this.containers.push(t),this.data.push(i),r},t.remove=function(e){var t=this.modals.indexOf(e);if(-1!==t){var n=this.containerIndexFromModal(e),r=this.data[n],o=this.containers[n];if(r.modals.splice(r.modals.indexOf(e),1),this.modals.splice(t,1),0===r.modals.length)r.classes.forEach(br.bind(null,o)),this.handleContainerOverflow&&this.removeContainerStyle(r,o),this.hideSiblingNodes&&function(e,t){var n=t.dialog,r=t.backdrop;xr(e,[n,r],(function(e){return Er(!1,e)}))}(o,e),this.containers.splice(n,1),this.data.splice(n,1);else if(this.hideSiblingNodes){var i=r.modals[r.modals.length-1],a=i.backdrop;Er(!1,i.dialog),Er(!1,a)}}},t.isTopModal=function(e){return!!this.modals.length&&this.modals[this.modals.length-1]===e},e}();!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/ModalManager.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/ModalManager.js")}}();var jr=function(e){return Mt(a.a.findDOMNode(e))};!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/utils/ownerDocument.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/utils/ownerDocument.js")}}();var Tr=new kr;var Or=function(e){function t(){for(var t,n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return(t=e.call.apply(e,[this].concat(r))||this).state={exited:!t.props.show},t.onShow=function(){var e=t.props,n=e.container,r=e.containerClassName,o=e.manager,i=e.onShow;o.add(hr(t),n,r),t.removeKeydownListener=St(document,"keydown",t.handleDocumentKeyDown),t.removeFocusListener=St(document,"focus",(function(){return setTimeout(t.enforceFocus)}),!0),i&&i(),t.autoFocus()},t.onHide=function(){t.props.manager.remove(hr(t)),t.removeKeydownListener(),t.removeFocusListener(),t.props.restoreFocus&&t.restoreLastFocus()},t.setDialogRef=function(e){t.dialog=e},t.setBackdropRef=function(e){t.backdrop=e&&a.a.findDOMNode(e)},t.handleHidden=function(){var e;(t.setState({exited:!0}),t.onHide(),t.props.onExited)&&(e=t.props).onExited.apply(e,arguments)},t.handleBackdropClick=function(e){e.target===e.currentTarget&&(t.props.onBackdropClick&&t.props.onBackdropClick(e),!0===t.props.backdrop&&t.props.onHide())},t.handleDocumentKeyDown=function(e){t.props.keyboard&&27===e.keyCode&&t.isTopModal()&&(t.props.onEscapeKeyDown&&t.props.onEscapeKeyDown(e),t.props.onHide())},t.enforceFocus=function(){if(t.props.enforceFocus&&t._isMounted&&t.isTopModal()){var e=mr(jr(hr(t)));t.dialog&&!ht(t.dialog,e)&&t.dialog.focus()}},t.renderBackdrop=function(){var e=t.props,n=e.renderBackdrop,r=e.backdropTransition,i=n({ref:t.setBackdropRef,onClick:t.handleBackdropClick});return r&&(i=o.a.createElement(r,{appear:!0,in:t.props.show},i)),i},t}pt(t,e),t.getDerivedStateFromProps=function(e){return e.show?{exited:!1}:e.transition?null:{exited:!0}};var n=t.prototype;return n.componentDidMount=function(){this._isMounted=!0,this.props.show&&this.onShow()},n.componentDidUpdate=function(e){var t=this.props.transition;!e.show||this.props.show||t?!e.show&&this.props.show&&this.onShow():this.onHide()},n.componentWillUnmount=function(){var e=this.props,t=e.show,n=e.transition;this._isMounted=!1,(t||n&&!this.state.exited)&&this.onHide()},n.getSnapshotBeforeUpdate=function(e){return Et&&!e.show&&this.props.show&&(this.lastFocus=mr()),null},n.restoreLastFocus=function(){this.lastFocus&&this.lastFocus.focus&&(this.lastFocus.focus(this.props.restoreFocusOptions),this.lastFocus=null)},n.autoFocus=function(){if(this.props.autoFocus){var e=mr(jr(this));this.dialog&&!ht(this.dialog,e)&&(this.lastFocus=e,this.dialog.focus())}},n.isTopModal=function(){return this.props.manager.isTopModal(this)},n.render=function(){var e=this.props,n=e.show,r=e.container,i=e.children,s=e.renderDialog,l=e.role,c=void 0===l?"dialog":l,u=e.transition,f=e.backdrop,d=e.className,p=e.style,h=e.onExit,m=e.onExiting,b=e.onEnter,g=e.onEntering,_=e.onEntered,w=y(e,["show","container","children","renderDialog","role","transition","backdrop","className","style","onExit","onExiting","onEnter","onEntering","onEntered"]);if(!(n||u&&!this.state.exited))return null;var x=v({role:c,ref:this.setDialogRef,"aria-modal":"dialog"===c||void 0},function(e,t){var n=Object.keys(e),r={};return n.forEach((function(n){Object.prototype.hasOwnProperty.call(t,n)||(r[n]=e[n])})),r}(w,t.propTypes),{style:p,className:d,tabIndex:"-1"}),E=s?s(x):o.a.createElement("div",x,o.a.cloneElement(i,{role:"document"}));return u&&(E=o.a.createElement(u,{appear:!0,unmountOnExit:!0,in:n,onExit:h,onExiting:m,onExited:this.handleHidden,onEnter:b,onEntering:g,onEntered:_},E)),a.a.createPortal(o.a.createElement(o.a.Fragment,null,f&&this.renderBackdrop(),E),r)},t}(o.a.Component);Or.propTypes={show:l.a.bool,container:l.a.any,onShow:l.a.func,onHide:l.a.func,backdrop:l.a.oneOfType([l.a.bool,l.a.oneOf(["static"])]),renderDialog:l.a.func,renderBackdrop:l.a.func,onEscapeKeyDown:l.a.func,onBackdropClick:l.a.func,containerClassName:l.a.string,keyboard:l.a.bool,transition:l.a.elementType,backdropTransition:l.a.elementType,autoFocus:l.a.bool,enforceFocus:l.a.bool,restoreFocus:l.a.bool,restoreFocusOptions:l.a.shape({preventScroll:l.a.bool}),onEnter:l.a.func,onEntering:l.a.func,onEntered:l.a.func,onExit:l.a.func,onExiting:l.a.func,onExited:l.a.func,manager:l.a.object.isRequired},Or.defaultProps={show:!1,role:"dialog",backdrop:!0,keyboard:!0,autoFocus:!0,enforceFocus:!0,restoreFocus:!0,onHide:function(){},manager:Tr,renderBackdrop:function(e){return o.a.createElement("div",e)}};var Cr,Sr,Lr=(Cr=Or,(Sr=o.a.forwardRef((function(e,t){var n=Ht(e.container);return n?o.a.createElement(Cr,v({},e,{ref:t,container:n})):null}))).Manager=kr,Sr._Inner=Cr,Sr);Lr.Manager=kr;var Pr=Lr;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/Modal.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/Modal.js")}}();var Nr=Function.prototype.bind.call(Function.prototype.call,[].slice);function Ar(e,t){return Nr(e.querySelectorAll(t))}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/querySelectorAll.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/querySelectorAll.js")}}();var Mr=".fixed-top, .fixed-bottom, .is-fixed, .sticky-top",Dr=".sticky-top",Hr=".navbar-toggler",Rr=function(e){function t(){for(var t,n=arguments.length,r=new Array(n),o=0;o<n;o++)r[o]=arguments[o];return(t=e.call.apply(e,[this].concat(r))||this).adjustAndStore=function(e,t,n){var r,o=t.style[e];t.dataset[e]=o,Wt(t,((r={})[e]=parseFloat(Wt(t,e))+n+"px",r))},t.restore=function(e,t){var n,r=t.dataset[e];void 0!==r&&(delete t.dataset[e],Wt(t,((n={})[e]=r,n)))},t}pt(t,e);var n=t.prototype;return n.setContainerStyle=function(t,n){var r=this;if(e.prototype.setContainerStyle.call(this,t,n),t.overflowing){var o=pr();Ar(n,Mr).forEach((function(e){return r.adjustAndStore("paddingRight",e,o)})),Ar(n,Dr).forEach((function(e){return r.adjustAndStore("margingRight",e,-o)})),Ar(n,Hr).forEach((function(e){return r.adjustAndStore("margingRight",e,o)}))}},n.removeContainerStyle=function(t,n){var r=this;e.prototype.removeContainerStyle.call(this,t,n),Ar(n,Mr).forEach((function(e){return r.restore("paddingRight",e)})),Ar(n,Dr).forEach((function(e){return r.restore("margingRight",e)})),Ar(n,Hr).forEach((function(e){return r.restore("margingRight",e)}))},t}(kr);!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/BootstrapModalManager.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/BootstrapModalManager.js")}}();var Ir=/-(.)/g;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/camelize.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/camelize.js")}}();var Fr=function(e){return e[0].toUpperCase()+(t=e,t.replace(Ir,(function(e,t){return t.toUpperCase()}))).slice(1);var t};function zr(e,t){var n=void 0===t?{}:t,r=n.displayName,i=void 0===r?Fr(e):r,a=n.Component,s=void 0===a?"div":a,l=n.defaultProps,c=o.a.forwardRef((function(t,n){var r=t.className,i=t.bsPrefix,a=t.as,l=void 0===a?s:a,c=y(t,["className","bsPrefix","as"]),u=ut(i,e);return o.a.createElement(l,v({ref:n,className:at()(r,u)},c))}));return c.defaultProps=l,c.displayName=i,c}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/createWithBsPrefix.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/createWithBsPrefix.js")}}();var Gr=zr("modal-body");!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ModalBody.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ModalBody.js")}}();var Ur=o.a.createContext({onHide:function(){}});!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ModalContext.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ModalContext.js")}}();var Br=o.a.forwardRef((function(e,t){var n=e.bsPrefix,r=e.className,i=e.centered,a=e.size,s=e.children,l=e.scrollable,c=y(e,["bsPrefix","className","centered","size","children","scrollable"]),u=(n=ut(n,"modal"))+"-dialog";return o.a.createElement("div",v({},c,{ref:t,className:at()(u,r,a&&n+"-"+a,i&&u+"-centered",l&&u+"-scrollable")}),o.a.createElement("div",{className:n+"-content"},s))}));Br.displayName="ModalDialog";var Wr=Br;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ModalDialog.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ModalDialog.js")}}();var qr=zr("modal-footer");!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ModalFooter.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ModalFooter.js")}}();var Vr={label:l.a.string.isRequired,onClick:l.a.func},$r=o.a.forwardRef((function(e,t){var n=e.label,r=e.onClick,i=e.className,a=y(e,["label","onClick","className"]);return o.a.createElement("button",v({ref:t,type:"button",className:at()("close",i),onClick:r},a),o.a.createElement("span",{"aria-hidden":"true"},"×"),o.a.createElement("span",{className:"sr-only"},n))}));$r.displayName="CloseButton",$r.propTypes=Vr,$r.defaultProps={label:"Close"};var Xr=$r;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/CloseButton.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/CloseButton.js")}}();var Yr=o.a.forwardRef((function(e,t){var n=e.bsPrefix,i=e.closeLabel,a=e.closeButton,s=e.onHide,l=e.className,c=e.children,u=y(e,["bsPrefix","closeLabel","closeButton","onHide","className","children"]);n=ut(n,"modal-header");var f=Object(r.useContext)(Ur),d=Pt((function(){f&&f.onHide(),s&&s()}));return o.a.createElement("div",v({ref:t},u,{className:at()(l,n)}),c,a&&o.a.createElement(Xr,{label:i,onClick:d}))}));Yr.displayName="ModalHeader",Yr.defaultProps={closeLabel:"Close",closeButton:!1};var Kr=Yr;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ModalHeader.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ModalHeader.js")}}();!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/divWithClassName.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/divWithClassName.js")}}();var Qr,Jr=zr("modal-title",{Component:(Qr="h4",o.a.forwardRef((function(e,t){return o.a.createElement("div",v({},e,{ref:t,className:at()(e.className,Qr)}))})))});!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ModalTitle.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ModalTitle.js")}}();var Zr={show:!1,backdrop:!0,keyboard:!0,autoFocus:!0,enforceFocus:!0,restoreFocus:!0,animation:!0,dialogAs:Wr,manager:new Rr};function eo(e){return o.a.createElement(nn,e)}function to(e){return o.a.createElement(nn,e)}var no=function(e){function t(){for(var t,n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return(t=e.call.apply(e,[this].concat(r))||this).state={style:{}},t.modalContext={onHide:function(){return t.props.onHide()}},t.setModalRef=function(e){t._modal=e},t.handleDialogMouseDown=function(){t._waitingForMouseUp=!0},t.handleMouseUp=function(e){t._waitingForMouseUp&&e.target===t._modal.dialog&&(t._ignoreBackdropClick=!0),t._waitingForMouseUp=!1},t.handleClick=function(e){t._ignoreBackdropClick||e.target!==e.currentTarget?t._ignoreBackdropClick=!1:t.props.onHide()},t.handleEnter=function(e){var n;e&&(e.style.display="block",t.updateDialogStyle(e));for(var r=arguments.length,o=new Array(r>1?r-1:0),i=1;i<r;i++)o[i-1]=arguments[i];t.props.onEnter&&(n=t.props).onEnter.apply(n,[e].concat(o))},t.handleEntering=function(e){for(var n,r=arguments.length,o=new Array(r>1?r-1:0),i=1;i<r;i++)o[i-1]=arguments[i];t.props.onEntering&&(n=t.props).onEntering.apply(n,[e].concat(o)),Ot(window,"resize",t.handleWindowResize)},t.handleExited=function(e){var n;e&&(e.style.display="");for(var r=arguments.length,o=new Array(r>1?r-1:0),i=1;i<r;i++)o[i-1]=arguments[i];t.props.onExited&&(n=t.props).onExited.apply(n,o),Ct(window,"resize",t.handleWindowResize)},t.handleWindowResize=function(){t.updateDialogStyle(t._modal.dialog)},t.renderBackdrop=function(e){var n=t.props,r=n.bsPrefix,i=n.backdropClassName,a=n.animation;return o.a.createElement("div",v({},e,{className:at()(r+"-backdrop",i,!a&&"show")}))},t}pt(t,e);var n=t.prototype;return n.componentWillUnmount=function(){Ct(window,"resize",this.handleWindowResize)},n.updateDialogStyle=function(e){if(Et){var t=this.props.manager.isContainerOverflowing(this._modal),n=e.scrollHeight>Mt(e).documentElement.clientHeight;this.setState({style:{paddingRight:t&&!n?pr():void 0,paddingLeft:!t&&n?pr():void 0}})}},n.render=function(){var e=this.props,t=e.bsPrefix,n=e.className,r=e.style,i=e.dialogClassName,a=e.children,s=e.dialogAs,l=e.show,c=e.animation,u=e.backdrop,f=e.keyboard,d=e.manager,p=e.onEscapeKeyDown,h=e.onShow,m=e.onHide,b=e.container,g=e.autoFocus,_=e.enforceFocus,w=e.restoreFocus,x=e.onEntered,E=e.onExit,k=e.onExiting,j=(e.onExited,e.onEntering,e.onEnter,e.onEntering,e.backdropClassName,y(e,["bsPrefix","className","style","dialogClassName","children","dialogAs","show","animation","backdrop","keyboard","manager","onEscapeKeyDown","onShow","onHide","container","autoFocus","enforceFocus","restoreFocus","onEntered","onExit","onExiting","onExited","onEntering","onEnter","onEntering","backdropClassName"])),T=!0===u?this.handleClick:null,O=v({},r,{},this.state.style);return c||(O.display="block"),o.a.createElement(Ur.Provider,{value:this.modalContext},o.a.createElement(Pr,{show:l,backdrop:u,container:b,keyboard:f,autoFocus:g,enforceFocus:_,restoreFocus:w,onEscapeKeyDown:p,onShow:h,onHide:m,onEntered:x,onExit:E,onExiting:k,manager:d,ref:this.setModalRef,style:O,className:at()(n,t),containerClassName:t+"-open",transition:c?eo:void 0,backdropTransition:c?to:void 0,renderBackdrop:this.renderBackdrop,onClick:T,onMouseUp:this.handleMouseUp,onEnter:this.handleEnter,onEntering:this.handleEntering,onExited:this.handleExited},o.a.createElement(s,v({},j,{onMouseDown:this.handleDialogMouseDown,className:i}),a)))},t}(o.a.Component);no.defaultProps=Zr;var ro=function(e,t){"string"==typeof t&&(t={prefix:t});var n=e.prototype&&e.prototype.isReactComponent,r=t,i=r.prefix,a=r.forwardRefAs,s=void 0===a?n?"ref":"innerRef":a;return lt()((function(t,n){var r=v({},t);r[s]=n;var a=ut(r.bsPrefix,i);return o.a.createElement(e,v({},r,{bsPrefix:a}))}),{displayName:"Bootstrap("+(e.displayName||e.name)+")"})}(no,"modal");ro.Body=Gr,ro.Header=Kr,ro.Title=Jr,ro.Footer=qr,ro.Dialog=Wr,ro.TRANSITION_DURATION=300,ro.BACKDROP_TRANSITION_DURATION=150;var oo=ro;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/Modal.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/Modal.js")}}();var io=function(e){return o.a.createElement(oo,{show:e.show,size:"lg",centered:!0,onHide:function(){}},o.a.createElement(oo.Header,null,o.a.createElement(oo.Title,null,"Complete!")),o.a.createElement(oo.Body,null,o.a.createElement("p",null,"The connection with the robot is now severed. Please click the button below to continue with the study.")),o.a.createElement(oo.Footer,null,o.a.createElement("a",{href:window.constants.NEXT_URL,role:"button",className:"btn btn-primary"},"Continue")))},ao=de((function(e,t){return{scenario_completed:e.scenario_state.scenario_completed,video_loaded:e.ui_status.video_loaded,video_playing:e.ui_status.video_playing}}))((function(e){var t=!1;return e.video_loaded&&!e.video_playing&&(t=e.scenario_completed),o.a.createElement("div",{className:"container-fluid"},o.a.createElement(io,{show:t}),o.a.createElement("div",{className:"row mt-3"},o.a.createElement("div",{className:"col"},o.a.createElement(ot,null)),o.a.createElement("div",{className:"col"},o.a.createElement(dn,null),o.a.createElement("hr",null),o.a.createElement(On,null),o.a.createElement("hr",null),o.a.createElement(dr,null))))}));function so(e){return function(e){if(Array.isArray(e)){for(var t=0,n=new Array(e.length);t<e.length;t++)n[t]=e[t];return n}}(e)||function(e){if(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e))return Array.from(e)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance")}()}function lo(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function co(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?lo(Object(n),!0).forEach((function(t){uo(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):lo(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function uo(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var fo=function e(t,n,r){var o;if("function"==typeof n&&"function"==typeof r||"function"==typeof r&&"function"==typeof arguments[3])throw new Error("It looks like you are passing several store enhancers to createStore(). This is not supported. Instead, compose them together to a single function.");if("function"==typeof n&&void 0===r&&(r=n,n=void 0),void 0!==r){if("function"!=typeof r)throw new Error("Expected the enhancer to be a function.");return r(e)(t,n)}if("function"!=typeof t)throw new Error("Expected the reducer to be a function.");var i=t,a=n,s=[],l=s,c=!1;function u(){l===s&&(l=s.slice())}function f(){if(c)throw new Error("You may not call store.getState() while the reducer is executing. The reducer has already received the state as an argument. Pass it down from the top reducer instead of reading it from the store.");return a}function d(e){if("function"!=typeof e)throw new Error("Expected the listener to be a function.");if(c)throw new Error("You may not call store.subscribe() while the reducer is executing. If you would like to be notified after the store has been updated, subscribe from a component and invoke store.getState() in the callback to access the latest state. See https://redux.js.org/api-reference/store#subscribelistener for more details.");var t=!0;return u(),l.push(e),function(){if(t){if(c)throw new Error("You may not unsubscribe from a store listener while the reducer is executing. See https://redux.js.org/api-reference/store#subscribelistener for more details.");t=!1,u();var n=l.indexOf(e);l.splice(n,1),s=null}}}function p(e){if(!D(e))throw new Error("Actions must be plain objects. Use custom middleware for async actions.");if(void 0===e.type)throw new Error('Actions may not have an undefined "type" property. Have you misspelled a constant?');if(c)throw new Error("Reducers may not dispatch actions.");try{c=!0,a=i(a,e)}finally{c=!1}for(var t=s=l,n=0;n<t.length;n++){(0,t[n])()}return e}function h(e){if("function"!=typeof e)throw new Error("Expected the nextReducer to be a function.");i=e,p({type:M.REPLACE})}function m(){var e,t=d;return(e={subscribe:function(e){if("object"!=typeof e||null===e)throw new TypeError("Expected the observer to be an object.");function n(){e.next&&e.next(f())}return n(),{unsubscribe:t(n)}}})[N.a]=function(){return this},e}return p({type:M.INIT}),(o={dispatch:p,subscribe:d,getState:f,replaceReducer:h})[N.a]=m,o}(function(e){for(var t=Object.keys(e),n={},r=0;r<t.length;r++){var o=t[r];0,"function"==typeof e[o]&&(n[o]=e[o])}var i,a=Object.keys(n);try{!function(e){Object.keys(e).forEach((function(t){var n=e[t];if(void 0===n(void 0,{type:M.INIT}))throw new Error('Reducer "'+t+"\" returned undefined during initialization. If the state passed to the reducer is undefined, you must explicitly return the initial state. The initial state may not be undefined. If you don't want to set a value for this reducer, you can use null instead of undefined.");if(void 0===n(void 0,{type:M.PROBE_UNKNOWN_ACTION()}))throw new Error('Reducer "'+t+"\" returned undefined when probed with a random type. Don't try to handle "+M.INIT+' or other actions in "redux/*" namespace. They are considered private. Instead, you must return the current state for any unknown actions, unless it is undefined, in which case you must return the initial state, regardless of the action type. The initial state may not be undefined, but can be null.')}))}(n)}catch(e){i=e}return function(e,t){if(void 0===e&&(e={}),i)throw i;for(var r=!1,o={},s=0;s<a.length;s++){var l=a[s],c=n[l],u=e[l],f=c(u,t);if(void 0===f){var d=H(l,t);throw new Error(d)}o[l]=f,r=r||f!==u}return(r=r||a.length!==Object.keys(e).length)?o:e}}({ui_status:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:window.constants.INITIAL_STATE.ui_state,t=arguments.length>1?arguments[1]:void 0;switch(t.type){case"UPDATE_STATE":return co({},window.constants.INITIAL_STATE.ui_state,{selected_action_idx:e.selected_action_idx});case"PLAY_VIDEO":return co({},e,{video_loaded:!0,video_playing:!0,video_loaded_time:Date.now()/1e3});case"DISPLAY_STATE":return co({},e,{video_playing:!1,video_stop_time:Date.now()/1e3});case"SELECT_DIAGNOSES":return co({},e,{confirmed_dx:t.diagnoses,dx_selected_time:Date.now()/1e3});case"CONFIRM_DIAGNOSES":return co({},e,{dx_certainty:t.certainty,dx_confirmed_time:Date.now()/1e3});case"SELECT_ACTION":return co({},e,{selected_action:t.action,ax_selected_time:Date.now()/1e3,selected_action_idx:e.selected_action_idx+1});default:return e}},scenario_state:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:window.constants.INITIAL_STATE.scenario_state,t=arguments.length>1?arguments[1]:void 0;switch(t.type){case"UPDATE_STATE":return t.new_state.server_state_tuple?t.new_state:co({},e,{},t.new_state);default:return e}},history:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:window.constants.INITIAL_STATE.history,t=arguments.length>1?arguments[1]:void 0;switch(t.type){case"DISPLAY_STATE":return e.dx_to_add&&e.ax_to_add?{dx_to_add:null,ax_to_add:null,result_to_add:null,history:[].concat(so(e.history),[{error:e.dx_to_add,action:e.ax_to_add,result:e.result_to_add}])}:e;case"UPDATE_STATE":return co({},e,{result_to_add:t.new_state.action_result});case"SELECT_DIAGNOSES":return co({},e,{dx_to_add:t.diagnoses});case"SELECT_ACTION":return co({},e,{ax_to_add:t.action});default:return e}}}),{},function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return function(e){return function(){var n=e.apply(void 0,arguments),r=function(){throw new Error("Dispatching while constructing your middleware is not allowed. Other middleware would not be applied to this dispatch.")},o={getState:n.getState,dispatch:function(){return r.apply(void 0,arguments)}},i=t.map((function(e){return e(o)}));return z({},n,{dispatch:r=G.apply(void 0,i)(n.dispatch)})}}}(_e,Object(we.createLogger)())),po=function(e){return o.a.createElement(m,{store:fo},o.a.createElement(ao,{condition:window.constants.EXPERIMENT_CONDITION}))};po=Object(xe.hot)(po),a.a.render(o.a.createElement(po,null),document.getElementById("app"))}]);
\ No newline at end of file
+function(e){var t,n,r,o,i,a,s,l,c,u,f,d,p,h,m,v,y,b,g,_="sizzle"+1*new Date,w=e.document,x=0,E=0,k=le(),j=le(),T=le(),O=le(),C=function(e,t){return e===t&&(f=!0),0},S={}.hasOwnProperty,L=[],P=L.pop,N=L.push,A=L.push,M=L.slice,D=function(e,t){for(var n=0,r=e.length;n<r;n++)if(e[n]===t)return n;return-1},H="checked|selected|async|autofocus|autoplay|controls|defer|disabled|hidden|ismap|loop|multiple|open|readonly|required|scoped",R="[\\x20\\t\\r\\n\\f]",I="(?:\\\\.|[\\w-]|[^\0-\\xa0])+",F="\\["+R+"*("+I+")(?:"+R+"*([*^$|!~]?=)"+R+"*(?:'((?:\\\\.|[^\\\\'])*)'|\"((?:\\\\.|[^\\\\\"])*)\"|("+I+"))|)"+R+"*\\]",z=":("+I+")(?:\\((('((?:\\\\.|[^\\\\'])*)'|\"((?:\\\\.|[^\\\\\"])*)\")|((?:\\\\.|[^\\\\()[\\]]|"+F+")*)|.*)\\)|)",G=new RegExp(R+"+","g"),U=new RegExp("^"+R+"+|((?:^|[^\\\\])(?:\\\\.)*)"+R+"+$","g"),B=new RegExp("^"+R+"*,"+R+"*"),W=new RegExp("^"+R+"*([>+~]|"+R+")"+R+"*"),q=new RegExp(R+"|>"),V=new RegExp(z),$=new RegExp("^"+I+"$"),X={ID:new RegExp("^#("+I+")"),CLASS:new RegExp("^\\.("+I+")"),TAG:new RegExp("^("+I+"|[*])"),ATTR:new RegExp("^"+F),PSEUDO:new RegExp("^"+z),CHILD:new RegExp("^:(only|first|last|nth|nth-last)-(child|of-type)(?:\\("+R+"*(even|odd|(([+-]|)(\\d*)n|)"+R+"*(?:([+-]|)"+R+"*(\\d+)|))"+R+"*\\)|)","i"),bool:new RegExp("^(?:"+H+")$","i"),needsContext:new RegExp("^"+R+"*[>+~]|:(even|odd|eq|gt|lt|nth|first|last)(?:\\("+R+"*((?:-\\d)?\\d*)"+R+"*\\)|)(?=[^-]|$)","i")},Y=/HTML$/i,K=/^(?:input|select|textarea|button)$/i,Q=/^h\d$/i,J=/^[^{]+\{\s*\[native \w/,Z=/^(?:#([\w-]+)|(\w+)|\.([\w-]+))$/,ee=/[+~]/,te=new RegExp("\\\\([\\da-f]{1,6}"+R+"?|("+R+")|.)","ig"),ne=function(e,t,n){var r="0x"+t-65536;return r!=r||n?t:r<0?String.fromCharCode(r+65536):String.fromCharCode(r>>10|55296,1023&r|56320)},re=/([\0-\x1f\x7f]|^-?\d)|^-$|[^\0-\x1f\x7f-\uFFFF\w-]/g,oe=function(e,t){return t?"\0"===e?"�":e.slice(0,-1)+"\\"+e.charCodeAt(e.length-1).toString(16)+" ":"\\"+e},ie=function(){d()},ae=_e((function(e){return!0===e.disabled&&"fieldset"===e.nodeName.toLowerCase()}),{dir:"parentNode",next:"legend"});try{A.apply(L=M.call(w.childNodes),w.childNodes),L[w.childNodes.length].nodeType}catch(e){A={apply:L.length?function(e,t){N.apply(e,M.call(t))}:function(e,t){for(var n=e.length,r=0;e[n++]=t[r++];);e.length=n-1}}}function se(e,t,r,o){var i,s,c,u,f,h,y,b=t&&t.ownerDocument,x=t?t.nodeType:9;if(r=r||[],"string"!=typeof e||!e||1!==x&&9!==x&&11!==x)return r;if(!o&&((t?t.ownerDocument||t:w)!==p&&d(t),t=t||p,m)){if(11!==x&&(f=Z.exec(e)))if(i=f[1]){if(9===x){if(!(c=t.getElementById(i)))return r;if(c.id===i)return r.push(c),r}else if(b&&(c=b.getElementById(i))&&g(t,c)&&c.id===i)return r.push(c),r}else{if(f[2])return A.apply(r,t.getElementsByTagName(e)),r;if((i=f[3])&&n.getElementsByClassName&&t.getElementsByClassName)return A.apply(r,t.getElementsByClassName(i)),r}if(n.qsa&&!O[e+" "]&&(!v||!v.test(e))&&(1!==x||"object"!==t.nodeName.toLowerCase())){if(y=e,b=t,1===x&&q.test(e)){for((u=t.getAttribute("id"))?u=u.replace(re,oe):t.setAttribute("id",u=_),s=(h=a(e)).length;s--;)h[s]="#"+u+" "+ge(h[s]);y=h.join(","),b=ee.test(e)&&ye(t.parentNode)||t}try{return A.apply(r,b.querySelectorAll(y)),r}catch(t){O(e,!0)}finally{u===_&&t.removeAttribute("id")}}}return l(e.replace(U,"$1"),t,r,o)}function le(){var e=[];return function t(n,o){return e.push(n+" ")>r.cacheLength&&delete t[e.shift()],t[n+" "]=o}}function ce(e){return e[_]=!0,e}function ue(e){var t=p.createElement("fieldset");try{return!!e(t)}catch(e){return!1}finally{t.parentNode&&t.parentNode.removeChild(t),t=null}}function fe(e,t){for(var n=e.split("|"),o=n.length;o--;)r.attrHandle[n[o]]=t}function de(e,t){var n=t&&e,r=n&&1===e.nodeType&&1===t.nodeType&&e.sourceIndex-t.sourceIndex;if(r)return r;if(n)for(;n=n.nextSibling;)if(n===t)return-1;return e?1:-1}function pe(e){return function(t){return"input"===t.nodeName.toLowerCase()&&t.type===e}}function he(e){return function(t){var n=t.nodeName.toLowerCase();return("input"===n||"button"===n)&&t.type===e}}function me(e){return function(t){return"form"in t?t.parentNode&&!1===t.disabled?"label"in t?"label"in t.parentNode?t.parentNode.disabled===e:t.disabled===e:t.isDisabled===e||t.isDisabled!==!e&&ae(t)===e:t.disabled===e:"label"in t&&t.disabled===e}}function ve(e){return ce((function(t){return t=+t,ce((function(n,r){for(var o,i=e([],n.length,t),a=i.length;a--;)n[o=i[a]]&&(n[o]=!(r[o]=n[o]))}))}))}function ye(e){return e&&void 0!==e.getElementsByTagName&&e}for(t in n=se.support={},i=se.isXML=function(e){var t=e.namespaceURI,n=(e.ownerDocument||e).documentElement;return!Y.test(t||n&&n.nodeName||"HTML")},d=se.setDocument=function(e){var t,o,a=e?e.ownerDocument||e:w;return a!==p&&9===a.nodeType&&a.documentElement?(h=(p=a).documentElement,m=!i(p),w!==p&&(o=p.defaultView)&&o.top!==o&&(o.addEventListener?o.addEventListener("unload",ie,!1):o.attachEvent&&o.attachEvent("onunload",ie)),n.attributes=ue((function(e){return e.className="i",!e.getAttribute("className")})),n.getElementsByTagName=ue((function(e){return e.appendChild(p.createComment("")),!e.getElementsByTagName("*").length})),n.getElementsByClassName=J.test(p.getElementsByClassName),n.getById=ue((function(e){return h.appendChild(e).id=_,!p.getElementsByName||!p.getElementsByName(_).length})),n.getById?(r.filter.ID=function(e){var t=e.replace(te,ne);return function(e){return e.getAttribute("id")===t}},r.find.ID=function(e,t){if(void 0!==t.getElementById&&m){var n=t.getElementById(e);return n?[n]:[]}}):(r.filter.ID=function(e){var t=e.replace(te,ne);return function(e){var n=void 0!==e.getAttributeNode&&e.getAttributeNode("id");return n&&n.value===t}},r.find.ID=function(e,t){if(void 0!==t.getElementById&&m){var n,r,o,i=t.getElementById(e);if(i){if((n=i.getAttributeNode("id"))&&n.value===e)return[i];for(o=t.getElementsByName(e),r=0;i=o[r++];)if((n=i.getAttributeNode("id"))&&n.value===e)return[i]}return[]}}),r.find.TAG=n.getElementsByTagName?function(e,t){return void 0!==t.getElementsByTagName?t.getElementsByTagName(e):n.qsa?t.querySelectorAll(e):void 0}:function(e,t){var n,r=[],o=0,i=t.getElementsByTagName(e);if("*"===e){for(;n=i[o++];)1===n.nodeType&&r.push(n);return r}return i},r.find.CLASS=n.getElementsByClassName&&function(e,t){if(void 0!==t.getElementsByClassName&&m)return t.getElementsByClassName(e)},y=[],v=[],(n.qsa=J.test(p.querySelectorAll))&&(ue((function(e){h.appendChild(e).innerHTML="<a id='"+_+"'></a><select id='"+_+"-\r\\' msallowcapture=''><option selected=''></option></select>",e.querySelectorAll("[msallowcapture^='']").length&&v.push("[*^$]="+R+"*(?:''|\"\")"),e.querySelectorAll("[selected]").length||v.push("\\["+R+"*(?:value|"+H+")"),e.querySelectorAll("[id~="+_+"-]").length||v.push("~="),e.querySelectorAll(":checked").length||v.push(":checked"),e.querySelectorAll("a#"+_+"+*").length||v.push(".#.+[+~]")})),ue((function(e){e.innerHTML="<a href='' disabled='disabled'></a><select disabled='disabled'><option/></select>";var t=p.createElement("input");t.setAttribute("type","hidden"),e.appendChild(t).setAttribute("name","D"),e.querySelectorAll("[name=d]").length&&v.push("name"+R+"*[*^$|!~]?="),2!==e.querySelectorAll(":enabled").length&&v.push(":enabled",":disabled"),h.appendChild(e).disabled=!0,2!==e.querySelectorAll(":disabled").length&&v.push(":enabled",":disabled"),e.querySelectorAll("*,:x"),v.push(",.*:")}))),(n.matchesSelector=J.test(b=h.matches||h.webkitMatchesSelector||h.mozMatchesSelector||h.oMatchesSelector||h.msMatchesSelector))&&ue((function(e){n.disconnectedMatch=b.call(e,"*"),b.call(e,"[s!='']:x"),y.push("!=",z)})),v=v.length&&new RegExp(v.join("|")),y=y.length&&new RegExp(y.join("|")),t=J.test(h.compareDocumentPosition),g=t||J.test(h.contains)?function(e,t){var n=9===e.nodeType?e.documentElement:e,r=t&&t.parentNode;return e===r||!(!r||1!==r.nodeType||!(n.contains?n.contains(r):e.compareDocumentPosition&&16&e.compareDocumentPosition(r)))}:function(e,t){if(t)for(;t=t.parentNode;)if(t===e)return!0;return!1},C=t?function(e,t){if(e===t)return f=!0,0;var r=!e.compareDocumentPosition-!t.compareDocumentPosition;return r||(1&(r=(e.ownerDocument||e)===(t.ownerDocument||t)?e.compareDocumentPosition(t):1)||!n.sortDetached&&t.compareDocumentPosition(e)===r?e===p||e.ownerDocument===w&&g(w,e)?-1:t===p||t.ownerDocument===w&&g(w,t)?1:u?D(u,e)-D(u,t):0:4&r?-1:1)}:function(e,t){if(e===t)return f=!0,0;var n,r=0,o=e.parentNode,i=t.parentNode,a=[e],s=[t];if(!o||!i)return e===p?-1:t===p?1:o?-1:i?1:u?D(u,e)-D(u,t):0;if(o===i)return de(e,t);for(n=e;n=n.parentNode;)a.unshift(n);for(n=t;n=n.parentNode;)s.unshift(n);for(;a[r]===s[r];)r++;return r?de(a[r],s[r]):a[r]===w?-1:s[r]===w?1:0},p):p},se.matches=function(e,t){return se(e,null,null,t)},se.matchesSelector=function(e,t){if((e.ownerDocument||e)!==p&&d(e),n.matchesSelector&&m&&!O[t+" "]&&(!y||!y.test(t))&&(!v||!v.test(t)))try{var r=b.call(e,t);if(r||n.disconnectedMatch||e.document&&11!==e.document.nodeType)return r}catch(e){O(t,!0)}return se(t,p,null,[e]).length>0},se.contains=function(e,t){return(e.ownerDocument||e)!==p&&d(e),g(e,t)},se.attr=function(e,t){(e.ownerDocument||e)!==p&&d(e);var o=r.attrHandle[t.toLowerCase()],i=o&&S.call(r.attrHandle,t.toLowerCase())?o(e,t,!m):void 0;return void 0!==i?i:n.attributes||!m?e.getAttribute(t):(i=e.getAttributeNode(t))&&i.specified?i.value:null},se.escape=function(e){return(e+"").replace(re,oe)},se.error=function(e){throw new Error("Syntax error, unrecognized expression: "+e)},se.uniqueSort=function(e){var t,r=[],o=0,i=0;if(f=!n.detectDuplicates,u=!n.sortStable&&e.slice(0),e.sort(C),f){for(;t=e[i++];)t===e[i]&&(o=r.push(i));for(;o--;)e.splice(r[o],1)}return u=null,e},o=se.getText=function(e){var t,n="",r=0,i=e.nodeType;if(i){if(1===i||9===i||11===i){if("string"==typeof e.textContent)return e.textContent;for(e=e.firstChild;e;e=e.nextSibling)n+=o(e)}else if(3===i||4===i)return e.nodeValue}else for(;t=e[r++];)n+=o(t);return n},(r=se.selectors={cacheLength:50,createPseudo:ce,match:X,attrHandle:{},find:{},relative:{">":{dir:"parentNode",first:!0}," ":{dir:"parentNode"},"+":{dir:"previousSibling",first:!0},"~":{dir:"previousSibling"}},preFilter:{ATTR:function(e){return e[1]=e[1].replace(te,ne),e[3]=(e[3]||e[4]||e[5]||"").replace(te,ne),"~="===e[2]&&(e[3]=" "+e[3]+" "),e.slice(0,4)},CHILD:function(e){return e[1]=e[1].toLowerCase(),"nth"===e[1].slice(0,3)?(e[3]||se.error(e[0]),e[4]=+(e[4]?e[5]+(e[6]||1):2*("even"===e[3]||"odd"===e[3])),e[5]=+(e[7]+e[8]||"odd"===e[3])):e[3]&&se.error(e[0]),e},PSEUDO:function(e){var t,n=!e[6]&&e[2];return X.CHILD.test(e[0])?null:(e[3]?e[2]=e[4]||e[5]||"":n&&V.test(n)&&(t=a(n,!0))&&(t=n.indexOf(")",n.length-t)-n.length)&&(e[0]=e[0].slice(0,t),e[2]=n.slice(0,t)),e.slice(0,3))}},filter:{TAG:function(e){var t=e.replace(te,ne).toLowerCase();return"*"===e?function(){return!0}:function(e){return e.nodeName&&e.nodeName.toLowerCase()===t}},CLASS:function(e){var t=k[e+" "];return t||(t=new RegExp("(^|"+R+")"+e+"("+R+"|$)"))&&k(e,(function(e){return t.test("string"==typeof e.className&&e.className||void 0!==e.getAttribute&&e.getAttribute("class")||"")}))},ATTR:function(e,t,n){return function(r){var o=se.attr(r,e);return null==o?"!="===t:!t||(o+="","="===t?o===n:"!="===t?o!==n:"^="===t?n&&0===o.indexOf(n):"*="===t?n&&o.indexOf(n)>-1:"$="===t?n&&o.slice(-n.length)===n:"~="===t?(" "+o.replace(G," ")+" ").indexOf(n)>-1:"|="===t&&(o===n||o.slice(0,n.length+1)===n+"-"))}},CHILD:function(e,t,n,r,o){var i="nth"!==e.slice(0,3),a="last"!==e.slice(-4),s="of-type"===t;return 1===r&&0===o?function(e){return!!e.parentNode}:function(t,n,l){var c,u,f,d,p,h,m=i!==a?"nextSibling":"previousSibling",v=t.parentNode,y=s&&t.nodeName.toLowerCase(),b=!l&&!s,g=!1;if(v){if(i){for(;m;){for(d=t;d=d[m];)if(s?d.nodeName.toLowerCase()===y:1===d.nodeType)return!1;h=m="only"===e&&!h&&"nextSibling"}return!0}if(h=[a?v.firstChild:v.lastChild],a&&b){for(g=(p=(c=(u=(f=(d=v)[_]||(d[_]={}))[d.uniqueID]||(f[d.uniqueID]={}))[e]||[])[0]===x&&c[1])&&c[2],d=p&&v.childNodes[p];d=++p&&d&&d[m]||(g=p=0)||h.pop();)if(1===d.nodeType&&++g&&d===t){u[e]=[x,p,g];break}}else if(b&&(g=p=(c=(u=(f=(d=t)[_]||(d[_]={}))[d.uniqueID]||(f[d.uniqueID]={}))[e]||[])[0]===x&&c[1]),!1===g)for(;(d=++p&&d&&d[m]||(g=p=0)||h.pop())&&((s?d.nodeName.toLowerCase()!==y:1!==d.nodeType)||!++g||(b&&((u=(f=d[_]||(d[_]={}))[d.uniqueID]||(f[d.uniqueID]={}))[e]=[x,g]),d!==t)););return(g-=o)===r||g%r==0&&g/r>=0}}},PSEUDO:function(e,t){var n,o=r.pseudos[e]||r.setFilters[e.toLowerCase()]||se.error("unsupported pseudo: "+e);return o[_]?o(t):o.length>1?(n=[e,e,"",t],r.setFilters.hasOwnProperty(e.toLowerCase())?ce((function(e,n){for(var r,i=o(e,t),a=i.length;a--;)e[r=D(e,i[a])]=!(n[r]=i[a])})):function(e){return o(e,0,n)}):o}},pseudos:{not:ce((function(e){var t=[],n=[],r=s(e.replace(U,"$1"));return r[_]?ce((function(e,t,n,o){for(var i,a=r(e,null,o,[]),s=e.length;s--;)(i=a[s])&&(e[s]=!(t[s]=i))})):function(e,o,i){return t[0]=e,r(t,null,i,n),t[0]=null,!n.pop()}})),has:ce((function(e){return function(t){return se(e,t).length>0}})),contains:ce((function(e){return e=e.replace(te,ne),function(t){return(t.textContent||o(t)).indexOf(e)>-1}})),lang:ce((function(e){return $.test(e||"")||se.error("unsupported lang: "+e),e=e.replace(te,ne).toLowerCase(),function(t){var n;do{if(n=m?t.lang:t.getAttribute("xml:lang")||t.getAttribute("lang"))return(n=n.toLowerCase())===e||0===n.indexOf(e+"-")}while((t=t.parentNode)&&1===t.nodeType);return!1}})),target:function(t){var n=e.location&&e.location.hash;return n&&n.slice(1)===t.id},root:function(e){return e===h},focus:function(e){return e===p.activeElement&&(!p.hasFocus||p.hasFocus())&&!!(e.type||e.href||~e.tabIndex)},enabled:me(!1),disabled:me(!0),checked:function(e){var t=e.nodeName.toLowerCase();return"input"===t&&!!e.checked||"option"===t&&!!e.selected},selected:function(e){return e.parentNode&&e.parentNode.selectedIndex,!0===e.selected},empty:function(e){for(e=e.firstChild;e;e=e.nextSibling)if(e.nodeType<6)return!1;return!0},parent:function(e){return!r.pseudos.empty(e)},header:function(e){return Q.test(e.nodeName)},input:function(e){return K.test(e.nodeName)},button:function(e){var t=e.nodeName.toLowerCase();return"input"===t&&"button"===e.type||"button"===t},text:function(e){var t;return"input"===e.nodeName.toLowerCase()&&"text"===e.type&&(null==(t=e.getAttribute("type"))||"text"===t.toLowerCase())},first:ve((function(){return[0]})),last:ve((function(e,t){return[t-1]})),eq:ve((function(e,t,n){return[n<0?n+t:n]})),even:ve((function(e,t){for(var n=0;n<t;n+=2)e.push(n);return e})),odd:ve((function(e,t){for(var n=1;n<t;n+=2)e.push(n);return e})),lt:ve((function(e,t,n){for(var r=n<0?n+t:n>t?t:n;--r>=0;)e.push(r);return e})),gt:ve((function(e,t,n){for(var r=n<0?n+t:n;++r<t;)e.push(r);return e}))}}).pseudos.nth=r.pseudos.eq,{radio:!0,checkbox:!0,file:!0,password:!0,image:!0})r.pseudos[t]=pe(t);for(t in{submit:!0,reset:!0})r.pseudos[t]=he(t);function be(){}function ge(e){for(var t=0,n=e.length,r="";t<n;t++)r+=e[t].value;return r}function _e(e,t,n){var r=t.dir,o=t.next,i=o||r,a=n&&"parentNode"===i,s=E++;return t.first?function(t,n,o){for(;t=t[r];)if(1===t.nodeType||a)return e(t,n,o);return!1}:function(t,n,l){var c,u,f,d=[x,s];if(l){for(;t=t[r];)if((1===t.nodeType||a)&&e(t,n,l))return!0}else for(;t=t[r];)if(1===t.nodeType||a)if(u=(f=t[_]||(t[_]={}))[t.uniqueID]||(f[t.uniqueID]={}),o&&o===t.nodeName.toLowerCase())t=t[r]||t;else{if((c=u[i])&&c[0]===x&&c[1]===s)return d[2]=c[2];if(u[i]=d,d[2]=e(t,n,l))return!0}return!1}}function we(e){return e.length>1?function(t,n,r){for(var o=e.length;o--;)if(!e[o](t,n,r))return!1;return!0}:e[0]}function xe(e,t,n,r,o){for(var i,a=[],s=0,l=e.length,c=null!=t;s<l;s++)(i=e[s])&&(n&&!n(i,r,o)||(a.push(i),c&&t.push(s)));return a}function Ee(e,t,n,r,o,i){return r&&!r[_]&&(r=Ee(r)),o&&!o[_]&&(o=Ee(o,i)),ce((function(i,a,s,l){var c,u,f,d=[],p=[],h=a.length,m=i||function(e,t,n){for(var r=0,o=t.length;r<o;r++)se(e,t[r],n);return n}(t||"*",s.nodeType?[s]:s,[]),v=!e||!i&&t?m:xe(m,d,e,s,l),y=n?o||(i?e:h||r)?[]:a:v;if(n&&n(v,y,s,l),r)for(c=xe(y,p),r(c,[],s,l),u=c.length;u--;)(f=c[u])&&(y[p[u]]=!(v[p[u]]=f));if(i){if(o||e){if(o){for(c=[],u=y.length;u--;)(f=y[u])&&c.push(v[u]=f);o(null,y=[],c,l)}for(u=y.length;u--;)(f=y[u])&&(c=o?D(i,f):d[u])>-1&&(i[c]=!(a[c]=f))}}else y=xe(y===a?y.splice(h,y.length):y),o?o(null,a,y,l):A.apply(a,y)}))}function ke(e){for(var t,n,o,i=e.length,a=r.relative[e[0].type],s=a||r.relative[" "],l=a?1:0,u=_e((function(e){return e===t}),s,!0),f=_e((function(e){return D(t,e)>-1}),s,!0),d=[function(e,n,r){var o=!a&&(r||n!==c)||((t=n).nodeType?u(e,n,r):f(e,n,r));return t=null,o}];l<i;l++)if(n=r.relative[e[l].type])d=[_e(we(d),n)];else{if((n=r.filter[e[l].type].apply(null,e[l].matches))[_]){for(o=++l;o<i&&!r.relative[e[o].type];o++);return Ee(l>1&&we(d),l>1&&ge(e.slice(0,l-1).concat({value:" "===e[l-2].type?"*":""})).replace(U,"$1"),n,l<o&&ke(e.slice(l,o)),o<i&&ke(e=e.slice(o)),o<i&&ge(e))}d.push(n)}return we(d)}return be.prototype=r.filters=r.pseudos,r.setFilters=new be,a=se.tokenize=function(e,t){var n,o,i,a,s,l,c,u=j[e+" "];if(u)return t?0:u.slice(0);for(s=e,l=[],c=r.preFilter;s;){for(a in n&&!(o=B.exec(s))||(o&&(s=s.slice(o[0].length)||s),l.push(i=[])),n=!1,(o=W.exec(s))&&(n=o.shift(),i.push({value:n,type:o[0].replace(U," ")}),s=s.slice(n.length)),r.filter)!(o=X[a].exec(s))||c[a]&&!(o=c[a](o))||(n=o.shift(),i.push({value:n,type:a,matches:o}),s=s.slice(n.length));if(!n)break}return t?s.length:s?se.error(e):j(e,l).slice(0)},s=se.compile=function(e,t){var n,o=[],i=[],s=T[e+" "];if(!s){for(t||(t=a(e)),n=t.length;n--;)(s=ke(t[n]))[_]?o.push(s):i.push(s);(s=T(e,function(e,t){var n=t.length>0,o=e.length>0,i=function(i,a,s,l,u){var f,h,v,y=0,b="0",g=i&&[],_=[],w=c,E=i||o&&r.find.TAG("*",u),k=x+=null==w?1:Math.random()||.1,j=E.length;for(u&&(c=a===p||a||u);b!==j&&null!=(f=E[b]);b++){if(o&&f){for(h=0,a||f.ownerDocument===p||(d(f),s=!m);v=e[h++];)if(v(f,a||p,s)){l.push(f);break}u&&(x=k)}n&&((f=!v&&f)&&y--,i&&g.push(f))}if(y+=b,n&&b!==y){for(h=0;v=t[h++];)v(g,_,a,s);if(i){if(y>0)for(;b--;)g[b]||_[b]||(_[b]=P.call(l));_=xe(_)}A.apply(l,_),u&&!i&&_.length>0&&y+t.length>1&&se.uniqueSort(l)}return u&&(x=k,c=w),g};return n?ce(i):i}(i,o))).selector=e}return s},l=se.select=function(e,t,n,o){var i,l,c,u,f,d="function"==typeof e&&e,p=!o&&a(e=d.selector||e);if(n=n||[],1===p.length){if((l=p[0]=p[0].slice(0)).length>2&&"ID"===(c=l[0]).type&&9===t.nodeType&&m&&r.relative[l[1].type]){if(!(t=(r.find.ID(c.matches[0].replace(te,ne),t)||[])[0]))return n;d&&(t=t.parentNode),e=e.slice(l.shift().value.length)}for(i=X.needsContext.test(e)?0:l.length;i--&&(c=l[i],!r.relative[u=c.type]);)if((f=r.find[u])&&(o=f(c.matches[0].replace(te,ne),ee.test(l[0].type)&&ye(t.parentNode)||t))){if(l.splice(i,1),!(e=o.length&&ge(l)))return A.apply(n,o),n;break}}return(d||s(e,p))(o,t,!m,n,!t||ee.test(e)&&ye(t.parentNode)||t),n},n.sortStable=_.split("").sort(C).join("")===_,n.detectDuplicates=!!f,d(),n.sortDetached=ue((function(e){return 1&e.compareDocumentPosition(p.createElement("fieldset"))})),ue((function(e){return e.innerHTML="<a href='#'></a>","#"===e.firstChild.getAttribute("href")}))||fe("type|href|height|width",(function(e,t,n){if(!n)return e.getAttribute(t,"type"===t.toLowerCase()?1:2)})),n.attributes&&ue((function(e){return e.innerHTML="<input/>",e.firstChild.setAttribute("value",""),""===e.firstChild.getAttribute("value")}))||fe("value",(function(e,t,n){if(!n&&"input"===e.nodeName.toLowerCase())return e.defaultValue})),ue((function(e){return null==e.getAttribute("disabled")}))||fe(H,(function(e,t,n){var r;if(!n)return!0===e[t]?t.toLowerCase():(r=e.getAttributeNode(t))&&r.specified?r.value:null})),se}(n);E.find=T,E.expr=T.selectors,E.expr[":"]=E.expr.pseudos,E.uniqueSort=E.unique=T.uniqueSort,E.text=T.getText,E.isXMLDoc=T.isXML,E.contains=T.contains,E.escapeSelector=T.escape;var O=function(e,t,n){for(var r=[],o=void 0!==n;(e=e[t])&&9!==e.nodeType;)if(1===e.nodeType){if(o&&E(e).is(n))break;r.push(e)}return r},C=function(e,t){for(var n=[];e;e=e.nextSibling)1===e.nodeType&&e!==t&&n.push(e);return n},S=E.expr.match.needsContext;function L(e,t){return e.nodeName&&e.nodeName.toLowerCase()===t.toLowerCase()}var P=/^<([a-z][^\/\0>:\x20\t\r\n\f]*)[\x20\t\r\n\f]*\/?>(?:<\/\1>|)$/i;function N(e,t,n){return b(t)?E.grep(e,(function(e,r){return!!t.call(e,r,e)!==n})):t.nodeType?E.grep(e,(function(e){return e===t!==n})):"string"!=typeof t?E.grep(e,(function(e){return f.call(t,e)>-1!==n})):E.filter(t,e,n)}E.filter=function(e,t,n){var r=t[0];return n&&(e=":not("+e+")"),1===t.length&&1===r.nodeType?E.find.matchesSelector(r,e)?[r]:[]:E.find.matches(e,E.grep(t,(function(e){return 1===e.nodeType})))},E.fn.extend({find:function(e){var t,n,r=this.length,o=this;if("string"!=typeof e)return this.pushStack(E(e).filter((function(){for(t=0;t<r;t++)if(E.contains(o[t],this))return!0})));for(n=this.pushStack([]),t=0;t<r;t++)E.find(e,o[t],n);return r>1?E.uniqueSort(n):n},filter:function(e){return this.pushStack(N(this,e||[],!1))},not:function(e){return this.pushStack(N(this,e||[],!0))},is:function(e){return!!N(this,"string"==typeof e&&S.test(e)?E(e):e||[],!1).length}});var A,M=/^(?:\s*(<[\w\W]+>)[^>]*|#([\w-]+))$/;(E.fn.init=function(e,t,n){var r,o;if(!e)return this;if(n=n||A,"string"==typeof e){if(!(r="<"===e[0]&&">"===e[e.length-1]&&e.length>=3?[null,e,null]:M.exec(e))||!r[1]&&t)return!t||t.jquery?(t||n).find(e):this.constructor(t).find(e);if(r[1]){if(t=t instanceof E?t[0]:t,E.merge(this,E.parseHTML(r[1],t&&t.nodeType?t.ownerDocument||t:a,!0)),P.test(r[1])&&E.isPlainObject(t))for(r in t)b(this[r])?this[r](t[r]):this.attr(r,t[r]);return this}return(o=a.getElementById(r[2]))&&(this[0]=o,this.length=1),this}return e.nodeType?(this[0]=e,this.length=1,this):b(e)?void 0!==n.ready?n.ready(e):e(E):E.makeArray(e,this)}).prototype=E.fn,A=E(a);var D=/^(?:parents|prev(?:Until|All))/,H={children:!0,contents:!0,next:!0,prev:!0};function R(e,t){for(;(e=e[t])&&1!==e.nodeType;);return e}E.fn.extend({has:function(e){var t=E(e,this),n=t.length;return this.filter((function(){for(var e=0;e<n;e++)if(E.contains(this,t[e]))return!0}))},closest:function(e,t){var n,r=0,o=this.length,i=[],a="string"!=typeof e&&E(e);if(!S.test(e))for(;r<o;r++)for(n=this[r];n&&n!==t;n=n.parentNode)if(n.nodeType<11&&(a?a.index(n)>-1:1===n.nodeType&&E.find.matchesSelector(n,e))){i.push(n);break}return this.pushStack(i.length>1?E.uniqueSort(i):i)},index:function(e){return e?"string"==typeof e?f.call(E(e),this[0]):f.call(this,e.jquery?e[0]:e):this[0]&&this[0].parentNode?this.first().prevAll().length:-1},add:function(e,t){return this.pushStack(E.uniqueSort(E.merge(this.get(),E(e,t))))},addBack:function(e){return this.add(null==e?this.prevObject:this.prevObject.filter(e))}}),E.each({parent:function(e){var t=e.parentNode;return t&&11!==t.nodeType?t:null},parents:function(e){return O(e,"parentNode")},parentsUntil:function(e,t,n){return O(e,"parentNode",n)},next:function(e){return R(e,"nextSibling")},prev:function(e){return R(e,"previousSibling")},nextAll:function(e){return O(e,"nextSibling")},prevAll:function(e){return O(e,"previousSibling")},nextUntil:function(e,t,n){return O(e,"nextSibling",n)},prevUntil:function(e,t,n){return O(e,"previousSibling",n)},siblings:function(e){return C((e.parentNode||{}).firstChild,e)},children:function(e){return C(e.firstChild)},contents:function(e){return void 0!==e.contentDocument?e.contentDocument:(L(e,"template")&&(e=e.content||e),E.merge([],e.childNodes))}},(function(e,t){E.fn[e]=function(n,r){var o=E.map(this,t,n);return"Until"!==e.slice(-5)&&(r=n),r&&"string"==typeof r&&(o=E.filter(r,o)),this.length>1&&(H[e]||E.uniqueSort(o),D.test(e)&&o.reverse()),this.pushStack(o)}}));var I=/[^\x20\t\r\n\f]+/g;function F(e){return e}function z(e){throw e}function G(e,t,n,r){var o;try{e&&b(o=e.promise)?o.call(e).done(t).fail(n):e&&b(o=e.then)?o.call(e,t,n):t.apply(void 0,[e].slice(r))}catch(e){n.apply(void 0,[e])}}E.Callbacks=function(e){e="string"==typeof e?function(e){var t={};return E.each(e.match(I)||[],(function(e,n){t[n]=!0})),t}(e):E.extend({},e);var t,n,r,o,i=[],a=[],s=-1,l=function(){for(o=o||e.once,r=t=!0;a.length;s=-1)for(n=a.shift();++s<i.length;)!1===i[s].apply(n[0],n[1])&&e.stopOnFalse&&(s=i.length,n=!1);e.memory||(n=!1),t=!1,o&&(i=n?[]:"")},c={add:function(){return i&&(n&&!t&&(s=i.length-1,a.push(n)),function t(n){E.each(n,(function(n,r){b(r)?e.unique&&c.has(r)||i.push(r):r&&r.length&&"string"!==x(r)&&t(r)}))}(arguments),n&&!t&&l()),this},remove:function(){return E.each(arguments,(function(e,t){for(var n;(n=E.inArray(t,i,n))>-1;)i.splice(n,1),n<=s&&s--})),this},has:function(e){return e?E.inArray(e,i)>-1:i.length>0},empty:function(){return i&&(i=[]),this},disable:function(){return o=a=[],i=n="",this},disabled:function(){return!i},lock:function(){return o=a=[],n||t||(i=n=""),this},locked:function(){return!!o},fireWith:function(e,n){return o||(n=[e,(n=n||[]).slice?n.slice():n],a.push(n),t||l()),this},fire:function(){return c.fireWith(this,arguments),this},fired:function(){return!!r}};return c},E.extend({Deferred:function(e){var t=[["notify","progress",E.Callbacks("memory"),E.Callbacks("memory"),2],["resolve","done",E.Callbacks("once memory"),E.Callbacks("once memory"),0,"resolved"],["reject","fail",E.Callbacks("once memory"),E.Callbacks("once memory"),1,"rejected"]],r="pending",o={state:function(){return r},always:function(){return i.done(arguments).fail(arguments),this},catch:function(e){return o.then(null,e)},pipe:function(){var e=arguments;return E.Deferred((function(n){E.each(t,(function(t,r){var o=b(e[r[4]])&&e[r[4]];i[r[1]]((function(){var e=o&&o.apply(this,arguments);e&&b(e.promise)?e.promise().progress(n.notify).done(n.resolve).fail(n.reject):n[r[0]+"With"](this,o?[e]:arguments)}))})),e=null})).promise()},then:function(e,r,o){var i=0;function a(e,t,r,o){return function(){var s=this,l=arguments,c=function(){var n,c;if(!(e<i)){if((n=r.apply(s,l))===t.promise())throw new TypeError("Thenable self-resolution");c=n&&("object"==typeof n||"function"==typeof n)&&n.then,b(c)?o?c.call(n,a(i,t,F,o),a(i,t,z,o)):(i++,c.call(n,a(i,t,F,o),a(i,t,z,o),a(i,t,F,t.notifyWith))):(r!==F&&(s=void 0,l=[n]),(o||t.resolveWith)(s,l))}},u=o?c:function(){try{c()}catch(n){E.Deferred.exceptionHook&&E.Deferred.exceptionHook(n,u.stackTrace),e+1>=i&&(r!==z&&(s=void 0,l=[n]),t.rejectWith(s,l))}};e?u():(E.Deferred.getStackHook&&(u.stackTrace=E.Deferred.getStackHook()),n.setTimeout(u))}}return E.Deferred((function(n){t[0][3].add(a(0,n,b(o)?o:F,n.notifyWith)),t[1][3].add(a(0,n,b(e)?e:F)),t[2][3].add(a(0,n,b(r)?r:z))})).promise()},promise:function(e){return null!=e?E.extend(e,o):o}},i={};return E.each(t,(function(e,n){var a=n[2],s=n[5];o[n[1]]=a.add,s&&a.add((function(){r=s}),t[3-e][2].disable,t[3-e][3].disable,t[0][2].lock,t[0][3].lock),a.add(n[3].fire),i[n[0]]=function(){return i[n[0]+"With"](this===i?void 0:this,arguments),this},i[n[0]+"With"]=a.fireWith})),o.promise(i),e&&e.call(i,i),i},when:function(e){var t=arguments.length,n=t,r=Array(n),o=l.call(arguments),i=E.Deferred(),a=function(e){return function(n){r[e]=this,o[e]=arguments.length>1?l.call(arguments):n,--t||i.resolveWith(r,o)}};if(t<=1&&(G(e,i.done(a(n)).resolve,i.reject,!t),"pending"===i.state()||b(o[n]&&o[n].then)))return i.then();for(;n--;)G(o[n],a(n),i.reject);return i.promise()}});var U=/^(Eval|Internal|Range|Reference|Syntax|Type|URI)Error$/;E.Deferred.exceptionHook=function(e,t){n.console&&n.console.warn&&e&&U.test(e.name)&&n.console.warn("jQuery.Deferred exception: "+e.message,e.stack,t)},E.readyException=function(e){n.setTimeout((function(){throw e}))};var B=E.Deferred();function W(){a.removeEventListener("DOMContentLoaded",W),n.removeEventListener("load",W),E.ready()}E.fn.ready=function(e){return B.then(e).catch((function(e){E.readyException(e)})),this},E.extend({isReady:!1,readyWait:1,ready:function(e){(!0===e?--E.readyWait:E.isReady)||(E.isReady=!0,!0!==e&&--E.readyWait>0||B.resolveWith(a,[E]))}}),E.ready.then=B.then,"complete"===a.readyState||"loading"!==a.readyState&&!a.documentElement.doScroll?n.setTimeout(E.ready):(a.addEventListener("DOMContentLoaded",W),n.addEventListener("load",W));var q=function(e,t,n,r,o,i,a){var s=0,l=e.length,c=null==n;if("object"===x(n))for(s in o=!0,n)q(e,t,s,n[s],!0,i,a);else if(void 0!==r&&(o=!0,b(r)||(a=!0),c&&(a?(t.call(e,r),t=null):(c=t,t=function(e,t,n){return c.call(E(e),n)})),t))for(;s<l;s++)t(e[s],n,a?r:r.call(e[s],s,t(e[s],n)));return o?e:c?t.call(e):l?t(e[0],n):i},V=/^-ms-/,$=/-([a-z])/g;function X(e,t){return t.toUpperCase()}function Y(e){return e.replace(V,"ms-").replace($,X)}var K=function(e){return 1===e.nodeType||9===e.nodeType||!+e.nodeType};function Q(){this.expando=E.expando+Q.uid++}Q.uid=1,Q.prototype={cache:function(e){var t=e[this.expando];return t||(t={},K(e)&&(e.nodeType?e[this.expando]=t:Object.defineProperty(e,this.expando,{value:t,configurable:!0}))),t},set:function(e,t,n){var r,o=this.cache(e);if("string"==typeof t)o[Y(t)]=n;else for(r in t)o[Y(r)]=t[r];return o},get:function(e,t){return void 0===t?this.cache(e):e[this.expando]&&e[this.expando][Y(t)]},access:function(e,t,n){return void 0===t||t&&"string"==typeof t&&void 0===n?this.get(e,t):(this.set(e,t,n),void 0!==n?n:t)},remove:function(e,t){var n,r=e[this.expando];if(void 0!==r){if(void 0!==t){n=(t=Array.isArray(t)?t.map(Y):(t=Y(t))in r?[t]:t.match(I)||[]).length;for(;n--;)delete r[t[n]]}(void 0===t||E.isEmptyObject(r))&&(e.nodeType?e[this.expando]=void 0:delete e[this.expando])}},hasData:function(e){var t=e[this.expando];return void 0!==t&&!E.isEmptyObject(t)}};var J=new Q,Z=new Q,ee=/^(?:\{[\w\W]*\}|\[[\w\W]*\])$/,te=/[A-Z]/g;function ne(e,t,n){var r;if(void 0===n&&1===e.nodeType)if(r="data-"+t.replace(te,"-$&").toLowerCase(),"string"==typeof(n=e.getAttribute(r))){try{n=function(e){return"true"===e||"false"!==e&&("null"===e?null:e===+e+""?+e:ee.test(e)?JSON.parse(e):e)}(n)}catch(e){}Z.set(e,t,n)}else n=void 0;return n}E.extend({hasData:function(e){return Z.hasData(e)||J.hasData(e)},data:function(e,t,n){return Z.access(e,t,n)},removeData:function(e,t){Z.remove(e,t)},_data:function(e,t,n){return J.access(e,t,n)},_removeData:function(e,t){J.remove(e,t)}}),E.fn.extend({data:function(e,t){var n,r,o,i=this[0],a=i&&i.attributes;if(void 0===e){if(this.length&&(o=Z.get(i),1===i.nodeType&&!J.get(i,"hasDataAttrs"))){for(n=a.length;n--;)a[n]&&0===(r=a[n].name).indexOf("data-")&&(r=Y(r.slice(5)),ne(i,r,o[r]));J.set(i,"hasDataAttrs",!0)}return o}return"object"==typeof e?this.each((function(){Z.set(this,e)})):q(this,(function(t){var n;if(i&&void 0===t)return void 0!==(n=Z.get(i,e))?n:void 0!==(n=ne(i,e))?n:void 0;this.each((function(){Z.set(this,e,t)}))}),null,t,arguments.length>1,null,!0)},removeData:function(e){return this.each((function(){Z.remove(this,e)}))}}),E.extend({queue:function(e,t,n){var r;if(e)return t=(t||"fx")+"queue",r=J.get(e,t),n&&(!r||Array.isArray(n)?r=J.access(e,t,E.makeArray(n)):r.push(n)),r||[]},dequeue:function(e,t){t=t||"fx";var n=E.queue(e,t),r=n.length,o=n.shift(),i=E._queueHooks(e,t);"inprogress"===o&&(o=n.shift(),r--),o&&("fx"===t&&n.unshift("inprogress"),delete i.stop,o.call(e,(function(){E.dequeue(e,t)}),i)),!r&&i&&i.empty.fire()},_queueHooks:function(e,t){var n=t+"queueHooks";return J.get(e,n)||J.access(e,n,{empty:E.Callbacks("once memory").add((function(){J.remove(e,[t+"queue",n])}))})}}),E.fn.extend({queue:function(e,t){var n=2;return"string"!=typeof e&&(t=e,e="fx",n--),arguments.length<n?E.queue(this[0],e):void 0===t?this:this.each((function(){var n=E.queue(this,e,t);E._queueHooks(this,e),"fx"===e&&"inprogress"!==n[0]&&E.dequeue(this,e)}))},dequeue:function(e){return this.each((function(){E.dequeue(this,e)}))},clearQueue:function(e){return this.queue(e||"fx",[])},promise:function(e,t){var n,r=1,o=E.Deferred(),i=this,a=this.length,s=function(){--r||o.resolveWith(i,[i])};for("string"!=typeof e&&(t=e,e=void 0),e=e||"fx";a--;)(n=J.get(i[a],e+"queueHooks"))&&n.empty&&(r++,n.empty.add(s));return s(),o.promise(t)}});var re=/[+-]?(?:\d*\.|)\d+(?:[eE][+-]?\d+|)/.source,oe=new RegExp("^(?:([+-])=|)("+re+")([a-z%]*)$","i"),ie=["Top","Right","Bottom","Left"],ae=a.documentElement,se=function(e){return E.contains(e.ownerDocument,e)},le={composed:!0};ae.getRootNode&&(se=function(e){return E.contains(e.ownerDocument,e)||e.getRootNode(le)===e.ownerDocument});var ce=function(e,t){return"none"===(e=t||e).style.display||""===e.style.display&&se(e)&&"none"===E.css(e,"display")},ue=function(e,t,n,r){var o,i,a={};for(i in t)a[i]=e.style[i],e.style[i]=t[i];for(i in o=n.apply(e,r||[]),t)e.style[i]=a[i];return o};function fe(e,t,n,r){var o,i,a=20,s=r?function(){return r.cur()}:function(){return E.css(e,t,"")},l=s(),c=n&&n[3]||(E.cssNumber[t]?"":"px"),u=e.nodeType&&(E.cssNumber[t]||"px"!==c&&+l)&&oe.exec(E.css(e,t));if(u&&u[3]!==c){for(l/=2,c=c||u[3],u=+l||1;a--;)E.style(e,t,u+c),(1-i)*(1-(i=s()/l||.5))<=0&&(a=0),u/=i;u*=2,E.style(e,t,u+c),n=n||[]}return n&&(u=+u||+l||0,o=n[1]?u+(n[1]+1)*n[2]:+n[2],r&&(r.unit=c,r.start=u,r.end=o)),o}var de={};function pe(e){var t,n=e.ownerDocument,r=e.nodeName,o=de[r];return o||(t=n.body.appendChild(n.createElement(r)),o=E.css(t,"display"),t.parentNode.removeChild(t),"none"===o&&(o="block"),de[r]=o,o)}function he(e,t){for(var n,r,o=[],i=0,a=e.length;i<a;i++)(r=e[i]).style&&(n=r.style.display,t?("none"===n&&(o[i]=J.get(r,"display")||null,o[i]||(r.style.display="")),""===r.style.display&&ce(r)&&(o[i]=pe(r))):"none"!==n&&(o[i]="none",J.set(r,"display",n)));for(i=0;i<a;i++)null!=o[i]&&(e[i].style.display=o[i]);return e}E.fn.extend({show:function(){return he(this,!0)},hide:function(){return he(this)},toggle:function(e){return"boolean"==typeof e?e?this.show():this.hide():this.each((function(){ce(this)?E(this).show():E(this).hide()}))}});var me=/^(?:checkbox|radio)$/i,ve=/<([a-z][^\/\0>\x20\t\r\n\f]*)/i,ye=/^$|^module$|\/(?:java|ecma)script/i,be={option:[1,"<select multiple='multiple'>","</select>"],thead:[1,"<table>","</table>"],col:[2,"<table><colgroup>","</colgroup></table>"],tr:[2,"<table><tbody>","</tbody></table>"],td:[3,"<table><tbody><tr>","</tr></tbody></table>"],_default:[0,"",""]};function ge(e,t){var n;return n=void 0!==e.getElementsByTagName?e.getElementsByTagName(t||"*"):void 0!==e.querySelectorAll?e.querySelectorAll(t||"*"):[],void 0===t||t&&L(e,t)?E.merge([e],n):n}function _e(e,t){for(var n=0,r=e.length;n<r;n++)J.set(e[n],"globalEval",!t||J.get(t[n],"globalEval"))}be.optgroup=be.option,be.tbody=be.tfoot=be.colgroup=be.caption=be.thead,be.th=be.td;var we,xe,Ee=/<|&#?\w+;/;function ke(e,t,n,r,o){for(var i,a,s,l,c,u,f=t.createDocumentFragment(),d=[],p=0,h=e.length;p<h;p++)if((i=e[p])||0===i)if("object"===x(i))E.merge(d,i.nodeType?[i]:i);else if(Ee.test(i)){for(a=a||f.appendChild(t.createElement("div")),s=(ve.exec(i)||["",""])[1].toLowerCase(),l=be[s]||be._default,a.innerHTML=l[1]+E.htmlPrefilter(i)+l[2],u=l[0];u--;)a=a.lastChild;E.merge(d,a.childNodes),(a=f.firstChild).textContent=""}else d.push(t.createTextNode(i));for(f.textContent="",p=0;i=d[p++];)if(r&&E.inArray(i,r)>-1)o&&o.push(i);else if(c=se(i),a=ge(f.appendChild(i),"script"),c&&_e(a),n)for(u=0;i=a[u++];)ye.test(i.type||"")&&n.push(i);return f}we=a.createDocumentFragment().appendChild(a.createElement("div")),(xe=a.createElement("input")).setAttribute("type","radio"),xe.setAttribute("checked","checked"),xe.setAttribute("name","t"),we.appendChild(xe),y.checkClone=we.cloneNode(!0).cloneNode(!0).lastChild.checked,we.innerHTML="<textarea>x</textarea>",y.noCloneChecked=!!we.cloneNode(!0).lastChild.defaultValue;var je=/^key/,Te=/^(?:mouse|pointer|contextmenu|drag|drop)|click/,Oe=/^([^.]*)(?:\.(.+)|)/;function Ce(){return!0}function Se(){return!1}function Le(e,t){return e===function(){try{return a.activeElement}catch(e){}}()==("focus"===t)}function Pe(e,t,n,r,o,i){var a,s;if("object"==typeof t){for(s in"string"!=typeof n&&(r=r||n,n=void 0),t)Pe(e,s,n,r,t[s],i);return e}if(null==r&&null==o?(o=n,r=n=void 0):null==o&&("string"==typeof n?(o=r,r=void 0):(o=r,r=n,n=void 0)),!1===o)o=Se;else if(!o)return e;return 1===i&&(a=o,(o=function(e){return E().off(e),a.apply(this,arguments)}).guid=a.guid||(a.guid=E.guid++)),e.each((function(){E.event.add(this,t,o,r,n)}))}function Ne(e,t,n){n?(J.set(e,t,!1),E.event.add(e,t,{namespace:!1,handler:function(e){var r,o,i=J.get(this,t);if(1&e.isTrigger&&this[t]){if(i.length)(E.event.special[t]||{}).delegateType&&e.stopPropagation();else if(i=l.call(arguments),J.set(this,t,i),r=n(this,t),this[t](),i!==(o=J.get(this,t))||r?J.set(this,t,!1):o={},i!==o)return e.stopImmediatePropagation(),e.preventDefault(),o.value}else i.length&&(J.set(this,t,{value:E.event.trigger(E.extend(i[0],E.Event.prototype),i.slice(1),this)}),e.stopImmediatePropagation())}})):void 0===J.get(e,t)&&E.event.add(e,t,Ce)}E.event={global:{},add:function(e,t,n,r,o){var i,a,s,l,c,u,f,d,p,h,m,v=J.get(e);if(v)for(n.handler&&(n=(i=n).handler,o=i.selector),o&&E.find.matchesSelector(ae,o),n.guid||(n.guid=E.guid++),(l=v.events)||(l=v.events={}),(a=v.handle)||(a=v.handle=function(t){return void 0!==E&&E.event.triggered!==t.type?E.event.dispatch.apply(e,arguments):void 0}),c=(t=(t||"").match(I)||[""]).length;c--;)p=m=(s=Oe.exec(t[c])||[])[1],h=(s[2]||"").split(".").sort(),p&&(f=E.event.special[p]||{},p=(o?f.delegateType:f.bindType)||p,f=E.event.special[p]||{},u=E.extend({type:p,origType:m,data:r,handler:n,guid:n.guid,selector:o,needsContext:o&&E.expr.match.needsContext.test(o),namespace:h.join(".")},i),(d=l[p])||((d=l[p]=[]).delegateCount=0,f.setup&&!1!==f.setup.call(e,r,h,a)||e.addEventListener&&e.addEventListener(p,a)),f.add&&(f.add.call(e,u),u.handler.guid||(u.handler.guid=n.guid)),o?d.splice(d.delegateCount++,0,u):d.push(u),E.event.global[p]=!0)},remove:function(e,t,n,r,o){var i,a,s,l,c,u,f,d,p,h,m,v=J.hasData(e)&&J.get(e);if(v&&(l=v.events)){for(c=(t=(t||"").match(I)||[""]).length;c--;)if(p=m=(s=Oe.exec(t[c])||[])[1],h=(s[2]||"").split(".").sort(),p){for(f=E.event.special[p]||{},d=l[p=(r?f.delegateType:f.bindType)||p]||[],s=s[2]&&new RegExp("(^|\\.)"+h.join("\\.(?:.*\\.|)")+"(\\.|$)"),a=i=d.length;i--;)u=d[i],!o&&m!==u.origType||n&&n.guid!==u.guid||s&&!s.test(u.namespace)||r&&r!==u.selector&&("**"!==r||!u.selector)||(d.splice(i,1),u.selector&&d.delegateCount--,f.remove&&f.remove.call(e,u));a&&!d.length&&(f.teardown&&!1!==f.teardown.call(e,h,v.handle)||E.removeEvent(e,p,v.handle),delete l[p])}else for(p in l)E.event.remove(e,p+t[c],n,r,!0);E.isEmptyObject(l)&&J.remove(e,"handle events")}},dispatch:function(e){var t,n,r,o,i,a,s=E.event.fix(e),l=new Array(arguments.length),c=(J.get(this,"events")||{})[s.type]||[],u=E.event.special[s.type]||{};for(l[0]=s,t=1;t<arguments.length;t++)l[t]=arguments[t];if(s.delegateTarget=this,!u.preDispatch||!1!==u.preDispatch.call(this,s)){for(a=E.event.handlers.call(this,s,c),t=0;(o=a[t++])&&!s.isPropagationStopped();)for(s.currentTarget=o.elem,n=0;(i=o.handlers[n++])&&!s.isImmediatePropagationStopped();)s.rnamespace&&!1!==i.namespace&&!s.rnamespace.test(i.namespace)||(s.handleObj=i,s.data=i.data,void 0!==(r=((E.event.special[i.origType]||{}).handle||i.handler).apply(o.elem,l))&&!1===(s.result=r)&&(s.preventDefault(),s.stopPropagation()));return u.postDispatch&&u.postDispatch.call(this,s),s.result}},handlers:function(e,t){var n,r,o,i,a,s=[],l=t.delegateCount,c=e.target;if(l&&c.nodeType&&!("click"===e.type&&e.button>=1))for(;c!==this;c=c.parentNode||this)if(1===c.nodeType&&("click"!==e.type||!0!==c.disabled)){for(i=[],a={},n=0;n<l;n++)void 0===a[o=(r=t[n]).selector+" "]&&(a[o]=r.needsContext?E(o,this).index(c)>-1:E.find(o,this,null,[c]).length),a[o]&&i.push(r);i.length&&s.push({elem:c,handlers:i})}return c=this,l<t.length&&s.push({elem:c,handlers:t.slice(l)}),s},addProp:function(e,t){Object.defineProperty(E.Event.prototype,e,{enumerable:!0,configurable:!0,get:b(t)?function(){if(this.originalEvent)return t(this.originalEvent)}:function(){if(this.originalEvent)return this.originalEvent[e]},set:function(t){Object.defineProperty(this,e,{enumerable:!0,configurable:!0,writable:!0,value:t})}})},fix:function(e){return e[E.expando]?e:new E.Event(e)},special:{load:{noBubble:!0},click:{setup:function(e){var t=this||e;return me.test(t.type)&&t.click&&L(t,"input")&&Ne(t,"click",Ce),!1},trigger:function(e){var t=this||e;return me.test(t.type)&&t.click&&L(t,"input")&&Ne(t,"click"),!0},_default:function(e){var t=e.target;return me.test(t.type)&&t.click&&L(t,"input")&&J.get(t,"click")||L(t,"a")}},beforeunload:{postDispatch:function(e){void 0!==e.result&&e.originalEvent&&(e.originalEvent.returnValue=e.result)}}}},E.removeEvent=function(e,t,n){e.removeEventListener&&e.removeEventListener(t,n)},E.Event=function(e,t){if(!(this instanceof E.Event))return new E.Event(e,t);e&&e.type?(this.originalEvent=e,this.type=e.type,this.isDefaultPrevented=e.defaultPrevented||void 0===e.defaultPrevented&&!1===e.returnValue?Ce:Se,this.target=e.target&&3===e.target.nodeType?e.target.parentNode:e.target,this.currentTarget=e.currentTarget,this.relatedTarget=e.relatedTarget):this.type=e,t&&E.extend(this,t),this.timeStamp=e&&e.timeStamp||Date.now(),this[E.expando]=!0},E.Event.prototype={constructor:E.Event,isDefaultPrevented:Se,isPropagationStopped:Se,isImmediatePropagationStopped:Se,isSimulated:!1,preventDefault:function(){var e=this.originalEvent;this.isDefaultPrevented=Ce,e&&!this.isSimulated&&e.preventDefault()},stopPropagation:function(){var e=this.originalEvent;this.isPropagationStopped=Ce,e&&!this.isSimulated&&e.stopPropagation()},stopImmediatePropagation:function(){var e=this.originalEvent;this.isImmediatePropagationStopped=Ce,e&&!this.isSimulated&&e.stopImmediatePropagation(),this.stopPropagation()}},E.each({altKey:!0,bubbles:!0,cancelable:!0,changedTouches:!0,ctrlKey:!0,detail:!0,eventPhase:!0,metaKey:!0,pageX:!0,pageY:!0,shiftKey:!0,view:!0,char:!0,code:!0,charCode:!0,key:!0,keyCode:!0,button:!0,buttons:!0,clientX:!0,clientY:!0,offsetX:!0,offsetY:!0,pointerId:!0,pointerType:!0,screenX:!0,screenY:!0,targetTouches:!0,toElement:!0,touches:!0,which:function(e){var t=e.button;return null==e.which&&je.test(e.type)?null!=e.charCode?e.charCode:e.keyCode:!e.which&&void 0!==t&&Te.test(e.type)?1&t?1:2&t?3:4&t?2:0:e.which}},E.event.addProp),E.each({focus:"focusin",blur:"focusout"},(function(e,t){E.event.special[e]={setup:function(){return Ne(this,e,Le),!1},trigger:function(){return Ne(this,e),!0},delegateType:t}})),E.each({mouseenter:"mouseover",mouseleave:"mouseout",pointerenter:"pointerover",pointerleave:"pointerout"},(function(e,t){E.event.special[e]={delegateType:t,bindType:t,handle:function(e){var n,r=this,o=e.relatedTarget,i=e.handleObj;return o&&(o===r||E.contains(r,o))||(e.type=i.origType,n=i.handler.apply(this,arguments),e.type=t),n}}})),E.fn.extend({on:function(e,t,n,r){return Pe(this,e,t,n,r)},one:function(e,t,n,r){return Pe(this,e,t,n,r,1)},off:function(e,t,n){var r,o;if(e&&e.preventDefault&&e.handleObj)return r=e.handleObj,E(e.delegateTarget).off(r.namespace?r.origType+"."+r.namespace:r.origType,r.selector,r.handler),this;if("object"==typeof e){for(o in e)this.off(o,t,e[o]);return this}return!1!==t&&"function"!=typeof t||(n=t,t=void 0),!1===n&&(n=Se),this.each((function(){E.event.remove(this,e,n,t)}))}});var Ae=/<(?!area|br|col|embed|hr|img|input|link|meta|param)(([a-z][^\/\0>\x20\t\r\n\f]*)[^>]*)\/>/gi,Me=/<script|<style|<link/i,De=/checked\s*(?:[^=]|=\s*.checked.)/i,He=/^\s*<!(?:\[CDATA\[|--)|(?:\]\]|--)>\s*$/g;function Re(e,t){return L(e,"table")&&L(11!==t.nodeType?t:t.firstChild,"tr")&&E(e).children("tbody")[0]||e}function Ie(e){return e.type=(null!==e.getAttribute("type"))+"/"+e.type,e}function Fe(e){return"true/"===(e.type||"").slice(0,5)?e.type=e.type.slice(5):e.removeAttribute("type"),e}function ze(e,t){var n,r,o,i,a,s,l,c;if(1===t.nodeType){if(J.hasData(e)&&(i=J.access(e),a=J.set(t,i),c=i.events))for(o in delete a.handle,a.events={},c)for(n=0,r=c[o].length;n<r;n++)E.event.add(t,o,c[o][n]);Z.hasData(e)&&(s=Z.access(e),l=E.extend({},s),Z.set(t,l))}}function Ge(e,t){var n=t.nodeName.toLowerCase();"input"===n&&me.test(e.type)?t.checked=e.checked:"input"!==n&&"textarea"!==n||(t.defaultValue=e.defaultValue)}function Ue(e,t,n,r){t=c.apply([],t);var o,i,a,s,l,u,f=0,d=e.length,p=d-1,h=t[0],m=b(h);if(m||d>1&&"string"==typeof h&&!y.checkClone&&De.test(h))return e.each((function(o){var i=e.eq(o);m&&(t[0]=h.call(this,o,i.html())),Ue(i,t,n,r)}));if(d&&(i=(o=ke(t,e[0].ownerDocument,!1,e,r)).firstChild,1===o.childNodes.length&&(o=i),i||r)){for(s=(a=E.map(ge(o,"script"),Ie)).length;f<d;f++)l=o,f!==p&&(l=E.clone(l,!0,!0),s&&E.merge(a,ge(l,"script"))),n.call(e[f],l,f);if(s)for(u=a[a.length-1].ownerDocument,E.map(a,Fe),f=0;f<s;f++)l=a[f],ye.test(l.type||"")&&!J.access(l,"globalEval")&&E.contains(u,l)&&(l.src&&"module"!==(l.type||"").toLowerCase()?E._evalUrl&&!l.noModule&&E._evalUrl(l.src,{nonce:l.nonce||l.getAttribute("nonce")}):w(l.textContent.replace(He,""),l,u))}return e}function Be(e,t,n){for(var r,o=t?E.filter(t,e):e,i=0;null!=(r=o[i]);i++)n||1!==r.nodeType||E.cleanData(ge(r)),r.parentNode&&(n&&se(r)&&_e(ge(r,"script")),r.parentNode.removeChild(r));return e}E.extend({htmlPrefilter:function(e){return e.replace(Ae,"<$1></$2>")},clone:function(e,t,n){var r,o,i,a,s=e.cloneNode(!0),l=se(e);if(!(y.noCloneChecked||1!==e.nodeType&&11!==e.nodeType||E.isXMLDoc(e)))for(a=ge(s),r=0,o=(i=ge(e)).length;r<o;r++)Ge(i[r],a[r]);if(t)if(n)for(i=i||ge(e),a=a||ge(s),r=0,o=i.length;r<o;r++)ze(i[r],a[r]);else ze(e,s);return(a=ge(s,"script")).length>0&&_e(a,!l&&ge(e,"script")),s},cleanData:function(e){for(var t,n,r,o=E.event.special,i=0;void 0!==(n=e[i]);i++)if(K(n)){if(t=n[J.expando]){if(t.events)for(r in t.events)o[r]?E.event.remove(n,r):E.removeEvent(n,r,t.handle);n[J.expando]=void 0}n[Z.expando]&&(n[Z.expando]=void 0)}}}),E.fn.extend({detach:function(e){return Be(this,e,!0)},remove:function(e){return Be(this,e)},text:function(e){return q(this,(function(e){return void 0===e?E.text(this):this.empty().each((function(){1!==this.nodeType&&11!==this.nodeType&&9!==this.nodeType||(this.textContent=e)}))}),null,e,arguments.length)},append:function(){return Ue(this,arguments,(function(e){1!==this.nodeType&&11!==this.nodeType&&9!==this.nodeType||Re(this,e).appendChild(e)}))},prepend:function(){return Ue(this,arguments,(function(e){if(1===this.nodeType||11===this.nodeType||9===this.nodeType){var t=Re(this,e);t.insertBefore(e,t.firstChild)}}))},before:function(){return Ue(this,arguments,(function(e){this.parentNode&&this.parentNode.insertBefore(e,this)}))},after:function(){return Ue(this,arguments,(function(e){this.parentNode&&this.parentNode.insertBefore(e,this.nextSibling)}))},empty:function(){for(var e,t=0;null!=(e=this[t]);t++)1===e.nodeType&&(E.cleanData(ge(e,!1)),e.textContent="");return this},clone:function(e,t){return e=null!=e&&e,t=null==t?e:t,this.map((function(){return E.clone(this,e,t)}))},html:function(e){return q(this,(function(e){var t=this[0]||{},n=0,r=this.length;if(void 0===e&&1===t.nodeType)return t.innerHTML;if("string"==typeof e&&!Me.test(e)&&!be[(ve.exec(e)||["",""])[1].toLowerCase()]){e=E.htmlPrefilter(e);try{for(;n<r;n++)1===(t=this[n]||{}).nodeType&&(E.cleanData(ge(t,!1)),t.innerHTML=e);t=0}catch(e){}}t&&this.empty().append(e)}),null,e,arguments.length)},replaceWith:function(){var e=[];return Ue(this,arguments,(function(t){var n=this.parentNode;E.inArray(this,e)<0&&(E.cleanData(ge(this)),n&&n.replaceChild(t,this))}),e)}}),E.each({appendTo:"append",prependTo:"prepend",insertBefore:"before",insertAfter:"after",replaceAll:"replaceWith"},(function(e,t){E.fn[e]=function(e){for(var n,r=[],o=E(e),i=o.length-1,a=0;a<=i;a++)n=a===i?this:this.clone(!0),E(o[a])[t](n),u.apply(r,n.get());return this.pushStack(r)}}));var We=new RegExp("^("+re+")(?!px)[a-z%]+$","i"),qe=function(e){var t=e.ownerDocument.defaultView;return t&&t.opener||(t=n),t.getComputedStyle(e)},Ve=new RegExp(ie.join("|"),"i");function $e(e,t,n){var r,o,i,a,s=e.style;return(n=n||qe(e))&&(""!==(a=n.getPropertyValue(t)||n[t])||se(e)||(a=E.style(e,t)),!y.pixelBoxStyles()&&We.test(a)&&Ve.test(t)&&(r=s.width,o=s.minWidth,i=s.maxWidth,s.minWidth=s.maxWidth=s.width=a,a=n.width,s.width=r,s.minWidth=o,s.maxWidth=i)),void 0!==a?a+"":a}function Xe(e,t){return{get:function(){if(!e())return(this.get=t).apply(this,arguments);delete this.get}}}!function(){function e(){if(u){c.style.cssText="position:absolute;left:-11111px;width:60px;margin-top:1px;padding:0;border:0",u.style.cssText="position:relative;display:block;box-sizing:border-box;overflow:scroll;margin:auto;border:1px;padding:1px;width:60%;top:1%",ae.appendChild(c).appendChild(u);var e=n.getComputedStyle(u);r="1%"!==e.top,l=12===t(e.marginLeft),u.style.right="60%",s=36===t(e.right),o=36===t(e.width),u.style.position="absolute",i=12===t(u.offsetWidth/3),ae.removeChild(c),u=null}}function t(e){return Math.round(parseFloat(e))}var r,o,i,s,l,c=a.createElement("div"),u=a.createElement("div");u.style&&(u.style.backgroundClip="content-box",u.cloneNode(!0).style.backgroundClip="",y.clearCloneStyle="content-box"===u.style.backgroundClip,E.extend(y,{boxSizingReliable:function(){return e(),o},pixelBoxStyles:function(){return e(),s},pixelPosition:function(){return e(),r},reliableMarginLeft:function(){return e(),l},scrollboxSize:function(){return e(),i}}))}();var Ye=["Webkit","Moz","ms"],Ke=a.createElement("div").style,Qe={};function Je(e){var t=E.cssProps[e]||Qe[e];return t||(e in Ke?e:Qe[e]=function(e){for(var t=e[0].toUpperCase()+e.slice(1),n=Ye.length;n--;)if((e=Ye[n]+t)in Ke)return e}(e)||e)}var Ze=/^(none|table(?!-c[ea]).+)/,et=/^--/,tt={position:"absolute",visibility:"hidden",display:"block"},nt={letterSpacing:"0",fontWeight:"400"};function rt(e,t,n){var r=oe.exec(t);return r?Math.max(0,r[2]-(n||0))+(r[3]||"px"):t}function ot(e,t,n,r,o,i){var a="width"===t?1:0,s=0,l=0;if(n===(r?"border":"content"))return 0;for(;a<4;a+=2)"margin"===n&&(l+=E.css(e,n+ie[a],!0,o)),r?("content"===n&&(l-=E.css(e,"padding"+ie[a],!0,o)),"margin"!==n&&(l-=E.css(e,"border"+ie[a]+"Width",!0,o))):(l+=E.css(e,"padding"+ie[a],!0,o),"padding"!==n?l+=E.css(e,"border"+ie[a]+"Width",!0,o):s+=E.css(e,"border"+ie[a]+"Width",!0,o));return!r&&i>=0&&(l+=Math.max(0,Math.ceil(e["offset"+t[0].toUpperCase()+t.slice(1)]-i-l-s-.5))||0),l}function it(e,t,n){var r=qe(e),o=(!y.boxSizingReliable()||n)&&"border-box"===E.css(e,"boxSizing",!1,r),i=o,a=$e(e,t,r),s="offset"+t[0].toUpperCase()+t.slice(1);if(We.test(a)){if(!n)return a;a="auto"}return(!y.boxSizingReliable()&&o||"auto"===a||!parseFloat(a)&&"inline"===E.css(e,"display",!1,r))&&e.getClientRects().length&&(o="border-box"===E.css(e,"boxSizing",!1,r),(i=s in e)&&(a=e[s])),(a=parseFloat(a)||0)+ot(e,t,n||(o?"border":"content"),i,r,a)+"px"}function at(e,t,n,r,o){return new at.prototype.init(e,t,n,r,o)}E.extend({cssHooks:{opacity:{get:function(e,t){if(t){var n=$e(e,"opacity");return""===n?"1":n}}}},cssNumber:{animationIterationCount:!0,columnCount:!0,fillOpacity:!0,flexGrow:!0,flexShrink:!0,fontWeight:!0,gridArea:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnStart:!0,gridRow:!0,gridRowEnd:!0,gridRowStart:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,widows:!0,zIndex:!0,zoom:!0},cssProps:{},style:function(e,t,n,r){if(e&&3!==e.nodeType&&8!==e.nodeType&&e.style){var o,i,a,s=Y(t),l=et.test(t),c=e.style;if(l||(t=Je(s)),a=E.cssHooks[t]||E.cssHooks[s],void 0===n)return a&&"get"in a&&void 0!==(o=a.get(e,!1,r))?o:c[t];"string"===(i=typeof n)&&(o=oe.exec(n))&&o[1]&&(n=fe(e,t,o),i="number"),null!=n&&n==n&&("number"!==i||l||(n+=o&&o[3]||(E.cssNumber[s]?"":"px")),y.clearCloneStyle||""!==n||0!==t.indexOf("background")||(c[t]="inherit"),a&&"set"in a&&void 0===(n=a.set(e,n,r))||(l?c.setProperty(t,n):c[t]=n))}},css:function(e,t,n,r){var o,i,a,s=Y(t);return et.test(t)||(t=Je(s)),(a=E.cssHooks[t]||E.cssHooks[s])&&"get"in a&&(o=a.get(e,!0,n)),void 0===o&&(o=$e(e,t,r)),"normal"===o&&t in nt&&(o=nt[t]),""===n||n?(i=parseFloat(o),!0===n||isFinite(i)?i||0:o):o}}),E.each(["height","width"],(function(e,t){E.cssHooks[t]={get:function(e,n,r){if(n)return!Ze.test(E.css(e,"display"))||e.getClientRects().length&&e.getBoundingClientRect().width?it(e,t,r):ue(e,tt,(function(){return it(e,t,r)}))},set:function(e,n,r){var o,i=qe(e),a=!y.scrollboxSize()&&"absolute"===i.position,s=(a||r)&&"border-box"===E.css(e,"boxSizing",!1,i),l=r?ot(e,t,r,s,i):0;return s&&a&&(l-=Math.ceil(e["offset"+t[0].toUpperCase()+t.slice(1)]-parseFloat(i[t])-ot(e,t,"border",!1,i)-.5)),l&&(o=oe.exec(n))&&"px"!==(o[3]||"px")&&(e.style[t]=n,n=E.css(e,t)),rt(0,n,l)}}})),E.cssHooks.marginLeft=Xe(y.reliableMarginLeft,(function(e,t){if(t)return(parseFloat($e(e,"marginLeft"))||e.getBoundingClientRect().left-ue(e,{marginLeft:0},(function(){return e.getBoundingClientRect().left})))+"px"})),E.each({margin:"",padding:"",border:"Width"},(function(e,t){E.cssHooks[e+t]={expand:function(n){for(var r=0,o={},i="string"==typeof n?n.split(" "):[n];r<4;r++)o[e+ie[r]+t]=i[r]||i[r-2]||i[0];return o}},"margin"!==e&&(E.cssHooks[e+t].set=rt)})),E.fn.extend({css:function(e,t){return q(this,(function(e,t,n){var r,o,i={},a=0;if(Array.isArray(t)){for(r=qe(e),o=t.length;a<o;a++)i[t[a]]=E.css(e,t[a],!1,r);return i}return void 0!==n?E.style(e,t,n):E.css(e,t)}),e,t,arguments.length>1)}}),E.Tween=at,at.prototype={constructor:at,init:function(e,t,n,r,o,i){this.elem=e,this.prop=n,this.easing=o||E.easing._default,this.options=t,this.start=this.now=this.cur(),this.end=r,this.unit=i||(E.cssNumber[n]?"":"px")},cur:function(){var e=at.propHooks[this.prop];return e&&e.get?e.get(this):at.propHooks._default.get(this)},run:function(e){var t,n=at.propHooks[this.prop];return this.options.duration?this.pos=t=E.easing[this.easing](e,this.options.duration*e,0,1,this.options.duration):this.pos=t=e,this.now=(this.end-this.start)*t+this.start,this.options.step&&this.options.step.call(this.elem,this.now,this),n&&n.set?n.set(this):at.propHooks._default.set(this),this}},at.prototype.init.prototype=at.prototype,at.propHooks={_default:{get:function(e){var t;return 1!==e.elem.nodeType||null!=e.elem[e.prop]&&null==e.elem.style[e.prop]?e.elem[e.prop]:(t=E.css(e.elem,e.prop,""))&&"auto"!==t?t:0},set:function(e){E.fx.step[e.prop]?E.fx.step[e.prop](e):1!==e.elem.nodeType||!E.cssHooks[e.prop]&&null==e.elem.style[Je(e.prop)]?e.elem[e.prop]=e.now:E.style(e.elem,e.prop,e.now+e.unit)}}},at.propHooks.scrollTop=at.propHooks.scrollLeft={set:function(e){e.elem.nodeType&&e.elem.parentNode&&(e.elem[e.prop]=e.now)}},E.easing={linear:function(e){return e},swing:function(e){return.5-Math.cos(e*Math.PI)/2},_default:"swing"},E.fx=at.prototype.init,E.fx.step={};var st,lt,ct=/^(?:toggle|show|hide)$/,ut=/queueHooks$/;function ft(){lt&&(!1===a.hidden&&n.requestAnimationFrame?n.requestAnimationFrame(ft):n.setTimeout(ft,E.fx.interval),E.fx.tick())}function dt(){return n.setTimeout((function(){st=void 0})),st=Date.now()}function pt(e,t){var n,r=0,o={height:e};for(t=t?1:0;r<4;r+=2-t)o["margin"+(n=ie[r])]=o["padding"+n]=e;return t&&(o.opacity=o.width=e),o}function ht(e,t,n){for(var r,o=(mt.tweeners[t]||[]).concat(mt.tweeners["*"]),i=0,a=o.length;i<a;i++)if(r=o[i].call(n,t,e))return r}function mt(e,t,n){var r,o,i=0,a=mt.prefilters.length,s=E.Deferred().always((function(){delete l.elem})),l=function(){if(o)return!1;for(var t=st||dt(),n=Math.max(0,c.startTime+c.duration-t),r=1-(n/c.duration||0),i=0,a=c.tweens.length;i<a;i++)c.tweens[i].run(r);return s.notifyWith(e,[c,r,n]),r<1&&a?n:(a||s.notifyWith(e,[c,1,0]),s.resolveWith(e,[c]),!1)},c=s.promise({elem:e,props:E.extend({},t),opts:E.extend(!0,{specialEasing:{},easing:E.easing._default},n),originalProperties:t,originalOptions:n,startTime:st||dt(),duration:n.duration,tweens:[],createTween:function(t,n){var r=E.Tween(e,c.opts,t,n,c.opts.specialEasing[t]||c.opts.easing);return c.tweens.push(r),r},stop:function(t){var n=0,r=t?c.tweens.length:0;if(o)return this;for(o=!0;n<r;n++)c.tweens[n].run(1);return t?(s.notifyWith(e,[c,1,0]),s.resolveWith(e,[c,t])):s.rejectWith(e,[c,t]),this}}),u=c.props;for(!function(e,t){var n,r,o,i,a;for(n in e)if(o=t[r=Y(n)],i=e[n],Array.isArray(i)&&(o=i[1],i=e[n]=i[0]),n!==r&&(e[r]=i,delete e[n]),(a=E.cssHooks[r])&&"expand"in a)for(n in i=a.expand(i),delete e[r],i)n in e||(e[n]=i[n],t[n]=o);else t[r]=o}(u,c.opts.specialEasing);i<a;i++)if(r=mt.prefilters[i].call(c,e,u,c.opts))return b(r.stop)&&(E._queueHooks(c.elem,c.opts.queue).stop=r.stop.bind(r)),r;return E.map(u,ht,c),b(c.opts.start)&&c.opts.start.call(e,c),c.progress(c.opts.progress).done(c.opts.done,c.opts.complete).fail(c.opts.fail).always(c.opts.always),E.fx.timer(E.extend(l,{elem:e,anim:c,queue:c.opts.queue})),c}E.Animation=E.extend(mt,{tweeners:{"*":[function(e,t){var n=this.createTween(e,t);return fe(n.elem,e,oe.exec(t),n),n}]},tweener:function(e,t){b(e)?(t=e,e=["*"]):e=e.match(I);for(var n,r=0,o=e.length;r<o;r++)n=e[r],mt.tweeners[n]=mt.tweeners[n]||[],mt.tweeners[n].unshift(t)},prefilters:[function(e,t,n){var r,o,i,a,s,l,c,u,f="width"in t||"height"in t,d=this,p={},h=e.style,m=e.nodeType&&ce(e),v=J.get(e,"fxshow");for(r in n.queue||(null==(a=E._queueHooks(e,"fx")).unqueued&&(a.unqueued=0,s=a.empty.fire,a.empty.fire=function(){a.unqueued||s()}),a.unqueued++,d.always((function(){d.always((function(){a.unqueued--,E.queue(e,"fx").length||a.empty.fire()}))}))),t)if(o=t[r],ct.test(o)){if(delete t[r],i=i||"toggle"===o,o===(m?"hide":"show")){if("show"!==o||!v||void 0===v[r])continue;m=!0}p[r]=v&&v[r]||E.style(e,r)}if((l=!E.isEmptyObject(t))||!E.isEmptyObject(p))for(r in f&&1===e.nodeType&&(n.overflow=[h.overflow,h.overflowX,h.overflowY],null==(c=v&&v.display)&&(c=J.get(e,"display")),"none"===(u=E.css(e,"display"))&&(c?u=c:(he([e],!0),c=e.style.display||c,u=E.css(e,"display"),he([e]))),("inline"===u||"inline-block"===u&&null!=c)&&"none"===E.css(e,"float")&&(l||(d.done((function(){h.display=c})),null==c&&(u=h.display,c="none"===u?"":u)),h.display="inline-block")),n.overflow&&(h.overflow="hidden",d.always((function(){h.overflow=n.overflow[0],h.overflowX=n.overflow[1],h.overflowY=n.overflow[2]}))),l=!1,p)l||(v?"hidden"in v&&(m=v.hidden):v=J.access(e,"fxshow",{display:c}),i&&(v.hidden=!m),m&&he([e],!0),d.done((function(){for(r in m||he([e]),J.remove(e,"fxshow"),p)E.style(e,r,p[r])}))),l=ht(m?v[r]:0,r,d),r in v||(v[r]=l.start,m&&(l.end=l.start,l.start=0))}],prefilter:function(e,t){t?mt.prefilters.unshift(e):mt.prefilters.push(e)}}),E.speed=function(e,t,n){var r=e&&"object"==typeof e?E.extend({},e):{complete:n||!n&&t||b(e)&&e,duration:e,easing:n&&t||t&&!b(t)&&t};return E.fx.off?r.duration=0:"number"!=typeof r.duration&&(r.duration in E.fx.speeds?r.duration=E.fx.speeds[r.duration]:r.duration=E.fx.speeds._default),null!=r.queue&&!0!==r.queue||(r.queue="fx"),r.old=r.complete,r.complete=function(){b(r.old)&&r.old.call(this),r.queue&&E.dequeue(this,r.queue)},r},E.fn.extend({fadeTo:function(e,t,n,r){return this.filter(ce).css("opacity",0).show().end().animate({opacity:t},e,n,r)},animate:function(e,t,n,r){var o=E.isEmptyObject(e),i=E.speed(t,n,r),a=function(){var t=mt(this,E.extend({},e),i);(o||J.get(this,"finish"))&&t.stop(!0)};return a.finish=a,o||!1===i.queue?this.each(a):this.queue(i.queue,a)},stop:function(e,t,n){var r=function(e){var t=e.stop;delete e.stop,t(n)};return"string"!=typeof e&&(n=t,t=e,e=void 0),t&&!1!==e&&this.queue(e||"fx",[]),this.each((function(){var t=!0,o=null!=e&&e+"queueHooks",i=E.timers,a=J.get(this);if(o)a[o]&&a[o].stop&&r(a[o]);else for(o in a)a[o]&&a[o].stop&&ut.test(o)&&r(a[o]);for(o=i.length;o--;)i[o].elem!==this||null!=e&&i[o].queue!==e||(i[o].anim.stop(n),t=!1,i.splice(o,1));!t&&n||E.dequeue(this,e)}))},finish:function(e){return!1!==e&&(e=e||"fx"),this.each((function(){var t,n=J.get(this),r=n[e+"queue"],o=n[e+"queueHooks"],i=E.timers,a=r?r.length:0;for(n.finish=!0,E.queue(this,e,[]),o&&o.stop&&o.stop.call(this,!0),t=i.length;t--;)i[t].elem===this&&i[t].queue===e&&(i[t].anim.stop(!0),i.splice(t,1));for(t=0;t<a;t++)r[t]&&r[t].finish&&r[t].finish.call(this);delete n.finish}))}}),E.each(["toggle","show","hide"],(function(e,t){var n=E.fn[t];E.fn[t]=function(e,r,o){return null==e||"boolean"==typeof e?n.apply(this,arguments):this.animate(pt(t,!0),e,r,o)}})),E.each({slideDown:pt("show"),slideUp:pt("hide"),slideToggle:pt("toggle"),fadeIn:{opacity:"show"},fadeOut:{opacity:"hide"},fadeToggle:{opacity:"toggle"}},(function(e,t){E.fn[e]=function(e,n,r){return this.animate(t,e,n,r)}})),E.timers=[],E.fx.tick=function(){var e,t=0,n=E.timers;for(st=Date.now();t<n.length;t++)(e=n[t])()||n[t]!==e||n.splice(t--,1);n.length||E.fx.stop(),st=void 0},E.fx.timer=function(e){E.timers.push(e),E.fx.start()},E.fx.interval=13,E.fx.start=function(){lt||(lt=!0,ft())},E.fx.stop=function(){lt=null},E.fx.speeds={slow:600,fast:200,_default:400},E.fn.delay=function(e,t){return e=E.fx&&E.fx.speeds[e]||e,t=t||"fx",this.queue(t,(function(t,r){var o=n.setTimeout(t,e);r.stop=function(){n.clearTimeout(o)}}))},function(){var e=a.createElement("input"),t=a.createElement("select").appendChild(a.createElement("option"));e.type="checkbox",y.checkOn=""!==e.value,y.optSelected=t.selected,(e=a.createElement("input")).value="t",e.type="radio",y.radioValue="t"===e.value}();var vt,yt=E.expr.attrHandle;E.fn.extend({attr:function(e,t){return q(this,E.attr,e,t,arguments.length>1)},removeAttr:function(e){return this.each((function(){E.removeAttr(this,e)}))}}),E.extend({attr:function(e,t,n){var r,o,i=e.nodeType;if(3!==i&&8!==i&&2!==i)return void 0===e.getAttribute?E.prop(e,t,n):(1===i&&E.isXMLDoc(e)||(o=E.attrHooks[t.toLowerCase()]||(E.expr.match.bool.test(t)?vt:void 0)),void 0!==n?null===n?void E.removeAttr(e,t):o&&"set"in o&&void 0!==(r=o.set(e,n,t))?r:(e.setAttribute(t,n+""),n):o&&"get"in o&&null!==(r=o.get(e,t))?r:null==(r=E.find.attr(e,t))?void 0:r)},attrHooks:{type:{set:function(e,t){if(!y.radioValue&&"radio"===t&&L(e,"input")){var n=e.value;return e.setAttribute("type",t),n&&(e.value=n),t}}}},removeAttr:function(e,t){var n,r=0,o=t&&t.match(I);if(o&&1===e.nodeType)for(;n=o[r++];)e.removeAttribute(n)}}),vt={set:function(e,t,n){return!1===t?E.removeAttr(e,n):e.setAttribute(n,n),n}},E.each(E.expr.match.bool.source.match(/\w+/g),(function(e,t){var n=yt[t]||E.find.attr;yt[t]=function(e,t,r){var o,i,a=t.toLowerCase();return r||(i=yt[a],yt[a]=o,o=null!=n(e,t,r)?a:null,yt[a]=i),o}}));var bt=/^(?:input|select|textarea|button)$/i,gt=/^(?:a|area)$/i;function _t(e){return(e.match(I)||[]).join(" ")}function wt(e){return e.getAttribute&&e.getAttribute("class")||""}function xt(e){return Array.isArray(e)?e:"string"==typeof e&&e.match(I)||[]}E.fn.extend({prop:function(e,t){return q(this,E.prop,e,t,arguments.length>1)},removeProp:function(e){return this.each((function(){delete this[E.propFix[e]||e]}))}}),E.extend({prop:function(e,t,n){var r,o,i=e.nodeType;if(3!==i&&8!==i&&2!==i)return 1===i&&E.isXMLDoc(e)||(t=E.propFix[t]||t,o=E.propHooks[t]),void 0!==n?o&&"set"in o&&void 0!==(r=o.set(e,n,t))?r:e[t]=n:o&&"get"in o&&null!==(r=o.get(e,t))?r:e[t]},propHooks:{tabIndex:{get:function(e){var t=E.find.attr(e,"tabindex");return t?parseInt(t,10):bt.test(e.nodeName)||gt.test(e.nodeName)&&e.href?0:-1}}},propFix:{for:"htmlFor",class:"className"}}),y.optSelected||(E.propHooks.selected={get:function(e){var t=e.parentNode;return t&&t.parentNode&&t.parentNode.selectedIndex,null},set:function(e){var t=e.parentNode;t&&(t.selectedIndex,t.parentNode&&t.parentNode.selectedIndex)}}),E.each(["tabIndex","readOnly","maxLength","cellSpacing","cellPadding","rowSpan","colSpan","useMap","frameBorder","contentEditable"],(function(){E.propFix[this.toLowerCase()]=this})),E.fn.extend({addClass:function(e){var t,n,r,o,i,a,s,l=0;if(b(e))return this.each((function(t){E(this).addClass(e.call(this,t,wt(this)))}));if((t=xt(e)).length)for(;n=this[l++];)if(o=wt(n),r=1===n.nodeType&&" "+_t(o)+" "){for(a=0;i=t[a++];)r.indexOf(" "+i+" ")<0&&(r+=i+" ");o!==(s=_t(r))&&n.setAttribute("class",s)}return this},removeClass:function(e){var t,n,r,o,i,a,s,l=0;if(b(e))return this.each((function(t){E(this).removeClass(e.call(this,t,wt(this)))}));if(!arguments.length)return this.attr("class","");if((t=xt(e)).length)for(;n=this[l++];)if(o=wt(n),r=1===n.nodeType&&" "+_t(o)+" "){for(a=0;i=t[a++];)for(;r.indexOf(" "+i+" ")>-1;)r=r.replace(" "+i+" "," ");o!==(s=_t(r))&&n.setAttribute("class",s)}return this},toggleClass:function(e,t){var n=typeof e,r="string"===n||Array.isArray(e);return"boolean"==typeof t&&r?t?this.addClass(e):this.removeClass(e):b(e)?this.each((function(n){E(this).toggleClass(e.call(this,n,wt(this),t),t)})):this.each((function(){var t,o,i,a;if(r)for(o=0,i=E(this),a=xt(e);t=a[o++];)i.hasClass(t)?i.removeClass(t):i.addClass(t);else void 0!==e&&"boolean"!==n||((t=wt(this))&&J.set(this,"__className__",t),this.setAttribute&&this.setAttribute("class",t||!1===e?"":J.get(this,"__className__")||""))}))},hasClass:function(e){var t,n,r=0;for(t=" "+e+" ";n=this[r++];)if(1===n.nodeType&&(" "+_t(wt(n))+" ").indexOf(t)>-1)return!0;return!1}});var Et=/\r/g;E.fn.extend({val:function(e){var t,n,r,o=this[0];return arguments.length?(r=b(e),this.each((function(n){var o;1===this.nodeType&&(null==(o=r?e.call(this,n,E(this).val()):e)?o="":"number"==typeof o?o+="":Array.isArray(o)&&(o=E.map(o,(function(e){return null==e?"":e+""}))),(t=E.valHooks[this.type]||E.valHooks[this.nodeName.toLowerCase()])&&"set"in t&&void 0!==t.set(this,o,"value")||(this.value=o))}))):o?(t=E.valHooks[o.type]||E.valHooks[o.nodeName.toLowerCase()])&&"get"in t&&void 0!==(n=t.get(o,"value"))?n:"string"==typeof(n=o.value)?n.replace(Et,""):null==n?"":n:void 0}}),E.extend({valHooks:{option:{get:function(e){var t=E.find.attr(e,"value");return null!=t?t:_t(E.text(e))}},select:{get:function(e){var t,n,r,o=e.options,i=e.selectedIndex,a="select-one"===e.type,s=a?null:[],l=a?i+1:o.length;for(r=i<0?l:a?i:0;r<l;r++)if(((n=o[r]).selected||r===i)&&!n.disabled&&(!n.parentNode.disabled||!L(n.parentNode,"optgroup"))){if(t=E(n).val(),a)return t;s.push(t)}return s},set:function(e,t){for(var n,r,o=e.options,i=E.makeArray(t),a=o.length;a--;)((r=o[a]).selected=E.inArray(E.valHooks.option.get(r),i)>-1)&&(n=!0);return n||(e.selectedIndex=-1),i}}}}),E.each(["radio","checkbox"],(function(){E.valHooks[this]={set:function(e,t){if(Array.isArray(t))return e.checked=E.inArray(E(e).val(),t)>-1}},y.checkOn||(E.valHooks[this].get=function(e){return null===e.getAttribute("value")?"on":e.value})})),y.focusin="onfocusin"in n;var kt=/^(?:focusinfocus|focusoutblur)$/,jt=function(e){e.stopPropagation()};E.extend(E.event,{trigger:function(e,t,r,o){var i,s,l,c,u,f,d,p,m=[r||a],v=h.call(e,"type")?e.type:e,y=h.call(e,"namespace")?e.namespace.split("."):[];if(s=p=l=r=r||a,3!==r.nodeType&&8!==r.nodeType&&!kt.test(v+E.event.triggered)&&(v.indexOf(".")>-1&&(y=v.split("."),v=y.shift(),y.sort()),u=v.indexOf(":")<0&&"on"+v,(e=e[E.expando]?e:new E.Event(v,"object"==typeof e&&e)).isTrigger=o?2:3,e.namespace=y.join("."),e.rnamespace=e.namespace?new RegExp("(^|\\.)"+y.join("\\.(?:.*\\.|)")+"(\\.|$)"):null,e.result=void 0,e.target||(e.target=r),t=null==t?[e]:E.makeArray(t,[e]),d=E.event.special[v]||{},o||!d.trigger||!1!==d.trigger.apply(r,t))){if(!o&&!d.noBubble&&!g(r)){for(c=d.delegateType||v,kt.test(c+v)||(s=s.parentNode);s;s=s.parentNode)m.push(s),l=s;l===(r.ownerDocument||a)&&m.push(l.defaultView||l.parentWindow||n)}for(i=0;(s=m[i++])&&!e.isPropagationStopped();)p=s,e.type=i>1?c:d.bindType||v,(f=(J.get(s,"events")||{})[e.type]&&J.get(s,"handle"))&&f.apply(s,t),(f=u&&s[u])&&f.apply&&K(s)&&(e.result=f.apply(s,t),!1===e.result&&e.preventDefault());return e.type=v,o||e.isDefaultPrevented()||d._default&&!1!==d._default.apply(m.pop(),t)||!K(r)||u&&b(r[v])&&!g(r)&&((l=r[u])&&(r[u]=null),E.event.triggered=v,e.isPropagationStopped()&&p.addEventListener(v,jt),r[v](),e.isPropagationStopped()&&p.removeEventListener(v,jt),E.event.triggered=void 0,l&&(r[u]=l)),e.result}},simulate:function(e,t,n){var r=E.extend(new E.Event,n,{type:e,isSimulated:!0});E.event.trigger(r,null,t)}}),E.fn.extend({trigger:function(e,t){return this.each((function(){E.event.trigger(e,t,this)}))},triggerHandler:function(e,t){var n=this[0];if(n)return E.event.trigger(e,t,n,!0)}}),y.focusin||E.each({focus:"focusin",blur:"focusout"},(function(e,t){var n=function(e){E.event.simulate(t,e.target,E.event.fix(e))};E.event.special[t]={setup:function(){var r=this.ownerDocument||this,o=J.access(r,t);o||r.addEventListener(e,n,!0),J.access(r,t,(o||0)+1)},teardown:function(){var r=this.ownerDocument||this,o=J.access(r,t)-1;o?J.access(r,t,o):(r.removeEventListener(e,n,!0),J.remove(r,t))}}}));var Tt=n.location,Ot=Date.now(),Ct=/\?/;E.parseXML=function(e){var t;if(!e||"string"!=typeof e)return null;try{t=(new n.DOMParser).parseFromString(e,"text/xml")}catch(e){t=void 0}return t&&!t.getElementsByTagName("parsererror").length||E.error("Invalid XML: "+e),t};var St=/\[\]$/,Lt=/\r?\n/g,Pt=/^(?:submit|button|image|reset|file)$/i,Nt=/^(?:input|select|textarea|keygen)/i;function At(e,t,n,r){var o;if(Array.isArray(t))E.each(t,(function(t,o){n||St.test(e)?r(e,o):At(e+"["+("object"==typeof o&&null!=o?t:"")+"]",o,n,r)}));else if(n||"object"!==x(t))r(e,t);else for(o in t)At(e+"["+o+"]",t[o],n,r)}E.param=function(e,t){var n,r=[],o=function(e,t){var n=b(t)?t():t;r[r.length]=encodeURIComponent(e)+"="+encodeURIComponent(null==n?"":n)};if(null==e)return"";if(Array.isArray(e)||e.jquery&&!E.isPlainObject(e))E.each(e,(function(){o(this.name,this.value)}));else for(n in e)At(n,e[n],t,o);return r.join("&")},E.fn.extend({serialize:function(){return E.param(this.serializeArray())},serializeArray:function(){return this.map((function(){var e=E.prop(this,"elements");return e?E.makeArray(e):this})).filter((function(){var e=this.type;return this.name&&!E(this).is(":disabled")&&Nt.test(this.nodeName)&&!Pt.test(e)&&(this.checked||!me.test(e))})).map((function(e,t){var n=E(this).val();return null==n?null:Array.isArray(n)?E.map(n,(function(e){return{name:t.name,value:e.replace(Lt,"\r\n")}})):{name:t.name,value:n.replace(Lt,"\r\n")}})).get()}});var Mt=/%20/g,Dt=/#.*$/,Ht=/([?&])_=[^&]*/,Rt=/^(.*?):[ \t]*([^\r\n]*)$/gm,It=/^(?:GET|HEAD)$/,Ft=/^\/\//,zt={},Gt={},Ut="*/".concat("*"),Bt=a.createElement("a");function Wt(e){return function(t,n){"string"!=typeof t&&(n=t,t="*");var r,o=0,i=t.toLowerCase().match(I)||[];if(b(n))for(;r=i[o++];)"+"===r[0]?(r=r.slice(1)||"*",(e[r]=e[r]||[]).unshift(n)):(e[r]=e[r]||[]).push(n)}}function qt(e,t,n,r){var o={},i=e===Gt;function a(s){var l;return o[s]=!0,E.each(e[s]||[],(function(e,s){var c=s(t,n,r);return"string"!=typeof c||i||o[c]?i?!(l=c):void 0:(t.dataTypes.unshift(c),a(c),!1)})),l}return a(t.dataTypes[0])||!o["*"]&&a("*")}function Vt(e,t){var n,r,o=E.ajaxSettings.flatOptions||{};for(n in t)void 0!==t[n]&&((o[n]?e:r||(r={}))[n]=t[n]);return r&&E.extend(!0,e,r),e}Bt.href=Tt.href,E.extend({active:0,lastModified:{},etag:{},ajaxSettings:{url:Tt.href,type:"GET",isLocal:/^(?:about|app|app-storage|.+-extension|file|res|widget):$/.test(Tt.protocol),global:!0,processData:!0,async:!0,contentType:"application/x-www-form-urlencoded; charset=UTF-8",accepts:{"*":Ut,text:"text/plain",html:"text/html",xml:"application/xml, text/xml",json:"application/json, text/javascript"},contents:{xml:/\bxml\b/,html:/\bhtml/,json:/\bjson\b/},responseFields:{xml:"responseXML",text:"responseText",json:"responseJSON"},converters:{"* text":String,"text html":!0,"text json":JSON.parse,"text xml":E.parseXML},flatOptions:{url:!0,context:!0}},ajaxSetup:function(e,t){return t?Vt(Vt(e,E.ajaxSettings),t):Vt(E.ajaxSettings,e)},ajaxPrefilter:Wt(zt),ajaxTransport:Wt(Gt),ajax:function(e,t){"object"==typeof e&&(t=e,e=void 0),t=t||{};var r,o,i,s,l,c,u,f,d,p,h=E.ajaxSetup({},t),m=h.context||h,v=h.context&&(m.nodeType||m.jquery)?E(m):E.event,y=E.Deferred(),b=E.Callbacks("once memory"),g=h.statusCode||{},_={},w={},x="canceled",k={readyState:0,getResponseHeader:function(e){var t;if(u){if(!s)for(s={};t=Rt.exec(i);)s[t[1].toLowerCase()+" "]=(s[t[1].toLowerCase()+" "]||[]).concat(t[2]);t=s[e.toLowerCase()+" "]}return null==t?null:t.join(", ")},getAllResponseHeaders:function(){return u?i:null},setRequestHeader:function(e,t){return null==u&&(e=w[e.toLowerCase()]=w[e.toLowerCase()]||e,_[e]=t),this},overrideMimeType:function(e){return null==u&&(h.mimeType=e),this},statusCode:function(e){var t;if(e)if(u)k.always(e[k.status]);else for(t in e)g[t]=[g[t],e[t]];return this},abort:function(e){var t=e||x;return r&&r.abort(t),j(0,t),this}};if(y.promise(k),h.url=((e||h.url||Tt.href)+"").replace(Ft,Tt.protocol+"//"),h.type=t.method||t.type||h.method||h.type,h.dataTypes=(h.dataType||"*").toLowerCase().match(I)||[""],null==h.crossDomain){c=a.createElement("a");try{c.href=h.url,c.href=c.href,h.crossDomain=Bt.protocol+"//"+Bt.host!=c.protocol+"//"+c.host}catch(e){h.crossDomain=!0}}if(h.data&&h.processData&&"string"!=typeof h.data&&(h.data=E.param(h.data,h.traditional)),qt(zt,h,t,k),u)return k;for(d in(f=E.event&&h.global)&&0==E.active++&&E.event.trigger("ajaxStart"),h.type=h.type.toUpperCase(),h.hasContent=!It.test(h.type),o=h.url.replace(Dt,""),h.hasContent?h.data&&h.processData&&0===(h.contentType||"").indexOf("application/x-www-form-urlencoded")&&(h.data=h.data.replace(Mt,"+")):(p=h.url.slice(o.length),h.data&&(h.processData||"string"==typeof h.data)&&(o+=(Ct.test(o)?"&":"?")+h.data,delete h.data),!1===h.cache&&(o=o.replace(Ht,"$1"),p=(Ct.test(o)?"&":"?")+"_="+Ot+++p),h.url=o+p),h.ifModified&&(E.lastModified[o]&&k.setRequestHeader("If-Modified-Since",E.lastModified[o]),E.etag[o]&&k.setRequestHeader("If-None-Match",E.etag[o])),(h.data&&h.hasContent&&!1!==h.contentType||t.contentType)&&k.setRequestHeader("Content-Type",h.contentType),k.setRequestHeader("Accept",h.dataTypes[0]&&h.accepts[h.dataTypes[0]]?h.accepts[h.dataTypes[0]]+("*"!==h.dataTypes[0]?", "+Ut+"; q=0.01":""):h.accepts["*"]),h.headers)k.setRequestHeader(d,h.headers[d]);if(h.beforeSend&&(!1===h.beforeSend.call(m,k,h)||u))return k.abort();if(x="abort",b.add(h.complete),k.done(h.success),k.fail(h.error),r=qt(Gt,h,t,k)){if(k.readyState=1,f&&v.trigger("ajaxSend",[k,h]),u)return k;h.async&&h.timeout>0&&(l=n.setTimeout((function(){k.abort("timeout")}),h.timeout));try{u=!1,r.send(_,j)}catch(e){if(u)throw e;j(-1,e)}}else j(-1,"No Transport");function j(e,t,a,s){var c,d,p,_,w,x=t;u||(u=!0,l&&n.clearTimeout(l),r=void 0,i=s||"",k.readyState=e>0?4:0,c=e>=200&&e<300||304===e,a&&(_=function(e,t,n){for(var r,o,i,a,s=e.contents,l=e.dataTypes;"*"===l[0];)l.shift(),void 0===r&&(r=e.mimeType||t.getResponseHeader("Content-Type"));if(r)for(o in s)if(s[o]&&s[o].test(r)){l.unshift(o);break}if(l[0]in n)i=l[0];else{for(o in n){if(!l[0]||e.converters[o+" "+l[0]]){i=o;break}a||(a=o)}i=i||a}if(i)return i!==l[0]&&l.unshift(i),n[i]}(h,k,a)),_=function(e,t,n,r){var o,i,a,s,l,c={},u=e.dataTypes.slice();if(u[1])for(a in e.converters)c[a.toLowerCase()]=e.converters[a];for(i=u.shift();i;)if(e.responseFields[i]&&(n[e.responseFields[i]]=t),!l&&r&&e.dataFilter&&(t=e.dataFilter(t,e.dataType)),l=i,i=u.shift())if("*"===i)i=l;else if("*"!==l&&l!==i){if(!(a=c[l+" "+i]||c["* "+i]))for(o in c)if((s=o.split(" "))[1]===i&&(a=c[l+" "+s[0]]||c["* "+s[0]])){!0===a?a=c[o]:!0!==c[o]&&(i=s[0],u.unshift(s[1]));break}if(!0!==a)if(a&&e.throws)t=a(t);else try{t=a(t)}catch(e){return{state:"parsererror",error:a?e:"No conversion from "+l+" to "+i}}}return{state:"success",data:t}}(h,_,k,c),c?(h.ifModified&&((w=k.getResponseHeader("Last-Modified"))&&(E.lastModified[o]=w),(w=k.getResponseHeader("etag"))&&(E.etag[o]=w)),204===e||"HEAD"===h.type?x="nocontent":304===e?x="notmodified":(x=_.state,d=_.data,c=!(p=_.error))):(p=x,!e&&x||(x="error",e<0&&(e=0))),k.status=e,k.statusText=(t||x)+"",c?y.resolveWith(m,[d,x,k]):y.rejectWith(m,[k,x,p]),k.statusCode(g),g=void 0,f&&v.trigger(c?"ajaxSuccess":"ajaxError",[k,h,c?d:p]),b.fireWith(m,[k,x]),f&&(v.trigger("ajaxComplete",[k,h]),--E.active||E.event.trigger("ajaxStop")))}return k},getJSON:function(e,t,n){return E.get(e,t,n,"json")},getScript:function(e,t){return E.get(e,void 0,t,"script")}}),E.each(["get","post"],(function(e,t){E[t]=function(e,n,r,o){return b(n)&&(o=o||r,r=n,n=void 0),E.ajax(E.extend({url:e,type:t,dataType:o,data:n,success:r},E.isPlainObject(e)&&e))}})),E._evalUrl=function(e,t){return E.ajax({url:e,type:"GET",dataType:"script",cache:!0,async:!1,global:!1,converters:{"text script":function(){}},dataFilter:function(e){E.globalEval(e,t)}})},E.fn.extend({wrapAll:function(e){var t;return this[0]&&(b(e)&&(e=e.call(this[0])),t=E(e,this[0].ownerDocument).eq(0).clone(!0),this[0].parentNode&&t.insertBefore(this[0]),t.map((function(){for(var e=this;e.firstElementChild;)e=e.firstElementChild;return e})).append(this)),this},wrapInner:function(e){return b(e)?this.each((function(t){E(this).wrapInner(e.call(this,t))})):this.each((function(){var t=E(this),n=t.contents();n.length?n.wrapAll(e):t.append(e)}))},wrap:function(e){var t=b(e);return this.each((function(n){E(this).wrapAll(t?e.call(this,n):e)}))},unwrap:function(e){return this.parent(e).not("body").each((function(){E(this).replaceWith(this.childNodes)})),this}}),E.expr.pseudos.hidden=function(e){return!E.expr.pseudos.visible(e)},E.expr.pseudos.visible=function(e){return!!(e.offsetWidth||e.offsetHeight||e.getClientRects().length)},E.ajaxSettings.xhr=function(){try{return new n.XMLHttpRequest}catch(e){}};var $t={0:200,1223:204},Xt=E.ajaxSettings.xhr();y.cors=!!Xt&&"withCredentials"in Xt,y.ajax=Xt=!!Xt,E.ajaxTransport((function(e){var t,r;if(y.cors||Xt&&!e.crossDomain)return{send:function(o,i){var a,s=e.xhr();if(s.open(e.type,e.url,e.async,e.username,e.password),e.xhrFields)for(a in e.xhrFields)s[a]=e.xhrFields[a];for(a in e.mimeType&&s.overrideMimeType&&s.overrideMimeType(e.mimeType),e.crossDomain||o["X-Requested-With"]||(o["X-Requested-With"]="XMLHttpRequest"),o)s.setRequestHeader(a,o[a]);t=function(e){return function(){t&&(t=r=s.onload=s.onerror=s.onabort=s.ontimeout=s.onreadystatechange=null,"abort"===e?s.abort():"error"===e?"number"!=typeof s.status?i(0,"error"):i(s.status,s.statusText):i($t[s.status]||s.status,s.statusText,"text"!==(s.responseType||"text")||"string"!=typeof s.responseText?{binary:s.response}:{text:s.responseText},s.getAllResponseHeaders()))}},s.onload=t(),r=s.onerror=s.ontimeout=t("error"),void 0!==s.onabort?s.onabort=r:s.onreadystatechange=function(){4===s.readyState&&n.setTimeout((function(){t&&r()}))},t=t("abort");try{s.send(e.hasContent&&e.data||null)}catch(e){if(t)throw e}},abort:function(){t&&t()}}})),E.ajaxPrefilter((function(e){e.crossDomain&&(e.contents.script=!1)})),E.ajaxSetup({accepts:{script:"text/javascript, application/javascript, application/ecmascript, application/x-ecmascript"},contents:{script:/\b(?:java|ecma)script\b/},converters:{"text script":function(e){return E.globalEval(e),e}}}),E.ajaxPrefilter("script",(function(e){void 0===e.cache&&(e.cache=!1),e.crossDomain&&(e.type="GET")})),E.ajaxTransport("script",(function(e){var t,n;if(e.crossDomain||e.scriptAttrs)return{send:function(r,o){t=E("<script>").attr(e.scriptAttrs||{}).prop({charset:e.scriptCharset,src:e.url}).on("load error",n=function(e){t.remove(),n=null,e&&o("error"===e.type?404:200,e.type)}),a.head.appendChild(t[0])},abort:function(){n&&n()}}}));var Yt,Kt=[],Qt=/(=)\?(?=&|$)|\?\?/;E.ajaxSetup({jsonp:"callback",jsonpCallback:function(){var e=Kt.pop()||E.expando+"_"+Ot++;return this[e]=!0,e}}),E.ajaxPrefilter("json jsonp",(function(e,t,r){var o,i,a,s=!1!==e.jsonp&&(Qt.test(e.url)?"url":"string"==typeof e.data&&0===(e.contentType||"").indexOf("application/x-www-form-urlencoded")&&Qt.test(e.data)&&"data");if(s||"jsonp"===e.dataTypes[0])return o=e.jsonpCallback=b(e.jsonpCallback)?e.jsonpCallback():e.jsonpCallback,s?e[s]=e[s].replace(Qt,"$1"+o):!1!==e.jsonp&&(e.url+=(Ct.test(e.url)?"&":"?")+e.jsonp+"="+o),e.converters["script json"]=function(){return a||E.error(o+" was not called"),a[0]},e.dataTypes[0]="json",i=n[o],n[o]=function(){a=arguments},r.always((function(){void 0===i?E(n).removeProp(o):n[o]=i,e[o]&&(e.jsonpCallback=t.jsonpCallback,Kt.push(o)),a&&b(i)&&i(a[0]),a=i=void 0})),"script"})),y.createHTMLDocument=((Yt=a.implementation.createHTMLDocument("").body).innerHTML="<form></form><form></form>",2===Yt.childNodes.length),E.parseHTML=function(e,t,n){return"string"!=typeof e?[]:("boolean"==typeof t&&(n=t,t=!1),t||(y.createHTMLDocument?((r=(t=a.implementation.createHTMLDocument("")).createElement("base")).href=a.location.href,t.head.appendChild(r)):t=a),i=!n&&[],(o=P.exec(e))?[t.createElement(o[1])]:(o=ke([e],t,i),i&&i.length&&E(i).remove(),E.merge([],o.childNodes)));var r,o,i},E.fn.load=function(e,t,n){var r,o,i,a=this,s=e.indexOf(" ");return s>-1&&(r=_t(e.slice(s)),e=e.slice(0,s)),b(t)?(n=t,t=void 0):t&&"object"==typeof t&&(o="POST"),a.length>0&&E.ajax({url:e,type:o||"GET",dataType:"html",data:t}).done((function(e){i=arguments,a.html(r?E("<div>").append(E.parseHTML(e)).find(r):e)})).always(n&&function(e,t){a.each((function(){n.apply(this,i||[e.responseText,t,e])}))}),this},E.each(["ajaxStart","ajaxStop","ajaxComplete","ajaxError","ajaxSuccess","ajaxSend"],(function(e,t){E.fn[t]=function(e){return this.on(t,e)}})),E.expr.pseudos.animated=function(e){return E.grep(E.timers,(function(t){return e===t.elem})).length},E.offset={setOffset:function(e,t,n){var r,o,i,a,s,l,c=E.css(e,"position"),u=E(e),f={};"static"===c&&(e.style.position="relative"),s=u.offset(),i=E.css(e,"top"),l=E.css(e,"left"),("absolute"===c||"fixed"===c)&&(i+l).indexOf("auto")>-1?(a=(r=u.position()).top,o=r.left):(a=parseFloat(i)||0,o=parseFloat(l)||0),b(t)&&(t=t.call(e,n,E.extend({},s))),null!=t.top&&(f.top=t.top-s.top+a),null!=t.left&&(f.left=t.left-s.left+o),"using"in t?t.using.call(e,f):u.css(f)}},E.fn.extend({offset:function(e){if(arguments.length)return void 0===e?this:this.each((function(t){E.offset.setOffset(this,e,t)}));var t,n,r=this[0];return r?r.getClientRects().length?(t=r.getBoundingClientRect(),n=r.ownerDocument.defaultView,{top:t.top+n.pageYOffset,left:t.left+n.pageXOffset}):{top:0,left:0}:void 0},position:function(){if(this[0]){var e,t,n,r=this[0],o={top:0,left:0};if("fixed"===E.css(r,"position"))t=r.getBoundingClientRect();else{for(t=this.offset(),n=r.ownerDocument,e=r.offsetParent||n.documentElement;e&&(e===n.body||e===n.documentElement)&&"static"===E.css(e,"position");)e=e.parentNode;e&&e!==r&&1===e.nodeType&&((o=E(e).offset()).top+=E.css(e,"borderTopWidth",!0),o.left+=E.css(e,"borderLeftWidth",!0))}return{top:t.top-o.top-E.css(r,"marginTop",!0),left:t.left-o.left-E.css(r,"marginLeft",!0)}}},offsetParent:function(){return this.map((function(){for(var e=this.offsetParent;e&&"static"===E.css(e,"position");)e=e.offsetParent;return e||ae}))}}),E.each({scrollLeft:"pageXOffset",scrollTop:"pageYOffset"},(function(e,t){var n="pageYOffset"===t;E.fn[e]=function(r){return q(this,(function(e,r,o){var i;if(g(e)?i=e:9===e.nodeType&&(i=e.defaultView),void 0===o)return i?i[t]:e[r];i?i.scrollTo(n?i.pageXOffset:o,n?o:i.pageYOffset):e[r]=o}),e,r,arguments.length)}})),E.each(["top","left"],(function(e,t){E.cssHooks[t]=Xe(y.pixelPosition,(function(e,n){if(n)return n=$e(e,t),We.test(n)?E(e).position()[t]+"px":n}))})),E.each({Height:"height",Width:"width"},(function(e,t){E.each({padding:"inner"+e,content:t,"":"outer"+e},(function(n,r){E.fn[r]=function(o,i){var a=arguments.length&&(n||"boolean"!=typeof o),s=n||(!0===o||!0===i?"margin":"border");return q(this,(function(t,n,o){var i;return g(t)?0===r.indexOf("outer")?t["inner"+e]:t.document.documentElement["client"+e]:9===t.nodeType?(i=t.documentElement,Math.max(t.body["scroll"+e],i["scroll"+e],t.body["offset"+e],i["offset"+e],i["client"+e])):void 0===o?E.css(t,n,s):E.style(t,n,o,s)}),t,a?o:void 0,a)}}))})),E.each("blur focus focusin focusout resize scroll click dblclick mousedown mouseup mousemove mouseover mouseout mouseenter mouseleave change select submit keydown keypress keyup contextmenu".split(" "),(function(e,t){E.fn[t]=function(e,n){return arguments.length>0?this.on(t,null,e,n):this.trigger(t)}})),E.fn.extend({hover:function(e,t){return this.mouseenter(e).mouseleave(t||e)}}),E.fn.extend({bind:function(e,t,n){return this.on(e,null,t,n)},unbind:function(e,t){return this.off(e,null,t)},delegate:function(e,t,n,r){return this.on(t,e,n,r)},undelegate:function(e,t,n){return 1===arguments.length?this.off(e,"**"):this.off(t,e||"**",n)}}),E.proxy=function(e,t){var n,r,o;if("string"==typeof t&&(n=e[t],t=e,e=n),b(e))return r=l.call(arguments,2),(o=function(){return e.apply(t||this,r.concat(l.call(arguments)))}).guid=e.guid=e.guid||E.guid++,o},E.holdReady=function(e){e?E.readyWait++:E.ready(!0)},E.isArray=Array.isArray,E.parseJSON=JSON.parse,E.nodeName=L,E.isFunction=b,E.isWindow=g,E.camelCase=Y,E.type=x,E.now=Date.now,E.isNumeric=function(e){var t=E.type(e);return("number"===t||"string"===t)&&!isNaN(e-parseFloat(e))},void 0===(r=function(){return E}.apply(t,[]))||(e.exports=r);var Jt=n.jQuery,Zt=n.$;return E.noConflict=function(e){return n.$===E&&(n.$=Zt),e&&n.jQuery===E&&(n.jQuery=Jt),E},o||(n.jQuery=n.$=E),E})),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n="undefined"!=typeof __webpack_exports__?__webpack_exports__:t;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/jquery/dist/jquery.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/jquery/dist/jquery.js")}}()},function(e,t,n){"use strict";n.r(t);n(23);var r=n(0),o=n.n(r),i=n(3),a=n.n(i),s=n(1),l=n.n(s),c=o.a.createContext(null);!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/components/Context.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/components/Context.js")}}();var u=function(e){e()};!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/batch.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/batch.js")}}();var f={notify:function(){}};function d(){var e=u,t=[],n=[];return{clear:function(){n=null,t=null},notify:function(){var r=t=n;e((function(){for(var e=0;e<r.length;e++)r[e]()}))},get:function(){return n},subscribe:function(e){var r=!0;return n===t&&(n=t.slice()),n.push(e),function(){r&&null!==t&&(r=!1,n===t&&(n=t.slice()),n.splice(n.indexOf(e),1))}}}}var p=function(){function e(e,t){this.store=e,this.parentSub=t,this.unsubscribe=null,this.listeners=f,this.handleChangeWrapper=this.handleChangeWrapper.bind(this)}var t=e.prototype;return t.addNestedSub=function(e){return this.trySubscribe(),this.listeners.subscribe(e)},t.notifyNestedSubs=function(){this.listeners.notify()},t.handleChangeWrapper=function(){this.onStateChange&&this.onStateChange()},t.isSubscribed=function(){return Boolean(this.unsubscribe)},t.trySubscribe=function(){this.unsubscribe||(this.unsubscribe=this.parentSub?this.parentSub.addNestedSub(this.handleChangeWrapper):this.store.subscribe(this.handleChangeWrapper),this.listeners=d())},t.tryUnsubscribe=function(){this.unsubscribe&&(this.unsubscribe(),this.unsubscribe=null,this.listeners.clear(),this.listeners=f)},e}();function h(e){var t=e.store,n=e.context,i=e.children,a=Object(r.useMemo)((function(){var e=new p(t);return e.onStateChange=e.notifyNestedSubs,{store:t,subscription:e}}),[t]),s=Object(r.useMemo)((function(){return t.getState()}),[t]);Object(r.useEffect)((function(){var e=a.subscription;return e.trySubscribe(),s!==t.getState()&&e.notifyNestedSubs(),function(){e.tryUnsubscribe(),e.onStateChange=null}}),[a,s]);var l=n||c;return o.a.createElement(l.Provider,{value:a},i)}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/Subscription.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/Subscription.js")}}(),h.propTypes={store:l.a.shape({subscribe:l.a.func.isRequired,dispatch:l.a.func.isRequired,getState:l.a.func.isRequired}),context:l.a.object,children:l.a.any};var m=h;function v(){return(v=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e}).apply(this,arguments)}function y(e,t){if(null==e)return{};var n,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||(o[n]=e[n]);return o}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/components/Provider.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/components/Provider.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@babel/runtime/helpers/esm/extends.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@babel/runtime/helpers/esm/extends.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@babel/runtime/helpers/esm/objectWithoutPropertiesLoose.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@babel/runtime/helpers/esm/objectWithoutPropertiesLoose.js")}}();var b=n(11),g=n.n(b),_=n(5),w=n.n(_),x=n(9),E="undefined"!=typeof window&&void 0!==window.document&&void 0!==window.document.createElement?r.useLayoutEffect:r.useEffect;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/useIsomorphicLayoutEffect.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/useIsomorphicLayoutEffect.js")}}();var k=[],j=[null,null];function T(e,t){var n=e[1];return[t.payload,n+1]}var O=function(){return[null,0]};function C(e,t){void 0===t&&(t={});var n=t,i=n.getDisplayName,a=void 0===i?function(e){return"ConnectAdvanced("+e+")"}:i,s=n.methodName,l=void 0===s?"connectAdvanced":s,u=n.renderCountProp,f=void 0===u?void 0:u,d=n.shouldHandleStateChanges,h=void 0===d||d,m=n.storeKey,b=void 0===m?"store":m,_=n.withRef,C=void 0!==_&&_,S=n.forwardRef,L=void 0!==S&&S,P=n.context,N=void 0===P?c:P,A=y(n,["getDisplayName","methodName","renderCountProp","shouldHandleStateChanges","storeKey","withRef","forwardRef","context"]);w()(void 0===f,"renderCountProp is removed. render counting is built into the latest React Dev Tools profiling extension"),w()(!C,"withRef is removed. To access the wrapped instance, use a ref on the connected component");w()("store"===b,"storeKey has been removed and does not do anything. To use a custom Redux store for specific components, create a custom React context with React.createContext(), and pass the context object to React Redux's Provider and specific components like: <Provider context={MyContext}><ConnectedComponent context={MyContext} /></Provider>. You may also pass a {context : MyContext} option to connect");var M=N;return function(t){var n=t.displayName||t.name||"Component",i=a(n),s=v({},A,{getDisplayName:a,methodName:l,renderCountProp:f,shouldHandleStateChanges:h,storeKey:b,displayName:i,wrappedComponentName:n,WrappedComponent:t}),c=A.pure;var u=c?r.useMemo:function(e){return e()};function d(n){var a=Object(r.useMemo)((function(){var e=n.forwardedRef,t=y(n,["forwardedRef"]);return[n.context,e,t]}),[n]),l=a[0],c=a[1],f=a[2],d=Object(r.useMemo)((function(){return l&&l.Consumer&&Object(x.isContextConsumer)(o.a.createElement(l.Consumer,null))?l:M}),[l,M]),m=Object(r.useContext)(d),b=Boolean(n.store)&&Boolean(n.store.getState)&&Boolean(n.store.dispatch),g=Boolean(m)&&Boolean(m.store);w()(b||g,'Could not find "store" in the context of "'+i+'". Either wrap the root component in a <Provider>, or pass a custom React context provider to <Provider> and the corresponding React context consumer to '+i+" in connect options.");var _=b?n.store:m.store,C=Object(r.useMemo)((function(){return function(t){return e(t.dispatch,s)}(_)}),[_]),S=Object(r.useMemo)((function(){if(!h)return j;var e=new p(_,b?null:m.subscription),t=e.notifyNestedSubs.bind(e);return[e,t]}),[_,b,m]),L=S[0],P=S[1],N=Object(r.useMemo)((function(){return b?m:v({},m,{subscription:L})}),[b,m,L]),A=Object(r.useReducer)(T,k,O),D=A[0][0],H=A[1];if(D&&D.error)throw D.error;var R=Object(r.useRef)(),I=Object(r.useRef)(f),F=Object(r.useRef)(),z=Object(r.useRef)(!1),G=u((function(){return F.current&&f===I.current?F.current:C(_.getState(),f)}),[_,D,f]);E((function(){I.current=f,R.current=G,z.current=!1,F.current&&(F.current=null,P())})),E((function(){if(h){var e=!1,t=null,n=function(){if(!e){var n,r,o=_.getState();try{n=C(o,I.current)}catch(e){r=e,t=e}r||(t=null),n===R.current?z.current||P():(R.current=n,F.current=n,z.current=!0,H({type:"STORE_UPDATED",payload:{error:r}}))}};L.onStateChange=n,L.trySubscribe(),n();return function(){if(e=!0,L.tryUnsubscribe(),L.onStateChange=null,t)throw t}}}),[_,L,C]);var U=Object(r.useMemo)((function(){return o.a.createElement(t,v({},G,{ref:c}))}),[c,t,G]);return Object(r.useMemo)((function(){return h?o.a.createElement(d.Provider,{value:N},U):U}),[d,U,N])}var m=c?o.a.memo(d):d;if(m.WrappedComponent=t,m.displayName=i,L){var _=o.a.forwardRef((function(e,t){return o.a.createElement(m,v({},e,{forwardedRef:t}))}));return _.displayName=i,_.WrappedComponent=t,g()(_,t)}return g()(m,t)}}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/components/connectAdvanced.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/components/connectAdvanced.js")}}();var S=Object.prototype.hasOwnProperty;function L(e,t){return e===t?0!==e||0!==t||1/e==1/t:e!=e&&t!=t}function P(e,t){if(L(e,t))return!0;if("object"!=typeof e||null===e||"object"!=typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(var o=0;o<n.length;o++)if(!S.call(t,n[o])||!L(e[n[o]],t[n[o]]))return!1;return!0}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/shallowEqual.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/shallowEqual.js")}}();var N=n(12),A=function(){return Math.random().toString(36).substring(7).split("").join(".")},M={INIT:"@@redux/INIT"+A(),REPLACE:"@@redux/REPLACE"+A(),PROBE_UNKNOWN_ACTION:function(){return"@@redux/PROBE_UNKNOWN_ACTION"+A()}};function D(e){if("object"!=typeof e||null===e)return!1;for(var t=e;null!==Object.getPrototypeOf(t);)t=Object.getPrototypeOf(t);return Object.getPrototypeOf(e)===t}function H(e,t){var n=t&&t.type;return"Given "+(n&&'action "'+String(n)+'"'||"an action")+', reducer "'+e+'" returned undefined. To ignore an action, you must explicitly return the previous state. If you want this reducer to hold no value, you can return null instead of undefined.'}function R(e,t){return function(){return t(e.apply(this,arguments))}}function I(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function F(e,t){var n=Object.keys(e);return Object.getOwnPropertySymbols&&n.push.apply(n,Object.getOwnPropertySymbols(e)),t&&(n=n.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n}function z(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?F(n,!0).forEach((function(t){I(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):F(n).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function G(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return 0===t.length?function(e){return e}:1===t.length?t[0]:t.reduce((function(e,t){return function(){return e(t.apply(void 0,arguments))}}))}function U(e){return function(t,n){var r=e(t,n);function o(){return r}return o.dependsOnOwnProps=!1,o}}function B(e){return null!==e.dependsOnOwnProps&&void 0!==e.dependsOnOwnProps?Boolean(e.dependsOnOwnProps):1!==e.length}function W(e,t){return function(t,n){n.displayName;var r=function(e,t){return r.dependsOnOwnProps?r.mapToProps(e,t):r.mapToProps(e)};return r.dependsOnOwnProps=!0,r.mapToProps=function(t,n){r.mapToProps=e,r.dependsOnOwnProps=B(e);var o=r(t,n);return"function"==typeof o&&(r.mapToProps=o,r.dependsOnOwnProps=B(o),o=r(t,n)),o},r}}(function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/redux/es/redux.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/redux/es/redux.js")}})(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/isPlainObject.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/isPlainObject.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/warning.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/warning.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/verifyPlainObject.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/verifyPlainObject.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/wrapMapToProps.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/wrapMapToProps.js")}}();var q=[function(e){return"function"==typeof e?W(e):void 0},function(e){return e?void 0:U((function(e){return{dispatch:e}}))},function(e){return e&&"object"==typeof e?U((function(t){return function(e,t){if("function"==typeof e)return R(e,t);if("object"!=typeof e||null===e)throw new Error("bindActionCreators expected an object or a function, instead received "+(null===e?"null":typeof e)+'. Did you write "import ActionCreators from" instead of "import * as ActionCreators from"?');var n={};for(var r in e){var o=e[r];"function"==typeof o&&(n[r]=R(o,t))}return n}(e,t)})):void 0}];!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/mapDispatchToProps.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/mapDispatchToProps.js")}}();var V=[function(e){return"function"==typeof e?W(e):void 0},function(e){return e?void 0:U((function(){return{}}))}];function $(e,t,n){return v({},n,{},e,{},t)}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/mapStateToProps.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/mapStateToProps.js")}}();var X=[function(e){return"function"==typeof e?function(e){return function(t,n){n.displayName;var r,o=n.pure,i=n.areMergedPropsEqual,a=!1;return function(t,n,s){var l=e(t,n,s);return a?o&&i(l,r)||(r=l):(a=!0,r=l),r}}}(e):void 0},function(e){return e?void 0:function(){return $}}];function Y(e,t,n,r){return function(o,i){return n(e(o,i),t(r,i),i)}}function K(e,t,n,r,o){var i,a,s,l,c,u=o.areStatesEqual,f=o.areOwnPropsEqual,d=o.areStatePropsEqual,p=!1;function h(o,p){var h,m,v=!f(p,a),y=!u(o,i);return i=o,a=p,v&&y?(s=e(i,a),t.dependsOnOwnProps&&(l=t(r,a)),c=n(s,l,a)):v?(e.dependsOnOwnProps&&(s=e(i,a)),t.dependsOnOwnProps&&(l=t(r,a)),c=n(s,l,a)):y?(h=e(i,a),m=!d(h,s),s=h,m&&(c=n(s,l,a)),c):c}return function(o,u){return p?h(o,u):(s=e(i=o,a=u),l=t(r,a),c=n(s,l,a),p=!0,c)}}function Q(e,t){var n=t.initMapStateToProps,r=t.initMapDispatchToProps,o=t.initMergeProps,i=y(t,["initMapStateToProps","initMapDispatchToProps","initMergeProps"]),a=n(e,i),s=r(e,i),l=o(e,i);return(i.pure?K:Y)(a,s,l,e,i)}function J(e,t,n){for(var r=t.length-1;r>=0;r--){var o=t[r](e);if(o)return o}return function(t,r){throw new Error("Invalid value of type "+typeof e+" for "+n+" argument when connecting component "+r.wrappedComponentName+".")}}function Z(e,t){return e===t}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/mergeProps.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/mergeProps.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/verifySubselectors.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/verifySubselectors.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/selectorFactory.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/selectorFactory.js")}}();var ee,te,ne,re,oe,ie,ae,se,le,ce,ue,fe,de=(ne=(te=void 0===ee?{}:ee).connectHOC,re=void 0===ne?C:ne,oe=te.mapStateToPropsFactories,ie=void 0===oe?V:oe,ae=te.mapDispatchToPropsFactories,se=void 0===ae?q:ae,le=te.mergePropsFactories,ce=void 0===le?X:le,ue=te.selectorFactory,fe=void 0===ue?Q:ue,function(e,t,n,r){void 0===r&&(r={});var o=r,i=o.pure,a=void 0===i||i,s=o.areStatesEqual,l=void 0===s?Z:s,c=o.areOwnPropsEqual,u=void 0===c?P:c,f=o.areStatePropsEqual,d=void 0===f?P:f,p=o.areMergedPropsEqual,h=void 0===p?P:p,m=y(o,["pure","areStatesEqual","areOwnPropsEqual","areStatePropsEqual","areMergedPropsEqual"]),b=J(e,ie,"mapStateToProps"),g=J(t,se,"mapDispatchToProps"),_=J(n,ce,"mergeProps");return re(fe,v({methodName:"connect",getDisplayName:function(e){return"Connect("+e+")"},shouldHandleStateChanges:Boolean(e),initMapStateToProps:b,initMapDispatchToProps:g,initMergeProps:_,pure:a,areStatesEqual:l,areOwnPropsEqual:u,areStatePropsEqual:d,areMergedPropsEqual:h},m))});function pe(){var e=Object(r.useContext)(c);return w()(e,"could not find react-redux context value; please ensure the component is wrapped in a <Provider>"),e}function he(e){void 0===e&&(e=c);var t=e===c?pe:function(){return Object(r.useContext)(e)};return function(){return t().store}}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/connect.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/connect/connect.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/hooks/useReduxContext.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/hooks/useReduxContext.js")}}();var me=he();!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/hooks/useStore.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/hooks/useStore.js")}}();!function(e){void 0===e&&(e=c);var t=e===c?me:he(e)}();!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/hooks/useDispatch.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/hooks/useDispatch.js")}}();var ve=function(e,t){return e===t};var ye;!function(e){void 0===e&&(e=c);var t=e===c?pe:function(){return Object(r.useContext)(e)}}();function be(e){return function(t){var n=t.dispatch,r=t.getState;return function(t){return function(o){return"function"==typeof o?o(n,r,e):t(o)}}}}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/hooks/useSelector.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/hooks/useSelector.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/reactBatchedUpdates.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/utils/reactBatchedUpdates.js")}}(),ye=i.unstable_batchedUpdates,u=ye,function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/index.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-redux/es/index.js")}}();var ge=be();ge.withExtraArgument=be;var _e=ge;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/redux-thunk/es/index.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/redux-thunk/es/index.js")}}();var we=n(16),xe=n(22),Ee=n(13);function ke(e){return(ke="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function je(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Te(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{},r=Object.keys(n);"function"==typeof Object.getOwnPropertySymbols&&(r=r.concat(Object.getOwnPropertySymbols(n).filter((function(e){return Object.getOwnPropertyDescriptor(n,e).enumerable})))),r.forEach((function(t){je(e,t,n[t])}))}return e}function Oe(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||(o[n]=e[n]);return o}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function Ce(e){return function(e){if(Array.isArray(e)){for(var t=0,n=new Array(e.length);t<e.length;t++)n[t]=e[t];return n}}(e)||function(e){if(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e))return Array.from(e)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance")}()}function Se(e){return t=e,(t-=0)==t?e:(e=e.replace(/[\-_\s]+(.)?/g,(function(e,t){return t?t.toUpperCase():""}))).substr(0,1).toLowerCase()+e.substr(1);var t}function Le(e){return e.split(";").map((function(e){return e.trim()})).filter((function(e){return e})).reduce((function(e,t){var n,r=t.indexOf(":"),o=Se(t.slice(0,r)),i=t.slice(r+1).trim();return o.startsWith("webkit")?e[(n=o,n.charAt(0).toUpperCase()+n.slice(1))]=i:e[o]=i,e}),{})}var Pe=!1;try{Pe=!0}catch(e){}function Ne(e){return null===e?null:"object"===ke(e)&&e.prefix&&e.iconName?e:Array.isArray(e)&&2===e.length?{prefix:e[0],iconName:e[1]}:"string"==typeof e?{prefix:"fas",iconName:e}:void 0}function Ae(e,t){return Array.isArray(t)&&t.length>0||!Array.isArray(t)&&t?je({},e,t):{}}function Me(e){var t=e.icon,n=e.mask,r=e.symbol,o=e.className,i=e.title,a=Ne(t),s=Ae("classes",[].concat(Ce(function(e){var t,n=e.spin,r=e.pulse,o=e.fixedWidth,i=e.inverse,a=e.border,s=e.listItem,l=e.flip,c=e.size,u=e.rotation,f=e.pull,d=(je(t={"fa-spin":n,"fa-pulse":r,"fa-fw":o,"fa-inverse":i,"fa-border":a,"fa-li":s,"fa-flip-horizontal":"horizontal"===l||"both"===l,"fa-flip-vertical":"vertical"===l||"both"===l},"fa-".concat(c),null!=c),je(t,"fa-rotate-".concat(u),null!=u),je(t,"fa-pull-".concat(f),null!=f),je(t,"fa-swap-opacity",e.swapOpacity),t);return Object.keys(d).map((function(e){return d[e]?e:null})).filter((function(e){return e}))}(e)),Ce(o.split(" ")))),l=Ae("transform","string"==typeof e.transform?Ee.b.transform(e.transform):e.transform),c=Ae("mask",Ne(n)),u=Object(Ee.a)(a,Te({},s,l,c,{symbol:r,title:i}));if(!u)return function(){var e;!Pe&&console&&"function"==typeof console.error&&(e=console).error.apply(e,arguments)}("Could not find icon",a),null;var f=u.abstract,d={};return Object.keys(e).forEach((function(t){Me.defaultProps.hasOwnProperty(t)||(d[t]=e[t])})),De(f[0],d)}Me.displayName="FontAwesomeIcon",Me.propTypes={border:l.a.bool,className:l.a.string,mask:l.a.oneOfType([l.a.object,l.a.array,l.a.string]),fixedWidth:l.a.bool,inverse:l.a.bool,flip:l.a.oneOf(["horizontal","vertical","both"]),icon:l.a.oneOfType([l.a.object,l.a.array,l.a.string]),listItem:l.a.bool,pull:l.a.oneOf(["right","left"]),pulse:l.a.bool,rotation:l.a.oneOf([90,180,270]),size:l.a.oneOf(["lg","xs","sm","1x","2x","3x","4x","5x","6x","7x","8x","9x","10x"]),spin:l.a.bool,symbol:l.a.oneOfType([l.a.bool,l.a.string]),title:l.a.string,transform:l.a.oneOfType([l.a.string,l.a.object]),swapOpacity:l.a.bool},Me.defaultProps={border:!1,className:"",mask:null,fixedWidth:!1,inverse:!1,flip:null,icon:null,listItem:!1,pull:null,pulse:!1,rotation:null,size:null,spin:!1,symbol:!1,title:"",transform:null,swapOpacity:!1};var De=function e(t,n){var r=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};if("string"==typeof n)return n;var o=(n.children||[]).map((function(n){return e(t,n)})),i=Object.keys(n.attributes||{}).reduce((function(e,t){var r=n.attributes[t];switch(t){case"class":e.attrs.className=r,delete n.attributes.class;break;case"style":e.attrs.style=Le(r);break;default:0===t.indexOf("aria-")||0===t.indexOf("data-")?e.attrs[t.toLowerCase()]=r:e.attrs[Se(t)]=r}return e}),{attrs:{}}),a=r.style,s=void 0===a?{}:a,l=Oe(r,["style"]);return i.attrs.style=Te({},i.attrs.style,s),t.apply(void 0,[n.tag,Te({},i.attrs,l)].concat(Ce(o)))}.bind(null,o.a.createElement);!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@fortawesome/react-fontawesome/index.es.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@fortawesome/react-fontawesome/index.es.js")}}();var He=n(17);function Rk(){return Date.now().toString(36)+Math.random().toString(36).substring(2)}function Rp(e,t){var n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:1,r=function(o){return new Promise((function(e){return setTimeout(e,o)})).then((function(){return Rp(e,t,n+1)}))};return fetch(e,{method:"POST",mode:"cors",headers:{"Content-Type":"application/json"},body:t}).then((function(e){return 503===e.status&&n<5?r(1e3*parseInt(e.headers.get("Retry-After"))||1e3):e.json()}),(function(e){if(n<5)return r(1e3);throw e}))}function Re(e){return function(t,n){t(function(e){return{type:"SELECT_ACTION",action:e}}(e));var r=n();return Rp(window.constants.NEXT_STATE_URL,JSON.stringify({server_state_tuple:r.scenario_state.server_state_tuple,action:e,ui_state:r.ui_status,idempotency_key:Rk()})).then((function(e){return t({type:"UPDATE_STATE",new_state:e})})).catch(console.error)}}function Ie(e){return(Ie="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function Fe(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function ze(e){return(ze=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function Ge(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function Ue(e,t){return(Ue=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}var Be=function(e){function t(e){var n;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,t),(n=function(e,t){return!t||"object"!==Ie(t)&&"function"!=typeof t?Ge(e):t}(this,ze(t).call(this,e))).MAX_HEIGHT="600px",n.PLAY_TIMEOUT=500,n.loaded=n.loaded.bind(Ge(n)),n.ended=n.ended.bind(Ge(n)),n.videoRef=o.a.createRef(),n}var n,r,i;return function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&Ue(e,t)}(t,e),n=t,(r=[{key:"ended",value:function(){this.props.dispatch({type:"DISPLAY_STATE"})}},{key:"loaded",value:function(){var e=this;this.props.video_loaded||(this.props.dispatch({type:"PLAY_VIDEO"}),setTimeout((function(){e.videoRef.current.play()}),this.PLAY_TIMEOUT))}},{key:"render",value:function(){return o.a.createElement("div",{className:"row"},o.a.createElement("div",{className:"col"},o.a.createElement("div",{className:"view"},o.a.createElement("div",{className:"embed-responsive embed-responsive-4by3"+(!this.props.ax_selected_time&&this.props.video_loaded?" visible":" invisible"),style:{maxHeight:this.MAX_HEIGHT},key:this.props.video_loaded||!!this.props.ax_selected_time},o.a.createElement("video",{autoPlay:!1,muted:!0,className:"embed-responsive-item",key:this.props.video_link,onEnded:this.ended,onCanPlayThrough:this.loaded,ref:this.videoRef},o.a.createElement("source",{src:this.props.video_link}))),o.a.createElement("div",{className:"mask text-center"+(this.props.ax_selected_time||!this.props.video_loaded?"":" d-none")},o.a.createElement("h1",{className:"mb-5"},"Communicating with robot..."),o.a.createElement("p",{className:"text-primary"},o.a.createElement(Me,{icon:He.faSpinner,size:"9x",pulse:!0}))))))}}])&&Fe(n.prototype,r),i&&Fe(n,i),t}(o.a.Component),We=de((function(e,t){return{video_link:e.scenario_state.video_link,video_loaded:e.ui_status.video_loaded,ax_selected_time:e.ui_status.ax_selected_time}}))(Be);function qe(){return(qe=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e}).apply(this,arguments)}function Ve(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){if(!(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e)))return;var n=[],r=!0,o=!1,i=void 0;try{for(var a,s=e[Symbol.iterator]();!(r=(a=s.next()).done)&&(n.push(a.value),!t||n.length!==t);r=!0);}catch(e){o=!0,i=e}finally{try{r||null==s.return||s.return()}finally{if(o)throw i}}return n}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance")}()}function $e(e){return($e="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function Xe(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function Ye(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function Ke(e,t,n){return t&&Ye(e.prototype,t),n&&Ye(e,n),e}function Qe(e,t){return!t||"object"!==$e(t)&&"function"!=typeof t?function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e):t}function Je(e){return(Je=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function Ze(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&et(e,t)}function et(e,t){return(et=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}var tt=function(e){function t(e){var n;return Xe(this,t),(n=Qe(this,Je(t).call(this,e))).BLINKING_BELIEFS={"Arm status":["In Motion"]},n}return Ze(t,e),Ke(t,[{key:"render",value:function(){var e=this.props.value instanceof Array?"[ "+this.props.value.join(", ")+" ]":this.props.value;return this.BLINKING_BELIEFS[this.props.attr]&&this.BLINKING_BELIEFS[this.props.attr].includes(this.props.value)&&(e=o.a.createElement("span",{className:"blinking"},e)),o.a.createElement("tr",null,o.a.createElement("td",null,o.a.createElement("i",null,this.props.attr)),o.a.createElement("td",null,e))}}]),t}(o.a.Component),nt=function(e){function t(e){var n;return Xe(this,t),(n=Qe(this,Je(t).call(this,e))).SHOW_IN_VIDEO_ATTRS=["Arm status"],n}return Ze(t,e),Ke(t,[{key:"shouldShowAttr",value:function(e,t){return!(!e||!e.video_loaded)&&(!!e.video_playing&&this.SHOW_IN_VIDEO_ATTRS.includes(t))}},{key:"render",value:function(){var e=[],t=!0,n=!1,r=void 0;try{for(var i,a=this.props.beliefs.entries()[Symbol.iterator]();!(t=(i=a.next()).done);t=!0){var s=Ve(i.value,2),l=(s[0],s[1]);this.shouldShowAttr(this.props.video_status,l.attr)&&e.push(o.a.createElement(tt,qe({},l,{key:l.value})))}}catch(e){n=!0,r=e}finally{try{t||null==a.return||a.return()}finally{if(n)throw r}}return o.a.createElement("div",{className:"row"},o.a.createElement("div",{className:"col"}),o.a.createElement("div",{className:"col-9"},o.a.createElement("table",{className:"table-sm table table-borderless table-hover"},o.a.createElement("colgroup",null,o.a.createElement("col",{width:"35%"}),o.a.createElement("col",{width:"65%"})),o.a.createElement("tbody",null,e))))}}]),t}(o.a.Component),rt=de((function(e,t){return{video_status:{video_loaded:e.ui_status.video_loaded,video_playing:e.ui_status.video_playing},beliefs:e.scenario_state.robot_beliefs}}))(nt),ot=function(e){return o.a.createElement("div",{className:"row"},o.a.createElement("div",{className:"col"},o.a.createElement(We,null),o.a.createElement("div",{className:"my-3"}),o.a.createElement(rt,null)))},it=n(2),at=n.n(it),st=(n(35),n(18)),lt=n.n(st),ct=o.a.createContext({});ct.Consumer,ct.Provider;function ut(e,t){var n=Object(r.useContext)(ct);return e||n[t]||t}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ThemeProvider.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ThemeProvider.js")}}();var ft=o.a.forwardRef((function(e,t){var n=e.bsPrefix,r=e.placement,i=e.className,a=e.style,s=e.children,l=e.arrowProps,c=(e.scheduleUpdate,e.outOfBoundaries,y(e,["bsPrefix","placement","className","style","children","arrowProps","scheduleUpdate","outOfBoundaries"]));return n=ut(n,"tooltip"),o.a.createElement("div",v({ref:t,style:a,role:"tooltip","x-placement":r,className:at()(i,n,"bs-tooltip-"+r)},c),o.a.createElement("div",v({className:"arrow"},l)),o.a.createElement("div",{className:n+"-inner"},s))}));ft.defaultProps={placement:"right"},ft.displayName="Tooltip";var dt=ft;function pt(e,t){e.prototype=Object.create(t.prototype),e.prototype.constructor=e,e.__proto__=t}function ht(e,t){return e.contains?e.contains(t):e.compareDocumentPosition?e===t||!!(16&e.compareDocumentPosition(t)):void 0}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/Tooltip.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/Tooltip.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@babel/runtime/helpers/esm/inheritsLoose.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@babel/runtime/helpers/esm/inheritsLoose.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/contains.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/contains.js")}}();var mt=n(10),vt=n.n(mt),yt=n(7);function bt(){return Object(r.useState)(null)}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@restart/hooks/esm/useCallbackRef.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@restart/hooks/esm/useCallbackRef.js")}}();var gt=function(e){return e&&"function"!=typeof e?function(t){e.current=t}:e};var _t=function(e,t){return Object(r.useMemo)((function(){return function(e,t){var n=gt(e),r=gt(t);return function(e){n&&n(e),r&&r(e)}}(e,t)}),[e,t])};!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@restart/hooks/esm/useMergedRefs.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@restart/hooks/esm/useMergedRefs.js")}}();var wt={position:"absolute",top:"0",left:"0",opacity:"0",pointerEvents:"none"},xt={};!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/usePopper.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/usePopper.js")}}();var Et=!("undefined"==typeof window||!window.document||!window.document.createElement);!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/canUseDOM.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/canUseDOM.js")}}();var kt=!1,jt=!1;try{var Tt={get passive(){return kt=!0},get once(){return jt=kt=!0}};Et&&(window.addEventListener("test",Tt,Tt),window.removeEventListener("test",Tt,!0))}catch(e){}var Ot=function(e,t,n,r){if(r&&"boolean"!=typeof r&&!jt){var o=r.once,i=r.capture,a=n;!jt&&o&&(a=n.__once||function e(r){this.removeEventListener(t,e,i),n.call(this,r)},n.__once=a),e.addEventListener(t,a,kt?r:i)}e.addEventListener(t,n,r)};!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/addEventListener.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/addEventListener.js")}}();var Ct=function(e,t,n,r){var o=r&&"boolean"!=typeof r?r.capture:r;e.removeEventListener(t,n,o),n.__once&&e.removeEventListener(t,n.__once,o)};!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/removeEventListener.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/removeEventListener.js")}}();var St=function(e,t,n,r){return Ot(e,t,n,r),function(){Ct(e,t,n,r)}};!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/listen.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/listen.js")}}();var Lt=function(e){var t=Object(r.useRef)(e);return Object(r.useEffect)((function(){t.current=e}),[e]),t};function Pt(e){var t=Lt(e);return Object(r.useCallback)((function(){return t.current&&t.current.apply(t,arguments)}),[t])}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@restart/hooks/esm/useCommittedRef.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@restart/hooks/esm/useCommittedRef.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@restart/hooks/esm/useEventCallback.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@restart/hooks/esm/useEventCallback.js")}}();var Nt=function(){};var At=function(e,t,n){var o=void 0===n?{}:n,i=o.disabled,a=o.clickTrigger,s=void 0===a?"click":a,l=Object(r.useRef)(!1),c=t||Nt,u=Object(r.useCallback)((function(t){var n,r=e&&("current"in e?e.current:e);vt()(!!r,"RootClose captured a close event but does not have a ref to compare it to. useRootClose(), should be passed a ref that resolves to a DOM node"),l.current=!r||!!((n=t).metaKey||n.altKey||n.ctrlKey||n.shiftKey)||!function(e){return 0===e.button}(t)||ht(r,t.target)}),[e]),f=Pt((function(e){l.current||c(e)})),d=Pt((function(e){27===e.keyCode&&c(e)}));Object(r.useEffect)((function(){if(!i&&null!=e){var t=St(document,s,u,!0),n=St(document,s,f),r=St(document,"keyup",d),o=[];return"ontouchstart"in document.documentElement&&(o=[].slice.call(document.body.children).map((function(e){return St(e,"mousemove",Nt)}))),function(){t(),n(),r(),o.forEach((function(e){return e()}))}}}),[e,i,s,u,f,d])};function Mt(e){return e&&e.ownerDocument||document}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/useRootClose.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/useRootClose.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/ownerDocument.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/ownerDocument.js")}}();var Dt=function(e){if("undefined"!=typeof document)return null==e?Mt().body:("function"==typeof e&&(e=e()),e&&e.current&&(e=e.current),e&&e.nodeType?e:null)};function Ht(e,t){var n=Object(r.useState)((function(){return Dt(e)})),o=n[0],i=n[1];if(!o){var a=Dt(e);a&&i(a)}return Object(r.useEffect)((function(){t&&o&&t(o)}),[t,o]),Object(r.useEffect)((function(){var t=Dt(e);t!==o&&i(t)}),[e,o]),o}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/utils/useWaitForDOMRef.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/utils/useWaitForDOMRef.js")}}();var Rt=o.a.forwardRef((function(e,t){var n=e.flip,i=e.placement,s=e.containerPadding,l=e.popperConfig,c=void 0===l?{}:l,u=e.transition,f=bt(),d=f[0],p=f[1],h=bt(),m=h[0],b=h[1],g=_t(p,t),_=Ht(e.container),w=Ht(e.target),x=Object(r.useState)(!e.show),E=x[0],k=x[1],j=c.modifiers,T=void 0===j?{}:j,O=function(e,t,n){var o=void 0===n?{}:n,i=o.enabled,a=void 0===i||i,s=o.placement,l=void 0===s?"bottom":s,c=o.positionFixed,u=void 0!==c&&c,f=o.eventsEnabled,d=void 0===f||f,p=o.modifiers,h=void 0===p?{}:p,m=Object(r.useRef)(),y=!(!h.arrow||!h.arrow.element),b=Object(r.useCallback)((function(){m.current&&m.current.scheduleUpdate()}),[]),g=Object(r.useState)({placement:l,scheduleUpdate:b,outOfBoundaries:!1,styles:wt,arrowStyles:xt}),_=g[0],w=g[1];return Object(r.useEffect)((function(){b()}),[_.placement,b]),Object(r.useEffect)((function(){m.current&&(d?m.current.enableEventListeners():m.current.disableEventListeners())}),[d]),Object(r.useEffect)((function(){if(a&&null!=e&&null!=t){var n=h.arrow&&v({},h.arrow,{element:h.arrow.element});return m.current=new yt.a(e,t,{placement:l,positionFixed:u,modifiers:v({},h,{arrow:n,applyStyle:{enabled:!1},updateStateModifier:{enabled:!0,order:900,fn:function(e){w({scheduleUpdate:b,styles:v({position:e.offsets.popper.position},e.styles),arrowStyles:e.arrowStyles,outOfBoundaries:e.hide,placement:e.placement})}}})}),function(){null!==m.current&&(m.current.destroy(),m.current=null)}}}),[a,l,u,e,t,y]),_}(w,d,v({},c,{placement:i||"bottom",enableEvents:e.show,modifiers:v({},T,{preventOverflow:v({padding:s||5},T.preventOverflow),arrow:v({},T.arrow,{enabled:!!m,element:m}),flip:v({enabled:!!n},T.preventOverflow)})})),C=O.styles,S=O.arrowStyles,L=y(O,["styles","arrowStyles"]);e.show?E&&k(!1):e.transition||E||k(!0);var P=e.show||u&&!E;if(At(d,e.onHide,{disabled:!e.rootClose||e.rootCloseDisabled,clickTrigger:e.rootCloseEvent}),!P)return null;var N=e.children(v({},L,{show:e.show,props:{style:C,ref:g},arrowProps:{style:S,ref:b}}));if(u){var A=e.onExit,M=e.onExiting,D=e.onEnter,H=e.onEntering,R=e.onEntered;N=o.a.createElement(u,{in:e.show,appear:!0,onExit:A,onExiting:M,onExited:function(){k(!0),e.onExited&&e.onExited.apply(e,arguments)},onEnter:D,onEntering:H,onEntered:R},N)}return _?a.a.createPortal(N,_):null}));Rt.displayName="Overlay",Rt.propTypes={show:l.a.bool,placement:l.a.oneOf(yt.a.placements),target:l.a.any,container:l.a.any,flip:l.a.bool,children:l.a.func.isRequired,containerPadding:l.a.number,popperConfig:l.a.object,rootClose:l.a.bool,rootCloseEvent:l.a.oneOf(["click","mousedown"]),rootCloseDisabled:l.a.bool,onHide:function(e){var t=l.a.func;e.rootClose&&(t=t.isRequired);for(var n=arguments.length,r=new Array(n>1?n-1:0),o=1;o<n;o++)r[o-1]=arguments[o];return t.apply(void 0,[e].concat(r))},transition:l.a.elementType,onEnter:l.a.func,onEntering:l.a.func,onEntered:l.a.func,onExit:l.a.func,onExiting:l.a.func,onExited:l.a.func},Rt.defaultProps={containerPadding:5};var It=Rt;function Ft(e,t){return function(e){var t=Mt(e);return t&&t.defaultView||window}(e).getComputedStyle(e,t)}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/Overlay.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/Overlay.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/ownerWindow.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/ownerWindow.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/getComputedStyle.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/getComputedStyle.js")}}();var zt=/([A-Z])/g;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/hyphenate.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/hyphenate.js")}}();var Gt=/^ms-/;function Ut(e){return function(e){return e.replace(zt,"-$1").toLowerCase()}(e).replace(Gt,"-ms-")}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/hyphenateStyle.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/hyphenateStyle.js")}}();var Bt=/^((translate|rotate|scale)(X|Y|Z|3d)?|matrix(3d)?|perspective|skew(X|Y)?)$/i;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/isTransform.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/isTransform.js")}}();var Wt=function(e,t){var n="",r="";if("string"==typeof t)return e.style.getPropertyValue(Ut(t))||Ft(e).getPropertyValue(Ut(t));Object.keys(t).forEach((function(o){var i=t[o];i||0===i?!function(e){return!(!e||!Bt.test(e))}(o)?n+=Ut(o)+": "+i+";":r+=o+"("+i+") ":e.style.removeProperty(Ut(o))})),r&&(n+="transform: "+r+";"),e.style.cssText+=";"+n};!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/css.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/css.js")}}();var qt=Et&&"ontransitionend"in window;function Vt(e,t,n){void 0===n&&(n=5);var r=!1,o=setTimeout((function(){r||function(e){var t=document.createEvent("HTMLEvents");t.initEvent("transitionend",!0,!0),e.dispatchEvent(t)}(e)}),t+n),i=St(e,"transitionend",(function(){r=!0}),{once:!0});return function(){clearTimeout(o),i()}}var $t=function(e,t,n){return qt?(null==n&&(r=Wt(e,"transitionDuration")||"",o=-1===r.indexOf("ms")?1e3:1,n=parseFloat(r)*o||0),Vt(e,n),St(e,"transitionend",t)):Vt(e,0,0);var r,o};!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/transitionEnd.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/transitionEnd.js")}}();var Xt=!1;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-transition-group/esm/config.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-transition-group/esm/config.js")}}();var Yt=o.a.createContext(null);!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-transition-group/esm/TransitionGroupContext.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-transition-group/esm/TransitionGroupContext.js")}}();var Kt=function(e){function t(t,n){var r;r=e.call(this,t,n)||this;var o,i=n&&!n.isMounting?t.enter:t.appear;return r.appearStatus=null,t.in?i?(o="exited",r.appearStatus="entering"):o="entered":o=t.unmountOnExit||t.mountOnEnter?"unmounted":"exited",r.state={status:o},r.nextCallback=null,r}pt(t,e),t.getDerivedStateFromProps=function(e,t){return e.in&&"unmounted"===t.status?{status:"exited"}:null};var n=t.prototype;return n.componentDidMount=function(){this.updateStatus(!0,this.appearStatus)},n.componentDidUpdate=function(e){var t=null;if(e!==this.props){var n=this.state.status;this.props.in?"entering"!==n&&"entered"!==n&&(t="entering"):"entering"!==n&&"entered"!==n||(t="exiting")}this.updateStatus(!1,t)},n.componentWillUnmount=function(){this.cancelNextCallback()},n.getTimeouts=function(){var e,t,n,r=this.props.timeout;return e=t=n=r,null!=r&&"number"!=typeof r&&(e=r.exit,t=r.enter,n=void 0!==r.appear?r.appear:t),{exit:e,enter:t,appear:n}},n.updateStatus=function(e,t){if(void 0===e&&(e=!1),null!==t){this.cancelNextCallback();var n=a.a.findDOMNode(this);"entering"===t?this.performEnter(n,e):this.performExit(n)}else this.props.unmountOnExit&&"exited"===this.state.status&&this.setState({status:"unmounted"})},n.performEnter=function(e,t){var n=this,r=this.props.enter,o=this.context?this.context.isMounting:t,i=this.getTimeouts(),a=o?i.appear:i.enter;!t&&!r||Xt?this.safeSetState({status:"entered"},(function(){n.props.onEntered(e)})):(this.props.onEnter(e,o),this.safeSetState({status:"entering"},(function(){n.props.onEntering(e,o),n.onTransitionEnd(e,a,(function(){n.safeSetState({status:"entered"},(function(){n.props.onEntered(e,o)}))}))})))},n.performExit=function(e){var t=this,n=this.props.exit,r=this.getTimeouts();n&&!Xt?(this.props.onExit(e),this.safeSetState({status:"exiting"},(function(){t.props.onExiting(e),t.onTransitionEnd(e,r.exit,(function(){t.safeSetState({status:"exited"},(function(){t.props.onExited(e)}))}))}))):this.safeSetState({status:"exited"},(function(){t.props.onExited(e)}))},n.cancelNextCallback=function(){null!==this.nextCallback&&(this.nextCallback.cancel(),this.nextCallback=null)},n.safeSetState=function(e,t){t=this.setNextCallback(t),this.setState(e,t)},n.setNextCallback=function(e){var t=this,n=!0;return this.nextCallback=function(r){n&&(n=!1,t.nextCallback=null,e(r))},this.nextCallback.cancel=function(){n=!1},this.nextCallback},n.onTransitionEnd=function(e,t,n){this.setNextCallback(n);var r=null==t&&!this.props.addEndListener;e&&!r?(this.props.addEndListener&&this.props.addEndListener(e,this.nextCallback),null!=t&&setTimeout(this.nextCallback,t)):setTimeout(this.nextCallback,0)},n.render=function(){var e=this.state.status;if("unmounted"===e)return null;var t=this.props,n=t.children,r=y(t,["children"]);if(delete r.in,delete r.mountOnEnter,delete r.unmountOnExit,delete r.appear,delete r.enter,delete r.exit,delete r.timeout,delete r.addEndListener,delete r.onEnter,delete r.onEntering,delete r.onEntered,delete r.onExit,delete r.onExiting,delete r.onExited,"function"==typeof n)return o.a.createElement(Yt.Provider,{value:null},n(e,r));var i=o.a.Children.only(n);return(o.a.createElement(Yt.Provider,{value:null},o.a.cloneElement(i,r)))},t}(o.a.Component);function Qt(){}Kt.contextType=Yt,Kt.propTypes={},Kt.defaultProps={in:!1,mountOnEnter:!1,unmountOnExit:!1,appear:!1,enter:!0,exit:!0,onEnter:Qt,onEntering:Qt,onEntered:Qt,onExit:Qt,onExiting:Qt,onExited:Qt},Kt.UNMOUNTED=0,Kt.EXITED=1,Kt.ENTERING=2,Kt.ENTERED=3,Kt.EXITING=4;var Jt,Zt=Kt;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-transition-group/esm/Transition.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-transition-group/esm/Transition.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/triggerBrowserReflow.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/triggerBrowserReflow.js")}}();var en=((Jt={}).entering="show",Jt.entered="show",Jt),tn=o.a.forwardRef((function(e,t){var n=e.className,i=e.children,a=y(e,["className","children"]),s=Object(r.useCallback)((function(e){!function(e){e.offsetHeight}(e),a.onEnter&&a.onEnter(e)}),[a]);return o.a.createElement(Zt,v({ref:t,addEndListener:$t},a,{onEnter:s}),(function(e,t){return o.a.cloneElement(i,v({},t,{className:at()("fade",n,i.props.className,en[e])}))}))}));tn.defaultProps={in:!1,timeout:300,mountOnEnter:!1,unmountOnExit:!1,appear:!1},tn.displayName="Fade";var nn=tn;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/Fade.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/Fade.js")}}();var rn={transition:nn,rootClose:!1,show:!1,placement:"top"};function on(e){var t=e.children,n=e.transition,r=y(e,["children","transition"]);return n=!0===n?nn:n||null,o.a.createElement(It,v({},r,{transition:n}),(function(e){var r=e.props,a=e.arrowProps,s=e.show,l=y(e,["props","arrowProps","show"]);return function(e,t){var n=e.ref,r=t.ref;e.ref=n.__wrapped||(n.__wrapped=function(e){return n(Object(i.findDOMNode)(e))}),t.ref=r.__wrapped||(r.__wrapped=function(e){return r(Object(i.findDOMNode)(e))})}(r,a),"function"==typeof t?t(v({},l,{},r,{show:s,arrowProps:a})):o.a.cloneElement(t,v({},l,{},r,{arrowProps:a,className:at()(t.props.className,!n&&s&&"show"),style:v({},t.props.style,{},r.style)}))}))}on.defaultProps=rn;var an=on;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/Overlay.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/Overlay.js")}}();var sn=function(e){function t(){return e.apply(this,arguments)||this}return pt(t,e),t.prototype.render=function(){return this.props.children},t}(o.a.Component),ln=function(e){return e&&"object"==typeof e?e:{show:e,hide:e}},cn=function(e){function t(t,n){var r;return(r=e.call(this,t,n)||this).getTarget=function(){return a.a.findDOMNode(r.trigger.current)},r.handleShow=function(){clearTimeout(r._timeout),r._hoverState="show";var e=ln(r.props.delay);e.show?r._timeout=setTimeout((function(){"show"===r._hoverState&&r.show()}),e.show):r.show()},r.handleHide=function(){clearTimeout(r._timeout),r._hoverState="hide";var e=ln(r.props.delay);e.hide?r._timeout=setTimeout((function(){"hide"===r._hoverState&&r.hide()}),e.hide):r.hide()},r.handleFocus=function(e){var t=r.getChildProps().onFocus;r.handleShow(e),t&&t(e)},r.handleBlur=function(e){var t=r.getChildProps().onBlur;r.handleHide(e),t&&t(e)},r.handleClick=function(e){var t=r.getChildProps().onClick;r.state.show?r.hide():r.show(),t&&t(e)},r.handleMouseOver=function(e){r.handleMouseOverOut(r.handleShow,e,"fromElement")},r.handleMouseOut=function(e){return r.handleMouseOverOut(r.handleHide,e,"toElement")},r.trigger=o.a.createRef(),r.state={show:!!t.defaultShow},r.ariaModifier={enabled:!0,order:900,fn:function(e){var t=e.instance.popper,n=r.getTarget();if(!r.state.show||!n)return e;var o=t.getAttribute("role")||"";return t.id&&"tooltip"===o.toLowerCase()&&n.setAttribute("aria-describedby",t.id),e}},r}pt(t,e);var n=t.prototype;return n.componentWillUnmount=function(){clearTimeout(this._timeout)},n.getChildProps=function(){return o.a.Children.only(this.props.children).props},n.handleMouseOverOut=function(e,t,n){var r=t.currentTarget,o=t.relatedTarget||t.nativeEvent[n];o&&o===r||ht(r,o)||e(t)},n.hide=function(){this.setState({show:!1})},n.show=function(){this.setState({show:!0})},n.render=function(){var e=this.props,t=e.trigger,n=e.overlay,i=e.children,a=e.popperConfig,s=void 0===a?{}:a,l=y(e,["trigger","overlay","children","popperConfig"]);delete l.delay,delete l.defaultShow;var c=o.a.Children.only(i),u={},f=null==t?[]:[].concat(t);return-1!==f.indexOf("click")&&(u.onClick=this.handleClick),-1!==f.indexOf("focus")&&(u.onFocus=this.handleShow,u.onBlur=this.handleHide),-1!==f.indexOf("hover")&&(u.onMouseOver=this.handleMouseOver,u.onMouseOut=this.handleMouseOut),o.a.createElement(o.a.Fragment,null,o.a.createElement(sn,{ref:this.trigger},Object(r.cloneElement)(c,u)),o.a.createElement(an,v({},l,{popperConfig:v({},s,{modifiers:v({},s.modifiers,{ariaModifier:this.ariaModifier})}),show:this.state.show,onHide:this.handleHide,target:this.getTarget}),n))},t}(o.a.Component);cn.defaultProps={defaultOverlayShown:!1,trigger:["hover","focus"]};var un=cn;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/OverlayTrigger.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/OverlayTrigger.js")}}();var fn=n(4),dn=(de((function(e,t){return{video_loaded:e.ui_status.video_loaded,video_playing:e.ui_status.video_playing,suggestions:e.scenario_state.dx_suggestions}}))((function(e){if(!e.video_loaded||e.video_playing)return"";var t=e.suggestions.map((function(e){return o.a.createElement("li",{key:e},o.a.createElement("h5",null,window.constants.DIAGNOSES[e]))}));return o.a.createElement("div",{className:"row"},o.a.createElement("p",{className:"col"},o.a.createElement(un,{placement:"right",overlay:o.a.createElement(dt,null,"The problems that the robot thinks might be stopping it from reaching its goal")},o.a.createElement(Me,{icon:fn.faQuestionCircle}))," ",o.a.createElement("b",null,"Possible Problems")),o.a.createElement("div",{className:"col-9"},o.a.createElement("ul",{className:"list-unstyled"},t)))})),de((function(e,t){return{video_loaded:e.ui_status.video_loaded,video_playing:e.ui_status.video_playing,suggestions:e.scenario_state.ax_suggestions}}))((function(e){if(!e.video_loaded||e.video_playing)return"";var t=e.suggestions.map((function(e){return o.a.createElement("li",{key:e},o.a.createElement("h5",null,window.constants.ACTIONS[e]))}));return o.a.createElement("div",{className:"row"},o.a.createElement("p",{className:"col"},o.a.createElement(un,{placement:"right",overlay:o.a.createElement(dt,null,"Actions the robot thinks might help you gather more information about the problem, or help resolve it")},o.a.createElement(Me,{icon:fn.faQuestionCircle}))," ",o.a.createElement("b",null,"Recommended Actions")),o.a.createElement("div",{className:"col-9"},o.a.createElement("ul",{className:"list-unstyled"},t)))})),function(e){return o.a.createElement("div",{className:"row"},o.a.createElement("h5",{className:"col-2"},o.a.createElement("b",null,"Goal:")),o.a.createElement("h5",{className:"col"},"Pick up the Cup from the Kitchen Counter and take it to the Couch."))}),pn=n(20),hn=n(19);function mn(){return(mn=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e}).apply(this,arguments)}function vn(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){if(!(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e)))return;var n=[],r=!0,o=!1,i=void 0;try{for(var a,s=e[Symbol.iterator]();!(r=(a=s.next()).done)&&(n.push(a.value),!t||n.length!==t);r=!0);}catch(e){o=!0,i=e}finally{try{r||null==s.return||s.return()}finally{if(o)throw i}}return n}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance")}()}function yn(e){return(yn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function bn(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function gn(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function _n(e,t,n){return t&&gn(e.prototype,t),n&&gn(e,n),e}function wn(e,t){return!t||"object"!==yn(t)&&"function"!=typeof t?function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e):t}function xn(e){return(xn=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function En(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&kn(e,t)}function kn(e,t){return(kn=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}var jn=function(e){function t(){return bn(this,t),wn(this,xn(t).apply(this,arguments))}return En(t,e),_n(t,[{key:"render",value:function(){var e=this.props.error instanceof Array?this.props.error.map((function(e){return o.a.createElement("span",{key:e},window.constants.DIAGNOSES[e],o.a.createElement("br",null))})):window.constants.DIAGNOSES[this.props.error],t=this.props.result?o.a.createElement("h3",{className:"text-success"},o.a.createElement(Me,{icon:hn.faCheckCircle})):o.a.createElement("h3",{className:"text-danger"},o.a.createElement(Me,{icon:pn.faTimesCircle}));return o.a.createElement("tr",null,o.a.createElement("th",{scope:"row"},this.props.idx),o.a.createElement("td",null,e),o.a.createElement("td",null,window.constants.ACTIONS[this.props.action]),o.a.createElement("td",null,t))}}]),t}(o.a.Component),Tn=function(e){function t(e){var n;return bn(this,t),(n=wn(this,xn(t).call(this,e))).MAX_HEIGHT="250px",n}return En(t,e),_n(t,[{key:"render",value:function(){var e=[],t=!0,n=!1,r=void 0;try{for(var i,a=this.props.history.slice().reverse().entries()[Symbol.iterator]();!(t=(i=a.next()).done);t=!0){var s=vn(i.value,2),l=s[0],c=s[1];e.push(o.a.createElement(jn,mn({key:this.props.history.length-l,idx:this.props.history.length-l},c)))}}catch(e){n=!0,r=e}finally{try{t||null==a.return||a.return()}finally{if(n)throw r}}return o.a.createElement("div",{className:"row overflow-auto",style:{maxHeight:this.MAX_HEIGHT}},o.a.createElement("div",{className:"col"},o.a.createElement("div",{className:"row"},o.a.createElement("p",{className:"col"},o.a.createElement(un,{placement:"right",overlay:o.a.createElement(dt,null,"The history of actions you have taken with the most-recent first. A red 'X' indicates that the action failed")},o.a.createElement(Me,{icon:fn.faQuestionCircle}))," ",o.a.createElement("b",null,"History"))),o.a.createElement("div",{className:"row"},o.a.createElement("div",{className:"col"},o.a.createElement("table",{className:"table-sm table text-center"+(e.length>0?"":" invisible")},o.a.createElement("colgroup",null,o.a.createElement("col",{width:"10%"}),o.a.createElement("col",{width:"40%"}),o.a.createElement("col",{width:"40%"}),o.a.createElement("col",{width:"10%"})),o.a.createElement("thead",{className:"thead-light"},o.a.createElement("tr",null,o.a.createElement("th",{scope:"col"},"#"),o.a.createElement("th",{scope:"col"},"Problems Identified"),o.a.createElement("th",{scope:"col"},"Action Taken"),o.a.createElement("th",{scope:"col"},"Result"))),o.a.createElement("tbody",null,e))))))}}]),t}(o.a.Component),On=de((function(e,t){return{history:e.history.history}}))(Tn),Cn=n(8);function Sn(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){if(!(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e)))return;var n=[],r=!0,o=!1,i=void 0;try{for(var a,s=e[Symbol.iterator]();!(r=(a=s.next()).done)&&(n.push(a.value),!t||n.length!==t);r=!0);}catch(e){o=!0,i=e}finally{try{r||null==s.return||s.return()}finally{if(o)throw i}}return n}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance")}()}function Ln(e){return(Ln="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function Pn(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function Nn(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function An(e,t,n){return t&&Nn(e.prototype,t),n&&Nn(e,n),e}function Mn(e,t){return!t||"object"!==Ln(t)&&"function"!=typeof t?Hn(e):t}function Dn(e){return(Dn=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function Hn(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function Rn(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&In(e,t)}function In(e,t){return(In=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}var Fn=function(e){function t(e){var n;return Pn(this,t),(n=Mn(this,Dn(t).call(this,e))).DEFAULT_BUTTON_COLOUR=" btn-outline-info",n.DISABLED_BUTTON_COLOUR=" btn-outline-secondary",n.select_action=n.select_action.bind(Hn(n)),n}return Rn(t,e),An(t,[{key:"select_action",value:function(e){this.props.dispatch(Re(this.props.value))}},{key:"render",value:function(){var e=!!this.props.show_suggestions&&!!this.props.suggested&&!this.props.disabled,t=this.DEFAULT_BUTTON_COLOUR,n=[];if(e){for(var r=0;r<this.props.suggested_imp;r++)n.push(o.a.createElement(Me,{icon:Cn.faStar,key:r}));n.push(o.a.createElement("br",{key:-1}))}return o.a.createElement("button",{className:"col btn"+t,style:{height:"100%",minHeight:"4rem"},onClick:this.select_action,disabled:this.props.disabled},o.a.createElement("span",{className:"lead",style:{pointerEvents:"none"}},n,window.constants.ACTIONS[this.props.value]))}}]),t}(o.a.Component),zn=function(e){function t(e){var n;Pn(this,t),(n=Mn(this,Dn(t).call(this,e))).BUTTONS_LAYOUT=[{name:"Update location belief",actions:window.constants.ACTIONS_ORDER.slice(0,3)},{name:"Navigate",actions:window.constants.ACTIONS_ORDER.slice(3,6)},{name:"",actions:window.constants.ACTIONS_ORDER.slice(6,8)},{name:"Look at",actions:window.constants.ACTIONS_ORDER.slice(8,11)},{name:"Pick",actions:window.constants.ACTIONS_ORDER.slice(11,14)},{name:"Place",actions:window.constants.ACTIONS_ORDER.slice(14,15)},{name:"Hardware & Drivers",actions:window.constants.ACTIONS_ORDER.slice(15,17)}],n.MAX_BUTTONS_PER_ROW=0;var r=!0,o=!1,i=void 0;try{for(var a,s=n.BUTTONS_LAYOUT.entries()[Symbol.iterator]();!(r=(a=s.next()).done);r=!0){var l=Sn(a.value,2),c=(l[0],l[1]);c.actions.length>n.MAX_BUTTONS_PER_ROW&&(n.MAX_BUTTONS_PER_ROW=c.actions.length)}}catch(e){o=!0,i=e}finally{try{r||null==s.return||s.return()}finally{if(o)throw i}}return n}return Rn(t,e),An(t,[{key:"render",value:function(){if(!this.props.video_loaded||this.props.video_playing||!this.props.dx_confirmed||!this.props.dx_certainty)return"";var e=[],t=!0,n=!1,r=void 0;try{for(var i,a=this.BUTTONS_LAYOUT.entries()[Symbol.iterator]();!(t=(i=a.next()).done);t=!0){var s=Sn(i.value,2),l=(s[0],s[1]),c=[],u=!0,f=!1,d=void 0;try{for(var p,h=l.actions.entries()[Symbol.iterator]();!(u=(p=h.next()).done);u=!0){var m=Sn(p.value,2),v=(m[0],m[1]),y=this.props.suggestions.includes(v),b=this.props.suggestions.indexOf(v),g=y?this.props.suggestions.length-b:0;c.push(o.a.createElement(Fn,{key:v,dispatch:this.props.dispatch,value:v,disabled:!!this.props.selected_action,show_suggestions:this.props.show_suggestions,suggested:y,suggested_idx:b,suggested_imp:g}))}}catch(e){f=!0,d=e}finally{try{u||null==h.return||h.return()}finally{if(f)throw d}}for(var _=c.length;_<this.MAX_BUTTONS_PER_ROW;_++)c.push(o.a.createElement("div",{className:"btn col invisible",key:_}));e.push(o.a.createElement("div",{className:"row my-1",key:l.name},o.a.createElement("div",{className:"col"},o.a.createElement("div",{className:"row"},o.a.createElement("p",{className:"col my-0"},o.a.createElement("small",null,l.name))),o.a.createElement("div",{className:"row"},o.a.createElement("div",{className:"col btn-group"},c)))))}}catch(e){n=!0,r=e}finally{try{t||null==a.return||a.return()}finally{if(n)throw r}}var w=this.props.show_suggestions?o.a.createElement("small",null,o.a.createElement("br",null),"The robot puts a star on the actions it thinks might help you gather more information about the problem, or help resolve it. ",o.a.createElement("b",null,"The more stars, the more certain the robot might be"),"."):"";return o.a.createElement("div",{className:"row"},o.a.createElement("div",{className:"col"},o.a.createElement("div",{className:"row"},o.a.createElement("p",{className:"col"},o.a.createElement(un,{placement:"right",overlay:o.a.createElement(dt,null,"Select the next action that the robot should take to eventually achieve its goal")},o.a.createElement(Me,{icon:fn.faQuestionCircle}))," ",o.a.createElement("b",null,"What action should the robot take to move towards its goal?"),w)),e))}}]),t}(o.a.Component),Gn=de((function(e,t){return{video_loaded:e.ui_status.video_loaded,video_playing:e.ui_status.video_playing,valid_actions:e.scenario_state.valid_actions,dx_confirmed:e.ui_status.confirmed_dx.length>0,dx_certainty:e.ui_status.dx_certainty,selected_action:e.ui_status.selected_action,suggestions:e.scenario_state.ax_suggestions,show_suggestions:!!window.constants.EXPERIMENT_CONDITION.show_ax_suggestions}}))(zn),Un=n(21),Bn=n.n(Un);function Wn(e){return(Wn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function qn(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function Vn(e){return(Vn=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function $n(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function Xn(e,t){return(Xn=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}var Yn=function(e){function t(e){var n;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,t),(n=function(e,t){return!t||"object"!==Wn(t)&&"function"!=typeof t?$n(e):t}(this,Vn(t).call(this,e))).MAX_VALUE=5,n.MIN_VALUE=1,n.DEFAULT_VALUE=3,n.state={},n.confirm_diagnoses=n.confirm_diagnoses.bind($n(n)),n.sliderRef=o.a.createRef(),n.slider=null,n}var n,r,i;return function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&Xn(e,t)}(t,e),n=t,(r=[{key:"create_slider",value:function(){this.slider=new Bn.a("input.slider",{min:this.MIN_VALUE,max:this.MAX_VALUE,step:1,value:this.props.dx_certainty||this.DEFAULT_VALUE,tooltip:"hide",ticks:[1,2,3,4,5]}),this.slider.enable()}},{key:"destroy_slider",value:function(){this.slider.destroy(),this.slider=null}},{key:"componentDidMount",value:function(){this.sliderRef.current&&!this.slider&&this.create_slider()}},{key:"componentDidUpdate",value:function(){this.sliderRef.current&&!this.slider?this.create_slider():!this.sliderRef.current&&this.slider&&this.destroy_slider()}},{key:"componentWillUnmount",value:function(){this.slider&&this.destroy_slider()}},{key:"confirm_diagnoses",value:function(e){this.props.dispatch({type:"CONFIRM_DIAGNOSES",certainty:this.slider.getValue()}),this.slider.disable()}},{key:"render",value:function(){return this.props.video_loaded&&!this.props.video_playing&&this.props.dx_confirmed?o.a.createElement("div",{className:"row"},o.a.createElement("div",{className:"col"},o.a.createElement("div",{className:"row"},o.a.createElement("p",{className:"col"},o.a.createElement(un,{placement:"right",overlay:o.a.createElement(dt,null,"Indicate on the scale how confident you are of the problem(s) that you have identified. For multiple problems, provide your confidence in your ",o.a.createElement("b",null,"most confident")," guess")},o.a.createElement(Me,{icon:fn.faQuestionCircle}))," ",o.a.createElement("b",null,"How sure are you of the above problem(s)?"))),o.a.createElement("div",{className:"row"},o.a.createElement("div",{className:"col"},o.a.createElement("div",{className:"row"},o.a.createElement("span",{className:"col-2 align-self-center"},"Very Unsure"),o.a.createElement("span",{className:"col bg-secondary align-self-center"},o.a.createElement("input",{type:"text",className:"col-8 slider",style:{width:"100%"},ref:this.sliderRef})),o.a.createElement("span",{className:"col-2 align-self-center"},"Very Sure")))),o.a.createElement("div",{className:"row mt-2"},o.a.createElement("div",{className:"offset-8 col"},o.a.createElement("button",{className:"btn btn-block btn-success",disabled:!!this.props.dx_certainty,onClick:this.confirm_diagnoses},"Confirm"))))):""}}])&&qn(n.prototype,r),i&&qn(n,i),t}(o.a.Component),Kn=de((function(e,t){return{video_loaded:e.ui_status.video_loaded,video_playing:e.ui_status.video_playing,dx_confirmed:e.ui_status.confirmed_dx.length>0,dx_certainty:e.ui_status.dx_certainty}}))(Yn);function Qn(e){return function(e){if(Array.isArray(e)){for(var t=0,n=new Array(e.length);t<e.length;t++)n[t]=e[t];return n}}(e)||function(e){if(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e))return Array.from(e)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance")}()}function Jn(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){if(!(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e)))return;var n=[],r=!0,o=!1,i=void 0;try{for(var a,s=e[Symbol.iterator]();!(r=(a=s.next()).done)&&(n.push(a.value),!t||n.length!==t);r=!0);}catch(e){o=!0,i=e}finally{try{r||null==s.return||s.return()}finally{if(o)throw i}}return n}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance")}()}function Zn(e){return(Zn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function er(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function tr(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function nr(e,t,n){return t&&tr(e.prototype,t),n&&tr(e,n),e}function rr(e,t){return!t||"object"!==Zn(t)&&"function"!=typeof t?or(e):t}function or(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function ir(e){return(ir=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function ar(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&sr(e,t)}function sr(e,t){return(sr=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}var lr,cr=function(e){function t(e){var n;return er(this,t),(n=rr(this,ir(t).call(this,e))).DEFAULT_BUTTON_COLOUR=" btn-outline-info",n.DISABLED_BUTTON_COLOUR=" btn-outline-secondary",n}return ar(t,e),nr(t,[{key:"render",value:function(){var e=!!this.props.show_suggestions&&!!this.props.suggested&&!this.props.disabled,t=this.DEFAULT_BUTTON_COLOUR,n=[];if(e){for(var r=0;r<this.props.suggested_imp;r++)n.push(o.a.createElement(Me,{icon:Cn.faStar,key:r}));n.push(o.a.createElement("br",{key:-1}))}return o.a.createElement("button",{className:"mx-1 col btn"+t+(this.props.selected?" active font-weight-bold":""),type:"button",style:{minHeight:"4rem",pointerEvents:this.props.disabled?"none":"auto"},value:this.props.value,onClick:this.props.select_diagnosis},o.a.createElement("span",{className:"lead",style:{pointerEvents:"none"}},n,window.constants.DIAGNOSES[this.props.value]))}}]),t}(o.a.Component),ur=function(e){function t(e){var n;er(this,t),(n=rr(this,ir(t).call(this,e))).state={selected_diagnoses:[]},n.BUTTONS_LAYOUT=[{name:"Location faults",diagnoses:window.constants.DIAGNOSES_ORDER.slice(0,4)},{name:"Object faults",diagnoses:window.constants.DIAGNOSES_ORDER.slice(4,8)},{name:"Miscellaneous & None",diagnoses:window.constants.DIAGNOSES_ORDER.slice(8,11)}],n.MAX_BUTTONS_PER_ROW=0;var r=!0,o=!1,i=void 0;try{for(var a,s=n.BUTTONS_LAYOUT.entries()[Symbol.iterator]();!(r=(a=s.next()).done);r=!0){var l=Jn(a.value,2),c=(l[0],l[1]);c.diagnoses.length>n.MAX_BUTTONS_PER_ROW&&(n.MAX_BUTTONS_PER_ROW=c.diagnoses.length)}}catch(e){o=!0,i=e}finally{try{r||null==s.return||s.return()}finally{if(o)throw i}}return n.select_diagnosis=n.select_diagnosis.bind(or(n)),n.select_diagnoses=n.select_diagnoses.bind(or(n)),n}return ar(t,e),nr(t,[{key:"select_diagnosis",value:function(e){var t=e.target.value,n=Qn(this.state.selected_diagnoses);n.includes(t)?n.splice(n.indexOf(t),1):n.push(t),this.setState({selected_diagnoses:n})}},{key:"select_diagnoses",value:function(e){this.props.dispatch({type:"SELECT_DIAGNOSES",diagnoses:this.state.selected_diagnoses})}},{key:"render",value:function(){if(!this.props.video_loaded||this.props.video_playing)return"";var e=[],t=!0,n=!1,r=void 0;try{for(var i,a=this.BUTTONS_LAYOUT.entries()[Symbol.iterator]();!(t=(i=a.next()).done);t=!0){var s=Jn(i.value,2),l=(s[0],s[1]),c=[],u=!0,f=!1,d=void 0;try{for(var p,h=l.diagnoses.entries()[Symbol.iterator]();!(u=(p=h.next()).done);u=!0){var m=Jn(p.value,2),v=(m[0],m[1]),y=this.props.suggestions.includes(v),b=this.props.suggestions.indexOf(v),g=y?this.props.suggestions.length-b:0;c.push(o.a.createElement(cr,{key:v,value:v,disabled:this.props.confirmed_dx.length>0,selected:this.state.selected_diagnoses.includes(v),select_diagnosis:this.select_diagnosis,show_suggestions:this.props.show_suggestions,suggested:y,suggested_idx:b,suggested_imp:g}))}}catch(e){f=!0,d=e}finally{try{u||null==h.return||h.return()}finally{if(f)throw d}}for(var _=c.length;_<this.MAX_BUTTONS_PER_ROW;_++)c.push(o.a.createElement("div",{className:"mx-1 btn col invisible",key:_}));e.push(o.a.createElement("div",{className:"row my-1",key:l.name},c))}}catch(e){n=!0,r=e}finally{try{t||null==a.return||a.return()}finally{if(n)throw r}}var w=this.props.show_suggestions?o.a.createElement("small",null,o.a.createElement("br",null),"The robot might put a star on the problem(s) it thinks might be stopping it from reaching its goal. ",o.a.createElement("b",null,"The more stars, the more certain the robot might be"),"."):"";return o.a.createElement("div",{className:"row"},o.a.createElement("div",{className:"col"},o.a.createElement("div",{className:"row"},o.a.createElement("p",{className:"col"},o.a.createElement(un,{placement:"right",overlay:o.a.createElement(dt,null,"Select the problem(s) in the current situation you observe or are trying to resolve")},o.a.createElement(Me,{icon:fn.faQuestionCircle}))," ",o.a.createElement("b",null,"What do you think is interfering with the robot's ability to achieve its goal?"),w)),e,o.a.createElement("div",{className:"row mt-2"},o.a.createElement("div",{className:"offset-8 col"},o.a.createElement("button",{className:"btn btn-block btn-success",disabled:0===this.state.selected_diagnoses.length||this.props.confirmed_dx.length>0,onClick:this.select_diagnoses},"Select")))))}}],[{key:"getDerivedStateFromProps",value:function(e,t){return e.video_loaded&&!e.video_playing?t:{selected_diagnoses:e.confirmed_dx}}}]),t}(o.a.Component),fr=de((function(e,t){return{video_loaded:e.ui_status.video_loaded,video_playing:e.ui_status.video_playing,confirmed_dx:e.ui_status.confirmed_dx,suggestions:e.scenario_state.dx_suggestions,show_suggestions:!!window.constants.EXPERIMENT_CONDITION.show_dx_suggestions}}))(ur),dr=function(e){return o.a.createElement("div",{className:"row bg-light"},o.a.createElement("div",{className:"col"},o.a.createElement(fr,null),o.a.createElement("div",{className:"my-3"}),o.a.createElement(Kn,null),o.a.createElement("div",{className:"my-3"}),o.a.createElement(Gn,null)))};function pr(e){if((!lr&&0!==lr||e)&&Et){var t=document.createElement("div");t.style.position="absolute",t.style.top="-9999px",t.style.width="50px",t.style.height="50px",t.style.overflow="scroll",document.body.appendChild(t),lr=t.offsetWidth-t.clientWidth,document.body.removeChild(t)}return lr}function hr(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function mr(e){void 0===e&&(e=Mt());try{var t=e.activeElement;return t&&t.nodeName?t:null}catch(t){return e.body}}function vr(e,t){e.classList?e.classList.add(t):function(e,t){return e.classList?!!t&&e.classList.contains(t):-1!==(" "+(e.className.baseVal||e.className)+" ").indexOf(" "+t+" ")}(e,t)||("string"==typeof e.className?e.className=e.className+" "+t:e.setAttribute("class",(e.className&&e.className.baseVal||"")+" "+t))}function yr(e,t){return e.replace(new RegExp("(^|\\s)"+t+"(?:\\s|$)","g"),"$1").replace(/\s+/g," ").replace(/^\s*|\s*$/g,"")}function br(e,t){e.classList?e.classList.remove(t):"string"==typeof e.className?e.className=yr(e.className,t):e.setAttribute("class",yr(e.className&&e.className.baseVal||"",t))}function gr(e){return"window"in e&&e.window===e?e:"nodeType"in(t=e)&&t.nodeType===document.DOCUMENT_NODE&&e.defaultView||!1;var t}function _r(e){var t;return gr(e)||(t=e)&&"body"===t.tagName.toLowerCase()?function(e){var t=Mt(e),n=gr(t);return t.body.clientWidth<n.innerWidth}(e):e.scrollHeight>e.clientHeight}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/scrollbarSize.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/scrollbarSize.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@babel/runtime/helpers/esm/assertThisInitialized.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/@babel/runtime/helpers/esm/assertThisInitialized.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/activeElement.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/activeElement.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/hasClass.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/hasClass.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/addClass.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/addClass.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/removeClass.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/removeClass.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/isDocument.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/isDocument.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/isWindow.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/isWindow.js")}}(),function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/utils/isOverflowing.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/utils/isOverflowing.js")}}();var wr=["template","script","style"],xr=function(e,t,n){t=[].concat(t),[].forEach.call(e.children,(function(e){-1===t.indexOf(e)&&function(e){var t=e.nodeType,n=e.tagName;return 1===t&&-1===wr.indexOf(n.toLowerCase())}(e)&&n(e)}))};function Er(e,t){t&&(e?t.setAttribute("aria-hidden","true"):t.removeAttribute("aria-hidden"))}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/utils/manageAriaHidden.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/utils/manageAriaHidden.js")}}();var kr=function(){function e(e){var t=void 0===e?{}:e,n=t.hideSiblingNodes,r=void 0===n||n,o=t.handleContainerOverflow,i=void 0===o||o;this.hideSiblingNodes=r,this.handleContainerOverflow=i,this.modals=[],this.containers=[],this.data=[],this.scrollbarSize=pr()}var t=e.prototype;return t.isContainerOverflowing=function(e){var t=this.data[this.containerIndexFromModal(e)];return t&&t.overflowing},t.containerIndexFromModal=function(e){return t=this.data,n=function(t){return-1!==t.modals.indexOf(e)},r=-1,t.some((function(e,t){return!!n(e,t)&&(r=t,!0)})),r;var t,n,r},t.setContainerStyle=function(e,t){var n={overflow:"hidden"};e.style={overflow:t.style.overflow,paddingRight:t.style.paddingRight},e.overflowing&&(n.paddingRight=parseInt(Wt(t,"paddingRight")||0,10)+this.scrollbarSize+"px"),Wt(t,n)},t.removeContainerStyle=function(e,t){var n=e.style;Object.keys(n).forEach((function(e){t.style[e]=n[e]}))},t.add=function(e,t,n){var r=this.modals.indexOf(e),o=this.containers.indexOf(t);if(-1!==r)return r;if(r=this.modals.length,this.modals.push(e),this.hideSiblingNodes&&function(e,t){var n=t.dialog,r=t.backdrop;xr(e,[n,r],(function(e){return Er(!0,e)}))}(t,e),-1!==o)return this.data[o].modals.push(e),r;var i={modals:[e],classes:n?n.split(/\s+/):[],overflowing:_r(t)};return this.handleContainerOverflow&&this.setContainerStyle(i,t),i.classes.forEach(vr.bind(null,t)),this.containers.push(t),this.data.push(i),r},t.remove=function(e){var t=this.modals.indexOf(e);if(-1!==t){var n=this.containerIndexFromModal(e),r=this.data[n],o=this.containers[n];if(r.modals.splice(r.modals.indexOf(e),1),this.modals.splice(t,1),0===r.modals.length)r.classes.forEach(br.bind(null,o)),this.handleContainerOverflow&&this.removeContainerStyle(r,o),this.hideSiblingNodes&&function(e,t){var n=t.dialog,r=t.backdrop;xr(e,[n,r],(function(e){return Er(!1,e)}))}(o,e),this.containers.splice(n,1),this.data.splice(n,1);else if(this.hideSiblingNodes){var i=r.modals[r.modals.length-1],a=i.backdrop;Er(!1,i.dialog),Er(!1,a)}}},t.isTopModal=function(e){return!!this.modals.length&&this.modals[this.modals.length-1]===e},e}();!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/ModalManager.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/ModalManager.js")}}();var jr=function(e){return Mt(a.a.findDOMNode(e))};!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/utils/ownerDocument.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/utils/ownerDocument.js")}}();var Tr=new kr;var Or=function(e){function t(){for(var t,n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return(t=e.call.apply(e,[this].concat(r))||this).state={exited:!t.props.show},t.onShow=function(){var e=t.props,n=e.container,r=e.containerClassName,o=e.manager,i=e.onShow;o.add(hr(t),n,r),t.removeKeydownListener=St(document,"keydown",t.handleDocumentKeyDown),t.removeFocusListener=St(document,"focus",(function(){return setTimeout(t.enforceFocus)}),!0),i&&i(),t.autoFocus()},t.onHide=function(){t.props.manager.remove(hr(t)),t.removeKeydownListener(),t.removeFocusListener(),t.props.restoreFocus&&t.restoreLastFocus()},t.setDialogRef=function(e){t.dialog=e},t.setBackdropRef=function(e){t.backdrop=e&&a.a.findDOMNode(e)},t.handleHidden=function(){var e;(t.setState({exited:!0}),t.onHide(),t.props.onExited)&&(e=t.props).onExited.apply(e,arguments)},t.handleBackdropClick=function(e){e.target===e.currentTarget&&(t.props.onBackdropClick&&t.props.onBackdropClick(e),!0===t.props.backdrop&&t.props.onHide())},t.handleDocumentKeyDown=function(e){t.props.keyboard&&27===e.keyCode&&t.isTopModal()&&(t.props.onEscapeKeyDown&&t.props.onEscapeKeyDown(e),t.props.onHide())},t.enforceFocus=function(){if(t.props.enforceFocus&&t._isMounted&&t.isTopModal()){var e=mr(jr(hr(t)));t.dialog&&!ht(t.dialog,e)&&t.dialog.focus()}},t.renderBackdrop=function(){var e=t.props,n=e.renderBackdrop,r=e.backdropTransition,i=n({ref:t.setBackdropRef,onClick:t.handleBackdropClick});return r&&(i=o.a.createElement(r,{appear:!0,in:t.props.show},i)),i},t}pt(t,e),t.getDerivedStateFromProps=function(e){return e.show?{exited:!1}:e.transition?null:{exited:!0}};var n=t.prototype;return n.componentDidMount=function(){this._isMounted=!0,this.props.show&&this.onShow()},n.componentDidUpdate=function(e){var t=this.props.transition;!e.show||this.props.show||t?!e.show&&this.props.show&&this.onShow():this.onHide()},n.componentWillUnmount=function(){var e=this.props,t=e.show,n=e.transition;this._isMounted=!1,(t||n&&!this.state.exited)&&this.onHide()},n.getSnapshotBeforeUpdate=function(e){return Et&&!e.show&&this.props.show&&(this.lastFocus=mr()),null},n.restoreLastFocus=function(){this.lastFocus&&this.lastFocus.focus&&(this.lastFocus.focus(this.props.restoreFocusOptions),this.lastFocus=null)},n.autoFocus=function(){if(this.props.autoFocus){var e=mr(jr(this));this.dialog&&!ht(this.dialog,e)&&(this.lastFocus=e,this.dialog.focus())}},n.isTopModal=function(){return this.props.manager.isTopModal(this)},n.render=function(){var e=this.props,n=e.show,r=e.container,i=e.children,s=e.renderDialog,l=e.role,c=void 0===l?"dialog":l,u=e.transition,f=e.backdrop,d=e.className,p=e.style,h=e.onExit,m=e.onExiting,b=e.onEnter,g=e.onEntering,_=e.onEntered,w=y(e,["show","container","children","renderDialog","role","transition","backdrop","className","style","onExit","onExiting","onEnter","onEntering","onEntered"]);if(!(n||u&&!this.state.exited))return null;var x=v({role:c,ref:this.setDialogRef,"aria-modal":"dialog"===c||void 0},function(e,t){var n=Object.keys(e),r={};return n.forEach((function(n){Object.prototype.hasOwnProperty.call(t,n)||(r[n]=e[n])})),r}(w,t.propTypes),{style:p,className:d,tabIndex:"-1"}),E=s?s(x):o.a.createElement("div",x,o.a.cloneElement(i,{role:"document"}));return u&&(E=o.a.createElement(u,{appear:!0,unmountOnExit:!0,in:n,onExit:h,onExiting:m,onExited:this.handleHidden,onEnter:b,onEntering:g,onEntered:_},E)),a.a.createPortal(o.a.createElement(o.a.Fragment,null,f&&this.renderBackdrop(),E),r)},t}(o.a.Component);Or.propTypes={show:l.a.bool,container:l.a.any,onShow:l.a.func,onHide:l.a.func,backdrop:l.a.oneOfType([l.a.bool,l.a.oneOf(["static"])]),renderDialog:l.a.func,renderBackdrop:l.a.func,onEscapeKeyDown:l.a.func,onBackdropClick:l.a.func,containerClassName:l.a.string,keyboard:l.a.bool,transition:l.a.elementType,backdropTransition:l.a.elementType,autoFocus:l.a.bool,enforceFocus:l.a.bool,restoreFocus:l.a.bool,restoreFocusOptions:l.a.shape({preventScroll:l.a.bool}),onEnter:l.a.func,onEntering:l.a.func,onEntered:l.a.func,onExit:l.a.func,onExiting:l.a.func,onExited:l.a.func,manager:l.a.object.isRequired},Or.defaultProps={show:!1,role:"dialog",backdrop:!0,keyboard:!0,autoFocus:!0,enforceFocus:!0,restoreFocus:!0,onHide:function(){},manager:Tr,renderBackdrop:function(e){return o.a.createElement("div",e)}};var Cr,Sr,Lr=(Cr=Or,(Sr=o.a.forwardRef((function(e,t){var n=Ht(e.container);return n?o.a.createElement(Cr,v({},e,{ref:t,container:n})):null}))).Manager=kr,Sr._Inner=Cr,Sr);Lr.Manager=kr;var Pr=Lr;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/Modal.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-overlays/esm/Modal.js")}}();var Nr=Function.prototype.bind.call(Function.prototype.call,[].slice);function Ar(e,t){return Nr(e.querySelectorAll(t))}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/querySelectorAll.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/querySelectorAll.js")}}();var Mr=".fixed-top, .fixed-bottom, .is-fixed, .sticky-top",Dr=".sticky-top",Hr=".navbar-toggler",Rr=function(e){function t(){for(var t,n=arguments.length,r=new Array(n),o=0;o<n;o++)r[o]=arguments[o];return(t=e.call.apply(e,[this].concat(r))||this).adjustAndStore=function(e,t,n){var r,o=t.style[e];t.dataset[e]=o,Wt(t,((r={})[e]=parseFloat(Wt(t,e))+n+"px",r))},t.restore=function(e,t){var n,r=t.dataset[e];void 0!==r&&(delete t.dataset[e],Wt(t,((n={})[e]=r,n)))},t}pt(t,e);var n=t.prototype;return n.setContainerStyle=function(t,n){var r=this;if(e.prototype.setContainerStyle.call(this,t,n),t.overflowing){var o=pr();Ar(n,Mr).forEach((function(e){return r.adjustAndStore("paddingRight",e,o)})),Ar(n,Dr).forEach((function(e){return r.adjustAndStore("margingRight",e,-o)})),Ar(n,Hr).forEach((function(e){return r.adjustAndStore("margingRight",e,o)}))}},n.removeContainerStyle=function(t,n){var r=this;e.prototype.removeContainerStyle.call(this,t,n),Ar(n,Mr).forEach((function(e){return r.restore("paddingRight",e)})),Ar(n,Dr).forEach((function(e){return r.restore("margingRight",e)})),Ar(n,Hr).forEach((function(e){return r.restore("margingRight",e)}))},t}(kr);!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/BootstrapModalManager.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/BootstrapModalManager.js")}}();var Ir=/-(.)/g;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/camelize.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/dom-helpers/esm/camelize.js")}}();var Fr=function(e){return e[0].toUpperCase()+(t=e,t.replace(Ir,(function(e,t){return t.toUpperCase()}))).slice(1);var t};function zr(e,t){var n=void 0===t?{}:t,r=n.displayName,i=void 0===r?Fr(e):r,a=n.Component,s=void 0===a?"div":a,l=n.defaultProps,c=o.a.forwardRef((function(t,n){var r=t.className,i=t.bsPrefix,a=t.as,l=void 0===a?s:a,c=y(t,["className","bsPrefix","as"]),u=ut(i,e);return o.a.createElement(l,v({ref:n,className:at()(r,u)},c))}));return c.defaultProps=l,c.displayName=i,c}!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/createWithBsPrefix.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/createWithBsPrefix.js")}}();var Gr=zr("modal-body");!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ModalBody.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ModalBody.js")}}();var Ur=o.a.createContext({onHide:function(){}});!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ModalContext.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ModalContext.js")}}();var Br=o.a.forwardRef((function(e,t){var n=e.bsPrefix,r=e.className,i=e.centered,a=e.size,s=e.children,l=e.scrollable,c=y(e,["bsPrefix","className","centered","size","children","scrollable"]),u=(n=ut(n,"modal"))+"-dialog";return o.a.createElement("div",v({},c,{ref:t,className:at()(u,r,a&&n+"-"+a,i&&u+"-centered",l&&u+"-scrollable")}),o.a.createElement("div",{className:n+"-content"},s))}));Br.displayName="ModalDialog";var Wr=Br;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ModalDialog.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ModalDialog.js")}}();var qr=zr("modal-footer");!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ModalFooter.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ModalFooter.js")}}();var Vr={label:l.a.string.isRequired,onClick:l.a.func},$r=o.a.forwardRef((function(e,t){var n=e.label,r=e.onClick,i=e.className,a=y(e,["label","onClick","className"]);return o.a.createElement("button",v({ref:t,type:"button",className:at()("close",i),onClick:r},a),o.a.createElement("span",{"aria-hidden":"true"},"×"),o.a.createElement("span",{className:"sr-only"},n))}));$r.displayName="CloseButton",$r.propTypes=Vr,$r.defaultProps={label:"Close"};var Xr=$r;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/CloseButton.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/CloseButton.js")}}();var Yr=o.a.forwardRef((function(e,t){var n=e.bsPrefix,i=e.closeLabel,a=e.closeButton,s=e.onHide,l=e.className,c=e.children,u=y(e,["bsPrefix","closeLabel","closeButton","onHide","className","children"]);n=ut(n,"modal-header");var f=Object(r.useContext)(Ur),d=Pt((function(){f&&f.onHide(),s&&s()}));return o.a.createElement("div",v({ref:t},u,{className:at()(l,n)}),c,a&&o.a.createElement(Xr,{label:i,onClick:d}))}));Yr.displayName="ModalHeader",Yr.defaultProps={closeLabel:"Close",closeButton:!1};var Kr=Yr;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ModalHeader.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ModalHeader.js")}}();!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/divWithClassName.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/divWithClassName.js")}}();var Qr,Jr=zr("modal-title",{Component:(Qr="h4",o.a.forwardRef((function(e,t){return o.a.createElement("div",v({},e,{ref:t,className:at()(e.className,Qr)}))})))});!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ModalTitle.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/ModalTitle.js")}}();var Zr={show:!1,backdrop:!0,keyboard:!0,autoFocus:!0,enforceFocus:!0,restoreFocus:!0,animation:!0,dialogAs:Wr,manager:new Rr};function eo(e){return o.a.createElement(nn,e)}function to(e){return o.a.createElement(nn,e)}var no=function(e){function t(){for(var t,n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return(t=e.call.apply(e,[this].concat(r))||this).state={style:{}},t.modalContext={onHide:function(){return t.props.onHide()}},t.setModalRef=function(e){t._modal=e},t.handleDialogMouseDown=function(){t._waitingForMouseUp=!0},t.handleMouseUp=function(e){t._waitingForMouseUp&&e.target===t._modal.dialog&&(t._ignoreBackdropClick=!0),t._waitingForMouseUp=!1},t.handleClick=function(e){t._ignoreBackdropClick||e.target!==e.currentTarget?t._ignoreBackdropClick=!1:t.props.onHide()},t.handleEnter=function(e){var n;e&&(e.style.display="block",t.updateDialogStyle(e));for(var r=arguments.length,o=new Array(r>1?r-1:0),i=1;i<r;i++)o[i-1]=arguments[i];t.props.onEnter&&(n=t.props).onEnter.apply(n,[e].concat(o))},t.handleEntering=function(e){for(var n,r=arguments.length,o=new Array(r>1?r-1:0),i=1;i<r;i++)o[i-1]=arguments[i];t.props.onEntering&&(n=t.props).onEntering.apply(n,[e].concat(o)),Ot(window,"resize",t.handleWindowResize)},t.handleExited=function(e){var n;e&&(e.style.display="");for(var r=arguments.length,o=new Array(r>1?r-1:0),i=1;i<r;i++)o[i-1]=arguments[i];t.props.onExited&&(n=t.props).onExited.apply(n,o),Ct(window,"resize",t.handleWindowResize)},t.handleWindowResize=function(){t.updateDialogStyle(t._modal.dialog)},t.renderBackdrop=function(e){var n=t.props,r=n.bsPrefix,i=n.backdropClassName,a=n.animation;return o.a.createElement("div",v({},e,{className:at()(r+"-backdrop",i,!a&&"show")}))},t}pt(t,e);var n=t.prototype;return n.componentWillUnmount=function(){Ct(window,"resize",this.handleWindowResize)},n.updateDialogStyle=function(e){if(Et){var t=this.props.manager.isContainerOverflowing(this._modal),n=e.scrollHeight>Mt(e).documentElement.clientHeight;this.setState({style:{paddingRight:t&&!n?pr():void 0,paddingLeft:!t&&n?pr():void 0}})}},n.render=function(){var e=this.props,t=e.bsPrefix,n=e.className,r=e.style,i=e.dialogClassName,a=e.children,s=e.dialogAs,l=e.show,c=e.animation,u=e.backdrop,f=e.keyboard,d=e.manager,p=e.onEscapeKeyDown,h=e.onShow,m=e.onHide,b=e.container,g=e.autoFocus,_=e.enforceFocus,w=e.restoreFocus,x=e.onEntered,E=e.onExit,k=e.onExiting,j=(e.onExited,e.onEntering,e.onEnter,e.onEntering,e.backdropClassName,y(e,["bsPrefix","className","style","dialogClassName","children","dialogAs","show","animation","backdrop","keyboard","manager","onEscapeKeyDown","onShow","onHide","container","autoFocus","enforceFocus","restoreFocus","onEntered","onExit","onExiting","onExited","onEntering","onEnter","onEntering","backdropClassName"])),T=!0===u?this.handleClick:null,O=v({},r,{},this.state.style);return c||(O.display="block"),o.a.createElement(Ur.Provider,{value:this.modalContext},o.a.createElement(Pr,{show:l,backdrop:u,container:b,keyboard:f,autoFocus:g,enforceFocus:_,restoreFocus:w,onEscapeKeyDown:p,onShow:h,onHide:m,onEntered:x,onExit:E,onExiting:k,manager:d,ref:this.setModalRef,style:O,className:at()(n,t),containerClassName:t+"-open",transition:c?eo:void 0,backdropTransition:c?to:void 0,renderBackdrop:this.renderBackdrop,onClick:T,onMouseUp:this.handleMouseUp,onEnter:this.handleEnter,onEntering:this.handleEntering,onExited:this.handleExited},o.a.createElement(s,v({},j,{onMouseDown:this.handleDialogMouseDown,className:i}),a)))},t}(o.a.Component);no.defaultProps=Zr;var ro=function(e,t){"string"==typeof t&&(t={prefix:t});var n=e.prototype&&e.prototype.isReactComponent,r=t,i=r.prefix,a=r.forwardRefAs,s=void 0===a?n?"ref":"innerRef":a;return lt()((function(t,n){var r=v({},t);r[s]=n;var a=ut(r.bsPrefix,i);return o.a.createElement(e,v({},r,{bsPrefix:a}))}),{displayName:"Bootstrap("+(e.displayName||e.name)+")"})}(no,"modal");ro.Body=Gr,ro.Header=Kr,ro.Title=Jr,ro.Footer=qr,ro.Dialog=Wr,ro.TRANSITION_DURATION=300,ro.BACKDROP_TRANSITION_DURATION=150;var oo=ro;!function(){var e="undefined"!=typeof reactHotLoaderGlobal?reactHotLoaderGlobal.default:void 0;if(e){var n=void 0!==t?t:exports;if(n)if("function"!=typeof n){for(var r in n)if(Object.prototype.hasOwnProperty.call(n,r)){var o=void 0;try{o=n[r]}catch(e){continue}e.register(o,r,"/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/Modal.js")}}else e.register(n,"module.exports","/home/banerjs/Libraries/banerjs/isolation_cyoa/dining_room/static/react/node_modules/react-bootstrap/esm/Modal.js")}}();var io=function(e){return o.a.createElement(oo,{show:e.show,size:"lg",centered:!0,onHide:function(){}},o.a.createElement(oo.Header,null,o.a.createElement(oo.Title,null,"Complete!")),o.a.createElement(oo.Body,null,o.a.createElement("p",null,"The connection with the robot is now severed. Please click the button below to continue with the study.")),o.a.createElement(oo.Footer,null,o.a.createElement("a",{href:window.constants.NEXT_URL,role:"button",className:"btn btn-primary"},"Continue")))},ao=de((function(e,t){return{scenario_completed:e.scenario_state.scenario_completed,video_loaded:e.ui_status.video_loaded,video_playing:e.ui_status.video_playing}}))((function(e){var t=!1;return e.video_loaded&&!e.video_playing&&(t=e.scenario_completed),o.a.createElement("div",{className:"container-fluid"},o.a.createElement(io,{show:t}),o.a.createElement("div",{className:"row mt-3"},o.a.createElement("div",{className:"col"},o.a.createElement(ot,null)),o.a.createElement("div",{className:"col"},o.a.createElement(dn,null),o.a.createElement("hr",null),o.a.createElement(On,null),o.a.createElement("hr",null),o.a.createElement(dr,null))))}));function so(e){return function(e){if(Array.isArray(e)){for(var t=0,n=new Array(e.length);t<e.length;t++)n[t]=e[t];return n}}(e)||function(e){if(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e))return Array.from(e)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance")}()}function lo(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function co(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?lo(Object(n),!0).forEach((function(t){uo(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):lo(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function uo(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var fo=function e(t,n,r){var o;if("function"==typeof n&&"function"==typeof r||"function"==typeof r&&"function"==typeof arguments[3])throw new Error("It looks like you are passing several store enhancers to createStore(). This is not supported. Instead, compose them together to a single function.");if("function"==typeof n&&void 0===r&&(r=n,n=void 0),void 0!==r){if("function"!=typeof r)throw new Error("Expected the enhancer to be a function.");return r(e)(t,n)}if("function"!=typeof t)throw new Error("Expected the reducer to be a function.");var i=t,a=n,s=[],l=s,c=!1;function u(){l===s&&(l=s.slice())}function f(){if(c)throw new Error("You may not call store.getState() while the reducer is executing. The reducer has already received the state as an argument. Pass it down from the top reducer instead of reading it from the store.");return a}function d(e){if("function"!=typeof e)throw new Error("Expected the listener to be a function.");if(c)throw new Error("You may not call store.subscribe() while the reducer is executing. If you would like to be notified after the store has been updated, subscribe from a component and invoke store.getState() in the callback to access the latest state. See https://redux.js.org/api-reference/store#subscribelistener for more details.");var t=!0;return u(),l.push(e),function(){if(t){if(c)throw new Error("You may not unsubscribe from a store listener while the reducer is executing. See https://redux.js.org/api-reference/store#subscribelistener for more details.");t=!1,u();var n=l.indexOf(e);l.splice(n,1),s=null}}}function p(e){if(!D(e))throw new Error("Actions must be plain objects. Use custom middleware for async actions.");if(void 0===e.type)throw new Error('Actions may not have an undefined "type" property. Have you misspelled a constant?');if(c)throw new Error("Reducers may not dispatch actions.");try{c=!0,a=i(a,e)}finally{c=!1}for(var t=s=l,n=0;n<t.length;n++){(0,t[n])()}return e}function h(e){if("function"!=typeof e)throw new Error("Expected the nextReducer to be a function.");i=e,p({type:M.REPLACE})}function m(){var e,t=d;return(e={subscribe:function(e){if("object"!=typeof e||null===e)throw new TypeError("Expected the observer to be an object.");function n(){e.next&&e.next(f())}return n(),{unsubscribe:t(n)}}})[N.a]=function(){return this},e}return p({type:M.INIT}),(o={dispatch:p,subscribe:d,getState:f,replaceReducer:h})[N.a]=m,o}(function(e){for(var t=Object.keys(e),n={},r=0;r<t.length;r++){var o=t[r];0,"function"==typeof e[o]&&(n[o]=e[o])}var i,a=Object.keys(n);try{!function(e){Object.keys(e).forEach((function(t){var n=e[t];if(void 0===n(void 0,{type:M.INIT}))throw new Error('Reducer "'+t+"\" returned undefined during initialization. If the state passed to the reducer is undefined, you must explicitly return the initial state. The initial state may not be undefined. If you don't want to set a value for this reducer, you can use null instead of undefined.");if(void 0===n(void 0,{type:M.PROBE_UNKNOWN_ACTION()}))throw new Error('Reducer "'+t+"\" returned undefined when probed with a random type. Don't try to handle "+M.INIT+' or other actions in "redux/*" namespace. They are considered private. Instead, you must return the current state for any unknown actions, unless it is undefined, in which case you must return the initial state, regardless of the action type. The initial state may not be undefined, but can be null.')}))}(n)}catch(e){i=e}return function(e,t){if(void 0===e&&(e={}),i)throw i;for(var r=!1,o={},s=0;s<a.length;s++){var l=a[s],c=n[l],u=e[l],f=c(u,t);if(void 0===f){var d=H(l,t);throw new Error(d)}o[l]=f,r=r||f!==u}return(r=r||a.length!==Object.keys(e).length)?o:e}}({ui_status:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:window.constants.INITIAL_STATE.ui_state,t=arguments.length>1?arguments[1]:void 0;switch(t.type){case"UPDATE_STATE":return co({},window.constants.INITIAL_STATE.ui_state,{selected_action_idx:e.selected_action_idx});case"PLAY_VIDEO":return co({},e,{video_loaded:!0,video_playing:!0,video_loaded_time:Date.now()/1e3});case"DISPLAY_STATE":return co({},e,{video_playing:!1,video_stop_time:Date.now()/1e3});case"SELECT_DIAGNOSES":return co({},e,{confirmed_dx:t.diagnoses,dx_selected_time:Date.now()/1e3});case"CONFIRM_DIAGNOSES":return co({},e,{dx_certainty:t.certainty,dx_confirmed_time:Date.now()/1e3});case"SELECT_ACTION":return co({},e,{selected_action:t.action,ax_selected_time:Date.now()/1e3,selected_action_idx:e.selected_action_idx+1});default:return e}},scenario_state:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:window.constants.INITIAL_STATE.scenario_state,t=arguments.length>1?arguments[1]:void 0;switch(t.type){case"UPDATE_STATE":return t.new_state.server_state_tuple?t.new_state:co({},e,{},t.new_state);default:return e}},history:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:window.constants.INITIAL_STATE.history,t=arguments.length>1?arguments[1]:void 0;switch(t.type){case"DISPLAY_STATE":return e.dx_to_add&&e.ax_to_add?{dx_to_add:null,ax_to_add:null,result_to_add:null,history:[].concat(so(e.history),[{error:e.dx_to_add,action:e.ax_to_add,result:e.result_to_add}])}:e;case"UPDATE_STATE":return co({},e,{result_to_add:t.new_state.action_result});case"SELECT_DIAGNOSES":return co({},e,{dx_to_add:t.diagnoses});case"SELECT_ACTION":return co({},e,{ax_to_add:t.action});default:return e}}}),{},function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return function(e){return function(){var n=e.apply(void 0,arguments),r=function(){throw new Error("Dispatching while constructing your middleware is not allowed. Other middleware would not be applied to this dispatch.")},o={getState:n.getState,dispatch:function(){return r.apply(void 0,arguments)}},i=t.map((function(e){return e(o)}));return z({},n,{dispatch:r=G.apply(void 0,i)(n.dispatch)})}}}(_e,Object(we.createLogger)())),po=function(e){return o.a.createElement(m,{store:fo},o.a.createElement(ao,{condition:window.constants.EXPERIMENT_CONDITION}))};po=Object(xe.hot)(po),a.a.render(o.a.createElement(po,null),document.getElementById("app"))}]);
\ No newline at end of file
@@ -17,6 +17,50 @@ export const SELECT_ACTION = 'SELECT_ACTION';
 
 // Other constants
 
+// The number of times to try a request for the next state, and the default
+// wait (in ms) between tries
+const MAX_NEXT_STATE_ATTEMPTS = 5;
+const NEXT_STATE_RETRY_DELAY = 1000;
+
+
+// Helper functions
+
+function createIdempotencyKey() {
+    // A random key that identifies a request, so that the server can tell
+    // when a request is being retried
+    return Date.now().toString(36) + Math.random().toString(36).substring(2);
+}
+
+function postWithRetries(url, body, attempt = 1) {
+    // Post the body, and retry with the same body if the server is busy or
+    // the request fails to reach it
+    const retry = (delay) => new Promise((resolve) => setTimeout(resolve, delay))
+        .then(() => postWithRetries(url, body, attempt + 1));
+
+    return fetch(
+            url,
+            {
+                method: 'POST',
+                mode: 'cors',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: body
+            }
+        )
+        .then((response) => {
+            if (response.status === 503 && attempt < MAX_NEXT_STATE_ATTEMPTS) {
+                return retry(1000 * parseInt(response.headers.get('Retry-After')) || NEXT_STATE_RETRY_DELAY);
+            }
+            return response.json();
+        }, (error) => {
+            if (attempt < MAX_NEXT_STATE_ATTEMPTS) {
+                return retry(NEXT_STATE_RETRY_DELAY);
+            }
+            throw error;
+        });
+}
+
 
 // Action Creators
 
@@ -27,24 +71,18 @@ export function fetchNextState(action) {
         dispatch(selectAction(action));
 
         // Get the state and send the data to the server. Parse the response
-        // and then send an updated state action
+        // and then send an updated state action. Retries of the request use
+        // the same idempotency key, so they are only processed once
         let state = getState();
-        return fetch(
+        return postWithRetries(
                 window.constants.NEXT_STATE_URL,
-                {
-                    method: 'POST',
-                    mode: 'cors',
-                    headers: {
-                        'Content-Type': 'application/json'
-                    },
-                    body: JSON.stringify({
-                        server_state_tuple: state.scenario_state.server_state_tuple,
-                        action: action,
-                        ui_state: state.ui_status
-                    })
-                }
+                JSON.stringify({
+                    server_state_tuple: state.scenario_state.server_state_tuple,
+                    action: action,
+                    ui_state: state.ui_status,
+                    idempotency_key: createIdempotencyKey()
+                })
             )
-            .then((response) => response.json())
             .then((state) => dispatch(updateState(state)))
             .catch(console.error);
     }
@@ -1,11 +1,13 @@
 #!/usr/bin/env python
 # Data Loader
 
+import collections
+
 import numpy as np
 import pandas as pd
 
 from django.conf import settings
-from django.db.models import Q
+from django.db.models import Q, F, BigIntegerField, ExpressionWrapper
 from django.forms.models import model_to_dict
 from django.utils import timezone
 
@@ -39,10 +41,57 @@ _cached_users_df = None
 _cached_actions_df = None
 
 
+def add_condition_columns(df):
+    """
+    Add the indicators of the study condition of the user to a data frame with
+    a study_condition column. Modifies the data frame in place
+    """
+    show_dx = df['study_condition'].isin(User.SHOW_DX_STUDY_CONDITIONS)
+    show_ax = df['study_condition'].isin(User.SHOW_AX_STUDY_CONDITIONS)
+
+    df['noise_level'] = df['study_condition'].map(
+        lambda x: User.STUDY_CONDITIONS_NOISE_LEVELS.get(x, Suggestions.DEFAULT_NOISE_LEVEL) * 10
+    )
+    df['has_noise'] = df['noise_level'] > 0
+    df['has_dx'] = show_dx
+    df['has_ax'] = show_ax
+    df['has_dxax'] = show_dx & show_ax
+    df['has_ax_only'] = show_ax & ~show_dx
+    df['has_dx_only'] = show_dx & ~show_ax
+    df['has_suggestions'] = show_dx | show_ax
+    df['suggestion_type'] = np.select(
+        [show_ax & ~show_dx, show_dx & ~show_ax, show_dx & show_ax],
+        ['AX', 'DX', 'DXAX'],
+        'NONE'
+    )
+    return df
+
+
+def get_action_choices_df(actions):
+    """
+    Get the data frame of the choices made in each of the actions, and whether
+    those choices were optimal or followed the suggestions. The data frame is
+    loaded in a single query
+    """
+    fields = [
+        'id', 'user_id', 'start_timestamp', 'diagnosis_certainty',
+        'video_stop_time', 'ax_selected_time', 'browser_refreshed',
+        'corrupted_dx_suggestions', 'corrupted_ax_suggestions',
+    ] + StudyAction.CHOICE_FIELDS
+    actions_df = pd.DataFrame.from_records(actions.values(*fields), columns=fields)
+
+    # The durations
+    actions_df['decision_duration'] = (actions_df['ax_selected_time'] - actions_df['video_stop_time']).dt.total_seconds()
+    return actions_df
+
+
 def get_users_df(*, users=None, use_cache=True):
     """
     Get information about the valid users as a data frame. A copy of a cache is
-    used unless users is specified or use_cache is set to False
+    used unless users is specified or use_cache is set to False.
+
+    The data frame is created from two queries, one for the users and one for
+    their actions, regardless of the number of users
     """
     global _cached_users_df
 
@@ -50,113 +99,86 @@ def get_users_df(*, users=None, use_cache=True):
     if (users is None and use_cache) and _cached_users_df is not None:
         return _cached_users_df.copy()
 
-    # Create a new df
-    users = users or load_valid_users()
-    _cached_users_df = users.values()
-
-    # Add common information to the data frame
-    for user, data in zip(users, _cached_users_df):
-        # Get rid of useless columns
-        del data['amt_worker_id']
-        del data['password']
-        del data['unique_key']
-
-        # Get some indicators
-        data['noise_level'] = (user.noise_level * 10)
-        data['has_noise'] = user.noise_level > 0
-        data['has_dx'] = user.show_dx_suggestions
-        data['has_ax'] = user.show_ax_suggestions
-        data['has_dxax'] = user.show_dx_suggestions and user.show_ax_suggestions
-        data['has_ax_only'] = user.show_ax_suggestions and not user.show_dx_suggestions
-        data['has_dx_only'] = user.show_dx_suggestions and not user.show_ax_suggestions
-        data['has_suggestions'] = user.show_ax_suggestions or user.show_dx_suggestions
-        data['suggestion_type'] = (
-            'AX' if user.show_ax_suggestions and not user.show_dx_suggestions else (
-                'DX' if not user.show_ax_suggestions and user.show_dx_suggestions else (
-                    'DXAX' if user.show_ax_suggestions and user.show_dx_suggestions else 'NONE'
-                )
-            )
-        )
-
-        # Get meta information about the actions
-        data['num_actions'] = user.num_actions
-        data['num_refreshes'] = user.studyaction_set.filter(browser_refreshed=True).count()
-
-        # Mark a refresh as incomplete and with 20 actions
-        if data['num_refreshes'] > 0:
-            data['num_actions'] = 20
-            data['scenario_completed'] = False
-
-        # Get the information tied to optimality
-        optimal_sequence = constants.OPTIMAL_ACTION_SEQUENCES[user.start_condition]
-        data['num_optimal'] = len(optimal_sequence)-1
-        data['num_dx_optimal'] = 0
-        data['num_ax_optimal'] = 0
-
-        # Get counts of how well/poorly suggestions were followed
-        data['num_dx_corrupt'] = 0 if user.show_dx_suggestions else None
-        data['num_ax_corrupt'] = 0 if user.show_ax_suggestions else None
-        data['num_dx_followed'] = 0 if user.show_dx_suggestions else None
-        data['num_ax_followed'] = 0 if user.show_ax_suggestions else None
-
-        # Get summary stats from actions
-        data['decision_duration'] = []
-        data['dx_decision_duration'] = []
-        data['ax_decision_duration'] = []
-        data['diagnosis_certainty'] = []
-
-        # Get the data from the actions
-        for action in user.studyaction_set.order_by('start_timestamp'):
-            data['decision_duration'].append(action.decision_duration.total_seconds())
-            data['dx_decision_duration'].append(action.decision_duration.total_seconds())
-            data['ax_decision_duration'].append(action.decision_duration.total_seconds())
-
-            data['diagnosis_certainty'].append(action.diagnosis_certainty)
-
-            data['num_dx_optimal'] += 1 if action.chose_dx_optimal else 0
-            data['num_ax_optimal'] += 1 if action.chose_ax_optimal else 0
-
-            if user.show_dx_suggestions:
-                data['num_dx_corrupt'] += 1 if action.corrupted_dx_suggestions else 0
-                data['num_dx_followed'] += 1 if action.chose_dx_suggestion else 0
-
-            if user.show_ax_suggestions:
-                data['num_ax_corrupt'] += 1 if action.corrupted_ax_suggestions else 0
-                data['num_ax_followed'] += 1 if action.chose_ax_suggestion else 0
-
-        # Summary stats for the time per action
-        data['decision_duration_sum'] = np.sum(data['decision_duration'])
-        data['dx_decision_duration_sum'] = np.sum(data['dx_decision_duration'])
-        data['ax_decision_duration_sum'] = np.sum(data['ax_decision_duration'])
-        data['decision_duration_mean'] = np.mean(data['decision_duration'])
-        data['dx_decision_duration_mean'] = np.mean(data['dx_decision_duration'])
-        data['ax_decision_duration_mean'] = np.mean(data['ax_decision_duration'])
-        data['decision_duration_median'] = np.median(data['decision_duration'])
-        data['dx_decision_duration_median'] = np.median(data['dx_decision_duration'])
-        data['ax_decision_duration_median'] = np.median(data['ax_decision_duration'])
-
-        del data['decision_duration']
-        del data['dx_decision_duration']
-        del data['ax_decision_duration']
-
-        # Summary stats of the diagnosis certainty
-        data['diagnosis_certainty_sum'] = np.sum(data['diagnosis_certainty'])
-        data['diagnosis_certainty_mean'] = np.mean(data['diagnosis_certainty'])
-        data['diagnosis_certainty_median'] = np.median(data['diagnosis_certainty'])
-        del data['diagnosis_certainty']
-
-        # Add the num_actions_diff metric
-        data['num_actions_diff'] = data['num_actions'] - data['num_optimal']
-        data['frac_actions_diff'] = data['num_actions_diff'] / (20 - data['num_optimal'])
-
-        # Get normalized metric values
-        data['frac_dx_optimal'] = data['num_dx_optimal'] / data['num_actions']
-        data['frac_dx_followed'] = (data['num_dx_followed'] / data['num_actions']) if user.show_dx_suggestions else None
-        data['frac_ax_optimal'] = data['num_ax_optimal'] / data['num_actions']
-        data['frac_ax_followed'] = (data['num_ax_followed'] / data['num_actions']) if user.show_ax_suggestions else None
-
-    # Make a dataframe out of the information
-    _cached_users_df = pd.DataFrame(_cached_users_df)
+    # Create a new df. Get rid of useless columns
+    users = users if users is not None else load_valid_users()
+    users_df = pd.DataFrame.from_records(users.values(), columns=[x.attname for x in User._meta.concrete_fields])
+    users_df = users_df.drop(columns=['amt_worker_id', 'password', 'unique_key', 'next_state_key', 'next_state_response'])
+    fields = list(users_df.columns)
+
+    # Get some indicators
+    add_condition_columns(users_df)
+
+    # Get the summaries of the actions of each user
+    actions_df = get_action_choices_df(StudyAction.objects.filter(user__in=users))
+    for column in StudyAction.CHOICE_FIELDS:
+        actions_df[column] = actions_df[column].fillna(False).astype(bool)
+
+    actions_summary = actions_df.groupby('user_id').agg(
+        num_actions=('id', 'size'),
+        num_refreshes=('browser_refreshed', 'sum'),
+        num_dx_optimal=('chose_dx_optimal', 'sum'),
+        num_ax_optimal=('chose_ax_optimal', 'sum'),
+        num_dx_corrupt=('corrupted_dx_suggestions', 'sum'),
+        num_ax_corrupt=('corrupted_ax_suggestions', 'sum'),
+        num_dx_followed=('chose_dx_suggestion', 'sum'),
+        num_ax_followed=('chose_ax_suggestion', 'sum'),
+        decision_duration_sum=('decision_duration', 'sum'),
+        decision_duration_mean=('decision_duration', 'mean'),
+        decision_duration_median=('decision_duration', 'median'),
+        diagnosis_certainty_sum=('diagnosis_certainty', 'sum'),
+        diagnosis_certainty_mean=('diagnosis_certainty', 'mean'),
+        diagnosis_certainty_median=('diagnosis_certainty', 'median'),
+    )
+    users_df = users_df.merge(actions_summary, how='left', left_on='id', right_index=True)
+
+    # Users without actions have counts of 0
+    count_columns = [x for x in actions_summary.columns if x.startswith('num_') or x.endswith('_sum')]
+    users_df[count_columns] = users_df[count_columns].fillna(0)
+
+    # Mark a refresh as incomplete and with 20 actions
+    refreshed = users_df['num_refreshes'] > 0
+    users_df.loc[refreshed, 'num_actions'] = 20
+    users_df.loc[refreshed, 'scenario_completed'] = False
+
+    # Get the information tied to optimality
+    users_df['num_optimal'] = users_df['start_condition'].map(lambda x: len(constants.OPTIMAL_ACTION_SEQUENCES[x]) - 1)
+
+    # Get counts of how well/poorly suggestions were followed
+    for column in ['num_dx_corrupt', 'num_dx_followed']:
+        users_df[column] = users_df[column].where(users_df['has_dx'], None)
+    for column in ['num_ax_corrupt', 'num_ax_followed']:
+        users_df[column] = users_df[column].where(users_df['has_ax'], None)
+
+    # Summary stats for the time per action. The DX and AX durations are
+    # summarized from the total decision duration
+    for stat in ['sum', 'mean', 'median']:
+        users_df[f'dx_decision_duration_{stat}'] = users_df[f'decision_duration_{stat}']
+        users_df[f'ax_decision_duration_{stat}'] = users_df[f'decision_duration_{stat}']
+
+    # Add the num_actions_diff metric
+    users_df['num_actions_diff'] = users_df['num_actions'] - users_df['num_optimal']
+    users_df['frac_actions_diff'] = users_df['num_actions_diff'] / (20 - users_df['num_optimal'])
+
+    # Get normalized metric values
+    users_df['frac_dx_optimal'] = users_df['num_dx_optimal'] / users_df['num_actions']
+    users_df['frac_dx_followed'] = (users_df['num_dx_followed'] / users_df['num_actions']).where(users_df['has_dx'], None)
+    users_df['frac_ax_optimal'] = users_df['num_ax_optimal'] / users_df['num_actions']
+    users_df['frac_ax_followed'] = (users_df['num_ax_followed'] / users_df['num_actions']).where(users_df['has_ax'], None)
+
+    # Order the columns and cache the data frame
+    _cached_users_df = users_df[fields + [
+        'noise_level', 'has_noise', 'has_dx', 'has_ax', 'has_dxax', 'has_ax_only',
+        'has_dx_only', 'has_suggestions', 'suggestion_type',
+        'num_actions', 'num_refreshes', 'num_optimal', 'num_dx_optimal',
+        'num_ax_optimal', 'num_dx_corrupt', 'num_ax_corrupt', 'num_dx_followed',
+        'num_ax_followed',
+        'decision_duration_sum', 'dx_decision_duration_sum', 'ax_decision_duration_sum',
+        'decision_duration_mean', 'dx_decision_duration_mean', 'ax_decision_duration_mean',
+        'decision_duration_median', 'dx_decision_duration_median', 'ax_decision_duration_median',
+        'diagnosis_certainty_sum', 'diagnosis_certainty_mean', 'diagnosis_certainty_median',
+        'num_actions_diff', 'frac_actions_diff', 'frac_dx_optimal', 'frac_dx_followed',
+        'frac_ax_optimal', 'frac_ax_followed',
+    ]].reset_index(drop=True)
 
     return _cached_users_df.copy()
 
@@ -174,28 +196,43 @@ def get_actions_df(*, actions=None, use_cache=True):
     if (actions is None and use_cache) and _cached_actions_df is not None:
         return _cached_actions_df.copy()
 
-    # Create a new df
-    actions = actions or load_valid_actions()
-    _cached_actions_df = actions.values()
+    # Create a new df. The actions are fetched with their users in one query
+    actions = actions if actions is not None else load_valid_actions()
+    actions = list(actions.select_related('user').annotate(
+        _diagnoses_mask=ExpressionWrapper(F('diagnoses'), output_field=BigIntegerField())
+    ))
+    _cached_actions_df = [
+        { field.attname: getattr(action, field.attname) for field in StudyAction._meta.concrete_fields }
+        for action in actions
+    ]
+
+    # Get the index of each action, and the number of actions and refreshes of
+    # each user, from all the actions of the users in a second query
+    user_actions = StudyAction.objects.filter(user__in={ action.user_id for action in actions }).with_action_idx()
+    action_idx, num_actions, num_refreshes = {}, collections.Counter(), collections.Counter()
+    for pk, user_id, idx, browser_refreshed in user_actions.values_list('pk', 'user_id', '_action_idx', 'browser_refreshed'):
+        action_idx[pk] = idx
+        num_actions[user_id] += 1
+        num_refreshes[user_id] += 1 if browser_refreshed else 0
 
     # Add commmon information to the data frames
     for action, data in zip(actions, _cached_actions_df):
-        data['action_idx'] = action.action_idx
+        data['action_idx'] = action._action_idx = action_idx[action.pk]
 
         # Create State, Action, Transition objects
-        start_state = State(eval(action.start_state))
-        next_state = State(eval(action.next_state))
+        start_state = action.get_start_state()
+        next_state = action.get_next_state()
         transition = Transition(start_state, action.action, next_state)
 
         # Get data from the user
-        data.update(model_to_dict(action.user))
+        data.update(model_to_dict(action.user, exclude=['groups', 'user_permissions', 'next_state_key', 'next_state_response']))
         del data['amt_worker_id']
         del data['password']
         del data['unique_key']
         data['id'] = action.pk
 
-        data['num_actions'] = action.user.num_actions
-        if action.user.studyaction_set.filter(browser_refreshed=True).count() > 0:
+        data['num_actions'] = num_actions[action.user_id]
+        if num_refreshes[action.user_id] > 0:
             data['scenario_completed'] = False
             data['num_actions'] = 20
 
@@ -236,10 +273,6 @@ def get_actions_df(*, actions=None, use_cache=True):
         data['optimal_dx'] = action.chose_dx_optimal
         data['optimal_ax'] = action.chose_ax_optimal
 
-        # Widen out the data for each diagnosis
-        for diagnosis in constants.DIAGNOSES.keys():
-            data[f'{diagnosis}_selected'] = diagnosis in action.diagnoses
-
         # Add information about the state itself
         data['failed_to_place'] = (
             None if start_state.gripper_empty
@@ -260,6 +293,13 @@ def get_actions_df(*, actions=None, use_cache=True):
     # Make a data frame from the information
     _cached_actions_df = pd.DataFrame(_cached_actions_df)
 
+    # Widen out the data for each diagnosis from the bits of the masks
+    masks = np.array([action._diagnoses_mask for action in actions], dtype=np.int64)
+    selected = ((masks[:, np.newaxis] >> np.arange(len(constants.DIAGNOSES))) & 1).astype(bool)
+    loc = _cached_actions_df.columns.get_loc('failed_to_place')
+    for idx, diagnosis in enumerate(constants.DIAGNOSES.keys()):
+        _cached_actions_df.insert(loc + idx, f'{diagnosis}_selected', selected[:, idx])
+
     # Update the state information so that it incorporates value counts
     state_counts = _cached_actions_df['start_state'].value_counts()
     action_counts = _cached_actions_df['action'].value_counts()
@@ -0,0 +1,140 @@
+import datetime
+import random
+import unittest
+
+import pandas as pd
+
+from django.test import TestCase
+from django.utils import timezone
+
+from dining_room import constants
+from dining_room.models import User, StudyAction
+from dining_room.models.domain import State, Transition
+
+# The analysis needs packages that are not installed on the website
+try:
+    from dining_room.stats import data_loader
+except ImportError as e:
+    data_loader = None
+
+
+# The tests for the data frames of the analysis go here
+
+@unittest.skipIf(data_loader is None, "The analysis packages are not installed")
+class DataLoaderTestCase(TestCase):
+    """
+    Test the data frames of the users and the actions against the values
+    computed from each of the rows
+    """
+
+    STUDY_CONDITIONS = [
+        User.StudyConditions.BASELINE,
+        User.StudyConditions.DX_100,
+        User.StudyConditions.AX_90,
+        User.StudyConditions.DXAX_80,
+    ]
+
+    def setUp(self):
+        rng = random.Random(0)
+        start_conditions = [x for x in User.StartConditions.values if x is not None]
+
+        # Create participants with short runs of actions. The last one has
+        # refreshed their browser
+        for idx, study_condition in enumerate(DataLoaderTestCase.STUDY_CONDITIONS):
+            user = User.objects.create_user(
+                f'test_user_{idx}', f'test_user_{idx}',
+                study_condition=study_condition,
+                start_condition=rng.choice(start_conditions)
+            )
+
+            state = State(user.start_condition)
+            start_time = timezone.now() - datetime.timedelta(minutes=10)
+            for action_idx in range(rng.randint(2, 6)):
+                valid_actions = [k for k, v in state.get_valid_actions().items() if v]
+                action = rng.choice(valid_actions)
+                next_state = Transition.get_end_state(state, action) or state
+                StudyAction.objects.create(
+                    user=user,
+                    start_timestamp=start_time,
+                    end_timestamp=start_time + datetime.timedelta(seconds=10),
+                    start_state=repr(state),
+                    diagnoses=rng.sample(list(constants.DIAGNOSES.keys()), 2),
+                    diagnosis_certainty=rng.randint(0, 4),
+                    action=action,
+                    next_state=repr(next_state),
+                    video_loaded_time=start_time,
+                    video_stop_time=start_time + datetime.timedelta(seconds=1),
+                    dx_selected_time=start_time + datetime.timedelta(seconds=2),
+                    dx_confirmed_time=start_time + datetime.timedelta(seconds=3),
+                    ax_selected_time=start_time + datetime.timedelta(seconds=rng.randint(4, 9)),
+                    browser_refreshed=(idx == len(DataLoaderTestCase.STUDY_CONDITIONS) - 1 and action_idx == 0),
+                    corrupted_dx_suggestions=rng.random() < 0.3,
+                    corrupted_ax_suggestions=rng.random() < 0.3,
+                    dx_suggestions=rng.sample(list(constants.DIAGNOSES.keys()), 1),
+                    ax_suggestions=[rng.choice(valid_actions)],
+                )
+
+                start_time += datetime.timedelta(seconds=11)
+                state = next_state
+
+    def test_users_df(self):
+        users = data_loader.load_valid_users()
+        users_df = data_loader.get_users_df(users=users).set_index('id')
+        self.assertEqual(len(DataLoaderTestCase.STUDY_CONDITIONS), len(users_df))
+
+        for user in users:
+            row = users_df.loc[user.pk]
+            actions = list(user.studyaction_set.order_by('start_timestamp'))
+            refreshed = any(x.browser_refreshed for x in actions)
+
+            self.assertEqual(20 if refreshed else user.num_actions, row['num_actions'])
+            self.assertEqual(sum(x.browser_refreshed for x in actions), row['num_refreshes'])
+            self.assertEqual(len(constants.OPTIMAL_ACTION_SEQUENCES[user.start_condition]) - 1, row['num_optimal'])
+            self.assertEqual(sum(bool(x.chose_dx_optimal) for x in actions), row['num_dx_optimal'])
+            self.assertEqual(sum(bool(x.chose_ax_optimal) for x in actions), row['num_ax_optimal'])
+            self.assertAlmostEqual(sum(x.decision_duration.total_seconds() for x in actions), row['decision_duration_sum'])
+            self.assertEqual(sum(x.diagnosis_certainty for x in actions), row['diagnosis_certainty_sum'])
+
+            # The suggestion counts are only defined for the conditions that
+            # show the suggestions
+            if user.show_dx_suggestions:
+                self.assertEqual(sum(bool(x.chose_dx_suggestion) for x in actions), row['num_dx_followed'])
+                self.assertEqual(sum(x.corrupted_dx_suggestions for x in actions), row['num_dx_corrupt'])
+            else:
+                self.assertTrue(pd.isna(row['num_dx_followed']))
+                self.assertTrue(pd.isna(row['num_dx_corrupt']))
+
+            if user.show_ax_suggestions:
+                self.assertEqual(sum(bool(x.chose_ax_suggestion) for x in actions), row['num_ax_followed'])
+                self.assertEqual(sum(x.corrupted_ax_suggestions for x in actions), row['num_ax_corrupt'])
+            else:
+                self.assertTrue(pd.isna(row['num_ax_followed']))
+                self.assertTrue(pd.isna(row['num_ax_corrupt']))
+
+    def test_actions_df(self):
+        actions = data_loader.load_valid_actions()
+        actions_df = data_loader.get_actions_df(actions=actions).set_index('id')
+        self.assertEqual(StudyAction.objects.count(), len(actions_df))
+
+        for action in StudyAction.objects.all():
+            row = actions_df.loc[action.pk]
+            refreshed = action.user.studyaction_set.filter(browser_refreshed=True).exists()
+
+            self.assertEqual(action.action_idx, row['action_idx'])
+            self.assertEqual(20 if refreshed else action.user.num_actions, row['num_actions'])
+            self.assertEqual(action.chose_dx_suggestion, row['chose_dx'])
+            self.assertEqual(action.chose_ax_suggestion, row['chose_ax'])
+            self.assertEqual(action.chose_dx_optimal, row['optimal_dx'])
+            self.assertEqual(action.chose_ax_optimal, row['optimal_ax'])
+            for diagnosis in constants.DIAGNOSES.keys():
+                self.assertEqual(diagnosis in action.diagnoses, row[f'{diagnosis}_selected'])
+
+            start_state = action.get_start_state()
+            self.assertEqual(start_state.mislocalized, row['mislocalized'])
+            self.assertEqual('mug' in start_state.visible_objects, row['mug_visible'])
+
+        # The actions of a user should be indexed from 0 even if only some of
+        # them are loaded
+        action = StudyAction.objects.order_by('-start_timestamp')[0]
+        actions_df = data_loader.get_actions_df(actions=StudyAction.objects.filter(pk=action.pk))
+        self.assertEqual(action.user.num_actions - 1, actions_df.loc[0, 'action_idx'])
@@ -6,11 +6,15 @@ import unittest
 import numpy as np
 
 from django.test import SimpleTestCase, TestCase, Client
+from django.utils import timezone
+from django.core.cache import cache
+from django.urls import reverse
 
 from dining_room import constants
-from dining_room.models import User, StudyManagement
+from dining_room.models import User, StudyManagement, StudyAction
 from dining_room.models.domain import State, Transition, Suggestions
-from dining_room.views import get_next_state_json, get_suggestions_json
+from dining_room.models.engine import TransitionTable
+from dining_room.views import dbx, get_next_state_json, get_static_state_json, get_suggestions_json
 
 
 # The tests for various aspects of the Dining Room domain
@@ -63,6 +67,151 @@ class TransitionTestCase(SimpleTestCase):
             start_state_tuple = start_state_str.split('.')
             self._run_test_action_sequence(start_state_tuple, action_sequence)
 
+    def test_cached_state_json(self):
+        """Test that the static part of the state JSON is cached per version of
+        the video links, and that the responses do not share it"""
+        state_tuple = tuple(next(iter(constants.OPTIMAL_ACTION_SEQUENCES.keys())).split('.'))
+        version = dbx.video_links.version
+        get_static_state_json.cache_clear()
+
+        next_json = get_next_state_json(state_tuple, None)
+        next_json['scenario_completed'] = None
+        self.assertIs(get_static_state_json(state_tuple, None, version)[0], get_static_state_json(state_tuple, None, version)[0])
+        self.assertIsNot(get_static_state_json(state_tuple, None, version)[0], get_static_state_json(state_tuple, None, (version, 'new'))[0])
+        self.assertFalse(get_next_state_json(state_tuple, None)['scenario_completed'])
+        self.assertEqual(2, get_static_state_json.cache_info().currsize)
+
+
+class StateTestCase(SimpleTestCase):
+    """
+    Test the State objects
+    """
+
+    def test_interned_and_immutable(self):
+        """Test that each distinct state exists only once and cannot change"""
+        state = State(['kc', 'kc', 'default', 'above_mug', 'default', None, 'dt'])
+        self.assertIs(state, State(('kc', 'kc', 'default', 'above_mug', 'default', 'empty', 'dt')))
+        self.assertIs(state, State('kc.kc.default.above_mug.default.empty.dt'))
+        self.assertIs(state, State(state.code))
+        self.assertIs(state, copy.deepcopy(state))
+        self.assertIs(state.visible_objects, state.visible_objects)
+
+        with self.assertRaises(AttributeError):
+            state.base_location = 'dt'
+
+        end_state = state.replace(base_location='dt')
+        self.assertEqual('kc', state.base_location)
+        self.assertEqual(('dt', 'kc', 'default', 'above_mug', 'default', 'empty', 'dt'), end_state.tuple)
+
+    def test_from_repr_and_all_states(self):
+        """Test parsing the states in the CSV files, and the list of all states"""
+        state = State('kc.kc.default.above_mug.default.empty.dt')
+        self.assertIs(state, State.from_repr(repr(state)))
+        self.assertRaises(ValueError, State.from_repr, "__import__('os')")
+
+        all_states = State.all_states()
+        self.assertIn(state, all_states)
+        self.assertEqual(len(all_states), len(set(x.code for x in all_states)))
+
+
+class TransitionTableTestCase(SimpleTestCase):
+    """
+    Test that the compiled transitions match the rules in the domain
+    """
+
+    def setUp(self):
+        self.table = TransitionTable(constants.OPTIMAL_ACTION_SEQUENCES.keys())
+
+    def test_compiled_transitions(self):
+        """Test every (state, action) pair in the table against the rules"""
+        for state in self.table.states:
+            self.assertDictEqual(state.get_valid_actions(), self.table.get_valid_actions(state))
+            self.assertEqual(Transition(None, None, state).video_name, self.table.step(state, None).video_name)
+
+            for action in constants.ACTIONS.keys():
+                end_state = Transition.get_end_state(state, action)
+                self.assertEqual(end_state, self.table.get_end_state(state, action))
+
+                # Check the step against the transition that the view would use
+                step = self.table.step(state, action)
+                transition = Transition(None, None, state) if end_state is None else Transition(state, action, end_state)
+                self.assertEqual(transition.end_state, step.end_state)
+                self.assertEqual(end_state is not None, step.action_result)
+                self.assertEqual(transition.arm_status, step.arm_status)
+                self.assertEqual(transition.video_name, step.video_name)
+
+    def test_unknown_state(self):
+        """Test that states outside the table are compiled into it"""
+        state = State(['c', 'dt', 'gripper', 'gripper', 'default', 'bowl', 'c'])
+        self.assertNotIn(state, self.table)
+        self.assertDictEqual(state.get_valid_actions(), self.table.get_valid_actions(state))
+        self.assertIn(state, self.table)
+        for action in constants.ACTIONS.keys():
+            self.assertEqual(Transition.get_end_state(state, action), self.table.get_end_state(state, action))
+
+    def test_unknown_action(self):
+        """Test that an unknown action is a noop that is not applicable"""
+        state = self.table.states[0]
+        step = self.table.step(state, 'unknown_action')
+        transition = Transition(None, None, state)
+        self.assertIsNone(Transition.get_end_state(state, 'unknown_action'))
+        self.assertEqual(state, step.end_state)
+        self.assertFalse(step.action_result)
+        self.assertEqual(transition.arm_status, step.arm_status)
+        self.assertEqual(transition.video_name, step.video_name)
+
+    def test_check_video_links(self):
+        """Test the cross-check of the videos against the video links"""
+        video_links = { x: f'https://example.com/{x}' for x in self.table.videos[1:] }
+        video_links['unused.mp4'] = 'https://example.com/unused.mp4'
+
+        missing, unused = self.table.check_video_links(video_links)
+        self.assertListEqual([self.table.videos[0]], missing)
+        self.assertListEqual(['unused.mp4'], unused)
+
+        # All the videos should be in the manifest of the transitions
+        for video_name in self.table.videos:
+            self.assertIn(video_name, Transition.VIDEO_MANIFEST.values())
+
+    def test_suggestions_table(self):
+        """Test that the precomputed suggestions match the rules"""
+        for state in self.table.states:
+            entry = Suggestions.TABLE[state]
+            self.assertTupleEqual(Suggestions._get_optimal_action(state), entry.optimal_action)
+            self.assertTupleEqual(Suggestions._get_ordered_diagnoses(state, False), entry.ordered_diagnoses)
+            self.assertTupleEqual(Suggestions._get_ordered_diagnoses(state, True), entry.accumulated_diagnoses)
+            self.assertTupleEqual(
+                tuple(k for k, v in state.get_valid_actions().items() if v and k not in entry.optimal_action),
+                entry.ax_alternatives
+            )
+            self.assertSetEqual(set(constants.DIAGNOSES.keys()), set(entry.accumulated_diagnoses) | set(entry.dx_alternatives))
+
+    def test_state_codes(self):
+        """Test the conversion of states to and from codes"""
+        for state in self.table.states:
+            self.assertLess(state.code, 1 << State.CODE_BITS)
+            self.assertEqual(state, State(state.code))
+            self.assertEqual(state, State(state.string))
+            self.assertEqual(state.tuple, State.decode(State.encode(state.tuple)))
+
+        self.assertEqual(len(self.table), len(set(self.table.codes.tolist())))
+        self.assertRaises(ValueError, State.decode, 1 << State.CODE_BITS)
+        self.assertRaises(ValueError, State.decode, 3)
+
+    def test_step_codes(self):
+        """Test the batch steps against the rules"""
+        states = self.table.states
+        state_codes = TransitionTable.encode_states(states)[:, None]
+        action_codes = np.arange(len(constants.ACTIONS))[None, :]
+
+        end_state_codes, valid = self.table.step_codes(state_codes, action_codes)
+        self.assertEqual((len(states), len(constants.ACTIONS)), end_state_codes.shape)
+        for state_idx, state in enumerate(states):
+            for action_idx, action in enumerate(constants.ACTIONS.keys()):
+                end_state = Transition.get_end_state(state, action)
+                self.assertEqual(end_state is not None, valid[state_idx, action_idx])
+                self.assertEqual(end_state or state, State(end_state_codes[state_idx, action_idx]))
+
 
 class SuggestionsTestCase(TestCase):
     """
@@ -70,6 +219,7 @@ class SuggestionsTestCase(TestCase):
     """
 
     def setUp(self):
+        cache.clear()
         self.sm = StudyManagement.get_default()
 
         # Create a user and log them in
@@ -514,3 +664,138 @@ class SuggestionsTestCase(TestCase):
 
                 # Check that we have encountered noise in this condition
                 self.assertTrue(encountered_noise, f"Did not encounter noise in {study_condition}, {start_state_str}")
+
+    def test_counter_rng(self):
+        """Test that the counter-based rng replays from the request number alone
+        and does not touch the user's saved rng state"""
+        self.sm.max_dx_suggestions = 3
+        self.sm.max_ax_suggestions = 3
+        self.sm.pad_suggestions = True
+        self.sm.counter_rng = True
+        self.sm.save()
+
+        self.user.study_condition = User.StudyConditions.DXAX_80
+        self.user.save()
+
+        for start_state_str, action_sequence in constants.OPTIMAL_ACTION_SEQUENCES.items():
+            for idx, (action, expected_values) in enumerate(action_sequence):
+                self.user.number_state_requests += 1
+                self.user.save()
+
+                # The suggestions provider and the shadow rng are created from
+                # the request number; the rng state should remain unchanged
+                self.user.refresh_from_db()
+                self.suggestions_provider = Suggestions(self.user)
+                self.rng = Suggestions.get_counter_rng(self.user.pk, self.user.number_state_requests)
+
+                state = State(expected_values['server_state_tuple'])
+                self._test_dx_suggestions(state, action, expected_values['dx_suggestions'], pad=True)
+
+                expected_suggestions = [] if idx == len(action_sequence)-1 else [action_sequence[idx+1][0]]
+                self._test_ax_suggestions(state, action, expected_suggestions, pad=True)
+
+                self.user.refresh_from_db()
+                self.assertEqual(Suggestions.DEFAULT_RNG_SEED, self.user.rng_state)
+
+        # A user that replays the requests should get the same draws
+        sim_user = User.objects.create_user('sim_user', 'sim_user')
+        sim_user.number_state_requests = self.user.number_state_requests
+        expected = Suggestions.get_counter_rng(self.user.pk, self.user.number_state_requests).random()
+        self.assertNotEqual(expected, Suggestions(sim_user).rng.random())
+        sim_user.replay_of = self.user
+        self.assertEqual(expected, Suggestions(sim_user).rng.random())
+
+
+class StudyActionTestCase(TestCase):
+    """
+    Test the storage of the study actions
+    """
+
+    def _create_action(self, user, **kwargs):
+        """Create an action of the user now. The kwargs override the fields"""
+        now = timezone.now()
+        fields = dict(
+            user=user,
+            start_timestamp=now,
+            end_timestamp=now,
+            start_state=repr(State('kc.kc.default.above_mug.default.empty.dt')),
+            diagnoses=['none', 'lost'],
+            diagnosis_certainty=2,
+            action='look_at_kc',
+            video_loaded_time=now,
+            video_stop_time=now,
+            dx_selected_time=now,
+            dx_confirmed_time=now,
+            ax_selected_time=now,
+        )
+        fields.update(kwargs)
+        return StudyAction.objects.create(**fields)
+
+    def test_bitmask_sets(self):
+        """Test that the sets of diagnoses and suggestions are stored as masks"""
+        user = User.objects.create_user('test_user', 'test_user')
+        action = self._create_action(user, dx_suggestions=['cannot_see', 'lost'])
+
+        action.refresh_from_db()
+        self.assertListEqual(['lost', 'none'], action.diagnoses)
+        self.assertListEqual(['lost', 'cannot_see'], action.dx_suggestions)
+        self.assertIsNone(action.ax_suggestions)
+        self.assertTrue(action.chose_dx_suggestion)
+
+        self.assertEqual(1 | (1 << 10), StudyAction._meta.get_field('diagnoses').get_prep_value(action.diagnoses))
+        self.assertEqual(1, StudyAction.objects.filter(diagnoses__has_any=['none', 'cannot_see']).count())
+        self.assertEqual(0, StudyAction.objects.filter(diagnoses__has_any=['cannot_see']).count())
+        self.assertEqual(1, StudyAction.objects.filter(diagnoses=['lost', 'none']).count())
+
+    def test_bitmask_sets_admin(self):
+        """Test that the admin displays the sets, including empty sets"""
+        user = User.objects.create_user('test_user', 'test_user')
+        self._create_action(user, diagnoses=[], dx_suggestions=['lost'])
+        staff = User.objects.create_superuser('test_staff', 'test_staff')
+
+        client = Client()
+        client.force_login(staff)
+        response = client.get(reverse('admin:dining_room_studyaction_changelist'))
+        self.assertEqual(200, response.status_code)
+        self.assertContains(response, 'Look at Kitchen Counter')
+
+    def test_recompute_choices(self):
+        """Test that stale choices are recomputed, and that the actions can be
+        filtered on their states in the DB"""
+        user = User.objects.create_user('test_user', 'test_user')
+        for start_condition in User.StartConditions.values:
+            if start_condition is None:
+                continue
+
+            state = State(start_condition)
+            for action in ['look_at_kc', 'at_dt', 'go_to_dt']:
+                self._create_action(
+                    user,
+                    start_state=repr(state),
+                    action=action,
+                    next_state=repr(Transition.get_end_state(state, action) or state),
+                    dx_suggestions=['lost'],
+                    ax_suggestions=['look_at_kc'],
+                )
+
+        expected = { action.pk: StudyAction.compute_choices(action) for action in StudyAction.objects.all() }
+        self.assertIn(True, [x['chose_dx_optimal'] for x in expected.values()])
+        self.assertIn(False, [x['chose_ax_optimal'] for x in expected.values()])
+
+        # Make the choices stale, and recompute them
+        StudyAction.objects.update(chose_dx_suggestion=None, chose_ax_suggestion=None, chose_dx_optimal=None, chose_ax_optimal=None)
+        self.assertEqual(len(expected), StudyAction.objects.all().recompute_choices(batch_size=5))
+        for action in StudyAction.objects.all():
+            self.assertDictEqual(expected[action.pk], { name: getattr(action, name) for name in StudyAction.CHOICE_FIELDS })
+
+        # Filter on the states
+        actions = list(StudyAction.objects.all())
+        for predicate, field in [
+            (lambda x: x.mislocalized, 'start_state'),
+            (lambda x: 'mug' in x.visible_objects, 'start_state'),
+            (lambda x: x.base_location == 'dt', 'next_state'),
+        ]:
+            getter = StudyAction.get_start_state if field == 'start_state' else StudyAction.get_next_state
+            expected_pks = { x.pk for x in actions if predicate(getter(x)) }
+            self.assertNotEqual(0, len(expected_pks))
+            self.assertSetEqual(expected_pks, set(StudyAction.objects.filter_state(predicate, field=field).values_list('pk', flat=True)))
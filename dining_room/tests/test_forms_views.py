@@ -1,16 +1,33 @@
+import os
+import io
+import csv
 import itertools
+import collections
 import datetime
 import random
+import contextlib
+from unittest import mock
 
+import dropbox
+
+from django.conf import settings
 from django.test import SimpleTestCase, TestCase, Client
+from django.core.cache import cache
+from django.core.management import call_command
 from django.db.models import Q
 from django.urls import reverse
+from django.contrib.auth.hashers import make_password
 from django.contrib.messages import get_messages
 from django.utils import timezone
 
-from dining_room.models import User, StudyManagement
+from dining_room.models import User, StudyManagement, ConditionQuota, PooledAccount, ActionLogEntry
+from dining_room.models.domain import State
 from dining_room.forms import CreateUserForm
-from dining_room.utils import DropboxConnection
+from dining_room.hashers import ParticipantPasswordHasher, is_participant_password
+from dining_room.utils import DropboxConnection, ActionLogWriter, LockError, cache_lock, claim_interval
+from dining_room import views
+from dining_room.views import create_admission
+from db_mutex.models import DBMutex
 
 
 # The tests for the various forms and views go here
@@ -20,6 +37,7 @@ class LoginTestCase(TestCase):
     A simple test case to test whether logins work
     """
     def test_login(self):
+        cache.clear()
         sm = StudyManagement.get_default()
 
         # Create a user. Password should be the same as their username
@@ -34,6 +52,108 @@ class LoginTestCase(TestCase):
         self.assertTrue(logged_in)
         self.assertEqual(sm, user.study_management)
 
+    def test_participant_passwords(self):
+        """Participants get cheap password hashes; staff do not, and cannot
+        log in with such hashes"""
+        user = User.objects.create_user('test_user', 'test_user')
+        self.assertTrue(is_participant_password(user.password))
+        self.assertTrue(self.client.login(username='test_user', password='test_user'))
+        self.assertFalse(Client().login(username='test_user', password='wrong_password'))
+
+        # The hash should not be upgraded on login
+        password = user.password
+        user.refresh_from_db()
+        self.assertEqual(password, user.password)
+
+        staff = User.objects.create_superuser('test_staff', 'test_staff')
+        self.assertFalse(is_participant_password(staff.password))
+        self.assertTrue(Client().login(username='test_staff', password='test_staff'))
+
+        # Staff logged in without a backend should stay logged in
+        client = Client()
+        client.force_login(staff)
+        self.assertEqual(200, client.get(reverse('admin:index')).status_code)
+
+        staff.password = make_password('test_staff', hasher=ParticipantPasswordHasher.algorithm)
+        staff.save()
+        self.assertFalse(Client().login(username='test_staff', password='test_staff'))
+
+
+class UserUpdateTestCase(TestCase):
+    """
+    Test the field updates on the user
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('test_user', 'test_user')
+
+    def test_update(self):
+        self.user.update(scenario_completed=True)
+        self.user.increment('number_state_requests', 2)
+        self.assertEqual(1, self.user.number_state_requests)
+
+        user = User.objects.get(pk=self.user.pk)
+        self.assertTrue(user.scenario_completed)
+        self.assertEqual(1, user.number_state_requests)
+
+    def test_deferred_updates(self):
+        other_user = User.objects.get(pk=self.user.pk)
+
+        # Only a single query should be made at the end of the block
+        with self.assertNumQueries(1):
+            with self.user.deferred_updates():
+                self.user.increment('number_state_requests')
+                self.user.update(rng_state=5, scenario_completed=False)
+                self.user.increment('number_state_requests')
+
+        # Increments made through another instance should not be lost
+        other_user.increment('number_state_requests')
+
+        user = User.objects.get(pk=self.user.pk)
+        self.assertEqual(2, user.number_state_requests)
+        self.assertEqual(5, user.rng_state)
+        self.assertFalse(user.scenario_completed)
+
+
+class StudyManagementCacheTestCase(TestCase):
+    """
+    Test the caching of the study management objects
+    """
+
+    def setUp(self):
+        cache.clear()
+
+    def test_cached_default(self):
+        sm = StudyManagement.get_default()
+        with self.assertNumQueries(0):
+            self.assertIs(sm, StudyManagement.get_default())
+            self.assertIs(sm, StudyManagement.get_cached(sm.pk))
+
+        # Saving the object, or adding a new one, should invalidate the cache
+        sm.max_test_attempts = 1
+        sm.save()
+        self.assertIsNot(sm, StudyManagement.get_default())
+        self.assertEqual(1, StudyManagement.get_default().max_test_attempts)
+
+        sm.pk = None
+        sm.data_directory = 'new_data_directory'
+        sm.save()
+        self.assertEqual('new_data_directory', StudyManagement.get_default().data_directory)
+
+        # The cache should also be invalidated when other processes save
+        StudyManagement.objects.filter(pk=sm.pk).update(max_test_attempts=2)
+        cache.set(StudyManagement.CACHE_VERSION_KEY, 'other_process')
+        self.assertEqual(2, StudyManagement.get_default().max_test_attempts)
+
+        # Without a shared cache, the changes should be seen after the timeout
+        StudyManagement.objects.filter(pk=sm.pk).update(max_test_attempts=3)
+        with self.settings(CACHE_IS_SHARED=True):
+            self.assertEqual(2, StudyManagement.get_default().max_test_attempts)
+            StudyManagement._cache['expires'] = 0
+            self.assertEqual(2, StudyManagement.get_default().max_test_attempts)
+        self.assertEqual(3, StudyManagement.get_default().max_test_attempts)
+
 
 class CreateUserTestCase(TestCase):
     """
@@ -44,6 +164,7 @@ class CreateUserTestCase(TestCase):
     STUDY_CONDITIONS = [User.StudyConditions.BASELINE, User.StudyConditions.DXAX_100]
 
     def setUp(self):
+        cache.clear()
         sm = StudyManagement.get_default()
         sm.enabled_start_conditions = "\n".join(CreateUserTestCase.START_CONDITIONS)
         sm.enabled_study_conditions = StudyManagement.convert_to_enabled_study_conditions(CreateUserTestCase.STUDY_CONDITIONS)
@@ -103,6 +224,29 @@ class CreateUserTestCase(TestCase):
         response = self.client.post(reverse('dining_room:create'))
         self._assertFail(response)
 
+    def test_admission_control(self):
+        # The limit should hold whether the count is in the cache or in the DB
+        for cache_is_shared in [True, False]:
+            with self.settings(CACHE_IS_SHARED=cache_is_shared):
+                client = Client()
+                number_of_users = User.objects.count()
+
+                # Sign ups should be rejected while the limit is in flight
+                with contextlib.ExitStack() as in_flight:
+                    for _ in range(settings.CREATE_MAX_IN_FLIGHT):
+                        in_flight.enter_context(create_admission.admit())
+
+                    response = client.post(reverse('dining_room:create'))
+                    self.assertEqual(503, response.status_code)
+                    self.assertEqual(str(settings.CREATE_RETRY_AFTER), response['Retry-After'])
+                    self.assertEqual(settings.CREATE_MAX_IN_FLIGHT, create_admission.depth)
+                    self.assertEqual(number_of_users, User.objects.count())
+
+                # And admitted once there is room
+                response = client.post(reverse('dining_room:create'))
+                self._assertSuccess(response)
+                self.assertEqual(0, create_admission.depth)
+
     def test_invalidate_user_based_on_timestamp(self):
         response = self.client.post(reverse('dining_room:create'))
         self._assertSuccess(response)
@@ -112,10 +256,86 @@ class CreateUserTestCase(TestCase):
         user.save()
         self.assertFalse(user.invalid_data)
 
+        # Signing up should not mark the user; only the sweep should
         response = self.client.post(reverse('dining_room:create'))
         self._assertSuccess(response)
         user.refresh_from_db()
+        self.assertFalse(user.invalid_data)
+
+        self.assertEqual(1, ConditionQuota.sweep_abandoned(StudyManagement.get_default()))
+        user.refresh_from_db()
         self.assertTrue(user.invalid_data)
+        self.assertEqual(0, ConditionQuota.sweep_abandoned(StudyManagement.get_default()))
+
+    def test_account_pool(self):
+        self.assertEqual(2, PooledAccount.refill(2))
+        self.assertEqual(0, PooledAccount.refill(2))
+        usernames = set(PooledAccount.objects.values_list('username', flat=True))
+
+        # The user should be created from the pool, and be able to log in
+        response = self.client.post(reverse('dining_room:create'))
+        self._assertSuccess(response)
+        self.assertEqual(1, PooledAccount.objects.count())
+
+        user = User.objects.get(username__in=usernames)
+        self.assertIn(user.study_condition, CreateUserTestCase.STUDY_CONDITIONS)
+        self.assertTrue(Client().login(username=user.username, password=user.username))
+
+    def test_account_collision(self):
+        # A username that is taken after it was generated should be replaced
+        # instead of failing the sign up
+        User.objects.create_user('taken_user', 'taken_key')
+        accounts = [PooledAccount(username='taken_user', unique_key='new_key', password='!'), PooledAccount.generate()]
+        with mock.patch.object(PooledAccount, 'generate', side_effect=accounts):
+            response = self.client.post(reverse('dining_room:create'))
+        self._assertSuccess(response)
+        self.assertTrue(User.objects.filter(username=accounts[1].username).exists())
+
+    def test_condition_quotas(self):
+        sm = StudyManagement.get_default()
+        for _ in itertools.product(CreateUserTestCase.STUDY_CONDITIONS, CreateUserTestCase.START_CONDITIONS):
+            response = self.client.post(reverse('dining_room:create'))
+            self._assertSuccess(response)
+
+        # The quotas should be full
+        quotas = ConditionQuota.objects.filter(study_management=sm)
+        self.assertEqual(5, quotas.count())
+        self.assertEqual(4, quotas.get(study_condition__isnull=True).number_assigned)
+        self.assertEqual(0, quotas.filter(study_condition__isnull=False).exclude(number_assigned=1).count())
+        self.assertIsNone(ConditionQuota.allocate(sm))
+
+        # Invalidating a user should free up a slot once the quotas are full
+        user = User.objects.filter(is_staff=False, study_condition__in=CreateUserTestCase.STUDY_CONDITIONS).order_by('?')[0]
+        user.ignore_data_reason = 'test'
+        user.save()
+        self.assertTupleEqual((user.study_condition, user.start_condition), ConditionQuota.allocate(sm))
+        User.objects.create_user('test_user', 'test_user', study_condition=user.study_condition, start_condition=user.start_condition)
+        self.assertIsNone(ConditionQuota.allocate(sm))
+
+    def test_enable_condition(self):
+        sm = StudyManagement.get_default()
+        sm.max_number_of_people = 10
+        sm.number_per_condition = 2
+        sm.save()
+        for _ in itertools.product(CreateUserTestCase.STUDY_CONDITIONS, CreateUserTestCase.START_CONDITIONS):
+            response = self.client.post(reverse('dining_room:create'))
+            self._assertSuccess(response)
+
+        # The participants should go to the newly enabled condition first
+        sm.enabled_start_conditions = "\n".join(CreateUserTestCase.START_CONDITIONS + [User.StartConditions.AT_TABLE])
+        sm.save()
+        for _ in CreateUserTestCase.STUDY_CONDITIONS:
+            response = self.client.post(reverse('dining_room:create'))
+            self._assertSuccess(response)
+        new_users = User.objects.filter(is_staff=False, start_condition=User.StartConditions.AT_TABLE)
+        self.assertSetEqual(set(CreateUserTestCase.STUDY_CONDITIONS), set(new_users.values_list('study_condition', flat=True)))
+
+        # Invalidating a participant should free up their slot immediately
+        user = User.objects.get(pk=new_users[0].pk)
+        user.update(ignore_data_reason='test')
+        quotas = ConditionQuota.objects.filter(study_management=sm)
+        self.assertEqual(5, quotas.get(study_condition__isnull=True).number_assigned)
+        self.assertEqual(0, quotas.get(study_condition=user.study_condition, start_condition=user.start_condition).number_assigned)
 
     def test_expected_number_of_users(self):
         base_user_qs = User.objects.filter(Q(is_staff=False) & (Q(ignore_data_reason__isnull=True) | Q(ignore_data_reason='')))
@@ -149,6 +369,9 @@ class CreateUserTestCase(TestCase):
         user = random.choice(base_user_qs)
         user.last_login = timezone.now() - datetime.timedelta(minutes=47)
         user.save()
+        out = io.StringIO()
+        call_command('sweep_abandoned_users', stdout=out)
+        self.assertIn("Freed 1 slots", out.getvalue())
 
         # Add another user and check the counts
         another_client = Client()
@@ -190,3 +413,248 @@ class CSVTestCase(SimpleTestCase):
 
     def test_csv_headers(self):
         self.assertListEqual(CSVTestCase.EXPECTED_CSV_HEADERS, DropboxConnection.USERDATA_CSV_HEADERS)
+
+
+class MemoryStorage:
+    """An in-memory stand-in for the dropbox storage and its client"""
+
+    def __init__(self):
+        self.files = {}
+        self.error = None
+        self.client = self
+
+    def _full_path(self, name):
+        return name
+
+    def files_get_metadata(self, path):
+        return collections.namedtuple('Metadata', ['rev'])(str(hash(self.files[path])))
+
+    def open(self, name):
+        if self.error is not None:
+            raise self.error
+        if name not in self.files:
+            raise dropbox.exceptions.ApiError('id', dropbox.files.DownloadError.path(dropbox.files.LookupError.not_found), None, None)
+        return io.BytesIO(self.files[name])
+
+    def save(self, name, content):
+        if self.error is not None:
+            raise self.error
+        self.files[name] = content
+        return name
+
+
+class ActionLogTestCase(TestCase):
+    """
+    Test the action log and its mirroring to the CSV files
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('test_user', 'test_user')
+        self.dbx = DropboxConnection()
+        self.dbx.storage = MemoryStorage()
+        self.csv_filename = os.path.join(self.user.study_management.resolved_data_directory, self.user.csv_file)
+
+    def _get_csv_rows(self):
+        return list(csv.reader(io.StringIO(self.dbx.storage.files[self.csv_filename].decode('utf-8'))))
+
+    def test_mirror_action_log(self):
+        self.assertEqual(2, self.dbx.write_to_csv(self.user).num_rows)
+        self.assertEqual(3, self.dbx.write_to_csv(self.user, action='look_at_kc', start_state='kc.kc').num_rows)
+        self.assertEqual(0, len(self.dbx.storage.files))
+
+        # Mirror the rows & check that they're all in the CSV
+        self.assertListEqual([self.csv_filename], self.dbx.mirror_action_log())
+        rows = self._get_csv_rows()
+        self.assertListEqual(DropboxConnection.USERDATA_CSV_HEADERS, rows[0])
+        self.assertEqual(3, len(rows))
+        self.assertEqual('look_at_kc', rows[2][DropboxConnection.USERDATA_CSV_HEADERS.index('action')])
+        self.assertFalse(ActionLogEntry.objects.filter(mirrored=False).exists())
+
+        # Subsequent rows should be appended to the existing file
+        self.dbx.write_to_csv(self.user)
+        self.dbx.mirror_action_log()
+        self.dbx.mirror_action_log()
+        rows = self._get_csv_rows()
+        self.assertEqual(4, len(rows))
+        self.assertListEqual(rows[1][1:], rows[3][1:])
+
+    def test_mirror_lock(self):
+        self.dbx.write_to_csv(self.user)
+
+        # Only one process should mirror the log at a time, whether the lock is
+        # in the cache or in the DB
+        for cache_is_shared in [True, False]:
+            with self.settings(CACHE_IS_SHARED=cache_is_shared):
+                with cache_lock('mirror_action_log_lock'):
+                    self.assertRaises(LockError, self.dbx.mirror_action_log)
+                    self.assertEqual(0, len(self.dbx.storage.files))
+
+        self.assertListEqual([self.csv_filename], self.dbx.mirror_action_log())
+
+    def test_expired_lock(self):
+        # A lock that was not released by its holder should expire after its
+        # timeout in the DB as well
+        with self.settings(CACHE_IS_SHARED=False):
+            with cache_lock('expired_lock', timeout=60):
+                DBMutex.objects.filter(lock_id='expired_lock').update(creation_time=timezone.now() - datetime.timedelta(seconds=120))
+                with cache_lock('expired_lock', timeout=60):
+                    with self.assertRaises(LockError):
+                        with cache_lock('expired_lock', timeout=60):
+                            pass
+
+    def test_claim_interval(self):
+        # Only one process should claim each interval of a periodic job
+        for cache_is_shared in [True, False]:
+            with self.settings(CACHE_IS_SHARED=cache_is_shared):
+                self.assertTrue(claim_interval('periodic_job', 60))
+                self.assertFalse(claim_interval('periodic_job', 60))
+
+        # And the claim should expire after the interval
+        DBMutex.objects.filter(lock_id='interval:periodic_job').update(creation_time=timezone.now() - datetime.timedelta(seconds=120))
+        with self.settings(CACHE_IS_SHARED=False):
+            self.assertTrue(claim_interval('periodic_job', 60))
+
+    def test_idempotent_next_state(self):
+        # Serve the requests from the in-memory storage instead of dropbox
+        self.dbx.storage.save(DropboxConnection.VIDEO_LINKS_FILE, b'')
+        patcher = mock.patch.object(views, 'dbx', self.dbx)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        client = Client()
+        client.force_login(self.user)
+        data = {
+            'server_state_tuple': State(CreateUserTestCase.START_CONDITIONS[0]).tuple,
+            'action': 'look_at_kc',
+            'ui_state': { 'selected_action_idx': 1 },
+            'idempotency_key': 'request_1',
+        }
+
+        number_state_requests = self.user.number_state_requests
+
+        # Retries of a request should get the same response without the
+        # request being processed again, even in a process without the cache
+        responses = [client.post(reverse('dining_room:xhr_next_state'), data, content_type='application/json')]
+        cache.clear()
+        responses.append(client.post(reverse('dining_room:xhr_next_state'), data, content_type='application/json'))
+        self.assertDictEqual(responses[0].json(), responses[1].json())
+        self.user.refresh_from_db()
+        self.assertEqual(number_state_requests + 1, self.user.number_state_requests)
+        self.assertEqual(1, ActionLogEntry.objects.filter(user=self.user).count())
+
+        data['idempotency_key'] = 'request_2'
+        client.post(reverse('dining_room:xhr_next_state'), data, content_type='application/json')
+        self.user.refresh_from_db()
+        self.assertEqual(number_state_requests + 2, self.user.number_state_requests)
+        self.assertEqual(2, ActionLogEntry.objects.filter(user=self.user).count())
+
+        # Keys that do not fit on the user, or with unexpected characters,
+        # should be rejected instead of being processed on every retry
+        for idempotency_key in ['k' * 65, 'request 3', 3]:
+            data['idempotency_key'] = idempotency_key
+            response = client.post(reverse('dining_room:xhr_next_state'), data, content_type='application/json')
+            self.assertEqual(400, response.status_code)
+        self.assertEqual(2, ActionLogEntry.objects.filter(user=self.user).count())
+
+        data['idempotency_key'] = 'k' * 64
+        responses = [client.post(reverse('dining_room:xhr_next_state'), data, content_type='application/json') for _ in range(2)]
+        self.assertDictEqual(responses[0].json(), responses[1].json())
+        self.assertEqual(3, ActionLogEntry.objects.filter(user=self.user).count())
+
+    def test_progress(self):
+        for cache_is_shared in [True, False]:
+            with self.settings(CACHE_IS_SHARED=cache_is_shared):
+                ActionLogEntry.objects.all().delete()
+                cache.clear()
+
+                self.dbx.write_to_csv(self.user)
+                self.dbx.write_to_csv(self.user, action='look_at_kc', start_state='kc.kc', next_state='kc.dt')
+                self.dbx.write_to_csv(self.user)
+                progress = self.dbx.write_to_csv(self.user, action='look_at_kc', start_state='kc.dt', next_state='kc.c')
+                self.assertTupleEqual((2, 2, 'kc.c'), progress)
+                self.assertEqual(5, progress.num_rows)
+
+                # The progress should be recreated from the log if it is not
+                # cached, and it should reflect the rows added by other processes
+                cache.clear()
+                self.assertTupleEqual(progress, self.dbx.get_progress(self.user))
+                self.assertTupleEqual((3, 2, 'kc.c'), self.dbx.write_to_csv(self.user))
+                if not cache_is_shared:
+                    DropboxConnection().write_to_csv(self.user)
+                    self.assertTupleEqual((4, 2, 'kc.c'), self.dbx.get_progress(self.user))
+
+                    # The progress should not cost more queries as the log grows
+                    for _ in range(5):
+                        self.dbx.write_to_csv(self.user, action='look_at_kc', start_state='kc.c', next_state='kc.kc')
+                    with self.assertNumQueries(2):
+                        self.assertTupleEqual((4, 7, 'kc.kc'), self.dbx.get_progress(self.user))
+
+    def test_mirror_failures(self):
+        self.dbx.write_to_csv(self.user)
+
+        # Rows remain in the log until they are written
+        self.dbx.storage.error = dropbox.exceptions.RateLimitError('id', backoff=20)
+        self.assertRaises(dropbox.exceptions.RateLimitError, self.dbx.mirror_action_log)
+        self.assertTrue(ActionLogEntry.objects.filter(mirrored=False).exists())
+
+        self.dbx.storage.error = None
+        self.dbx.mirror_action_log()
+        self.assertEqual(2, len(self._get_csv_rows()))
+
+        # Errors reading an existing file should not overwrite it
+        self.dbx.write_to_csv(self.user)
+        self.dbx.storage.error = dropbox.exceptions.ApiError('id', dropbox.files.DownloadError.unsupported_file, None, None)
+        self.assertRaises(dropbox.exceptions.ApiError, self.dbx.mirror_action_log)
+        self.assertTrue(ActionLogEntry.objects.filter(mirrored=False).exists())
+
+        self.dbx.storage.error = None
+        self.dbx.mirror_action_log()
+        self.assertEqual(3, len(self._get_csv_rows()))
+
+        # Check the backoff of the writer
+        writer = ActionLogWriter(self.dbx, 5)
+        writer.num_failures = 1
+        self.assertEqual(5, writer.get_backoff(Exception()))
+        self.assertEqual(20, writer.get_backoff(dropbox.exceptions.RateLimitError('id', backoff=20)))
+        writer.num_failures = 4
+        self.assertEqual(40, writer.get_backoff(Exception()))
+        writer.num_failures = 20
+        self.assertEqual(ActionLogWriter.MAX_BACKOFF, writer.get_backoff(Exception()))
+
+
+class VideoLinksTestCase(SimpleTestCase):
+    """
+    Test the sharing and refreshing of the video links
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.storage = MemoryStorage()
+        self.storage.save(DropboxConnection.VIDEO_LINKS_FILE, b'a.mp4,https://example.com/a.mp4\n')
+
+        self.dbx = DropboxConnection()
+        self.dbx.storage = self.storage
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_shared_video_links(self):
+        video_links = self.dbx.video_links
+        self.assertDictEqual({ 'a.mp4': 'https://example.com/a.mp4' }, video_links)
+
+        # Another process should get the links from the cache
+        other_dbx = DropboxConnection()
+        other_dbx.storage = None
+        self.assertDictEqual(video_links, other_dbx.video_links)
+        self.assertEqual(video_links.version, other_dbx.video_links.version)
+
+        # The links should only change after they are refreshed
+        self.storage.save(DropboxConnection.VIDEO_LINKS_FILE, b'b.mp4,https://example.com/b.mp4\n')
+        self.assertIs(video_links, self.dbx.video_links)
+        self.assertEqual(self.dbx.refresh_video_links().version, self.dbx.refresh_video_links().version)
+
+        self.assertNotEqual(video_links.version, other_dbx.video_links.version)
+        self.assertDictEqual({ 'b.mp4': 'https://example.com/b.mp4' }, other_dbx.video_links)
+        self.assertDictEqual(other_dbx.video_links, self.dbx.video_links)
+
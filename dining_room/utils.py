@@ -4,29 +4,128 @@
 import os
 import io
 import csv
+import json
 import time
 import datetime
 import codecs
 import logging
+import contextlib
+import threading
+import collections
 
 import dropbox
 
 import numpy as np
 
+from django import db
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.base import File, ContentFile
+from django.db.models import Q, Count
 from django.utils import timezone
-from storages.backends.dropbox import DropBoxStorage, DropBoxStorageException
+from django.utils.crypto import get_random_string
+from storages.backends.dropbox import DropBoxStorage
 
-from .models import StudyManagement, StudyAction
+from db_mutex import DBMutexError, DBMutexTimeoutError
+from db_mutex.db_mutex import db_mutex
+from db_mutex.models import DBMutex
+
+from .models import StudyManagement, StudyAction, ActionLogEntry, PooledAccount, ConditionQuota
 
 
 logger = logging.getLogger(__name__)
 
 
+# Locks that are shared between the processes
+
+# Seconds between attempts to acquire a lock that is held
+LOCK_POLL_INTERVAL = 0.05
+
+
+class LockError(Exception):
+    """Raised when a lock is held by another process"""
+    pass
+
+
+@contextlib.contextmanager
+def cache_lock(name, timeout=600, wait=0):
+    """
+    Hold the lock called name for the duration of the context. If the lock is
+    held elsewhere, wait up to wait seconds for it to be released before
+    raising a LockError. The lock is kept in the cache when the cache is shared
+    between the processes, and otherwise in a row in the DB. Either way, it
+    expires after timeout seconds in case the holder dies
+    """
+    if settings.CACHE_IS_SHARED:
+        key, token = f'lock:{name}', get_random_string(12)
+
+        def acquire():
+            return cache.add(key, token, timeout)
+
+        def release():
+            if cache.get(key) == token:
+                cache.delete(key)
+    else:
+        mutex = db_mutex(name)
+
+        def acquire():
+            DBMutex.objects.filter(lock_id=name, creation_time__lte=timezone.now() - datetime.timedelta(seconds=timeout)).delete()
+            try:
+                mutex.start()
+                return True
+            except DBMutexError as e:
+                return False
+
+        def release():
+            try:
+                mutex.stop()
+            except DBMutexTimeoutError as e:
+                logger.warning(f"Lock {name} expired before it was released")
+
+    deadline = time.monotonic() + wait
+    while not acquire():
+        if time.monotonic() >= deadline:
+            raise LockError(f"Lock {name} is held")
+        time.sleep(LOCK_POLL_INTERVAL)
+
+    try:
+        yield
+    finally:
+        release()
+
+
+def claim_interval(name, interval):
+    """
+    Claim the run of the periodic job called name for the next interval
+    seconds. Only one process can claim each interval, so a job that runs in
+    every process runs once per interval. The claim is kept where
+    ``cache_lock`` keeps the locks, and it expires instead of being released.
+    Returns whether the interval was claimed
+    """
+    if settings.CACHE_IS_SHARED:
+        return cache.add(f'interval:{name}', get_random_string(12), interval)
+
+    lock_id = f'interval:{name}'
+    DBMutex.objects.filter(lock_id=lock_id, creation_time__lte=timezone.now() - datetime.timedelta(seconds=interval)).delete()
+    try:
+        db_mutex(lock_id).start()
+        return True
+    except DBMutexError as e:
+        return False
+
+
 # Dealing with dropbox connections
 
 
+def is_not_found_error(error):
+    """Check if the ApiError from dropbox is because the path does not exist"""
+    return (
+        isinstance(error.error, dropbox.files.DownloadError) and
+        error.error.is_path() and
+        error.error.get_path().is_not_found()
+    )
+
+
 class OverwriteDropboxStorage(DropBoxStorage):
     """
     Overwrite files when saving instead of the default add
@@ -76,6 +175,38 @@ class OverwriteDropboxStorage(DropBoxStorage):
                 cursor.offset = content.tell()
 
 
+class VideoLinks(dict):
+    """
+    A dictionary of video name -> video link, along with a version that changes
+    every time the links file changes (the Dropbox revision of the file). Data
+    derived from the links should be keyed by the version
+    """
+
+    def __init__(self, links, version):
+        super().__init__(links)
+        self.version = version
+
+
+class ParticipantProgress(collections.namedtuple('ParticipantProgress', ['restarts', 'actions', 'last_state'])):
+    """
+    The progress of a participant as recorded in their CSV: the number of
+    restart markers, the number of actions, and the state after the last action
+    """
+
+    __slots__ = ()
+
+    @property
+    def num_rows(self):
+        """The number of rows in the CSV, including the header"""
+        return 1 + self.restarts + self.actions
+
+    def add_row(self, data):
+        """Get the progress after adding the row of data (dict) to the CSV"""
+        if not data.get('start_state'):
+            return self._replace(restarts=self.restarts + 1)
+        return self._replace(actions=self.actions + 1, last_state=data.get('next_state'))
+
+
 class DropboxConnection:
     """
     Helper to wrap the excellent utilities already provided by the Dropbox
@@ -84,6 +215,15 @@ class DropboxConnection:
 
     VIDEO_LINKS_FILE = os.path.join(settings.DROPBOX_DATA_FOLDER, 'video_links.csv')
 
+    # The keys of the video links in the shared cache
+    VIDEO_LINKS_CACHE_KEY = 'video_links'
+    VIDEO_LINKS_VERSION_CACHE_KEY = 'video_links_version'
+
+    # The progress of the participants is kept in the cache if it is shared
+    # between the processes. Otherwise it is counted in the action log
+    PROGRESS_CACHE_KEY = 'progress:{user.pk}:{csv_filename}'
+    PROGRESS_CACHE_TIMEOUT = 24 * 60 * 60
+
     # The fields in the user data
     USERDATA_CSV_HEADERS = ['timestamp'] + StudyAction.get_csv_headers()
 
@@ -91,9 +231,13 @@ class DropboxConnection:
         # Create the storage system
         self.storage = OverwriteDropboxStorage()
 
-        # Cache some of the data so that we don't make too many requests
+        # Cache some of the data so that we don't make too many requests. The
+        # video links are shared between processes through the cache
         self._video_links = None
 
+        # The background threads. See start_writer and start_refresher
+        self.writer = self.refresher = None
+
     def _get_csv_rows(self, read_file):
         """Given a DropBoxFile, try to read it as a CSV and return the rows.
         The read file will be closed after this method is called"""
@@ -115,34 +259,62 @@ class DropboxConnection:
 
     @property
     def video_links(self):
-        """A dictionary of video name -> video CORS enabled link"""
-        if self._video_links is not None:
+        """A dictionary of video name -> video CORS enabled link. The links are
+        loaded from the shared cache if they have changed since they were last
+        loaded, and from dropbox if they are not in the cache"""
+        version = cache.get(DropboxConnection.VIDEO_LINKS_VERSION_CACHE_KEY)
+        if self._video_links is not None and (version is None or version == self._video_links.version):
             return self._video_links
 
+        video_links = cache.get(DropboxConnection.VIDEO_LINKS_CACHE_KEY)
+        if video_links is None or video_links.version != version:
+            video_links = self.refresh_video_links(force=True)
+
+        self._video_links = video_links
+        return self._video_links
+
+    def get_video_links_version(self):
+        """Get the version (revision) of the video links file on dropbox"""
+        metadata = self.storage.client.files_get_metadata(self.storage._full_path(DropboxConnection.VIDEO_LINKS_FILE))
+        return metadata.rev
+
+    def refresh_video_links(self, force=False):
+        """
+        Download the video links from dropbox and share them through the cache
+        if the file on dropbox has changed since the links were cached, or if
+        force is True. Returns the VideoLinks
+        """
+        version = self.get_video_links_version()
+        video_links = cache.get(DropboxConnection.VIDEO_LINKS_CACHE_KEY)
+        if not force and video_links is not None and video_links.version == version:
+            return video_links
+
         # Get the links file from dropbox
         links_file = self.storage.open(DropboxConnection.VIDEO_LINKS_FILE)
         links_data = self._get_csv_rows(links_file)
 
-        # Create the links dictionary
-        self._video_links = { l[0]: l[-1] for l in links_data }
-        return self._video_links
+        # Create the links dictionary and share it
+        video_links = VideoLinks({ l[0]: l[-1] for l in links_data }, version)
+        cache.set_many({
+            DropboxConnection.VIDEO_LINKS_CACHE_KEY: video_links,
+            DropboxConnection.VIDEO_LINKS_VERSION_CACHE_KEY: version,
+        }, timeout=None)
+
+        logger.info(f"Loaded {len(video_links)} video links; version {version}")
+        return video_links
 
     def write_to_csv(self, user, **data):
         """
-        Given a dictionary of data, write it to the users's CSV. An empty
-        dictionary is added automatically as a restart marker with a timestamp
-        of now()
+        Given a dictionary of data, append it to the log of the users's CSV. An
+        empty dictionary is added automatically as a restart marker with a
+        timestamp of now(). The log is written to the CSV on Dropbox by
+        ``mirror_action_log``
 
-        Returns the rows of data that are in the CSV
+        Returns the ParticipantProgress of the user after adding the row
         """
-        sm = user.study_management or StudyManagement.get_default()
-        csv_filename = os.path.join(sm.resolved_data_directory, user.csv_file)
-
-        try:
-            read_file = self.storage.open(csv_filename)
-            experiment_data = self._get_csv_rows(read_file)
-        except (dropbox.exceptions.ApiError, DropBoxStorageException) as e:
-            experiment_data = [DropboxConnection.USERDATA_CSV_HEADERS]
+        csv_filename = self._get_csv_filename(user)
+        progress_key = DropboxConnection.PROGRESS_CACHE_KEY.format(user=user, csv_filename=csv_filename)
+        progress = cache.get(progress_key) if settings.CACHE_IS_SHARED else None
 
         # If there is no incoming data (the user has restarted), then
         # create a dictionary. Otherwise, we set the timestamp field here
@@ -156,15 +328,355 @@ class DropboxConnection:
             # We specifically test here for equality to None
             row.append(data[header] if data.get(header) is not None else '')
 
-        # Add the row to the CSV data
-        experiment_data.append(row)
+        # Add the row to the log
+        ActionLogEntry.objects.create(
+            user=user,
+            csv_filename=csv_filename,
+            row=json.dumps(row, default=str),
+            is_restart=not data.get('start_state')
+        )
+        if self.writer is not None:
+            self.writer.notify()
+
+        # Update the progress of the user
+        if progress is None:
+            return self.get_progress(user)
+
+        progress = progress.add_row(data)
+        cache.set(progress_key, progress, DropboxConnection.PROGRESS_CACHE_TIMEOUT)
+        return progress
+
+    def _get_csv_filename(self, user):
+        """Get the path of the user's CSV file"""
+        sm = user.cached_study_management or StudyManagement.get_default()
+        return os.path.join(sm.resolved_data_directory, user.csv_file)
+
+    def get_progress(self, user):
+        """Get the ParticipantProgress of the user. The progress is read from
+        the shared cache, or counted in the action log if it is not there or if
+        the cache is not shared"""
+        csv_filename = self._get_csv_filename(user)
+        progress_key = DropboxConnection.PROGRESS_CACHE_KEY.format(user=user, csv_filename=csv_filename)
+        progress = cache.get(progress_key) if settings.CACHE_IS_SHARED else None
+        if progress is not None:
+            return progress
+
+        # Count the rows, and only decode the last action for its state
+        entries = ActionLogEntry.objects.filter(user=user, csv_filename=csv_filename)
+        counts = entries.aggregate(
+            restarts=Count('pk', filter=Q(is_restart=True)),
+            actions=Count('pk', filter=Q(is_restart=False)),
+        )
+        last_row = entries.filter(is_restart=False).order_by('-pk').values_list('row', flat=True).first()
+        last_state = dict(zip(DropboxConnection.USERDATA_CSV_HEADERS, json.loads(last_row))).get('next_state') if last_row is not None else None
+        progress = ParticipantProgress(counts['restarts'], counts['actions'], last_state)
+
+        if settings.CACHE_IS_SHARED:
+            cache.set(progress_key, progress, DropboxConnection.PROGRESS_CACHE_TIMEOUT)
+        return progress
+
+    def mirror_action_log(self, users=None):
+        """
+        Append the rows in the action log that have not been mirrored to the
+        CSV files on Dropbox. If users is not None, then only mirror the logs
+        for those users. Only one process mirrors the logs at a time; a
+        LockError is raised if another process is already mirroring.
+
+        Errors writing a file are logged and the file is retried on the next
+        call. Errors reading a file that exists, and errors that affect all
+        files, such as rate limits, are raised.
+
+        Returns the list of CSV files that were updated
+        """
+        with cache_lock('mirror_action_log_lock'):
+            return self._mirror_action_log(users)
+
+    def _mirror_action_log(self, users):
+        entries = ActionLogEntry.objects.filter(mirrored=False)
+        if users is not None:
+            entries = entries.filter(user__in=users)
+
+        # Group the entries by their CSV files
+        csv_entries = collections.defaultdict(list)
+        for entry in entries.order_by('pk'):
+            csv_entries[entry.csv_filename].append(entry)
+
+        # Update each of the CSV files
+        updated_filenames = []
+        for csv_filename, file_entries in csv_entries.items():
+            try:
+                read_file = self.storage.open(csv_filename)
+                experiment_data = self._get_csv_rows(read_file)
+            except dropbox.exceptions.ApiError as e:
+                # Only start a new file if there isn't one. On other errors,
+                # the entries stay in the log until the file can be read
+                if not is_not_found_error(e):
+                    raise
+                experiment_data = [DropboxConnection.USERDATA_CSV_HEADERS]
+
+            experiment_data.extend([json.loads(x.row) for x in file_entries])
+
+            # Write the data to dropbox. On a failure, we try again later
+            try:
+                self.storage.save(csv_filename, self._set_csv_bytes(experiment_data))
+            except dropbox.exceptions.ApiError as e:
+                logger.error(f"Error writing to Dropbox: {e}")
+                continue
+
+            ActionLogEntry.objects.filter(pk__in=[x.pk for x in file_entries]).update(mirrored=True)
+            updated_filenames.append(csv_filename)
+
+        return updated_filenames
+
+    def start_refresher(self, interval):
+        """Start a background thread that checks for changes to the video links
+        every interval seconds"""
+        if self.refresher is None:
+            self.refresher = VideoLinksRefresher(self, interval)
+            self.refresher.start()
+        return self.refresher
+
+    def start_writer(self, interval):
+        """Start a background thread that mirrors the action log every interval
+        seconds, as well as soon after new rows are added to it"""
+        if self.writer is None:
+            self.writer = ActionLogWriter(self, interval)
+            self.writer.start()
+        return self.writer
+
+
+class ActionLogWriter(threading.Thread):
+    """
+    A background thread that writes the action log to Dropbox. The log in the
+    DB serves as the journal, so rows that were not written before a crash are
+    written by the next writer that runs. If writing fails, the writer backs
+    off exponentially before trying again
+    """
+
+    # Delay after a notification, so that rows can be written in batches
+    BATCH_DELAY = 1
+
+    # Maximum time to wait after failures
+    MAX_BACKOFF = 300
+
+    def __init__(self, dbx, interval):
+        super().__init__(name='ActionLogWriter', daemon=True)
+        self.dbx = dbx
+        self.interval = interval
+        self.num_failures = 0
+        self._event = threading.Event()
+
+    def notify(self):
+        """Notify the writer that there are new rows in the log"""
+        self._event.set()
+
+    def get_backoff(self, error):
+        """Get the time to wait before retrying after an error"""
+        backoff = getattr(error, 'backoff', None) or (self.interval * (2 ** (self.num_failures - 1)))
+        return min(backoff, ActionLogWriter.MAX_BACKOFF)
+
+    def run(self):
+        while True:
+            if self._event.wait(self.interval):
+                time.sleep(ActionLogWriter.BATCH_DELAY)
+            self._event.clear()
+
+            try:
+                self.dbx.mirror_action_log()
+                self.num_failures = 0
+            except LockError as e:
+                # Another process is mirroring the log
+                pass
+            except Exception as e:
+                self.num_failures += 1
+                backoff = self.get_backoff(e)
+                logger.error(f"Error mirroring the action log ({self.num_failures} failures). Retrying in {backoff}s: {e}")
+                time.sleep(backoff)
+            finally:
+                db.connection.close()
+
+
+class VideoLinksRefresher(threading.Thread):
+    """
+    A background thread that refreshes the video links when the links file on
+    dropbox changes. If the cache is shared, then only one process refreshes
+    the links each interval; otherwise each process refreshes its own links
+    """
+
+    def __init__(self, dbx, interval):
+        super().__init__(name='VideoLinksRefresher', daemon=True)
+        self.dbx = dbx
+        self.interval = interval
+
+    def run(self):
+        while True:
+            time.sleep(self.interval)
+            if settings.CACHE_IS_SHARED and not claim_interval('refresh_video_links', self.interval):
+                continue
+
+            try:
+                self.dbx.refresh_video_links()
+            except Exception as e:
+                logger.error(f"Error refreshing the video links: {e}")
+
+
+class AccountPoolRefiller(threading.Thread):
+    """
+    A background thread that tops up the pool of accounts every interval
+    seconds, as well as soon after an account is claimed from the pool. Only
+    one process tops up the pool each interval
+    """
+
+    # The refiller that is running in this process
+    instance = None
+
+    def __init__(self, size, interval):
+        super().__init__(name='AccountPoolRefiller', daemon=True)
+        self.size = size
+        self.interval = interval
+        self._event = threading.Event()
+
+    @staticmethod
+    def start_refiller(size, interval):
+        """Start the refiller in this process, if it hasn't been started"""
+        if AccountPoolRefiller.instance is None:
+            AccountPoolRefiller.instance = AccountPoolRefiller(size, interval)
+            AccountPoolRefiller.instance.start()
+        return AccountPoolRefiller.instance
+
+    @staticmethod
+    def notify():
+        """Notify the refiller, if it is running, that accounts were claimed"""
+        if AccountPoolRefiller.instance is not None:
+            AccountPoolRefiller.instance._event.set()
+
+    def run(self):
+        while True:
+            notified = self._event.wait(self.interval)
+            self._event.clear()
+
+            try:
+                if not notified and not claim_interval('refill_account_pool', self.interval):
+                    continue
+
+                number_added = PooledAccount.refill(self.size)
+                if number_added > 0:
+                    logger.info(f"Added {number_added} accounts to the pool")
+            except Exception as e:
+                logger.error(f"Error refilling the account pool: {e}")
+            finally:
+                db.connection.close()
+
+
+class AbandonedUserSweeper(threading.Thread):
+    """
+    A background thread that marks the participants that have abandoned the
+    study every interval seconds, and frees up their slots in the quotas. Only
+    one process sweeps each interval
+    """
+
+    # The sweeper that is running in this process
+    instance = None
+
+    def __init__(self, interval):
+        super().__init__(name='AbandonedUserSweeper', daemon=True)
+        self.interval = interval
+
+    @staticmethod
+    def start_sweeper(interval):
+        """Start the sweeper in this process, if it hasn't been started"""
+        if AbandonedUserSweeper.instance is None:
+            AbandonedUserSweeper.instance = AbandonedUserSweeper(interval)
+            AbandonedUserSweeper.instance.start()
+        return AbandonedUserSweeper.instance
+
+    def run(self):
+        while True:
+            time.sleep(self.interval)
+
+            try:
+                if not claim_interval('sweep_abandoned_users', self.interval):
+                    continue
+
+                number_freed = ConditionQuota.sweep_abandoned(StudyManagement.get_default())
+                if number_freed > 0:
+                    logger.info(f"Freed {number_freed} slots from abandoned participants")
+            except Exception as e:
+                logger.error(f"Error sweeping abandoned participants: {e}")
+            finally:
+                db.connection.close()
+
 
-        # Write the data to dropbox
-        write_data = self._set_csv_bytes(experiment_data)
+# Limiting the number of concurrent requests
+
+class AdmissionControl:
+    """
+    Bound the number of requests of a kind that are in flight at once, across
+    all the processes. When the cache is shared, the number in flight is
+    counted in the cache, and the count expires after ``timeout`` seconds of
+    being idle. Otherwise, each request in flight holds one of ``limit`` slot
+    locks in the DB, which expire after ``timeout`` seconds. Either way, the
+    expiry is in case a process dies with a request in flight
+    """
+
+    def __init__(self, name, limit, timeout=300):
+        self.key = f'in_flight:{name}'
+        self.limit = limit
+        self.timeout = timeout
+
+    @property
+    def depth(self):
+        """The number of requests that are in flight"""
+        if settings.CACHE_IS_SHARED:
+            return cache.get(self.key, 0)
+
+        return DBMutex.objects.filter(
+            lock_id__startswith=f'{self.key}:',
+            creation_time__gt=timezone.now() - datetime.timedelta(seconds=self.timeout)
+        ).count()
+
+    @contextlib.contextmanager
+    def admit(self):
+        """
+        Count a request as in flight for the duration of the context. Yields
+        the tuple (admitted, depth), where admitted is False if the request
+        should be rejected because the limit was exceeded, and depth is the
+        number of requests in flight including this one
+        """
+        admit_request = self._admit_counter if settings.CACHE_IS_SHARED else self._admit_slot
+        with admit_request() as result:
+            yield result
+
+    @contextlib.contextmanager
+    def _admit_counter(self):
+        """Admit the request with the count in the shared cache"""
+        cache.add(self.key, 0, self.timeout)
         try:
-            self.storage.save(csv_filename, write_data)
-        except dropbox.exceptions.ApiError as e:
-            logger.error(f"Error writing to Dropbox: {e}")
-            write_data = None
+            depth = cache.incr(self.key)
+        except ValueError:
+            # The count expired between the add and the incr
+            cache.add(self.key, 1, self.timeout)
+            depth = 1
 
-        return experiment_data
+        try:
+            yield (depth <= self.limit, depth)
+        finally:
+            try:
+                cache.decr(self.key)
+            except ValueError:
+                pass
+
+    @contextlib.contextmanager
+    def _admit_slot(self):
+        """Admit the request if one of the slot locks in the DB is free"""
+        with contextlib.ExitStack() as stack:
+            admitted = False
+            for slot in range(self.limit):
+                try:
+                    stack.enter_context(cache_lock(f'{self.key}:{slot}', timeout=self.timeout))
+                    admitted = True
+                    break
+                except LockError as e:
+                    continue
+
+            yield (admitted, self.depth + (0 if admitted else 1))
@@ -1,11 +1,14 @@
+import re
 import json
 import logging
+import contextlib
+import functools
 import traceback
 
 from django.conf import settings
 from django.core.cache import cache
 from django.shortcuts import render, redirect
-from django.http import JsonResponse, HttpResponseRedirect
+from django.http import JsonResponse, HttpResponse, HttpResponseRedirect
 from django.views.generic.base import TemplateView as GenericTemplateView
 from django.views.generic.edit import FormView as GenericFormView
 from django.views.decorators.http import require_POST
@@ -19,20 +22,30 @@ from django.urls import reverse, reverse_lazy
 from django.utils import timezone
 from django.utils.decorators import method_decorator
 
-from db_mutex.db_mutex import db_mutex
-
 from . import constants
 from .models import User
 from .models.domain import display, State, Transition, Suggestions
+from .models.engine import TransitionTable
 from .forms import (DemographicsForm, InstructionsTestForm, SurveyForm,
                     CreateUserForm)
-from .utils import DropboxConnection
+from .utils import DropboxConnection, AdmissionControl, LockError, cache_lock
 
 
 # Shared output across all views
 
 logger = logging.getLogger(__name__)
 dbx = DropboxConnection()
+transition_table = TransitionTable([x for x in User.StartConditions.values if x is not None])
+create_admission = AdmissionControl('create', settings.CREATE_MAX_IN_FLIGHT)
+
+# The requests of a user wait up to this many seconds for the user's previous
+# request. The lock expires after the timeout in case a process dies
+NEXT_STATE_LOCK_WAIT = 10
+NEXT_STATE_LOCK_TIMEOUT = 60
+
+# The idempotency keys that are accepted from the clients. They must fit in
+# User.next_state_key
+IDEMPOTENCY_KEY_RE = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
 
 
 # Create your views here.
@@ -176,16 +189,16 @@ class StudyView(TemplateView):
     def dispatch(self, request, *args, **kwargs):
         # Create a dropbox file for the user, or mark that the user has
         # restarted the scenarios
-        rows_in_csv = dbx.write_to_csv(request.user)
+        num_rows_in_csv = dbx.write_to_csv(request.user).num_rows
         if not request.user.is_staff:
             # If the participant has taken too few steps, then fail them
-            if len(rows_in_csv) > 2 and len(rows_in_csv) < (2 + StudyView.MARK_RUN_INVALID_THRESHOLD):
-                request.user.ignore_data_reason = f'refreshed after {len(rows_in_csv)-2} actions'
+            if num_rows_in_csv > 2 and num_rows_in_csv < (2 + StudyView.MARK_RUN_INVALID_THRESHOLD):
+                request.user.ignore_data_reason = f'refreshed after {num_rows_in_csv-2} actions'
                 request.user.save()
                 return redirect(reverse('dining_room:fail'))
 
             # Otherwise redirect them to the survey
-            elif len(rows_in_csv) > 2:
+            elif num_rows_in_csv > 2:
                 return redirect(reverse('dining_room:survey'))
 
         # Update the time the user started the study
@@ -239,22 +252,29 @@ class FailView(TemplateView):
 def create(request):
     """Create a user; if that works, authenticate them and return them to the
     login page, which will then redirect them to the appropriate page. If not,
-    send them back to login but with errors"""
-
-    # Create the user generation form
-    form = CreateUserForm(request, request.POST)
+    send them back to login but with errors. If too many users are being
+    created at once, respond with a 503 so that the client retries later"""
+
+    with create_admission.admit() as (admitted, depth):
+        # Log the queue depth in a format that can be picked up as a metric
+        logger.info(f"sample#create.queue_depth={depth}")
+        if not admitted:
+            logger.warning(f"Rejected a sign up with {depth} in flight")
+            response = HttpResponse("Too many participants are signing up right now; please try again in a few moments.", status=503, content_type='text/plain')
+            response['Retry-After'] = str(settings.CREATE_RETRY_AFTER)
+            return response
 
-    # If the form is not valid (this is when we log the user in, if possible)
-    # then include an error message
-    form_valid = False
-    with db_mutex('create_user_lock'):
-        form_valid = form.is_valid()
+        # Create the user generation form
+        form = CreateUserForm(request, request.POST)
 
-    if not form_valid:
-        messages.error(
-            request,
-            "Thank you for your time, but it appears that all robots are being helped right now; you can try again in a few moments if the HIT is still available on Mechanical Turk."
-        )
+        # If the form is not valid (this is when we log the user in, if
+        # possible) then include an error message. The conditions are allocated
+        # with row locks in the form, so we don't need a lock here
+        if not form.is_valid():
+            messages.error(
+                request,
+                "Thank you for your time, but it appears that all robots are being helped right now; you can try again in a few moments if the HIT is still available on Mechanical Turk."
+            )
 
     # Redirect to the login page. If the user is logged in, they'll get
     # redirected to the appropriate page
@@ -306,49 +326,42 @@ def get_suggestions_json(transition, user=None):
     return suggestions_json
 
 
-def get_next_state_json(current_state, action, user=None):
+@functools.lru_cache(maxsize=settings.STATE_JSON_CACHE_SIZE)
+def get_static_state_json(current_state, action, video_links_version):
     """
-    Return the next state information given the current state and the action.
-    If action is None, then simply return the current state as a JSON. We
-    perform caching within this view function to save time
+    Return the part of the next state JSON that depends only on the current
+    state and the action, along with the transition that the suggestions should
+    be based on. The results are cached per process; the version of the video
+    links is part of the key so that reloading the links invalidates the cache.
+    The returned dictionary must not be modified
 
     Args:
-        current_state (tuple/list) : the current state object as a tuple
+        current_state (tuple) : the current state tuple
         action (None / str) : the action to take
-        user (User) : the user that is in the given state
+        video_links_version : ``dbx.video_links.version``
 
     Returns:
-        next_state_json: JSON dictionary of the next state
+        (static_json, transition)
     """
-    # Update the number of times that this function has been called
-    if user is not None and user.is_authenticated:
-        user.number_state_requests += 1
-        user.save()
-
     # Create a State object
     current_state = State(current_state)
 
-    # Generate the JSON data
-    action_result = True
-    if action is None:
-        next_state = current_state
-        transition = Transition(None, None, current_state)
+    # Generate the JSON data from the compiled transitions
+    step = transition_table.step(current_state, action)
+    next_state, action_result, arm_status = step.end_state, step.action_result, step.arm_status
+    if action_result and action is not None:
+        transition = Transition(current_state, action, next_state)
     else:
-        next_state = Transition.get_end_state(current_state, action)
-        if next_state is None:
-            action_result = False
-            transition = Transition(None, None, current_state)
-            next_state = current_state
-        else:
-            transition = Transition(current_state, action, next_state)
+        transition = Transition(None, None, current_state)
 
     # Check to see if the video exists. If it doesn't, mark it as failed, show
     # the no-op video and mark this action as failed
-    video_link = dbx.video_links.get(transition.video_name)
+    video_link = dbx.video_links.get(step.video_name)
     if video_link is None:
         action_result = False
         transition = Transition(None, None, current_state)
         next_state = current_state
+        arm_status = transition.arm_status
 
     # Create the JSON dictionary
     next_state_json = {
@@ -358,13 +371,40 @@ def get_next_state_json(current_state, action, user=None):
             { "attr": "Location", "value": display(next_state.relocalized_base_location) },
             { "attr": "Object in hand", "value": display(convert_mug_to_cup(convert_empty_gripper(next_state.gripper_state))) },
             { "attr": "Objects in view", "value": [display(convert_mug_to_cup(x)) for x in next_state.visible_objects] },
-            { "attr": "Arm status", "value": display(transition.arm_status) },
+            { "attr": "Arm status", "value": display(arm_status) },
         ],
-        "valid_actions": next_state.get_valid_actions(),
+        "valid_actions": transition_table.get_valid_actions(next_state),
         "action_result": action_result,
         "scenario_completed": next_state.is_end_state,
     }
 
+    return next_state_json, transition
+
+
+def get_next_state_json(current_state, action, user=None):
+    """
+    Return the next state information given the current state and the action.
+    If action is None, then simply return the current state as a JSON. We
+    perform caching within this view function to save time
+
+    Args:
+        current_state (tuple/list) : the current state object as a tuple
+        action (None / str) : the action to take
+        user (User) : the user that is in the given state
+
+    Returns:
+        next_state_json: JSON dictionary of the next state
+    """
+    # Update the number of times that this function has been called
+    if user is not None and user.is_authenticated:
+        user.increment('number_state_requests')
+
+    # Get the static part of the JSON; copy it so that it can be modified
+    static_json, transition = get_static_state_json(
+        State(current_state).tuple, action, dbx.video_links.version
+    )
+    next_state_json = dict(static_json)
+
     # Update the dictionary with suggestions
     next_state_json.update(get_suggestions_json(transition, user))
 
@@ -372,59 +412,111 @@ def get_next_state_json(current_state, action, user=None):
     return next_state_json
 
 
+def process_next_state(request, post_data):
+    """
+    Get the next state JSON for the data posted to ``get_next_state``, and
+    record the request against the user if they are logged in
+    """
+    # Collect the changes to the user and write them to the DB at the end
+    if request.user.is_authenticated:
+        user_updates = request.user.deferred_updates()
+    else:
+        user_updates = contextlib.nullcontext()
+
+    with user_updates:
+        try:
+            # Get the next state
+            current_state_tuple = post_data.get('server_state_tuple')
+            action = post_data.get('action')
+            next_state_json = get_next_state_json(current_state_tuple, action, request.user)
+
+            # Update the CSV with the incoming data (only if this is on django)
+            if request.user.is_authenticated:
+                dbx.write_to_csv(
+                    request.user,
+                    **{
+                        "start_state": repr(State(current_state_tuple)),
+                        "diagnoses": str(post_data.get('ui_state', {}).get('confirmed_dx')),
+                        "diagnosis_certainty": post_data.get('ui_state', {}).get('dx_certainty'),
+                        "action": action,
+                        "next_state": repr(State(next_state_json['server_state_tuple'])),
+                        "video_loaded_time": post_data.get('ui_state', {}).get('video_loaded_time'),
+                        "video_stop_time": post_data.get('ui_state', {}).get('video_stop_time'),
+                        "dx_selected_time": post_data.get('ui_state', {}).get('dx_selected_time'),
+                        "dx_confirmed_time": post_data.get('ui_state', {}).get('dx_confirmed_time'),
+                        "ax_selected_time": post_data.get('ui_state', {}).get('ax_selected_time'),
+                    }
+                )
+
+                # If the next state JSON says that the user is done, then mark that, else
+                # complete the scenario based on if the user has exceeded max actions
+                if next_state_json['scenario_completed']:
+                    request.user.update(scenario_completed=True)
+                elif post_data.get('ui_state', {}).get('selected_action_idx') >= constants.MAX_NUMBER_OF_ACTIONS:
+                    next_state_json['scenario_completed'] = True
+                    request.user.update(scenario_completed=False)
+
+            # Otherwise, simply check to see if we are over the limit of the maximum
+            # number of actions
+            elif post_data.get('ui_state', {}).get('selected_action_idx') >= constants.MAX_NUMBER_OF_ACTIONS:
+                next_state_json['scenario_completed'] = True
+        except Exception as e:
+            trace = traceback.format_exc()
+            logger.error(f"Error processing next state {e}:\n{trace}")
+            if request.user.is_authenticated:
+                request.user.update(ignore_data_reason=trace)
+            next_state_json = {
+                'scenario_completed': True
+            }
+
+    return next_state_json
+
+
 @require_POST
 @csrf_exempt
 @never_cache
 def get_next_state(request):
+    """
+    Get the next state given the current state and action in the POST. The
+    requests of each user are processed one at a time. If the POST has an
+    ``idempotency_key``, then the response is saved with the key on the user,
+    so that a retry of the request returns the same response without being
+    processed again. The response is replaced when the next key is accepted
+    """
+    # Errors in the data are handled, and recorded, in process_next_state
     try:
         post_data = json.loads(request.body.decode('utf-8'))
+    except ValueError as e:
+        post_data = {}
 
-        # Get the next state
-        current_state_tuple = post_data.get('server_state_tuple')
-        action = post_data.get('action')
-        next_state_json = get_next_state_json(current_state_tuple, action, request.user)
-
-        # Update the CSV with the incoming data (only if this is on django)
-        if request.user.is_authenticated:
-            dbx.write_to_csv(
-                request.user,
-                **{
-                    "start_state": repr(State(current_state_tuple)),
-                    "diagnoses": str(post_data.get('ui_state', {}).get('confirmed_dx')),
-                    "diagnosis_certainty": post_data.get('ui_state', {}).get('dx_certainty'),
-                    "action": action,
-                    "next_state": repr(State(next_state_json['server_state_tuple'])),
-                    "video_loaded_time": post_data.get('ui_state', {}).get('video_loaded_time'),
-                    "video_stop_time": post_data.get('ui_state', {}).get('video_stop_time'),
-                    "dx_selected_time": post_data.get('ui_state', {}).get('dx_selected_time'),
-                    "dx_confirmed_time": post_data.get('ui_state', {}).get('dx_confirmed_time'),
-                    "ax_selected_time": post_data.get('ui_state', {}).get('ax_selected_time'),
-                }
-            )
+    if not request.user.is_authenticated:
+        return JsonResponse(process_next_state(request, post_data))
 
-            # If the next state JSON says that the user is done, then mark that, else
-            # complete the scenario based on if the user has exceeded max actions
-            if next_state_json['scenario_completed']:
-                request.user.scenario_completed = True
-                request.user.save()
-            elif post_data.get('ui_state', {}).get('selected_action_idx') >= constants.MAX_NUMBER_OF_ACTIONS:
-                next_state_json['scenario_completed'] = True
-                request.user.scenario_completed = False
-                request.user.save()
+    idempotency_key = post_data.get('idempotency_key')
+    if idempotency_key is not None and (not isinstance(idempotency_key, str) or not IDEMPOTENCY_KEY_RE.match(idempotency_key)):
+        return JsonResponse({ 'error': "Invalid idempotency key" }, status=400)
 
-        # Otherwise, simply check to see if we are over the limit of the maximum
-        # number of actions
-        elif post_data.get('ui_state', {}).get('selected_action_idx') >= constants.MAX_NUMBER_OF_ACTIONS:
-            next_state_json['scenario_completed'] = True
-    except Exception as e:
-        trace = traceback.format_exc()
-        logger.error(f"Error processing next state {e}:\n{trace}")
-        if request.user.is_authenticated:
-            request.user.ignore_data_reason = trace
-            request.user.save()
-        next_state_json = {
-            'scenario_completed': True
-        }
+    try:
+        with cache_lock(f'next_state:{request.user.pk}', timeout=NEXT_STATE_LOCK_TIMEOUT, wait=NEXT_STATE_LOCK_WAIT):
+            # Another request could've updated the user while we waited. The
+            # saved response is only loaded for a retry
+            request.user.refresh_from_db(fields=['number_state_requests', 'rng_state', 'next_state_key'])
+            if idempotency_key and idempotency_key == request.user.next_state_key:
+                request.user.refresh_from_db(fields=['next_state_response'])
+                next_state_json = json.loads(request.user.next_state_response)
+            else:
+                with request.user.deferred_updates():
+                    next_state_json = process_next_state(request, post_data)
+                    if idempotency_key:
+                        request.user.update(
+                            next_state_key=idempotency_key,
+                            next_state_response=json.dumps(next_state_json)
+                        )
+    except LockError as e:
+        logger.warning(f"Timed out waiting for the previous request of {request.user}")
+        response = JsonResponse({ 'error': "The previous request is still being processed" }, status=503)
+        response['Retry-After'] = '1'
+        return response
 
     # Return
     return JsonResponse(next_state_json)
@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# Check that there is a video for every transition that a participant can take
+
+from django.core.management.base import BaseCommand, CommandError
+
+from dining_room.views import dbx, transition_table
+
+
+# Create the Command class
+
+class Command(BaseCommand):
+    """
+    Compile the video names of every transition that is reachable from the
+    start conditions and cross-check them against the video links on dropbox
+    """
+
+    help = "Check the video links on dropbox against the videos needed by the transitions. Run this before launching a study"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--show-unused', action='store_true', help="List the videos in the links file that are not used by any transition")
+        parser.add_argument('--allow-missing', action='store_true', help="Do not raise an error if videos are missing")
+
+    def handle(self, *args, **options):
+        verbosity = options.get('verbosity')
+        missing, unused = transition_table.check_video_links(dbx.video_links)
+
+        if verbosity > 0:
+            self.stdout.write(f"{len(transition_table.videos)} videos needed by {len(transition_table)} states; {len(dbx.video_links)} video links")
+
+        # Print out the unused videos
+        if options['show_unused'] or verbosity > 1:
+            for video_name in unused:
+                self.stdout.write(f"Unused: {video_name}")
+
+        # Print out the missing videos
+        for video_name in missing:
+            self.stdout.write(self.style.ERROR(f"Missing: {video_name}"))
+
+        if len(missing) > 0 and not options['allow_missing']:
+            raise CommandError(f"{len(missing)} videos are missing")
+
+        # Print a completion message
+        self.stdout.write(self.style.SUCCESS(f"Video links checked! {len(missing)} missing, {len(unused)} unused"))
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# Write the rows in the action log to the users' CSV files on dropbox
+
+from django.core.management.base import BaseCommand, CommandError
+
+from dining_room.models import User, ActionLogEntry
+from dining_room.views import dbx
+
+
+# Create the Command class
+
+class Command(BaseCommand):
+    """
+    Append the rows in the action log that have not yet been written to the
+    users' CSV files on dropbox
+    """
+
+    help = "Mirror the action log to the users' CSV files on dropbox. Run this before syncing the actions"
+
+    def add_arguments(self, parser):
+        parser.add_argument('usernames', nargs='*', help="The users whose logs should be mirrored. Defaults to all users")
+        parser.add_argument('--raise-on-pending', action='store_true', help="Raise an error if rows could not be mirrored")
+
+    def handle(self, *args, **options):
+        verbosity = options.get('verbosity')
+        users = User.objects.filter(username__in=options['usernames']) if options['usernames'] else None
+
+        updated_filenames = dbx.mirror_action_log(users)
+        if verbosity > 1:
+            for filename in updated_filenames:
+                self.stdout.write(f"Updated {filename}")
+
+        # Check for the rows that could not be written
+        pending = ActionLogEntry.objects.filter(mirrored=False)
+        if users is not None:
+            pending = pending.filter(user__in=users)
+
+        if pending.exists():
+            msg = f"{pending.count()} rows could not be mirrored"
+            if options['raise_on_pending']:
+                raise CommandError(msg)
+            self.stdout.write(self.style.ERROR(msg))
+
+        # Print a completion message
+        self.stdout.write(self.style.SUCCESS(f"Action log mirrored! {len(updated_filenames)} files updated"))
@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+# Recompute the choices of the study actions
+
+from django.core.management.base import BaseCommand
+
+from dining_room.models import StudyAction
+
+
+# Create the Command class
+
+class Command(BaseCommand):
+    """
+    Recompute whether the choices in the study actions followed the suggestions
+    and were optimal. Use this after changes to the suggestions, or to the
+    actions in bulk
+    """
+
+    help = "Recompute the suggestion-following and optimality columns of the study actions"
+
+    def add_arguments(self, parser):
+        parser.add_argument('usernames', nargs='*', help="The users whose actions should be recomputed. Defaults to all users")
+
+    def handle(self, *args, **options):
+        actions = StudyAction.objects.all()
+        if options['usernames']:
+            actions = actions.filter(user__username__in=options['usernames'])
+
+        number_updated = actions.recompute_choices()
+
+        # Print a completion message
+        self.stdout.write(self.style.SUCCESS(f"Action choices recomputed! Updated {number_updated}"))
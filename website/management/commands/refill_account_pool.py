@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+# Top up the pool of participant accounts
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from dining_room.models import PooledAccount
+
+
+# Create the Command class
+
+class Command(BaseCommand):
+    """
+    Generate participant accounts ahead of time so that sign ups only need to
+    claim one from the pool
+    """
+
+    help = "Top up the pool of participant accounts that are assigned on sign up"
+
+    def add_arguments(self, parser):
+        parser.add_argument('-s', '--size', type=int, default=settings.ACCOUNT_POOL_SIZE, help="The number of accounts that should be in the pool")
+
+    def handle(self, *args, **options):
+        if options['size'] < 0:
+            raise CommandError(f"Invalid pool size: {options['size']}")
+
+        number_added = PooledAccount.refill(options['size'])
+
+        # Print a completion message
+        self.stdout.write(self.style.SUCCESS(f"Account pool refilled! Added {number_added}; {PooledAccount.objects.count()} in the pool"))
@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+# Load the video links from dropbox into the cache that is shared by the workers
+
+from django.core.management.base import BaseCommand, CommandError
+
+from dining_room.views import dbx
+
+
+# Create the Command class
+
+class Command(BaseCommand):
+    """
+    Download the video links file from dropbox, if it has changed, and share
+    the links with the web processes through the cache
+    """
+
+    help = "Refresh the video links that are used by the web processes. Run this after updating the video links on dropbox"
+
+    def add_arguments(self, parser):
+        parser.add_argument('-f', '--force', action='store_true', help="Download the links even if the file has not changed")
+
+    def handle(self, *args, **options):
+        video_links = dbx.refresh_video_links(force=options['force'])
+
+        # Print a completion message
+        self.stdout.write(self.style.SUCCESS(f"Video links refreshed! {len(video_links)} links, version {video_links.version}"))
@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+# Mark the participants that have abandoned the study
+
+from django.core.management.base import BaseCommand
+
+from dining_room.models import StudyManagement, ConditionQuota
+
+
+# Create the Command class
+
+class Command(BaseCommand):
+    """
+    Mark the participants that have not completed the study, and have not
+    logged in for a while, as abandoned. Their slots in the condition quotas are
+    freed up for new participants
+    """
+
+    help = "Mark abandoned participants as invalid and free up their slots in the study"
+
+    def handle(self, *args, **options):
+        number_freed = ConditionQuota.sweep_abandoned(StudyManagement.get_default())
+
+        # Print a completion message
+        self.stdout.write(self.style.SUCCESS(f"Abandoned participants swept! Freed {number_freed} slots"))
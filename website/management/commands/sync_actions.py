@@ -3,6 +3,7 @@
 
 import os
 import sys
+import ast
 import csv
 import codecs
 import pytz
@@ -39,6 +40,7 @@ class Command(BaseCommand):
         parser.add_argument('-a', '--all', action='store_true', help='Whether to simulate suggestions for all users, or only those with valid / relevant data')
         parser.add_argument("--raise-on-missing", action="store_true", help="Raise an error if the actions CSV file is missing")
         parser.add_argument("--raise-on-delete", action="store_true", help="Raise an error if there already exist actions for the user")
+        parser.add_argument("--skip-mirror", action="store_true", help="Do not mirror the action log to dropbox before fetching the actions")
 
     def _get_csv_data(self, dbx_filename):
         try:
@@ -86,7 +88,7 @@ class Command(BaseCommand):
             elif '_time' in key:
                 setattr(action, key, datetime.datetime.fromtimestamp(float(value), pytz.utc))
             elif key == 'diagnoses':
-                setattr(action, key, eval(value))
+                setattr(action, key, ast.literal_eval(value))
             elif 'corrupted_' in key:
                 # FIXME: Maybe make this more permanent?
                 pass
@@ -98,6 +100,11 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         verbosity = options.get('verbosity')
+
+        # Make sure that the CSV files contain all the logged actions
+        if not options['skip_mirror']:
+            management.call_command('mirror_action_log', verbosity=verbosity)
+
         if options['all']:
             users = User.objects.filter(is_staff=False).exclude(studyaction=None)
         else:
@@ -88,8 +88,11 @@ class Command(BaseCommand):
         """Simulate the user's experience"""
         actions = user.studyaction_set.order_by('start_timestamp')
 
-        # Get the simulated user and reset them
+        # Get the simulated user and reset them. The sim user makes the same
+        # sequence of requests as the user, so the counter-based rng is keyed
+        # by the user and the same request numbers
         sim_user = User.objects.get(username='sim_user')
+        sim_user.replay_of = user
         sim_user.study_condition = user.study_condition
         sim_user.start_condition = user.start_condition
         sim_user.rng_state = Suggestions.DEFAULT_RNG_SEED
@@ -101,7 +104,7 @@ class Command(BaseCommand):
         start_state = State(user.start_condition.split('.'))
         schk = Suggestions()  # Just a means to get the optimal alternatives
         for action in actions:
-            next_state = State(eval(action.start_state))
+            next_state = action.get_start_state()
 
             # Get the next state and verify it
             if sim_user.study_condition in Command.V1_NOISE_USAGE_CONDITIONS:
@@ -139,7 +142,7 @@ class Command(BaseCommand):
             # Save the action
             action.save()
             prev_action = action.action
-            start_state = State(eval(action.next_state))
+            start_state = action.get_next_state()
 
         # Simulate the last suggestions call
         if sim_user.study_condition in Command.V1_NOISE_USAGE_CONDITIONS:
@@ -148,10 +151,12 @@ class Command(BaseCommand):
         else:
             json = get_next_state_json(start_state.tuple, prev_action, sim_user)
 
-        # Check the RNG state
+        # Check the RNG state, and the request number of the counter-based rng
         try:
             assert sim_user.rng_state == user.rng_state, \
                 f"Mismatch end state... FML: {user}... {user.rng_state} != {sim_user.rng_state}"
+            assert not user.cached_study_management.counter_rng or sim_user.number_state_requests == user.number_state_requests, \
+                f"Mismatch number of requests: {user}... {user.number_state_requests} != {sim_user.number_state_requests}"
         except Exception as e:
             self.stdout.write(self.style.ERROR(f"{e}"))
 
@@ -140,13 +140,54 @@ AUTH_PASSWORD_VALIDATORS = [
     # },
 ]
 
-# Customizing authentication
+# Customizing authentication. Participants (non-staff) have cheap passwords that
+# are checked by the participant backend; everyone else uses the default hashers
 AUTH_USER_MODEL = 'dining_room.User'
+AUTHENTICATION_BACKENDS = [
+    'dining_room.backends.ParticipantBackend',
+    'django.contrib.auth.backends.ModelBackend',
+]
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'dining_room.hashers.ParticipantPasswordHasher',
+]
 LOGIN_URL = '/'
 LOGIN_REDIRECT_URL = '/demographics'
 
-# Caches are disabled in development, so change the session engine too
-SESSION_ENGINE = 'django.contrib.sessions.backends.db'
+# Use redis for the cache if it is configured. Otherwise, each process has its
+# own in-memory cache, and the locks that need to be shared between processes
+# are kept in the DB
+REDIS_URL = os.getenv('REDIS_URL')
+CACHE_IS_SHARED = bool(REDIS_URL)
+
+if CACHE_IS_SHARED:
+    CACHES = {
+        'default': {
+            'BACKEND': 'redis_cache.RedisCache',
+            'LOCATION': REDIS_URL,
+            'OPTIONS': {
+                'CONNECTION_POOL_CLASS_KWARGS': {
+                    'max_connections': int(os.getenv('REDIS_MAX_CONNECTIONS', 20)),
+                },
+            },
+        },
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        },
+    }
+
+# Keep the sessions in redis if it is available. Otherwise keep them in the DB;
+# the local caches would keep serving sessions that other processes have ended
+SESSION_ENGINE = os.getenv(
+    'SESSION_ENGINE',
+    'django.contrib.sessions.backends.cache' if CACHE_IS_SHARED else 'django.contrib.sessions.backends.db'
+)
 
 
 # Internationalization
@@ -179,3 +220,30 @@ if os.getenv('ENVIRONMENT', 'dev') == 'prod':
 DROPBOX_OAUTH2_TOKEN = os.getenv('DROPBOX_ACCESS_TOKEN')
 DROPBOX_ROOT_PATH = '/DiningRoom_IsolationCYOA/'
 DROPBOX_DATA_FOLDER = 'data'
+
+# The number of (state, action) responses to cache in each process
+STATE_JSON_CACHE_SIZE = int(os.getenv('STATE_JSON_CACHE_SIZE', 8192))
+
+# Seconds between writes of the action log to dropbox by the web processes. Set
+# to 0 to only write the log with the mirror_action_log command
+DROPBOX_WRITE_BEHIND_INTERVAL = float(os.getenv('DROPBOX_WRITE_BEHIND_INTERVAL', 10))
+
+# Seconds between checks for changes to the video links on dropbox by the web
+# processes. Set to 0 to only refresh with the refresh_video_links command
+VIDEO_LINKS_REFRESH_INTERVAL = float(os.getenv('VIDEO_LINKS_REFRESH_INTERVAL', 300))
+
+# The number of participant accounts to keep ready in the pool, and the seconds
+# between checks of the pool by the web processes. Set the size to 0 to only
+# fill the pool with the refill_account_pool command
+ACCOUNT_POOL_SIZE = int(os.getenv('ACCOUNT_POOL_SIZE', 20))
+ACCOUNT_POOL_REFILL_INTERVAL = float(os.getenv('ACCOUNT_POOL_REFILL_INTERVAL', 60))
+
+# Seconds between sweeps for participants that have abandoned the study by the
+# web processes. Set to 0 to only sweep with the sweep_abandoned_users command
+ABANDONED_USER_SWEEP_INTERVAL = float(os.getenv('ABANDONED_USER_SWEEP_INTERVAL', 60))
+
+# The number of sign ups that can be processed at once by all the web
+# processes. Further sign ups are rejected with a 503, and the login page
+# retries them after the number of seconds in the Retry-After header
+CREATE_MAX_IN_FLIGHT = int(os.getenv('CREATE_MAX_IN_FLIGHT', 4))
+CREATE_RETRY_AFTER = int(os.getenv('CREATE_RETRY_AFTER', 5))
@@ -8,9 +8,33 @@ https://docs.djangoproject.com/en/3.0/howto/deployment/wsgi/
 """
 
 import os
+import logging
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'website.settings')
 
 application = get_wsgi_application()
+
+# Preload the video links, and start the threads that write the action log,
+# refresh the video links, refill the account pool, and sweep abandoned
+# participants in the background. Every worker starts the threads, but the
+# periodic jobs only run in one of them each interval. If the links cannot be
+# loaded now, they are loaded on the first request that needs them
+from dining_room.views import dbx
+from dining_room.utils import AccountPoolRefiller, AbandonedUserSweeper
+
+try:
+    dbx.video_links
+except Exception as e:
+    logging.getLogger(__name__).warning(f"Could not preload the video links: {e}")
+
+if settings.DROPBOX_WRITE_BEHIND_INTERVAL > 0:
+    dbx.start_writer(settings.DROPBOX_WRITE_BEHIND_INTERVAL)
+if settings.VIDEO_LINKS_REFRESH_INTERVAL > 0:
+    dbx.start_refresher(settings.VIDEO_LINKS_REFRESH_INTERVAL)
+if settings.ACCOUNT_POOL_SIZE > 0:
+    AccountPoolRefiller.start_refiller(settings.ACCOUNT_POOL_SIZE, settings.ACCOUNT_POOL_REFILL_INTERVAL)
+if settings.ABANDONED_USER_SWEEP_INTERVAL > 0:
+    AbandonedUserSweeper.start_sweeper(settings.ABANDONED_USER_SWEEP_INTERVAL)